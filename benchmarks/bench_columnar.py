@@ -0,0 +1,90 @@
+"""
+컬럼형 내보내기 벤치마크
+- summary.csv (pandas.read_csv + 리스트 컬럼 분해) vs Parquet / npz 로드 시간
+- 기록 시간 및 파일 크기
+
+실행:
+    python -m benchmarks.bench_columnar --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.columnar import ColumnarExporter, load_columnar, BACKEND_NPZ, BACKEND_PARQUET, pa, np
+from src.output_formatters import SummaryCSVWriter, format_csv_row
+
+from .bench_sqlite_sink import make_rows
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def load_csv(path: Path):
+    """분석 담당자가 매일 하는 방식: 문자열 CSV를 타입 변환까지"""
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for col in ["gross_weight_kg", "tare_weight_kg", "net_weight_kg"]:
+        df[col] = pd.to_numeric(df[col].replace("", None)).astype("Int64")
+    df["date"] = pd.to_datetime(df["date"].replace("", None))
+    df["is_valid"] = df["is_valid"] == "TRUE"
+    df["parse_warnings"] = df["parse_warnings"].map(lambda s: s.split("; ") if s else [])
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="컬럼형 내보내기 벤치마크")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--row-group-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"rows={args.rows}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+
+        csv_path = tmp / "summary.csv"
+
+        def write_csv():
+            with SummaryCSVWriter(csv_path, flush_every=1000) as writer:
+                for row in rows:
+                    writer.write_row(format_csv_row(row["source"], row))
+
+        _, t_write = _timed(write_csv)
+        _, t_load = _timed(lambda: load_csv(csv_path))
+        print(
+            f"  {'csv':8s} 기록 {t_write:6.2f}초  로드 {t_load:6.2f}초  "
+            f"크기 {csv_path.stat().st_size / 1e6:7.1f}MB"
+        )
+
+        backends = []
+        if pa is not None:
+            backends.append((BACKEND_PARQUET, ".parquet"))
+        if np is not None:
+            backends.append((BACKEND_NPZ, ".npz"))
+
+        for backend, suffix in backends:
+            path = tmp / f"summary{suffix}"
+
+            def write_columnar():
+                with ColumnarExporter(path, row_group_size=args.row_group_size, backend=backend) as exporter:
+                    for row in rows:
+                        exporter.write(row["source"], row)
+
+            _, t_write = _timed(write_columnar)
+            _, t_load = _timed(lambda: load_columnar(path))
+            print(
+                f"  {backend:8s} 기록 {t_write:6.2f}초  로드 {t_load:6.2f}초  "
+                f"크기 {path.stat().st_size / 1e6:7.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+종단간 처리량 벤치마크 (합성 계근지, benchmarks/synthetic.py)
+- 생성기 자체 속도 (측정값에서 제외할 비용 확인용)
+- run_full_pipeline: docs/sec, 단계별 소요 시간(StageMetrics), 필드 정확도, 최대 RSS
+- main 배치 경로 (--input-dir): 산출물 / summary.csv 기록까지 포함한 docs/sec, 최대 RSS
+- 구간마다 새 프로세스(spawn)에서 실행해 최대 RSS가 섞이지 않게 함
+- 파이프라인 구간은 --batch 건씩 임시 파일로 쓰고 덮어쓰므로 수백만 건도 디스크 사용량 일정
+
+실행:
+    python -m benchmarks.bench_end_to_end --docs 20000
+    python -m benchmarks.bench_end_to_end --docs 1000000 --main-docs 0
+    python -m benchmarks.bench_end_to_end --main-docs 5000 --main-args "--layout bundle --writer-threads 4"
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import shlex
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .synthetic import TicketGenerator, document_name, write_directory
+
+_FIELDS = ["date", "vehicle_no", "gross_weight_kg", "tare_weight_kg", "net_weight_kg"]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (peak if os.uname().sysname == "Darwin" else peak * 1024) / 1e6
+
+
+def _isolated(fn, **kwargs) -> Dict[str, Any]:
+    """새 프로세스에서 실행 (최대 RSS를 구간별로 분리)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(fn, **kwargs).result()
+
+
+def bench_generator(docs: int, seed: int, noise: float, words: bool) -> Dict[str, Any]:
+    generator = TicketGenerator(seed=seed, noise=noise, words=words)
+    start = time.perf_counter()
+    size = sum(len(json.dumps(doc, ensure_ascii=False)) for doc in generator.iter_documents(docs))
+    elapsed = time.perf_counter() - start
+    return {"docs_per_sec": docs / elapsed, "avg_kb": size / docs / 1024}
+
+
+def bench_pipeline(docs: int, seed: int, noise: float, words: bool, batch: int, with_evidence: bool) -> Dict[str, Any]:
+    """run_full_pipeline만 시간 측정 (파일 생성 시간 제외)"""
+    from src.metrics import enable_metrics
+    from src.pipeline import run_full_pipeline
+
+    generator = TicketGenerator(seed=seed, noise=noise, words=words)
+    metrics = enable_metrics()
+    correct = {field: 0 for field in _FIELDS}
+    elapsed = 0.0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        for first in range(0, docs, batch):
+            count = min(batch, docs - first)
+            truths: List[Dict[str, Any]] = []
+            paths: List[str] = []
+            for slot, doc in enumerate(generator.iter_documents(count, first)):
+                path = tmp / document_name(slot)
+                path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+                truths.append(doc["synthetic"]["truth"])
+                paths.append(str(path))
+
+            start = time.perf_counter()
+            results = [run_full_pipeline(path, with_evidence=with_evidence)[3] for path in paths]
+            elapsed += time.perf_counter() - start
+
+            for result, truth in zip(results, truths):
+                for field in _FIELDS:
+                    correct[field] += getattr(result, field) == truth[field]
+
+    return {
+        "docs_per_sec": docs / elapsed,
+        "stages": metrics.format_report(),
+        "accuracy": {field: n / docs for field, n in correct.items()},
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def bench_main(docs: int, seed: int, noise: float, words: bool, main_args: List[str]) -> Dict[str, Any]:
+    """main() 배치 경로 전체 (입력 파일은 미리 생성, 출력은 임시 디렉토리)"""
+    from src import main as pipeline_main
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        write_directory(tmp / "raw", docs, TicketGenerator(seed=seed, noise=noise, words=words))
+        pipeline_main.PROCESSED_DIR = tmp / "processed"
+        pipeline_main.LOG_DIR = tmp / "logs"
+
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+                start = time.perf_counter()
+                pipeline_main.main(["--input-dir", str(tmp / "raw")] + main_args)
+                elapsed = time.perf_counter() - start
+
+        files = [p for p in (tmp / "processed").rglob("*") if p.is_file()]
+        return {
+            "docs_per_sec": docs / elapsed,
+            "files": len(files),
+            "output_mb": sum(p.stat().st_size for p in files) / 1e6,
+            "peak_rss_mb": _peak_rss_mb(),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="종단간 처리량 벤치마크 (합성 계근지)")
+    parser.add_argument("--docs", type=int, default=20000, help="run_full_pipeline 구간 문서 수")
+    parser.add_argument("--main-docs", type=int, default=2000, help="main 배치 경로 구간 문서 수 (0=생략)")
+    parser.add_argument("--main-args", default="", help="main에 넘길 추가 인자 (예: \"--layout bundle --compact-json\")")
+    parser.add_argument("--batch", type=int, default=1000, help="파이프라인 구간 임시 파일 묶음 크기")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--noise", type=float, default=0.3, help="잡음 종류별 적용 확률")
+    parser.add_argument("--no-words", action="store_true", help="단어 박스 없는 문서 (생성 / JSON 로드 비용 감소, 대량 실행용)")
+    parser.add_argument("--no-evidence", action="store_true", help="후보 / 선택 근거 생성 생략 (minimal 산출물과 같은 경로)")
+    args = parser.parse_args()
+
+    words = not args.no_words
+    gen = bench_generator(min(args.docs, 5000) or 1000, args.seed, args.noise, words)
+    print(f"생성기: {gen['docs_per_sec']:8.0f} docs/sec (평균 {gen['avg_kb']:.1f}KB/문서)")
+
+    if args.docs:
+        result = _isolated(
+            bench_pipeline, docs=args.docs, seed=args.seed, noise=args.noise, words=words,
+            batch=args.batch, with_evidence=not args.no_evidence,
+        )
+        accuracy = ", ".join(f"{field} {rate:.1%}" for field, rate in result["accuracy"].items())
+        print(f"\nrun_full_pipeline (docs={args.docs}, 근거 {'생략' if args.no_evidence else '포함'})")
+        print(f"  처리량   : {result['docs_per_sec']:8.1f} docs/sec")
+        print(f"  최대 RSS : {result['peak_rss_mb']:8.1f} MB")
+        print(f"  정확도   : {accuracy}")
+        print("  단계별 (ms):")
+        for line in result["stages"].splitlines():
+            print(f"    {line}")
+
+    if args.main_docs:
+        result = _isolated(
+            bench_main, docs=args.main_docs, seed=args.seed, noise=args.noise, words=words,
+            main_args=shlex.split(args.main_args),
+        )
+        print(f"\nmain 배치 경로 (docs={args.main_docs}, 인자: {args.main_args or '기본'})")
+        print(f"  처리량   : {result['docs_per_sec']:8.1f} docs/sec")
+        print(f"  최대 RSS : {result['peak_rss_mb']:8.1f} MB")
+        print(f"  산출물   : {result['files']}개 파일, {result['output_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+백그라운드 산출물 기록기 벤치마크
+- 문서당 산출물 7개(각 약 2KB)를 기록할 때 스레드 수 / fsync 정책별 비교
+- 처리 루프 시간(submit까지)과 전체 시간(close까지), 큐 대기 시간
+
+실행:
+    python -m benchmarks.bench_file_writer --docs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.file_writer import BackgroundFileWriter, FSYNC_POLICIES
+
+# 문서당 산출물 수 (FileNamingConvention.STAGES)
+FILES_PER_DOC = 7
+
+
+def _busy(ms: float) -> None:
+    """문서 처리(CPU) 흉내"""
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def bench(output_dir: Path, docs: int, threads: int, fsync: str, cpu_ms: float) -> None:
+    payload = ('{"source": "doc.json", "value": "' + "가" * 600 + '"}\n')
+    writer = BackgroundFileWriter(threads=threads, fsync=fsync)
+
+    start = time.perf_counter()
+    for i in range(docs):
+        _busy(cpu_ms)
+        for stage in range(FILES_PER_DOC):
+            writer.submit(output_dir / f"doc_{i:06d}_{stage}.json", payload)
+    loop = time.perf_counter() - start
+    writer.close()
+    total = time.perf_counter() - start
+
+    stats = writer.stats()
+    print(
+        f"  threads={threads} fsync={fsync:5s}: 루프 {loop:6.2f}초 / 전체 {total:6.2f}초 "
+        f"({stats['files_per_sec']:8.0f} files/s, {stats['mb_per_sec']:6.2f} MB/s, "
+        f"큐 대기 평균 {stats['queue_latency_avg_ms']:7.3f}ms)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="백그라운드 산출물 기록기 벤치마크")
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, nargs="+", default=FSYNC_POLICIES)
+    parser.add_argument("--cpu-ms", type=float, default=1.0, help="문서당 처리 시간 흉내 (ms)")
+    args = parser.parse_args()
+
+    print(f"docs={args.docs} files={args.docs * FILES_PER_DOC} cpu_ms={args.cpu_ms}")
+    for fsync in args.fsync:
+        for threads in args.threads:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                bench(Path(tmpdir), args.docs, threads, fsync, args.cpu_ms)
+
+
+if __name__ == "__main__":
+    main()
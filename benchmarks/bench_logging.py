@@ -0,0 +1,77 @@
+"""
+로그 오버헤드 벤치마크
+- 문서 1건 = process_single_file과 같은 로그 10줄 (INFO 2줄 + log_step DEBUG 4쌍)
+- 동기 핸들러(콘솔 + 파일) vs 큐 로깅(--log-queue), 크기 기준 교체(--log-rotate) 여부
+- 처리 루프 시간(호출 스레드 부담)과 전체 시간(stop_logger로 큐를 비울 때까지)
+
+실행:
+    python -m benchmarks.bench_logging --docs 5000
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.config import Constants
+from src.logger import log_step, setup_logger, stop_logger
+
+NAME = "ocr_pipeline_bench"
+
+
+def _log_document(logger: logging.Logger, i: int) -> None:
+    """process_single_file의 문서당 로그 흉내"""
+    logger.info(f"파일 처리 시작: doc_{i:06d}.json")
+    with log_step(logger, f"doc_{i:06d}.json 파이프라인", logging.DEBUG):
+        pass
+    with log_step(logger, "전처리 산출물 생성", logging.DEBUG):
+        pass
+    with log_step(logger, "최종 파싱 결과 생성", logging.DEBUG):
+        pass
+    with log_step(logger, "산출물 저장", logging.DEBUG):
+        pass
+    logger.info(f"✓ doc_{i:06d}.json: 검증 통과")
+
+
+def bench(log_dir: Path, docs: int, queued: bool, max_bytes: int) -> None:
+    with open(os.devnull, "w", encoding="utf-8") as console:
+        logger = setup_logger(NAME, log_dir=log_dir, console_stream=console, queued=queued, max_bytes=max_bytes)
+
+        start = time.perf_counter()
+        for i in range(docs):
+            _log_document(logger, i)
+        loop = time.perf_counter() - start
+
+        stop_logger(NAME)
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers.clear()
+        total = time.perf_counter() - start
+
+    mode = "queue" if queued else "sync"
+    rotate = f"rotate={max_bytes // 1024}KB" if max_bytes else "rotate=off"
+    files = len(list(log_dir.iterdir()))
+    print(
+        f"{mode:5s} {rotate:14s} loop {loop / docs * 1e6:7.1f} us/doc   "
+        f"total {total / docs * 1e6:7.1f} us/doc   log files {files}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로그 오버헤드 벤치마크")
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--max-bytes", type=int, default=Constants.LOG_MAX_BYTES // 16, help="교체 크기 (바이트)")
+    args = parser.parse_args()
+
+    print(f"docs={args.docs} (문서당 로그 10줄, 콘솔 INFO → /dev/null, 파일 DEBUG)")
+    for queued in (False, True):
+        for max_bytes in (0, args.max_bytes):
+            with tempfile.TemporaryDirectory() as tmp:
+                bench(Path(tmp), args.docs, queued, max_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+핫 함수 마이크로 벤치마크 + 기준값 회귀 검사 (timeit)
+- 대상: 전처리 규칙 11개, extract_by_label, extract_by_pattern, _dedupe_candidates, resolve_candidates,
+  normalize_weight_kg / normalize_time / normalize_date, validate_and_recover, _try_recover_by_candidates
+- 입력: data/raw 샘플 4개 + 합성 계근지(시드 고정)를 파이프라인 순서대로 통과시킨 실제 중간값
+- 기준값: benchmarks/baselines/micro.json (함수별 us/call + 기준 작업 대비 배율, 입력 구성 / 정규식 백엔드가 같아야 비교)
+- 함수와 기준 작업(reference)을 번갈아 측정한 배율의 중앙값으로 비교
+  (기계 간 속도 차이와 측정 중 부하 변동을 상쇄)
+- 임계값을 넘은 함수는 한 번 더 측정해 둘 다 넘을 때만 회귀로 판정
+
+실행:
+    python -m benchmarks.bench_micro                      # 측정 + 기준값 대비 표
+    python -m benchmarks.bench_micro --check              # 회귀가 있으면 종료 코드 1
+    python -m benchmarks.bench_micro --update             # 기준값 갱신 (의도한 변경 후)
+    python -m benchmarks.bench_micro --check --threshold 0.5 --only preprocess.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import statistics
+import sys
+import timeit
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src import main as pipeline_main
+from src.config import PreprocessRules
+from src.extractor import _dedupe_candidates, extract_by_label, extract_by_pattern
+from src.loader import load_ocr_json
+from src.normalizers import normalize_date, normalize_time, normalize_weight_kg
+from src.pipeline import normalize_resolved_fields
+from src.regex_backend import ACTIVE_BACKEND
+from src.preprocessor import (
+    normalize_character_visual_noise,
+    normalize_coordinates,
+    normalize_date_suffix,
+    normalize_datetime_trailing_garbage,
+    normalize_korean_time_format,
+    normalize_label_variants,
+    normalize_line_noise,
+    normalize_number_grouping_before_unit,
+    normalize_punctuation_spacing,
+    normalize_vehicle_value_noise,
+    normalize_whitespace,
+)
+from src.resolver import resolve_candidates
+from src.validators import _try_recover_by_candidates, validate_and_recover
+
+from .synthetic import TicketGenerator
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "micro.json"
+DEFAULT_THRESHOLD = 0.25
+
+# 입력 구성 (기준값과 같아야 비교 가능)
+SYNTHETIC_DOCS = 40
+SYNTHETIC_SEED = 7
+
+# 전처리 규칙 (preprocess() 적용 순서)
+PREPROCESS_RULES: List[Tuple[str, Callable[[str], Any]]] = [
+    (PreprocessRules.COLLAPSED_WHITESPACE, normalize_whitespace),
+    (PreprocessRules.NORMALIZED_PUNCTUATION_SPACING, normalize_punctuation_spacing),
+    (PreprocessRules.NORMALIZED_CHARACTER_VISUAL_NOISE, normalize_character_visual_noise),
+    (PreprocessRules.STANDARDIZED_LABELS, normalize_label_variants),
+    (PreprocessRules.CONVERTED_KOREAN_TIME, normalize_korean_time_format),
+    (PreprocessRules.MERGED_SPLIT_NUMBERS, normalize_number_grouping_before_unit),
+    (PreprocessRules.SPLIT_DATE_SUFFIX, normalize_date_suffix),
+    (PreprocessRules.PRESERVED_AMBIGUOUS_TAIL, normalize_datetime_trailing_garbage),
+    (PreprocessRules.SPLIT_VEHICLE_TAIL_KEYWORD, normalize_vehicle_value_noise),
+    (PreprocessRules.NORMALIZED_COORDINATES, normalize_coordinates),
+    (PreprocessRules.REMOVED_SYMBOL_LINES, normalize_line_noise),
+]
+
+# 기준 작업: 정규식 치환 + 문자열 / dict / 정렬 (파이프라인 함수들과 비슷한 구성)
+_REFERENCE_TEXT = "계량일자: 2026-02-02 05:37:55 \n실 중 량: 5 010 kg \n" * 10
+_REFERENCE_PATTERN = re.compile(r"(\d{1,3})\s+(\d{3})\s*kg")
+
+
+def reference_workload() -> List[Tuple[int, List[str]]]:
+    table: Dict[int, List[str]] = {}
+    for i, line in enumerate(_REFERENCE_TEXT.splitlines()):
+        table[i] = _REFERENCE_PATTERN.sub(r"\1,\2 kg", line.strip()).split()
+    return sorted(table.items(), key=lambda kv: -len(kv[1]))
+
+
+@dataclass
+class MicroCase:
+    """측정 대상 함수 + 입력 한 벌 (run() 1회 = 입력 전체 1회 호출)"""
+    name: str
+    calls: List[Callable[[], Any]]
+
+    def run(self) -> None:
+        for call in self.calls:
+            call()
+
+
+def _texts() -> List[str]:
+    texts = [
+        load_ocr_json(str(pipeline_main.RAW_DIR / name)).raw_text
+        for name in pipeline_main.TARGET_FILES
+    ]
+    generator = TicketGenerator(seed=SYNTHETIC_SEED, words=False)
+    texts.extend(generator.text(i)["text"] for i in range(SYNTHETIC_DOCS))
+    return texts
+
+
+def build_cases() -> List[MicroCase]:
+    """파이프라인 순서대로 중간값을 만들어 함수별 입력으로 사용"""
+    cases: List[MicroCase] = []
+
+    # 전처리: 규칙마다 직전 규칙까지 적용된 텍스트
+    texts = _texts()
+    for rule_name, fn in PREPROCESS_RULES:
+        cases.append(MicroCase("preprocess." + rule_name, [partial(fn, t) for t in texts]))
+        texts = [fn(t).text for t in texts]
+    normalized = texts
+
+    # 추출 / 중복 제거 / 선택
+    label_results = [extract_by_label(t, True)[0] for t in normalized]
+    pattern_results = [extract_by_pattern(t, True) for t in normalized]
+    merged = [a + b for a, b in zip(label_results, pattern_results)]
+    deduped = [_dedupe_candidates(c) for c in merged]
+    resolved = [resolve_candidates(c, with_evidence=True) for c in deduped]
+
+    cases.append(MicroCase("extract_by_label", [partial(extract_by_label, t, True) for t in normalized]))
+    cases.append(MicroCase("extract_by_pattern", [partial(extract_by_pattern, t, True) for t in normalized]))
+    cases.append(MicroCase("_dedupe_candidates", [partial(_dedupe_candidates, c) for c in merged]))
+    cases.append(MicroCase("resolve_candidates", [partial(resolve_candidates, c, True) for c in deduped]))
+
+    # 정규화: 선택된 값 + 중량 후보 원문
+    weights, times, dates = [], [], []
+    for r in resolved:
+        weights.extend(w for w in (r.gross_weight_raw, r.tare_weight_raw, r.net_weight_raw) if w)
+        weights.extend(
+            item["value_raw"]
+            for item in r.evidence.get("weight_kg_candidates", {}).get("candidates", [])
+            if item.get("value_raw")
+        )
+        if r.time_raw:
+            times.append(r.time_raw)
+        if r.date_raw:
+            dates.append(r.date_raw)
+    cases.append(MicroCase("normalize_weight_kg", [partial(normalize_weight_kg, w) for w in weights]))
+    cases.append(MicroCase("normalize_time", [partial(normalize_time, t) for t in times]))
+    cases.append(MicroCase("normalize_date", [partial(normalize_date, d) for d in dates]))
+
+    # 검증 / 복구: 정규화된 값 + 중량 하나를 비운 변형 (복구 경로)
+    validate_calls, recover_calls = [], []
+    for r in resolved:
+        result = normalize_resolved_fields(r)
+        cands = [
+            n for n in (
+                normalize_weight_kg(item["value_raw"])
+                for item in r.evidence.get("weight_kg_candidates", {}).get("candidates", [])
+                if item.get("value_raw")
+            )
+            if n is not None
+        ]
+        g, t, n = result.gross_weight_kg, result.tare_weight_kg, result.net_weight_kg
+        for weights_in in [(g, t, n), (g, t, None), (g, None, n), (None, t, n)]:
+            validate_calls.append(partial(
+                validate_and_recover, result.date, result.time, result.vehicle_no, *weights_in, cands
+            ))
+            recover_calls.append(partial(_try_recover_by_candidates, *weights_in, cands))
+    cases.append(MicroCase("validate_and_recover", validate_calls))
+    cases.append(MicroCase("_try_recover_by_candidates", recover_calls))
+
+    return cases
+
+
+def _number(timer: timeit.Timer, min_time: float) -> int:
+    """1회 측정이 min_time을 넘는 반복 횟수"""
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return number
+
+
+def measure_case(case: MicroCase, repeat: int = 9, min_time: float = 0.02) -> Tuple[float, float]:
+    """
+    (호출 1회당 us, 기준 작업 대비 배율)
+    함수와 기준 작업을 번갈아 repeat회 측정해 각각 중앙값을 사용
+    """
+    timer, reference = timeit.Timer(case.run), timeit.Timer(reference_workload)
+    number, ref_number = _number(timer, min_time), _number(reference, min_time)
+    times, ratios = [], []
+    for _ in range(repeat):
+        ref = reference.timeit(ref_number) / ref_number
+        t = timer.timeit(number) / number / len(case.calls)
+        times.append(t)
+        ratios.append(t / ref)
+    return statistics.median(times) * 1e6, statistics.median(ratios)
+
+
+def compare(
+    results: Dict[str, Tuple[float, float]],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    함수별 기준값 대비 변화율 (기준 작업 대비 배율끼리 비교)
+    status: ok / regressed / improved / new
+    """
+    rows = []
+    for name, (us, relative) in results.items():
+        base = baseline["functions"].get(name)
+        row: Dict[str, Any] = {
+            "name": name, "us": us, "baseline_us": base["us"] if base else None,
+            "change": None, "status": "new",
+        }
+        if base:
+            change = relative / base["relative"] - 1
+            row["change"] = change
+            if change > threshold:
+                row["status"] = "regressed"
+            elif change < -threshold:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _inputs() -> Dict[str, Any]:
+    """입력 구성 + 정규식 백엔드 (기준값과 같아야 비교 가능)"""
+    return {
+        "samples": len(pipeline_main.TARGET_FILES),
+        "synthetic": SYNTHETIC_DOCS,
+        "seed": SYNTHETIC_SEED,
+        "regex_backend": ACTIVE_BACKEND,
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_baseline(results: Dict[str, Tuple[float, float]], path: Path = BASELINE_PATH) -> None:
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "inputs": _inputs(),
+        "functions": {
+            name: {"us": round(us, 3), "relative": round(relative, 6)}
+            for name, (us, relative) in results.items()
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def run(
+    only: Optional[str] = None,
+    repeat: int = 9,
+    min_time: float = 0.02,
+    baseline: Optional[Dict[str, Any]] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[Dict[str, Tuple[float, float]], List[Dict[str, Any]]]:
+    """측정 → (함수별 (us, 배율), 비교 행). 기준값이 있으면 회귀 의심 함수는 다시 측정"""
+    cases = [c for c in build_cases() if only is None or c.name.startswith(only)]
+    results = {case.name: measure_case(case, repeat, min_time) for case in cases}
+    if baseline is None:
+        return results, []
+
+    rows = compare(results, baseline, threshold)
+    suspects = {row["name"] for row in rows if row["status"] == "regressed"}
+    if suspects:
+        # 일시적인 부하로 인한 오탐을 줄이기 위해 두 번째 측정의 작은 쪽 사용
+        for case in cases:
+            if case.name in suspects:
+                results[case.name] = min(results[case.name], measure_case(case, repeat, min_time), key=lambda r: r[1])
+        rows = compare(results, baseline, threshold)
+    return results, rows
+
+
+def format_rows(rows: List[Dict[str, Any]]) -> str:
+    width = max(len(row["name"]) for row in rows)
+    lines = [f"{'function':{width}s} {'us/call':>10s} {'baseline':>10s} {'change':>8s}  status"]
+    for row in rows:
+        base = f"{row['baseline_us']:10.2f}" if row["baseline_us"] else f"{'-':>10s}"
+        change = f"{row['change']:+8.1%}" if row["change"] is not None else f"{'-':>8s}"
+        lines.append(f"{row['name']:{width}s} {row['us']:10.2f} {base} {change}  {row['status']}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="핫 함수 마이크로 벤치마크 + 기준값 회귀 검사")
+    parser.add_argument("--check", action="store_true", help="기준값 대비 임계값 넘게 느려진 함수가 있으면 종료 코드 1")
+    parser.add_argument("--update", action="store_true", help=f"측정값으로 기준값 파일 갱신 ({BASELINE_PATH.name})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"회귀 판정 변화율 (기본: {DEFAULT_THRESHOLD}, 0.25 = 25%% 느려짐)")
+    parser.add_argument("--only", default=None, metavar="PREFIX", help="이름이 PREFIX로 시작하는 함수만")
+    parser.add_argument("--repeat", type=int, default=9, help="함수 / 기준 작업 번갈아 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--min-time", type=float, default=0.02, help="측정 1회 최소 시간 (초)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    if args.update and args.only:
+        parser.error("--update는 전체 함수를 측정해야 합니다 (--only와 함께 사용 불가)")
+
+    baseline = None if args.update else load_baseline(args.baseline)
+    if args.check and baseline is None:
+        parser.error(f"기준값 파일이 없습니다: {args.baseline} (--update로 생성)")
+    inputs = _inputs()
+    if baseline is not None and baseline.get("inputs") != inputs:
+        parser.error(f"기준값의 입력 구성이 다릅니다: {baseline.get('inputs')} != {inputs} (--update로 다시 생성)")
+
+    results, rows = run(args.only, args.repeat, args.min_time, baseline, args.threshold)
+
+    if args.update:
+        write_baseline(results, args.baseline)
+        print(f"기준값 갱신: {args.baseline} ({len(results)}개 함수)")
+        return
+
+    if not rows:
+        rows = [
+            {"name": name, "us": us, "baseline_us": None, "change": None, "status": "new"}
+            for name, (us, _) in results.items()
+        ]
+    print(format_rows(rows))
+
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\n회귀 {len(regressed)}개 (임계값 +{args.threshold:.0%}): {', '.join(regressed)}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
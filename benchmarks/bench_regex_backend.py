@@ -0,0 +1,134 @@
+"""
+정규식 백엔드 비교 벤치마크 (re / regex, src/regex_backend.py)
+- 패턴별: REGISTRY의 모든 정규식을 두 백엔드로 컴파일해 같은 코퍼스에 finditer
+  (코퍼스: 합성 계근지 원문 + 전처리 규칙마다의 중간 텍스트 = 각 패턴이 실제로 보는 입력)
+- 문서 경로: 백엔드마다 새 프로세스(spawn, OCR_REGEX_BACKEND 지정)에서 run_document_pipeline docs/sec
+- 최악 입력: 종결자 없는 긴 숫자 / 공백 / O·l·I 줄에서 preprocess KB당 시간
+- regex 패키지가 없으면 re만 측정
+
+실행:
+    python -m benchmarks.bench_regex_backend
+    python -m benchmarks.bench_regex_backend --docs 2000 --top 10
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from src.regex_backend import BACKEND_ENV, REGISTRY, available_backends
+
+from .bench_micro import PREPROCESS_RULES
+from .synthetic import TicketGenerator, document_name
+
+# 최악 입력 (각 32KB)
+ADVERSARIAL = {
+    "digit_space": ("1 " * 16384),
+    "visual_noise": ("O o l I 0 " * 3277)[:32768],
+    "colon_space": (" : " * 10923)[:32768],
+}
+
+
+def corpus(docs: int, seed: int = 42) -> List[str]:
+    """원문 + 전처리 규칙별 중간 텍스트 (전처리 / 추출 / 정규화 정규식이 보는 입력)"""
+    generator = TicketGenerator(seed=seed, words=False)
+    texts = [generator.text(i)["text"] for i in range(docs)]
+    stages = list(texts)
+    for _, fn in PREPROCESS_RULES:
+        texts = [fn(t).text for t in texts]
+        stages.extend(texts)
+    lines = [line for text in texts for line in text.splitlines() if line]
+    return stages + lines
+
+
+def bench_patterns(texts: List[str], backends: List[str], repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """패턴별 코퍼스 전체 finditer 시간 (ms, repeat회 중 최솟값)"""
+    results: Dict[str, Dict[str, float]] = {}
+    for name in sorted(REGISTRY):
+        results[name] = {}
+        for backend in backends:
+            pattern = REGISTRY[name].compile(backend)
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for text in texts:
+                    for _ in pattern.finditer(text):
+                        pass
+                best = min(best, time.perf_counter() - start)
+            results[name][backend] = best * 1000
+    return results
+
+
+def bench_documents(docs: int, seed: int) -> Dict[str, Any]:
+    """현재 프로세스의 백엔드로 run_document_pipeline 처리량 + 최악 입력 preprocess 시간"""
+    from src.loader import parse_ocr_record
+    from src.pipeline import run_document_pipeline
+    from src.preprocessor import preprocess
+    from src.regex_backend import ACTIVE_BACKEND
+
+    generator = TicketGenerator(seed=seed, words=False)
+    raw_docs = [parse_ocr_record(generator.document(i), document_name(i)) for i in range(docs)]
+    start = time.perf_counter()
+    for raw_doc in raw_docs:
+        run_document_pipeline(raw_doc, with_evidence=True)
+    elapsed = time.perf_counter() - start
+
+    adversarial = {}
+    for name, text in ADVERSARIAL.items():
+        start = time.perf_counter()
+        preprocess(text)
+        adversarial[name] = (time.perf_counter() - start) * 1000 / (len(text) / 1024)
+    return {"backend": ACTIVE_BACKEND, "docs_per_sec": docs / elapsed, "adversarial_ms_per_kb": adversarial}
+
+
+def _isolated(backend: str, **kwargs) -> Dict[str, Any]:
+    """OCR_REGEX_BACKEND를 지정한 새 프로세스에서 실행 (패턴은 import 시점에 컴파일되므로)"""
+    previous = os.environ.get(BACKEND_ENV)
+    os.environ[BACKEND_ENV] = backend
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return pool.submit(bench_documents, **kwargs).result()
+    finally:
+        if previous is None:
+            os.environ.pop(BACKEND_ENV, None)
+        else:
+            os.environ[BACKEND_ENV] = previous
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="정규식 백엔드 비교 (re / regex)")
+    parser.add_argument("--docs", type=int, default=1000, help="문서 경로 구간 문서 수")
+    parser.add_argument("--pattern-docs", type=int, default=200, help="패턴별 구간 코퍼스 문서 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--top", type=int, default=0, help="패턴별 표에서 re 기준 느린 순 N개만 (0=전체)")
+    args = parser.parse_args()
+
+    backends = available_backends()
+    if len(backends) == 1:
+        print("regex 패키지가 없어 re만 측정합니다 (pip install regex)")
+
+    texts = corpus(args.pattern_docs, args.seed)
+    print(f"패턴별 finditer (코퍼스 {len(texts)}개 텍스트, {sum(map(len, texts)) / 1e6:.1f}M 글자, ms)")
+    rows = sorted(bench_patterns(texts, backends).items(), key=lambda item: -item[1][backends[0]])
+    if args.top:
+        rows = rows[:args.top]
+    width = max(len(name) for name, _ in rows)
+    print(f"  {'pattern':{width}s} " + " ".join(f"{b:>9s}" for b in backends) + ("    ratio" if len(backends) > 1 else ""))
+    for name, times in rows:
+        line = f"  {name:{width}s} " + " ".join(f"{times[b]:9.2f}" for b in backends)
+        if len(backends) > 1:
+            line += f"  {times[backends[1]] / times[backends[0]]:6.2f}x"
+        print(line)
+
+    print(f"\nrun_document_pipeline (docs={args.docs})")
+    for backend in backends:
+        result = _isolated(backend, docs=args.docs, seed=args.seed)
+        worst = ", ".join(f"{name} {ms:.2f}" for name, ms in result["adversarial_ms_per_kb"].items())
+        print(f"  {result['backend']:6s} {result['docs_per_sec']:8.1f} docs/sec   최악 입력 preprocess ms/KB: {worst}")
+
+
+if __name__ == "__main__":
+    main()
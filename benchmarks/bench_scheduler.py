@@ -0,0 +1,90 @@
+"""
+배치 병렬 스케줄러 벤치마크 (src/scheduler.py)
+- 입력: 합성 계근지 N건 + 다중 페이지 대형 스캔본 K건 (이름순으로 맨 뒤 = 입력 순서 배분의 최악)
+- 배분 순서별(input / lpt) main 배치 경로(--input-dir --workers W) 경과 시간, 워커 가동률
+- 직렬(--workers 1) 기준 대비 속도 향상
+
+실행:
+    python -m benchmarks.bench_scheduler
+    python -m benchmarks.bench_scheduler --docs 2000 --large 6 --pages 300 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from .synthetic import TicketGenerator, write_directory
+
+
+def write_large_documents(out_dir: Path, count: int, pages: int, generator: TicketGenerator, start: int) -> List[Path]:
+    """페이지 pages장짜리 문서 count건 (페이지 = 합성 계근지 1건, 이름순으로 맨 뒤)"""
+    paths = []
+    for n in range(count):
+        docs = [generator.document(start + n * pages + p) for p in range(pages)]
+        merged = dict(docs[0])
+        merged["pages"] = [dict(page, id=p) for p, doc in enumerate(docs) for page in doc["pages"]]
+        merged["text"] = "\n".join(doc["text"] for doc in docs)
+        merged["numBilledPages"] = pages
+        path = out_dir / f"zz_large_{n:04d}.json"
+        path.write_text(json.dumps(merged, ensure_ascii=False), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def run_main(input_dir: Path, out_dir: Path, main_args: List[str]) -> float:
+    """main() 배치 경로 1회 경과 시간 (출력은 out_dir, 콘솔 출력은 버림)"""
+    from src import main as pipeline_main
+
+    pipeline_main.PROCESSED_DIR = out_dir / "processed"
+    pipeline_main.LOG_DIR = out_dir / "logs"
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            start = time.perf_counter()
+            pipeline_main.main(["--input-dir", str(input_dir), "--verbosity", "minimal"] + main_args)
+            return time.perf_counter() - start
+
+
+def utilization(log_dir: Path) -> str:
+    """실행 로그의 워커 가동률"""
+    for line in next(log_dir.glob("pipeline_*.log")).read_text(encoding="utf-8").splitlines():
+        if "워커 가동률" in line:
+            return line.rsplit("워커 가동률", 1)[1].strip()
+    return "-"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="배치 병렬 스케줄러 (input / lpt 배분 순서) 비교")
+    parser.add_argument("--docs", type=int, default=1000, help="일반 문서 수")
+    parser.add_argument("--large", type=int, default=4, help="대형 다중 페이지 문서 수")
+    parser.add_argument("--pages", type=int, default=200, help="대형 문서 페이지 수")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        raw = tmp / "raw"
+        generator = TicketGenerator(seed=args.seed, words=False)
+        write_directory(raw, args.docs, generator)
+        write_large_documents(raw, args.large, args.pages, generator, start=args.docs)
+        total_mb = sum(p.stat().st_size for p in raw.iterdir()) / 1e6
+        print(f"입력: 일반 {args.docs}건 + 대형 {args.large}건 x {args.pages}페이지 ({total_mb:.1f} MB)")
+
+        serial = run_main(raw, tmp / "serial", [])
+        print(f"  직렬               : {serial:7.2f}초")
+        for schedule in ("input", "lpt"):
+            elapsed = run_main(raw, tmp / schedule, ["--workers", str(args.workers), "--schedule", schedule])
+            print(
+                f"  workers={args.workers} {schedule:6s}: {elapsed:7.2f}초 "
+                f"(x{serial / elapsed:.2f}, 워커 가동률 {utilization(tmp / schedule / 'logs')})"
+            )
+
+
+if __name__ == "__main__":
+    main()
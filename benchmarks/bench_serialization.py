@@ -0,0 +1,76 @@
+"""
+문서당 직렬화 비용 벤치마크
+- dict 변환: dataclasses.asdict (재귀 deepcopy) vs 클래스별 to_dict (얕은 변환)
+- JSON 직렬화: 들여쓰기(indent=2) vs compact
+- 대상: data/raw 샘플의 PreprocessedDocument / ExtractedCandidates / ResolvedFields / ParseResult
+
+실행:
+    python -m benchmarks.bench_serialization --number 2000
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from dataclasses import asdict
+
+from src import main as pipeline_main
+from src.artifacts import dumps_json
+from src.pipeline import run_full_pipeline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="문서당 직렬화 비용 벤치마크")
+    parser.add_argument("--number", type=int, default=1000, help="측정 반복 횟수 (샘플 전체 1회 = 1)")
+    args = parser.parse_args()
+
+    docs = [
+        run_full_pipeline(str(pipeline_main.RAW_DIR / name))
+        for name in pipeline_main.TARGET_FILES
+    ]
+    n_docs = len(docs)
+
+    def convert_asdict():
+        return [[asdict(obj) for obj in doc] for doc in docs]
+
+    def convert_to_dict():
+        return [[obj.to_dict() for obj in doc] for doc in docs]
+
+    assert convert_asdict() == convert_to_dict()
+    dicts = convert_to_dict()
+
+    def dumps_indent():
+        for doc in dicts:
+            for d in doc:
+                dumps_json(d)
+
+    def dumps_compact():
+        for doc in dicts:
+            for d in doc:
+                dumps_json(d, compact=True)
+
+    def per_doc_us(func) -> float:
+        best = min(timeit.repeat(func, number=args.number, repeat=3))
+        return best / (args.number * n_docs) * 1e6
+
+    results = [
+        ("asdict", per_doc_us(convert_asdict)),
+        ("to_dict", per_doc_us(convert_to_dict)),
+        ("json indent=2", per_doc_us(dumps_indent)),
+        ("json compact", per_doc_us(dumps_compact)),
+    ]
+
+    size_indent = sum(len(dumps_json(d).encode("utf-8")) for doc in dicts for d in doc) / n_docs
+    size_compact = sum(len(dumps_json(d, compact=True).encode("utf-8")) for doc in dicts for d in doc) / n_docs
+
+    print(f"docs={n_docs} number={args.number}")
+    for name, us in results:
+        print(f"  {name:14s}: {us:8.1f} us/doc")
+    print(f"  크기: indent {size_indent:,.0f} B/doc, compact {size_compact:,.0f} B/doc")
+    print(
+        f"  변환+직렬화 합계: asdict+indent {results[0][1] + results[2][1]:.1f} us/doc → "
+        f"to_dict+compact {results[1][1] + results[3][1]:.1f} us/doc"
+    )
+
+
+if __name__ == "__main__":
+    main()
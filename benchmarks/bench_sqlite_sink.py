@@ -0,0 +1,117 @@
+"""
+SQLite 결과 저장소 벤치마크
+- 삽입 속도 (rows/sec, 배치 크기별)
+- 점 조회 (vehicle_no 일치) / 범위 조회 (date 구간) 지연 시간
+
+실행:
+    python -m benchmarks.bench_sqlite_sink --rows 200000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+from src.schemas import ParsedOutputSchema
+from src.sqlite_sink import SQLiteResultSink, connect, query_results, count_results
+
+
+def make_rows(n: int, seed: int = 42) -> List[ParsedOutputSchema]:
+    """합성 파싱 결과 생성 (차량 2,000대 / 날짜 365일)"""
+    rng = random.Random(seed)
+    vehicles = [f"{rng.randint(10, 99)}가{rng.randint(1000, 9999)}" for _ in range(2000)]
+    start = date(2025, 1, 1)
+
+    rows: List[ParsedOutputSchema] = []
+    for i in range(n):
+        gross = rng.randint(8000, 40000)
+        tare = rng.randint(5000, gross)
+        is_valid = rng.random() > 0.1
+        rows.append({
+            "source": f"doc_{i:08d}.json",
+            "date": (start + timedelta(days=rng.randint(0, 364))).isoformat(),
+            "time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+            "vehicle_no": rng.choice(vehicles),
+            "gross_weight_kg": gross,
+            "tare_weight_kg": tare,
+            "net_weight_kg": gross - tare,
+            "parse_warnings": ["unassigned_weight_candidates_present"] if rng.random() < 0.5 else [],
+            "validation_errors": [] if is_valid else ["missing_required_field:date"],
+            "imputation_notes": [],
+            "is_valid": is_valid,
+        })
+    return rows
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def bench_insert(rows: List[ParsedOutputSchema], db_path: Path, batch_size: int) -> float:
+    start = time.perf_counter()
+    with SQLiteResultSink(db_path, batch_size=batch_size) as sink:
+        for row in rows:
+            sink.write(row)
+    return time.perf_counter() - start
+
+
+def bench_queries(db_path: Path, rows: List[ParsedOutputSchema], repeat: int) -> None:
+    rng = random.Random(7)
+    conn = connect(db_path)
+
+    point_ms: List[float] = []
+    for _ in range(repeat):
+        vehicle = rng.choice(rows)["vehicle_no"]
+        start = time.perf_counter()
+        query_results(conn, vehicle_no=vehicle, limit=None)
+        point_ms.append((time.perf_counter() - start) * 1000)
+
+    range_ms: List[float] = []
+    for _ in range(repeat):
+        d0 = date(2025, 1, 1) + timedelta(days=rng.randint(0, 357))
+        start = time.perf_counter()
+        count_results(conn, date_from=d0.isoformat(), date_to=(d0 + timedelta(days=7)).isoformat(), is_valid=False)
+        range_ms.append((time.perf_counter() - start) * 1000)
+
+    conn.close()
+
+    for name, values in [("점 조회 (vehicle_no)", point_ms), ("범위 조회 (date 7일 + is_valid)", range_ms)]:
+        print(
+            f"  {name:32s} p50={statistics.median(values):7.3f}ms "
+            f"p95={_percentile(values, 0.95):7.3f}ms max={max(values):7.3f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite 결과 저장소 벤치마크")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=200, help="조회 반복 횟수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"rows={args.rows}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        last_db = None
+        for batch_size in args.batch_sizes:
+            # batch_size=1은 트랜잭션당 1건 → 비교용으로 일부만 측정
+            n = min(len(rows), 5000) if batch_size == 1 else len(rows)
+            db_path = Path(tmpdir) / f"bench_{batch_size}.sqlite"
+            elapsed = bench_insert(rows[:n], db_path, batch_size)
+            print(f"  삽입 batch_size={batch_size:5d}: {n / elapsed:10.0f} rows/sec ({n}건, {elapsed:.2f}초)")
+            if n == len(rows):
+                last_db = db_path
+
+        if last_db is not None:
+            bench_queries(last_db, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
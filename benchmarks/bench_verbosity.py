@@ -0,0 +1,58 @@
+"""
+산출물 상세 수준별 처리량 벤치마크
+- data/raw 샘플을 반복 처리하며 minimal / standard / debug의 docs/sec 비교
+- 파이프라인 + 산출물 생성 + 파일 기록(임시 디렉토리, files 레이아웃) 포함
+
+실행:
+    python -m benchmarks.bench_verbosity --rounds 200
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from src import main as pipeline_main
+from src.artifacts import create_artifact_store
+from src.output_formatters import FileNamingConvention
+
+
+def bench(inputs, rounds: int, verbosity: str) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pipeline_main.artifact_store = create_artifact_store(
+            FileNamingConvention.LAYOUT_FILES, Path(tmpdir), verbosity=verbosity
+        )
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for path in inputs:
+                status, _, _, _ = pipeline_main.process_single_file(path)
+                assert status == "SUCCESS"
+        pipeline_main.artifact_store.close()
+        elapsed = time.perf_counter() - start
+        pipeline_main.artifact_store = None
+    return rounds * len(inputs) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="산출물 상세 수준별 처리량 벤치마크")
+    parser.add_argument("--rounds", type=int, default=100, help="샘플 전체 반복 횟수")
+    args = parser.parse_args()
+
+    # 로그 출력 비용은 제외
+    pipeline_main.logger = logging.getLogger("bench_verbosity")
+    pipeline_main.logger.disabled = True
+
+    inputs = [pipeline_main.RAW_DIR / name for name in pipeline_main.TARGET_FILES]
+    print(f"docs={args.rounds * len(inputs)}")
+
+    baseline = None
+    for verbosity in reversed(FileNamingConvention.VERBOSITY_LEVELS):
+        rate = bench(inputs, args.rounds, verbosity)
+        baseline = baseline or rate
+        print(f"  {verbosity:9s}: {rate:8.1f} docs/sec (debug 대비 x{rate / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+합성 계근지 OCR 문서 생성기 (시드 고정)
+- data/raw 샘플 4종의 양식을 본뜬 텍스트 + 단어 박스(words)
+- src/preprocessor.py가 다루는 OCR 잡음을 문서마다 확률적으로 섞음
+  (라벨 깨짐, 한글 시간, 천 단위 공백, 날짜 suffix, 날짜 꼬리, O/0 혼동, 좌표, 기호 줄, 차량번호 뒤 입고/출고)
+- 문서 i는 (seed, i)만으로 결정되므로 한 건씩 만들어 내보내면 수백만 건도 메모리 일정
+
+실행:
+    python -m benchmarks.synthetic --docs 1000000 --jsonl /tmp/tickets.jsonl
+    python -m benchmarks.synthetic --docs 10000 --out-dir /tmp/tickets
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# 잡음 종류 (전처리 규칙과 1:1)
+NOISE_SPLIT_LABEL = "split_label"            # standardized_labels
+NOISE_KOREAN_TIME = "korean_time"            # converted_korean_time_to_colon_format
+NOISE_SPLIT_THOUSANDS = "split_thousands"    # merged_split_numbers_before_kg
+NOISE_DATE_SUFFIX = "date_suffix"            # split_date_suffix_to_doc_seq
+NOISE_RAW_TAIL = "raw_tail"                  # preserved_ambiguous_date_tail_as_raw_tail
+NOISE_VISUAL = "visual_noise"                # normalized_character_visual_noise
+NOISE_COORDINATES = "coordinates"            # normalized_coordinates
+NOISE_SYMBOL_LINES = "symbol_lines"          # removed_symbol_only_lines
+NOISE_VEHICLE_TAIL = "vehicle_tail"          # split_vehicle_tail_keyword_as_category
+
+NOISE_TYPES = (
+    NOISE_SPLIT_LABEL,
+    NOISE_KOREAN_TIME,
+    NOISE_SPLIT_THOUSANDS,
+    NOISE_DATE_SUFFIX,
+    NOISE_RAW_TAIL,
+    NOISE_VISUAL,
+    NOISE_COORDINATES,
+    NOISE_SYMBOL_LINES,
+    NOISE_VEHICLE_TAIL,
+)
+
+LAYOUTS = ("certificate", "ticket", "confirmation", "statement")
+
+_COMPANIES = ["곰욕환경폐기물", "고요환경", "정우리사이클링(주)", "신성(푸디스트)", "대한자원", "한빛제지", "우성산업", "청솔환경"]
+_ITEMS = ["식물", "국판", "폐지", "고철", "골판지", "목재", "폐플라스틱", "음식물"]
+_ISSUERS = ["동우바이오(주)", "장원C&S", "정우리사이클링 (주)", "(주) 하 은 펄 프", "세림자원(주)"]
+_PLATE_HANGUL = "가나다라마거너더러머버서어저고노도로모보소오조구누두루무부수우주"
+_START_DATE = date(2024, 1, 1)
+
+
+def _spaced(label: str) -> str:
+    """'실중량' -> '실 중 량' (OCR이 글자 사이를 띄운 라벨)"""
+    return " ".join(label)
+
+
+def _visual(digits: str, rng: random.Random) -> str:
+    """숫자 0 하나를 O로 (없으면 그대로)"""
+    zeros = [i for i, ch in enumerate(digits) if ch == "0"]
+    if not zeros:
+        return digits
+    i = rng.choice(zeros)
+    return digits[:i] + "O" + digits[i + 1:]
+
+
+class TicketGenerator:
+    """
+    합성 계근지 생성기
+
+    noise: 잡음 종류별 적용 확률
+    words: 단어 박스 포함 여부 (실제 OCR 응답 크기 / JSON 로드 비용을 흉내냄)
+    """
+
+    def __init__(self, seed: int = 42, noise: float = 0.3, words: bool = True):
+        self.seed = seed
+        self.noise = noise
+        self.words = words
+
+    def _rng(self, index: int) -> random.Random:
+        return random.Random(self.seed * 1_000_003 + index)
+
+    def truth(self, rng: random.Random) -> Dict[str, Any]:
+        """문서의 실제 값"""
+        day = _START_DATE + timedelta(days=rng.randrange(730))
+        first = datetime(day.year, day.month, day.day, rng.randrange(6, 20), rng.randrange(60), rng.randrange(60))
+        second = first + timedelta(minutes=rng.randrange(3, 40), seconds=rng.randrange(60))
+        printed = second + timedelta(minutes=rng.randrange(1, 20), seconds=rng.randrange(60))
+        gross = rng.randrange(800, 4000) * 10
+        tare = rng.randrange(500, gross // 10) * 10
+        if rng.random() < 0.6:
+            vehicle = f"{rng.randrange(10, 100)}{rng.choice(_PLATE_HANGUL)}{rng.randrange(1000, 10000)}"
+        else:
+            vehicle = f"{rng.randrange(1000, 10000)}"
+        return {
+            "date": day.isoformat(),
+            "first": first,
+            "second": second,
+            "printed": printed,
+            "vehicle_no": vehicle,
+            "gross_weight_kg": gross,
+            "tare_weight_kg": tare,
+            "net_weight_kg": gross - tare,
+        }
+
+    def text(self, index: int) -> Dict[str, Any]:
+        """문서 i의 OCR 텍스트, 실제 값, 적용된 잡음"""
+        rng = self._rng(index)
+        t = self.truth(rng)
+        noise = {n for n in NOISE_TYPES if rng.random() < self.noise}
+        layout = LAYOUTS[rng.randrange(len(LAYOUTS))]
+
+        def label(clean: str, split: str) -> str:
+            return split if NOISE_SPLIT_LABEL in noise else clean
+
+        def hm(moment: datetime) -> str:
+            if NOISE_KOREAN_TIME in noise:
+                return f"{moment.hour}시 {moment.minute}분"
+            return f"{moment:%H:%M}"
+
+        def kg(value: int) -> str:
+            digits = f"{value:,}"
+            if NOISE_SPLIT_THOUSANDS in noise:
+                digits = digits.replace(",", " ")
+            if NOISE_VISUAL in noise and value == t["gross_weight_kg"]:
+                digits = _visual(digits, rng)
+            return f"{digits} kg"
+
+        day = t["date"]
+        if NOISE_VISUAL in noise and "0" in day[5:]:
+            day = day[:5] + _visual(day[5:], rng)
+        date_value = day
+        if NOISE_DATE_SUFFIX in noise:
+            date_value = f"{day}-{rng.randrange(1, 100000):05d}"
+        elif NOISE_RAW_TAIL in noise:
+            date_value = f"{day} {rng.randrange(1, 10000):0{rng.randrange(1, 5)}d}"
+
+        vehicle = t["vehicle_no"]
+        if NOISE_VEHICLE_TAIL in noise:
+            vehicle = f"{vehicle} {rng.choice(['입고', '출고'])}"
+
+        gross, tare, net = kg(t["gross_weight_kg"]), kg(t["tare_weight_kg"]), kg(t["net_weight_kg"])
+        company, item, issuer = rng.choice(_COMPANIES), rng.choice(_ITEMS), rng.choice(_ISSUERS)
+        footer = f"{t['date']} {t['printed']:%H:%M:%S}"
+
+        if layout == "certificate":
+            lines = [
+                "계 량 증 명 서",
+                f"{label('계량일자', '계량 일자')}: {date_value}",
+                f"{label('차량번호', '차량 번호')}: {vehicle}",
+                f"거 래 처: {company}",
+                f"품 명: {item}",
+                f"{label('총중량', '총 중 량')}: {hm(t['first'])} {gross}",
+                f"{label('차중량', '차 중 량')}: {hm(t['second'])} {tare}",
+                f"{label('실중량', '실 중 량')}: {net}",
+                "* 위와 같이 계량하였음을 확인함.",
+                issuer,
+                footer,
+            ]
+        elif layout == "ticket":
+            lines = [
+                "* 계 량 표 *",
+                f"{label('날짜', '날 짜')}: {date_value}",
+                f"ID-NO : {rng.randrange(1, 1000000):06d}",
+                f"{label('차번호', '차 번호')}: {vehicle}",
+                f"상 호: {company}",
+                f"품 명: {item}",
+                f"구 분: {rng.choice(['입고', '출고'])}",
+                f"{label('총중량', '총 중 량')}: {hm(t['first'])} {gross}",
+                f"{label('차중량', '차 중 량')}: {hm(t['second'])} {tare}",
+                f"{label('실중량', '실 중 량')}: {net}",
+                issuer,
+                footer,
+            ]
+        elif layout == "confirmation":
+            lines = [
+                "** 계 량 확 인 서 **",
+                "(공급자 보관용)",
+                f"{label('계량일자', '계량 일자')}: {date_value}",
+                f"{label('차량번호', '차량 번호')}: {vehicle}",
+                f"회 사 명 : {company}",
+                f"제 품 명 : {item}",
+                f"{label('총중량', '총 중 량')} : {hm(t['first'])} {gross}",
+                f"{label('공차중량', '공차 중량')} : {hm(t['second'])} {tare}",
+                f"{label('실중량', '실 중 량')} : {net}",
+                issuer,
+                "경기도 화성시 팔탄면 노하길454번길 23",
+                f"Tel) 031-{rng.randrange(200, 1000)}-{rng.randrange(10000):04d}",
+                "* 상기와 같이 계량하였음을 증명합니다. *",
+                footer,
+            ]
+        else:
+            lines = [
+                "계 량 증 명 표",
+                issuer,
+                "경기도 화성시 팔탄면 포승향남로 2960-19",
+                f"TEL : (031){rng.randrange(200, 1000)}-{rng.randrange(10000):04d}",
+                f"{company} 귀하",
+                f"품 명 {item} 구 분 입고",
+                f"{label('차량No.', '차량 No.')} {vehicle}",
+                f"{label('일시', '일 시')} {date_value}",
+                f"계량횟수 {rng.randrange(1, 10000):04d}",
+                f"{label('총중량', '총 중 량')} {gross} ({hm(t['first'])})",
+                f"{label('공차중량', '공차 중량')} {tare} ({hm(t['second'])})",
+                f"{label('실중량', '실 중 량')} {net} 감 량 0 kg",
+                "계량표는 상기와 같이 계량하였음을 증명함.",
+            ]
+
+        if NOISE_SYMBOL_LINES in noise:
+            for _ in range(rng.randrange(1, 3)):
+                lines.insert(rng.randrange(2, len(lines)), rng.choice(["·", ",", "· ·"]))
+        if NOISE_COORDINATES in noise:
+            lines.append(f"{rng.uniform(35.0, 38.0):.6f}, {rng.uniform(126.5, 129.0):.6f}")
+
+        return {
+            # 샘플처럼 줄 끝 공백 포함
+            "text": " \n".join(lines),
+            "layout": layout,
+            "noise": sorted(noise),
+            "truth": {
+                "date": t["date"],
+                "vehicle_no": t["vehicle_no"],
+                "gross_weight_kg": t["gross_weight_kg"],
+                "tare_weight_kg": t["tare_weight_kg"],
+                "net_weight_kg": t["net_weight_kg"],
+            },
+        }
+
+    def _words(self, text: str, rng: random.Random) -> List[Dict[str, Any]]:
+        words = []
+        for row, line in enumerate(text.split("\n")):
+            x = 140
+            y = 380 + row * 95
+            for token in line.split():
+                width = 24 * len(token) + 24
+                words.append({
+                    "boundingBox": {"vertices": [
+                        {"x": x, "y": y}, {"x": x + width, "y": y},
+                        {"x": x + width, "y": y + 90}, {"x": x, "y": y + 90},
+                    ]},
+                    "confidence": round(rng.uniform(0.85, 0.999), 4),
+                    "id": len(words),
+                    "text": token,
+                })
+                x += width + 28
+        return words
+
+    def document(self, index: int) -> Dict[str, Any]:
+        """문서 i의 OCR 응답 JSON (data/raw 샘플과 같은 최상위 키 + synthetic)"""
+        generated = self.text(index)
+        text = generated["text"]
+        confidence = round(self._rng(-index - 1).uniform(0.88, 0.99), 4)
+        page: Dict[str, Any] = {"confidence": confidence, "height": 1920, "id": 0, "text": text, "width": 1142}
+        if self.words:
+            page["words"] = self._words(text, self._rng(-index - 1))
+        return {
+            "apiVersion": "1.1",
+            "confidence": confidence,
+            "metadata": {"pages": [{"height": 1920, "page": 1, "width": 1142}]},
+            "mimeType": "multipart/form-data",
+            "modelVersion": "ocr-250904",
+            "numBilledPages": 1,
+            "pages": [page],
+            "stored": False,
+            "text": text,
+            "synthetic": {
+                "index": index,
+                "layout": generated["layout"],
+                "noise": generated["noise"],
+                "truth": generated["truth"],
+            },
+        }
+
+    def iter_documents(self, count: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+        for index in range(start, start + count):
+            yield self.document(index)
+
+
+def document_name(index: int) -> str:
+    return f"synthetic_{index:08d}.json"
+
+
+def write_directory(out_dir: Path, count: int, generator: Optional[TicketGenerator] = None, start: int = 0) -> List[Path]:
+    """문서 하나당 JSON 파일 하나 (배치 모드 --input-dir 입력)"""
+    generator = generator or TicketGenerator()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(start, start + count):
+        path = out_dir / document_name(index)
+        path.write_text(json.dumps(generator.document(index), ensure_ascii=False), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def write_jsonl(out: TextIO, count: int, generator: Optional[TicketGenerator] = None, start: int = 0) -> int:
+    """한 줄 = 문서 1건 (스트리밍 모드 --stdin 입력)"""
+    generator = generator or TicketGenerator()
+    for doc in generator.iter_documents(count, start):
+        out.write(json.dumps(doc, ensure_ascii=False))
+        out.write("\n")
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="합성 계근지 OCR 문서 생성")
+    parser.add_argument("--docs", type=int, default=10000, help="생성할 문서 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--noise", type=float, default=0.3, help="잡음 종류별 적용 확률 (0~1)")
+    parser.add_argument("--no-words", action="store_true", help="단어 박스 생략 (텍스트만)")
+    parser.add_argument("--start", type=int, default=0, help="첫 문서 번호 (나눠서 생성할 때)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--jsonl", type=Path, default=None, help="JSONL 파일로 기록 (기본: stdout)")
+    target.add_argument("--out-dir", type=Path, default=None, help="문서당 JSON 파일로 기록")
+    args = parser.parse_args()
+
+    generator = TicketGenerator(seed=args.seed, noise=args.noise, words=not args.no_words)
+    if args.out_dir:
+        write_directory(args.out_dir, args.docs, generator, args.start)
+        print(f"{args.docs}개 문서 생성: {args.out_dir}", file=sys.stderr)
+    elif args.jsonl:
+        with args.jsonl.open("w", encoding="utf-8") as f:
+            write_jsonl(f, args.docs, generator, args.start)
+        print(f"{args.docs}개 문서 생성: {args.jsonl}", file=sys.stderr)
+    else:
+        write_jsonl(sys.stdout, args.docs, generator, args.start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+산출물 저장소 (레이아웃별 문서 산출물 기록)
+- files: 문서당 단계별 파일 7개 (기존 방식)
+- bundle: 문서당 번들 JSON 1개
+- jsonl: 실행당 단계별 append-only JSONL + 문서별 레코드 위치 인덱스
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from .config import Constants
+from .file_writer import BackgroundFileWriter, atomic_write
+from .metrics import stage_timer
+from .output_formatters import FileNamingConvention, get_output_files
+
+
+# ============================================================================
+# 파일 I/O 함수
+# ============================================================================
+
+def write_text(path: Path, content: str) -> None:
+    """텍스트 파일 쓰기 (원자적 교체)"""
+    atomic_write(path, content)
+
+
+def write_json(path: Path, data: dict) -> None:
+    """JSON 파일 쓰기 (원자적 교체)"""
+    atomic_write(path, dumps_json(data))
+
+
+def dumps_json(data: Any, compact: bool = False) -> str:
+    """
+    산출물 JSON 직렬화
+    - 기본: 들여쓰기 포함 (사람이 읽는 용도)
+    - compact: 들여쓰기/구분자 공백 없음 (운영용, 크기·직렬화 시간 절감)
+    """
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, ensure_ascii=False, indent=Constants.JSON_INDENT)
+
+
+def make_run_id() -> str:
+    """실행 식별자: run_YYYYMMDD_HHMMSS"""
+    return datetime.now().strftime("run_%Y%m%d_%H%M%S")
+
+
+# ============================================================================
+# 산출물 저장소
+# ============================================================================
+
+class ArtifactStore(ABC):
+    """
+    문서 산출물 저장소 기본 클래스
+
+    artifacts 딕셔너리는 stages(기본: FileNamingConvention.STAGES 전체)를 키로 가진다.
+    - raw / normalized: str
+    - 나머지: JSON 직렬화 가능한 dict
+
+    파일 기록은 writer(BackgroundFileWriter)에 맡긴다. 지정하지 않으면
+    호출 스레드에서 바로 기록하는 기록기(threads=0)를 사용한다.
+    기록 실패는 write_document()가 아니라 flush() / close()에서 WriteFailedError로 나오고,
+    keys에 실패한 문서의 stem이 들어 있다.
+
+    shard(FileNamingConvention.SHARDS)에 따라 문서별 하위 디렉토리에 기록한다.
+    date 샤딩은 artifacts["parsed"]["date"]를 사용한다.
+
+    compact_json=True면 JSON 산출물을 들여쓰기 없이 기록한다.
+    """
+
+    layout: str = ""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        writer: Optional[BackgroundFileWriter] = None,
+        shard: str = FileNamingConvention.SHARD_FLAT,
+        stages: Optional[List[str]] = None,
+        compact_json: bool = False
+    ):
+        if shard not in FileNamingConvention.SHARDS:
+            raise ValueError(f"알 수 없는 샤딩 방식: {shard}")
+        self.output_dir = output_dir
+        self.writer = writer or BackgroundFileWriter(threads=0)
+        self.shard = shard
+        self.stages = list(stages) if stages is not None else list(FileNamingConvention.STAGES)
+        self.compact_json = compact_json
+        # 출력 디렉토리는 한 번만 생성
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    @abstractmethod
+    def write_document(self, stem: str, artifacts: Dict[str, Any]) -> None:
+        """문서 1건의 단계별 산출물 기록"""
+
+    def document_dir(self, stem: str, date: Optional[str] = None) -> Path:
+        """문서 산출물이 기록되는 디렉토리"""
+        sub = FileNamingConvention.shard_dir(stem, self.shard, date)
+        return self.output_dir / sub if sub else self.output_dir
+
+    def output_files(self, stem: str, date: Optional[str] = None) -> List[str]:
+        return get_output_files(
+            stem, layout=self.layout, shard=self.shard, date=date, stages=self.stages
+        )
+
+    def flush(self) -> None:
+        """지금까지 요청한 산출물을 모두 기록 (체크포인트 커밋 전)"""
+        self.writer.flush()
+
+    def close(self) -> None:
+        """대기 중인 기록 완료 후 기록기 종료"""
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class FileArtifactStore(ArtifactStore):
+    """문서당 단계별 파일 7개 (기존 레이아웃)"""
+
+    layout = FileNamingConvention.LAYOUT_FILES
+
+    def write_document(self, stem: str, artifacts: Dict[str, Any]) -> None:
+        directory = self.document_dir(stem, _document_date(artifacts))
+        with stage_timer("serialize"):
+            contents = []
+            for stage in self.stages:
+                content = artifacts[stage]
+                if not isinstance(content, str):
+                    content = dumps_json(content, compact=self.compact_json)
+                contents.append((directory / FileNamingConvention.for_stage(stage, stem), content))
+        with stage_timer("write"):
+            for path, content in contents:
+                self.writer.submit(path, content, key=stem)
+
+
+class BundleArtifactStore(ArtifactStore):
+    """문서당 번들 JSON 1개 (단계명 → 산출물)"""
+
+    layout = FileNamingConvention.LAYOUT_BUNDLE
+
+    def write_document(self, stem: str, artifacts: Dict[str, Any]) -> None:
+        bundle = {"source": f"{stem}.json"}
+        for stage in self.stages:
+            bundle[stage] = artifacts[stage]
+
+        path = self.document_dir(stem, _document_date(artifacts)) / FileNamingConvention.bundle(stem)
+        with stage_timer("serialize"):
+            content = dumps_json(bundle, compact=self.compact_json)
+        with stage_timer("write"):
+            self.writer.submit(path, content, key=stem)
+
+
+class JsonlArtifactStore(ArtifactStore):
+    """
+    실행당 단계별 append-only JSONL 7개 + 인덱스 1개
+
+    - 단계 파일 한 줄: {"stem": ..., "data": <산출물>}
+    - 인덱스 한 줄: {"stem": ..., "records": {stage: [byte_offset, byte_length]}}
+      → 인덱스만 읽고 seek으로 특정 문서 레코드를 바로 찾을 수 있다
+    - 오프셋 계산이 필요하므로 기록기를 거치지 않고 호출 스레드에서 append
+    - 실행당 파일 수가 고정이므로 샤딩하지 않는다
+    - 레코드는 항상 한 줄 JSON (compact_json과 무관)
+    """
+
+    layout = FileNamingConvention.LAYOUT_JSONL
+
+    def __init__(
+        self,
+        output_dir: Path,
+        run_id: Optional[str] = None,
+        writer: Optional[BackgroundFileWriter] = None,
+        stages: Optional[List[str]] = None
+    ):
+        super().__init__(output_dir, writer=writer, stages=stages)
+        self.run_id = run_id or make_run_id()
+        self._stage_files: Dict[str, BinaryIO] = {}
+        self._index_file: Optional[BinaryIO] = None
+
+    def _open(self) -> None:
+        for stage in self.stages:
+            path = self.output_dir / FileNamingConvention.stage_jsonl(self.run_id, stage)
+            self._stage_files[stage] = path.open("ab")
+        index_path = self.output_dir / FileNamingConvention.jsonl_index(self.run_id)
+        self._index_file = index_path.open("ab")
+
+    def write_document(self, stem: str, artifacts: Dict[str, Any]) -> None:
+        if self._index_file is None:
+            self._open()
+
+        with stage_timer("serialize"):
+            lines = [
+                (stage, _encode_jsonl({"stem": stem, "data": artifacts[stage]}))
+                for stage in self.stages
+            ]
+
+        with stage_timer("write"):
+            records: Dict[str, Tuple[int, int]] = {}
+            for stage, line in lines:
+                f = self._stage_files[stage]
+                offset = f.tell()
+                f.write(line)
+                records[stage] = (offset, len(line))
+
+            self._index_file.write(_encode_jsonl({"stem": stem, "records": records}))
+
+    def output_files(self, stem: str, date: Optional[str] = None) -> List[str]:
+        return get_output_files(stem, layout=self.layout, run_id=self.run_id, stages=self.stages)
+
+    def flush(self) -> None:
+        for f in self._stage_files.values():
+            f.flush()
+        if self._index_file is not None:
+            self._index_file.flush()
+        super().flush()
+
+    def close(self) -> None:
+        for f in self._stage_files.values():
+            f.close()
+        self._stage_files.clear()
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+        super().close()
+
+
+def _document_date(artifacts: Dict[str, Any]) -> Optional[str]:
+    parsed = artifacts.get("parsed")
+    return parsed.get("date") if isinstance(parsed, dict) else None
+
+
+def _encode_jsonl(data: Dict[str, Any]) -> bytes:
+    line = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return (line + "\n").encode(Constants.DEFAULT_ENCODING)
+
+
+def create_artifact_store(
+    layout: str,
+    output_dir: Path,
+    run_id: Optional[str] = None,
+    writer: Optional[BackgroundFileWriter] = None,
+    shard: str = FileNamingConvention.SHARD_FLAT,
+    verbosity: str = FileNamingConvention.VERBOSITY_DEBUG,
+    compact_json: bool = False
+) -> ArtifactStore:
+    """레이아웃 이름으로 산출물 저장소 생성 (jsonl은 샤딩 불가)"""
+    stages = FileNamingConvention.stages_for(verbosity)
+    if layout == FileNamingConvention.LAYOUT_FILES:
+        return FileArtifactStore(
+            output_dir, writer=writer, shard=shard, stages=stages, compact_json=compact_json
+        )
+    if layout == FileNamingConvention.LAYOUT_BUNDLE:
+        return BundleArtifactStore(
+            output_dir, writer=writer, shard=shard, stages=stages, compact_json=compact_json
+        )
+    if layout == FileNamingConvention.LAYOUT_JSONL:
+        if shard != FileNamingConvention.SHARD_FLAT:
+            raise ValueError("jsonl 레이아웃은 샤딩을 지원하지 않습니다")
+        return JsonlArtifactStore(output_dir, run_id=run_id, writer=writer, stages=stages)
+    raise ValueError(f"알 수 없는 레이아웃: {layout}")
+
+
+# ============================================================================
+# 샤딩 레이아웃 조회
+# ============================================================================
+
+def find_document_dir(
+    output_dir: Path,
+    stem: str,
+    shard: str = FileNamingConvention.SHARD_FLAT,
+    date: Optional[str] = None,
+    layout: str = FileNamingConvention.LAYOUT_FILES
+) -> Optional[Path]:
+    """
+    문서 산출물 디렉토리 찾기 (없으면 None)
+
+    - flat / hash / date(날짜를 알 때): 경로를 계산해 존재 여부만 확인
+    - date(날짜를 모를 때): YYYY/MM/DD/와 unknown/ 아래를 탐색
+    """
+    if layout == FileNamingConvention.LAYOUT_BUNDLE:
+        marker = FileNamingConvention.bundle(stem)
+    else:
+        marker = FileNamingConvention.parse_result(stem)
+
+    if shard != FileNamingConvention.SHARD_DATE or date:
+        sub = FileNamingConvention.shard_dir(stem, shard, date)
+        directory = output_dir / sub if sub else output_dir
+        return directory if (directory / marker).exists() else None
+
+    unknown = output_dir / FileNamingConvention.SHARD_UNKNOWN_DATE
+    if (unknown / marker).exists():
+        return unknown
+    for path in output_dir.glob(f"*/*/*/{marker}"):
+        return path.parent
+    return None
+
+
+# ============================================================================
+# jsonl 레이아웃 조회
+# ============================================================================
+
+def load_jsonl_index(output_dir: Path, run_id: str) -> Dict[str, Dict[str, List[int]]]:
+    """인덱스 파일 로드: stem → {stage: [offset, length]}"""
+    index: Dict[str, Dict[str, List[int]]] = {}
+    index_path = output_dir / FileNamingConvention.jsonl_index(run_id)
+    with index_path.open("r", encoding=Constants.DEFAULT_ENCODING) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                index[entry["stem"]] = entry["records"]
+    return index
+
+
+def read_jsonl_document(
+    output_dir: Path,
+    run_id: str,
+    stem: str,
+    index: Optional[Dict[str, Dict[str, List[int]]]] = None
+) -> Dict[str, Any]:
+    """
+    jsonl 레이아웃에서 문서 1건의 단계별 산출물 복원
+
+    Returns:
+        {stage: 산출물} (write_document에 전달된 artifacts와 동일한 형태)
+    """
+    if index is None:
+        index = load_jsonl_index(output_dir, run_id)
+    records = index[stem]
+
+    artifacts: Dict[str, Any] = {}
+    for stage, (offset, length) in records.items():
+        path = output_dir / FileNamingConvention.stage_jsonl(run_id, stage)
+        with path.open("rb") as f:
+            f.seek(offset)
+            line = f.read(length)
+        artifacts[stage] = json.loads(line.decode(Constants.DEFAULT_ENCODING))["data"]
+    return artifacts
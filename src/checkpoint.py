@@ -0,0 +1,153 @@
+"""
+배치 실행 체크포인트 (--resume)
+- 저널: 처리 디렉토리의 checkpoint.jsonl, 한 줄 = 완료된 입력 1건 (append-only)
+    {"source": 파일명, "status": SUCCESS/FAILED/MISSING/TIMEOUT, "is_valid": bool,
+     "csv_offset": 이 문서까지 기록한 summary.csv 끝 위치 (바이트)}
+- record()는 버퍼에 쌓기만 하고 commit()이 한꺼번에 추가
+  호출자는 commit 전에 summary.csv / SQLite / 문서 산출물을 먼저 flush한다
+  → 저널에 있는 문서는 결과가 모두 디스크에 있고, 중단 시 잃는 것은 마지막 커밋 이후 문서뿐
+- 재개: 저널의 문서는 건너뛰고, summary.csv는 마지막 커밋 위치로 잘라 이어쓴다
+  (커밋 전에 기록된 행 / 중단으로 잘린 행 제거 → 다시 처리해도 중복 행 없음)
+  SQLite는 source 기준 대체, 문서 산출물은 덮어쓰기라 다시 처리해도 중복이 생기지 않는다
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Collection, Dict, List, Optional, Tuple
+
+from .config import Constants
+from .error_handler import OutputError
+
+
+@dataclass
+class CheckpointEntry:
+    """완료된 입력 1건"""
+    source: str
+    status: str
+    is_valid: bool
+    csv_offset: int
+
+
+def read_journal(path: Path) -> Tuple[List[CheckpointEntry], int]:
+    """
+    저널 읽기 → (완료 목록, 유효한 부분의 길이)
+    중단으로 잘린 마지막 줄 / 깨진 줄부터는 버린다
+    """
+    if not path.exists():
+        return [], 0
+    entries: List[CheckpointEntry] = []
+    valid = 0
+    with path.open("rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entries.append(CheckpointEntry(**json.loads(line)))
+            except (ValueError, TypeError):
+                break
+            valid += len(line)
+    return entries, valid
+
+
+def truncate_results(path: Path, offset: int) -> int:
+    """결과 파일을 커밋 위치로 자름 → 잘라낸 바이트 수"""
+    size = path.stat().st_size if path.exists() else 0
+    if size < offset:
+        raise OutputError(f"{path.name}이 체크포인트보다 짧습니다 ({size} < {offset}바이트): 재개할 수 없습니다")
+    if size > offset:
+        with path.open("rb+") as f:
+            f.truncate(offset)
+    return size - offset
+
+
+class CheckpointJournal:
+    """
+    체크포인트 저널
+        journal = CheckpointJournal(path, resume=True)
+        todo = [name for name in names if name not in journal.completed]
+        journal.record(name, status, is_valid, csv_writer.offset)
+        journal.commit()   # 결과 파일 flush 후
+        journal.close()
+    - resume=False: 기존 저널을 비우고 새로 시작
+    - fsync: commit마다 저널을 fsync
+    """
+
+    def __init__(self, path: Path, resume: bool = False, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self.completed: Dict[str, CheckpointEntry] = {}
+        self.commits = 0
+        self._pending: List[CheckpointEntry] = []
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entries: List[CheckpointEntry] = []
+        if resume:
+            entries, valid = read_journal(path)
+            self._file: Optional[BinaryIO] = path.open("ab" if path.exists() else "wb")
+            self._file.truncate(valid)
+        else:
+            self._file = path.open("wb")
+        for entry in entries:
+            self.completed[entry.source] = entry
+        self.resumed = len(self.completed)
+        self._csv_offset = entries[-1].csv_offset if entries else 0
+
+    @property
+    def csv_offset(self) -> int:
+        """마지막으로 커밋한 summary.csv 끝 위치 (바이트)"""
+        return self._csv_offset
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def record(self, source: str, status: str, is_valid: bool, csv_offset: int) -> None:
+        """문서 1건 완료 (commit 전까지는 저널에 없음)"""
+        self._pending.append(CheckpointEntry(source, status, bool(is_valid), csv_offset))
+
+    def commit(self, failed: Collection[str] = ()) -> int:
+        """
+        대기 중인 완료 기록을 저널에 추가 → 추가한 건수
+        failed: 결과 기록에 실패한 문서. 처음 실패한 문서부터는 저널에 넣지 않고 버린다
+                (저널의 summary.csv 커밋 위치가 실패 문서 행 앞에서 멈춰 재개 시 다시 처리)
+        """
+        if failed:
+            for i, entry in enumerate(self._pending):
+                if entry.source in failed:
+                    del self._pending[i:]
+                    break
+        if not self._pending:
+            return 0
+        data = b"".join(
+            (json.dumps(asdict(entry), ensure_ascii=False) + "\n").encode(Constants.DEFAULT_ENCODING)
+            for entry in self._pending
+        )
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        for entry in self._pending:
+            self.completed[entry.source] = entry
+        self._csv_offset = self._pending[-1].csv_offset
+        count = len(self._pending)
+        self._pending = []
+        self.commits += 1
+        return count
+
+    def close(self) -> None:
+        """남은 기록 커밋 후 닫기"""
+        if self._file is None:
+            return
+        self.commit()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,323 @@
+"""
+파싱 결과 컬럼형 내보내기
+- pyarrow가 있으면 Parquet, 없으면 압축 NumPy 아카이브(.npz)
+- row_group_size건씩 모아 row group 단위로 기록 (스트리밍 중 작성 가능)
+
+컬럼 (summary.csv와 달리 타입 보존):
+    filename                str
+    date                    date (Parquet: date32 / npz: datetime64[D], 없음=NaT)
+    time                    str (HH:MM, 없음="")
+    vehicle_no              str (없음="")
+    gross/tare/net_weight_kg  nullable int64
+    is_valid                bool
+    parse_warnings          경고 코드(':' 앞부분) 리스트 (사전 인코딩)
+    validation_error_codes  검증 오류 코드(':' 앞부분) 리스트 (사전 인코딩)
+    imputation_count        복구/계산 이력 개수
+"""
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from datetime import date as date_cls
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Constants
+from .schemas import ParsedOutputSchema
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 환경에 따라 다름
+    pa = None
+    pq = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 환경에 따라 다름
+    np = None
+
+
+BACKEND_PARQUET = "parquet"
+BACKEND_NPZ = "npz"
+
+WEIGHT_COLUMNS = ["gross_weight_kg", "tare_weight_kg", "net_weight_kg"]
+STRING_COLUMNS = ["filename", "time", "vehicle_no"]
+LIST_COLUMNS = ["parse_warnings", "validation_error_codes"]
+
+# npz 아카이브 내 메타데이터 항목명
+_NPZ_META = "__meta__.json"
+
+
+def default_backend() -> str:
+    """사용 가능한 백엔드 (Parquet 우선)"""
+    if pa is not None:
+        return BACKEND_PARQUET
+    if np is not None:
+        return BACKEND_NPZ
+    raise ImportError("컬럼형 내보내기에는 pyarrow 또는 numpy가 필요합니다")
+
+
+def backend_suffix(backend: str) -> str:
+    return ".parquet" if backend == BACKEND_PARQUET else ".npz"
+
+
+def error_code(message: str) -> str:
+    """경고 / 검증 오류 메시지 → 코드 ('weight_mismatch:net(...)...' → 'weight_mismatch')"""
+    return message.split(":", 1)[0]
+
+
+def _parse_date(value: Optional[str]) -> Optional[date_cls]:
+    if not value:
+        return None
+    try:
+        return date_cls.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class ColumnarExporter:
+    """
+    파싱 결과 컬럼형 기록기
+    - write()는 컬럼 버퍼에 추가만 하고 row_group_size건마다 row group 1개를 기록
+    - close() 시 남은 행 기록 후 파일 마무리
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        row_group_size: int = Constants.COLUMNAR_ROW_GROUP_SIZE,
+        backend: Optional[str] = None
+    ):
+        self.backend = backend or default_backend()
+        if self.backend == BACKEND_PARQUET and pa is None:
+            raise ImportError("Parquet 백엔드에는 pyarrow가 필요합니다")
+        if self.backend == BACKEND_NPZ and np is None:
+            raise ImportError("npz 백엔드에는 numpy가 필요합니다")
+
+        self.output_path = output_path
+        self.row_group_size = max(1, row_group_size)
+        self.rows_written = 0
+        self.row_groups = 0
+
+        self._columns: Dict[str, List[Any]] = {}
+        self._reset_buffer()
+
+        # npz: 전체 실행에서 공유하는 코드 사전 (코드 → id)
+        self._dictionaries: Dict[str, Dict[str, int]] = {c: {} for c in LIST_COLUMNS}
+        self._group_sizes: List[int] = []
+
+        self._writer = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._closed = False
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _reset_buffer(self) -> None:
+        self._columns = {
+            "filename": [],
+            "date": [],
+            "time": [],
+            "vehicle_no": [],
+            **{c: [] for c in WEIGHT_COLUMNS},
+            "is_valid": [],
+            **{c: [] for c in LIST_COLUMNS},
+            "imputation_count": [],
+        }
+
+    def write(self, filename: str, parsed: ParsedOutputSchema) -> None:
+        """결과 1건 추가"""
+        cols = self._columns
+        cols["filename"].append(filename)
+        cols["date"].append(_parse_date(parsed["date"]))
+        cols["time"].append(parsed["time"])
+        cols["vehicle_no"].append(parsed["vehicle_no"])
+        for c in WEIGHT_COLUMNS:
+            cols[c].append(parsed[c])
+        cols["is_valid"].append(bool(parsed["is_valid"]))
+        cols["parse_warnings"].append([error_code(w) for w in parsed["parse_warnings"]])
+        cols["validation_error_codes"].append([error_code(e) for e in parsed["validation_errors"]])
+        cols["imputation_count"].append(len(parsed["imputation_notes"]))
+
+        if len(cols["filename"]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼를 row group 1개로 기록"""
+        n = len(self._columns["filename"])
+        if n == 0:
+            return
+
+        if self.backend == BACKEND_PARQUET:
+            self._flush_parquet()
+        else:
+            self._flush_npz(n)
+
+        self.rows_written += n
+        self.row_groups += 1
+        self._reset_buffer()
+
+    # ------------------------------------------------------------------
+    # Parquet
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def parquet_schema():
+        return pa.schema([
+            ("filename", pa.string()),
+            ("date", pa.date32()),
+            ("time", pa.string()),
+            ("vehicle_no", pa.string()),
+            *[(c, pa.int64()) for c in WEIGHT_COLUMNS],
+            ("is_valid", pa.bool_()),
+            *[(c, pa.list_(pa.string())) for c in LIST_COLUMNS],
+            ("imputation_count", pa.int16()),
+        ])
+
+    def _flush_parquet(self) -> None:
+        schema = self.parquet_schema()
+        if self._writer is None:
+            # 문자열/코드 컬럼은 Parquet 사전 인코딩으로 저장
+            self._writer = pq.ParquetWriter(
+                str(self.output_path), schema, compression="zstd", use_dictionary=True
+            )
+        table = pa.Table.from_pydict(self._columns, schema=schema)
+        self._writer.write_table(table)
+
+    # ------------------------------------------------------------------
+    # npz (numpy만 있을 때)
+    # ------------------------------------------------------------------
+
+    def _write_array(self, name: str, array) -> None:
+        with self._zip.open(f"{name}.npy", "w", force_zip64=True) as f:
+            np.lib.format.write_array(f, array, allow_pickle=False)
+
+    def _flush_npz(self, n: int) -> None:
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.output_path, "w", compression=zipfile.ZIP_DEFLATED)
+
+        g = f"{len(self._group_sizes):06d}"
+        cols = self._columns
+
+        for c in STRING_COLUMNS:
+            self._write_array(f"{c}/{g}", np.array([v or "" for v in cols[c]], dtype=str))
+
+        self._write_array(f"date/{g}", np.array(
+            [d.isoformat() if d else "NaT" for d in cols["date"]], dtype="datetime64[D]"
+        ))
+
+        for c in WEIGHT_COLUMNS:
+            values = cols[c]
+            self._write_array(f"{c}/{g}", np.array([v if v is not None else 0 for v in values], dtype=np.int64))
+            self._write_array(f"{c}__mask/{g}", np.array([v is None for v in values], dtype=bool))
+
+        self._write_array(f"is_valid/{g}", np.array(cols["is_valid"], dtype=bool))
+        self._write_array(f"imputation_count/{g}", np.array(cols["imputation_count"], dtype=np.int16))
+
+        # 리스트 컬럼: 코드 id를 평탄화 + 행별 오프셋
+        for c in LIST_COLUMNS:
+            dictionary = self._dictionaries[c]
+            ids: List[int] = []
+            offsets = [0]
+            for items in cols[c]:
+                for item in items:
+                    code_id = dictionary.get(item)
+                    if code_id is None:
+                        code_id = dictionary[item] = len(dictionary)
+                    ids.append(code_id)
+                offsets.append(len(ids))
+            self._write_array(f"{c}__ids/{g}", np.array(ids, dtype=np.int32))
+            self._write_array(f"{c}__offsets/{g}", np.array(offsets, dtype=np.int64))
+
+        self._group_sizes.append(n)
+
+    def _finish_npz(self) -> None:
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.output_path, "w", compression=zipfile.ZIP_DEFLATED)
+        for c in LIST_COLUMNS:
+            codes = sorted(self._dictionaries[c], key=self._dictionaries[c].get)
+            self._write_array(f"{c}__dictionary", np.array(codes, dtype=str))
+        meta = {"row_groups": self._group_sizes, "columns": list(self._columns)}
+        self._zip.writestr(_NPZ_META, json.dumps(meta))
+        self._zip.close()
+        self._zip = None
+
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        self.flush()
+        if self.backend == BACKEND_PARQUET:
+            if self._writer is None:
+                # 행이 없어도 스키마만 있는 빈 파일 생성
+                self._writer = pq.ParquetWriter(str(self.output_path), self.parquet_schema())
+            self._writer.close()
+            self._writer = None
+        else:
+            self._finish_npz()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# ============================================================================
+# 로드 (pandas)
+# ============================================================================
+
+def load_columnar(path: Path):
+    """
+    컬럼형 결과 파일을 pandas DataFrame으로 로드
+    - 중량 컬럼: nullable Int64
+    - date: datetime64
+    - 리스트 컬럼: 행별 코드 리스트
+    """
+    import pandas as pd
+
+    if path.suffix == ".parquet":
+        table = pq.read_table(str(path))
+        return table.to_pandas(
+            types_mapper={pa.int64(): pd.Int64Dtype()}.get,
+            date_as_object=False,
+        )
+
+    with zipfile.ZipFile(path) as zf:
+        meta = json.loads(zf.read(_NPZ_META))
+
+        def read(name: str):
+            return np.lib.format.read_array(io.BytesIO(zf.read(f"{name}.npy")), allow_pickle=False)
+
+        groups = [f"{i:06d}" for i in range(len(meta["row_groups"]))]
+
+        def concat(column: str, dtype):
+            if not groups:
+                return np.array([], dtype=dtype)
+            return np.concatenate([read(f"{column}/{g}") for g in groups])
+
+        data: Dict[str, Any] = {}
+        for c in STRING_COLUMNS:
+            data[c] = concat(c, str)
+        data["date"] = concat("date", "datetime64[D]")
+        for c in WEIGHT_COLUMNS:
+            data[c] = pd.arrays.IntegerArray(concat(c, np.int64), concat(f"{c}__mask", bool))
+        data["is_valid"] = concat("is_valid", bool)
+        data["imputation_count"] = concat("imputation_count", np.int16)
+
+        for c in LIST_COLUMNS:
+            dictionary = read(f"{c}__dictionary")
+            rows: List[List[str]] = []
+            for g in groups:
+                ids = read(f"{c}__ids/{g}")
+                offsets = read(f"{c}__offsets/{g}")
+                codes = dictionary[ids].tolist() if len(ids) else []
+                rows.extend(codes[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1))
+            data[c] = rows
+
+    columns = meta["columns"]
+    return pd.DataFrame({c: data[c] for c in columns})
@@ -2,9 +2,10 @@
 OCR 파싱 파이프라인 설정 및 정책 상수
 """
 from __future__ import annotations
-import re
 from typing import Dict, List
 
+from .regex_backend import compile_pattern
+
 # ============================================================================
 # 검증 정책 (Validator)
 # ============================================================================
@@ -71,34 +72,41 @@ class LabelTokens:
 # ============================================================================
 
 class Patterns:
-    """OCR 텍스트 파싱을 위한 정규식 패턴"""
+    """OCR 텍스트 파싱을 위한 정규식 패턴 (compile_pattern: re / regex 백엔드, regex_backend.py)"""
     
     # 날짜 패턴
     # 예: 2026-02-04 / 2026.02.04 / 2026/2/4 / 26-2-4
-    DATE = re.compile(
-        r"\b(?P<y>\d{2,4})[.\-\/](?P<m>\d{1,2})[.\-\/](?P<d>\d{1,2})\b"
+    DATE = compile_pattern(
+        "Patterns.DATE",
+        r"\b(?P<y>\d{2,4})[.\-\/](?P<m>\d{1,2})[.\-\/](?P<d>\d{1,2})\b",
     )
     
     # 시간 패턴
     # 예: 09:12 / 9:12 / 09:12:33 / 9:12:33
-    TIME = re.compile(
-        r"\b(?P<h>\d{1,2}):(?P<min>\d{2})(?::(?P<s>\d{2}))?\b"
+    TIME = compile_pattern(
+        "Patterns.TIME",
+        r"\b(?P<h>\d{1,2}):(?P<min>\d{2})(?::(?P<s>\d{2}))?\b",
     )
     
     # 중량 패턴 (kg 단위)
     # 예: 12,340 kg / 12340kg / 12340 KG / 12 340 kg
-    WEIGHT_KG = re.compile(
-        r"(?<![:\d])(?P<num>\d[\d,\s]*\d|\d)\s*(?P<unit>kg|KG|Kg|kG)\b"
+    # 숫자부 길이 상한(WEIGHT_KG_MAX_SPAN): 숫자/공백이 길게 이어진 줄에서 시작 위치마다
+    # 끝까지 훑고 되돌아오는 이차 시간 탐색을 막는다 (실제 중량 표기는 10자 안팎)
+    WEIGHT_KG_MAX_SPAN = 32
+    WEIGHT_KG = compile_pattern(
+        "Patterns.WEIGHT_KG",
+        r"(?<![:\d])(?P<num>\d[\d,\s]{0,%d}\d|\d)\s*(?P<unit>kg|KG|Kg|kG)\b" % (WEIGHT_KG_MAX_SPAN - 2),
     )
     
     # 차량번호 패턴 (전형적 형태)
     # 예: 12가3456 / 123가4567 / 서울12가3456
-    VEHICLE_NO = re.compile(
-        r"\b(?:[가-힣]{1,4}\s*)?(?P<prefix>\d{2,3})\s*(?P<hangul>[가-힣])\s*(?P<suffix>\d{4})\b"
+    VEHICLE_NO = compile_pattern(
+        "Patterns.VEHICLE_NO",
+        r"\b(?:[가-힣]{1,4}\s*)?(?P<prefix>\d{2,3})\s*(?P<hangul>[가-힣])\s*(?P<suffix>\d{4})\b",
     )
     
     # 차량번호 패턴 (단순 4자리 - fallback)
-    VEHICLE_NO_SIMPLE = re.compile(r"\b\d{4}\b")
+    VEHICLE_NO_SIMPLE = compile_pattern("Patterns.VEHICLE_NO_SIMPLE", r"\b\d{4}\b")
 
 
 # ============================================================================
@@ -152,4 +160,30 @@ class Constants:
     
     # 파일 출력
     DEFAULT_ENCODING = "utf-8"
-    JSON_INDENT = 2
\ No newline at end of file
+    JSON_INDENT = 2
+    CSV_FLUSH_EVERY = 100  # summary.csv flush 주기 (행)
+    SQLITE_BATCH_SIZE = 500  # SQLite 트랜잭션당 기록 건수
+    COLUMNAR_ROW_GROUP_SIZE = 65536  # 컬럼형 내보내기 row group 크기 (행)
+    WRITER_THREADS = 2  # 산출물 기록 스레드 수
+    WRITER_QUEUE_SIZE = 256  # 산출물 기록 큐 크기 (파일)
+    WRITER_FSYNC_BATCH = 64  # fsync=batch일 때 fsync 묶음 크기 (파일)
+    SHARD_HASH_DEPTH = 2  # hash 샤딩 디렉토리 단계 수
+    SHARD_HASH_WIDTH = 2  # hash 샤딩 단계당 16진수 자리 수 (2 → 단계당 256개)
+    RESHARD_WORKERS = 8  # 샤딩 이전 도구 기본 스레드 수
+    METRICS_TEXTFILE_INTERVAL = 15.0  # Prometheus textfile 기록 주기 (초)
+    PROFILE_SAMPLE_INTERVAL_MS = 5  # --profile sample 모드 샘플 간격 (ms)
+    MEMPROFILE_SNAPSHOT_EVERY = 50  # --memprofile 단계 스냅샷 비교 주기 (문서, 스냅샷 문서는 단계마다 힙 전체를 비교해 느림)
+    MEMPROFILE_TOP = 10  # --memprofile 보고 상위 할당 위치 수
+    MEMPROFILE_SIZE_BUCKETS_KB = [4, 16, 64, 256, 1024]  # --memprofile 입력 크기 구간 경계 (KB)
+    LOG_MAX_BYTES = 10 * 1024 * 1024  # --log-rotate 기본 교체 크기 (바이트)
+    LOG_BACKUP_COUNT = 5  # 교체된 로그 파일 보관 수
+    PROGRESS_MIN_INTERVAL_MS = 100  # 프로그레스 바 최소 다시 그리기 간격 (ms, 터미널)
+    PROGRESS_PLAIN_INTERVAL = 10.0  # 터미널이 아닐 때 진행 줄 출력 간격 (초)
+    PROGRESS_REPORT_EVERY = 32  # 워커 진행 보고 묶음 크기 (건)
+    ERROR_SAMPLE_SIZE = 10  # 에러 그룹별 소스 표본 크기 (reservoir)
+    ERROR_MAX_GROUPS = 1000  # 에러 그룹(예외 타입 + 가장 안쪽 프레임) 수 상한
+    ERROR_SUMMARY_GROUPS = 5  # 스트리밍 모드 종료 시 stderr에 요약할 에러 그룹 수
+    WORKER_START_TIMEOUT = 60.0  # --doc-timeout 문서 워커 프로세스 준비 대기 상한 (초, 문서 시간 제한과 별도)
+    CHECKPOINT_EVERY = 100  # 배치 체크포인트 저널 커밋 주기 (문서, 커밋마다 결과 파일 flush)
+    INFLIGHT_BYTES_PER_INPUT_BYTE = 12  # 배치 메모리 예산: 처리 중 문서의 입력 1바이트당 추정 메모리 (워커 피크 측정값 11~16배)
+    INFLIGHT_BYTES_PER_CANDIDATE = 1024  # 배치 메모리 예산: 처리 끝난 결과 객체의 후보 1개당 추정 메모리
\ No newline at end of file
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import io
+import logging
+import os
+import random
 import traceback
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, List, TextIO, Tuple, Union
+from dataclasses import asdict, dataclass, field, replace
+
+from .config import Constants
 
 
 # 커스텀 예외 클래스
@@ -50,33 +57,143 @@ class ErrorInfo:
     traceback_str: Optional[str] = None
     recoverable: bool = False
     recovery_action: Optional[str] = None
+    source: Optional[str] = None
+
+
+def error_signature(error: BaseException) -> Tuple[str, str]:
+    """그룹 키: (예외 타입, 가장 안쪽 프레임 '파일:줄 함수')"""
+    remote_frame = getattr(error, "remote_frame", None)
+    if remote_frame is not None:
+        return type(error).__name__, remote_frame  # 워커 프로세스에서 올라온 예외 (watchdog)
+    tb = error.__traceback__
+    if tb is None:
+        return type(error).__name__, ""
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    return type(error).__name__, f"{os.path.basename(code.co_filename)}:{tb.tb_lineno} {code.co_name}"
+
+
+@dataclass
+class ErrorGroup:
+    """
+    같은 시그니처 에러 묶음
+    - 첫 예시만 전체 스택 트레이스를 보관하고, 마지막 예시는 메시지 / 컨텍스트만
+    - sources: 발생 소스의 크기 제한 무작위 표본 (reservoir sampling)
+    """
+    error_type: str
+    frame: str
+    count: int = 0
+    recoverable: int = 0
+    first: Optional[ErrorInfo] = None
+    last: Optional[ErrorInfo] = None
+    sources: List[str] = field(default_factory=list)
+    sources_seen: int = 0
+
+    @property
+    def critical(self) -> int:
+        return self.count - self.recoverable
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "error_type": self.error_type,
+            "frame": self.frame,
+            "count": self.count,
+            "recoverable": self.recoverable,
+            "first": asdict(self.first) if self.first else None,
+            "last": asdict(self.last) if self.last else None,
+            "sources": list(self.sources),
+            "sources_seen": self.sources_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ErrorGroup":
+        return cls(
+            error_type=data["error_type"],
+            frame=data["frame"],
+            count=data["count"],
+            recoverable=data["recoverable"],
+            first=ErrorInfo(**data["first"]) if data["first"] else None,
+            last=ErrorInfo(**data["last"]) if data["last"] else None,
+            sources=list(data["sources"]),
+            sources_seen=data["sources_seen"],
+        )
+
+
+# 그룹 수 상한 초과 시 나머지를 모으는 그룹의 키
+OVERFLOW_SIGNATURE = ("(기타)", "그룹 수 상한 초과")
 
 
 # 에러 핸들러
 class ErrorHandler:
+    """
+    에러 수집기 (시그니처별 집계)
+    - 에러마다 전체 스택 트레이스를 쌓지 않고 (예외 타입, 가장 안쪽 프레임)으로 묶어
+      건수 / 첫·마지막 예시 / 소스 표본만 보관 → 메모리는 그룹 수 × 표본 크기로 제한
+    - max_groups를 넘는 새 시그니처는 OVERFLOW_SIGNATURE 그룹에 건수만 더한다
+    - snapshot() / merge()로 워커 프로세스 간 집계
+    """
     
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        sample_size: int = Constants.ERROR_SAMPLE_SIZE,
+        max_groups: int = Constants.ERROR_MAX_GROUPS,
+        seed: Optional[int] = None,
+    ):
         self.logger = logger
-        self.errors: List[ErrorInfo] = []
+        self.sample_size = sample_size
+        self.max_groups = max_groups
+        self.groups: Dict[Tuple[str, str], ErrorGroup] = {}
+        self._rng = random.Random(seed)
     
     def handle_error(
         self,
         error: Exception,
         context: str = "",
         recoverable: bool = False,
-        recovery_action: Optional[str] = None
+        recovery_action: Optional[str] = None,
+        source: Optional[str] = None,
     ) -> ErrorInfo:
-
+        """
+        에러 1건 기록
+        스택 트레이스는 그룹의 첫 예시일 때(또는 DEBUG 로그를 남길 때)만 만든다.
+        """
+        signature = error_signature(error)
+        group = self.groups.get(signature)
+        if group is None:
+            if len(self.groups) >= self.max_groups:
+                signature = OVERFLOW_SIGNATURE
+                group = self.groups.get(signature)
+            if group is None:
+                group = self.groups[signature] = ErrorGroup(*signature)
+        
+        log_traceback = (
+            self.logger is not None and not recoverable and self.logger.isEnabledFor(logging.DEBUG)
+        )
+        traceback_str = None
+        if group.first is None or log_traceback:
+            traceback_str = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        
         error_info = ErrorInfo(
             error_type=type(error).__name__,
             error_message=str(error),
             context=context,
-            traceback_str=traceback.format_exc(),
+            traceback_str=traceback_str,
             recoverable=recoverable,
-            recovery_action=recovery_action
+            recovery_action=recovery_action,
+            source=source,
         )
         
-        self.errors.append(error_info)
+        group.count += 1
+        if recoverable:
+            group.recoverable += 1
+        if group.first is None:
+            group.first = error_info
+        else:
+            group.last = replace(error_info, traceback_str=None)
+        if source is not None:
+            self._sample_source(group, source)
         
         if self.logger:
             if recoverable:
@@ -85,83 +202,164 @@ class ErrorHandler:
                     self.logger.info(f"  복구 액션: {recovery_action}")
             else:
                 self.logger.error(f"치명적 에러 [{context}]: {error_info.error_type} - {error_info.error_message}")
-                self.logger.debug(f"스택 트레이스:\n{error_info.traceback_str}")
+                if log_traceback:
+                    self.logger.debug(f"스택 트레이스:\n{traceback_str}")
         
         return error_info
     
+    def _sample_source(self, group: ErrorGroup, source: str) -> None:
+        # reservoir sampling (Algorithm R): 지금까지 본 소스마다 같은 확률로 표본에 남는다
+        group.sources_seen += 1
+        if len(group.sources) < self.sample_size:
+            group.sources.append(source)
+            return
+        j = self._rng.randrange(group.sources_seen)
+        if j < self.sample_size:
+            group.sources[j] = source
+    
+    @property
+    def total(self) -> int:
+        return sum(g.count for g in self.groups.values())
+    
     def get_error_summary(self) -> Dict[str, Any]:
         """에러 요약 정보 반환"""
-        total_errors = len(self.errors)
-        recoverable_count = sum(1 for e in self.errors if e.recoverable)
+        total_errors = self.total
+        recoverable_count = sum(g.recoverable for g in self.groups.values())
         critical_count = total_errors - recoverable_count
         
-        error_types = {}
-        for error in self.errors:
-            error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
+        error_types: Dict[str, int] = {}
+        for group in self.groups.values():
+            error_types[group.error_type] = error_types.get(group.error_type, 0) + group.count
         
         return {
             "total": total_errors,
             "recoverable": recoverable_count,
             "critical": critical_count,
             "by_type": error_types,
+            "groups": len(self.groups),
         }
     
     def has_critical_errors(self) -> bool:
         """치명적 에러가 있는지 확인"""
-        return any(not e.recoverable for e in self.errors)
+        return any(g.critical for g in self.groups.values())
     
     def clear_errors(self) -> None:
         """에러 목록 초기화"""
-        self.errors.clear()
+        self.groups.clear()
     
-    def generate_error_report(self) -> str:
-        """에러 리포트 생성"""
-        if not self.errors:
-            return "에러 없음"
+    # ------------------------------------------------------------------
+    # 워커 간 집계
+    # ------------------------------------------------------------------
+    
+    def snapshot(self, reset: bool = True) -> List[Dict[str, Any]]:
+        """그룹 목록을 피클 가능한 dict로 (워커 → 부모 전달용, reset이면 비움)"""
+        data = [g.to_dict() for g in self.groups.values()]
+        if reset:
+            self.groups.clear()
+        return data
+    
+    def merge(self, data: List[Dict[str, Any]]) -> None:
+        """
+        다른 프로세스의 snapshot() 병합
+        - 건수는 합산, 첫 예시는 기존 것 유지, 마지막 예시는 들어온 것
+        - 소스 표본은 양쪽이 본 건수 비율로 다시 뽑는다
+        """
+        for item in data:
+            other = ErrorGroup.from_dict(item)
+            signature = (other.error_type, other.frame)
+            group = self.groups.get(signature)
+            if group is None and len(self.groups) >= self.max_groups:
+                signature = OVERFLOW_SIGNATURE
+                group = self.groups.get(signature)
+            if group is None:
+                other.error_type, other.frame = signature
+                self.groups[signature] = other
+                continue
+            group.count += other.count
+            group.recoverable += other.recoverable
+            if group.first is None:
+                group.first = other.first
+            group.last = other.last or other.first or group.last
+            group.sources = self._merge_samples(
+                group.sources, group.sources_seen, other.sources, other.sources_seen
+            )
+            group.sources_seen += other.sources_seen
+    
+    def _merge_samples(self, a: List[str], seen_a: int, b: List[str], seen_b: int) -> List[str]:
+        # 두 표본에서 비복원 추출: 매번 남은 "본 건수" 비율로 어느 쪽에서 뽑을지 정한다
+        a, b = a[:], b[:]
+        self._rng.shuffle(a)
+        self._rng.shuffle(b)
+        out: List[str] = []
+        while len(out) < self.sample_size and (a or b):
+            if a and (not b or self._rng.random() * (seen_a + seen_b) < seen_a):
+                out.append(a.pop())
+                seen_a = max(0, seen_a - 1)
+            else:
+                out.append(b.pop())
+                seen_b = max(0, seen_b - 1)
+        return out
+    
+    # ------------------------------------------------------------------
+    # 리포트
+    # ------------------------------------------------------------------
+    
+    def write_error_report(self, out: Union[Path, TextIO]) -> None:
+        """에러 리포트를 파일 / 스트림에 그룹 단위로 바로 기록 (건수 내림차순)"""
+        if isinstance(out, Path):
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with open(out, "w", encoding=Constants.DEFAULT_ENCODING) as f:
+                self.write_error_report(f)
+            return
         
-        lines = []
-        lines.append("\n" + "="*60)
-        lines.append("에러 리포트")
-        lines.append("="*60)
+        if not self.groups:
+            out.write("에러 없음")
+            return
         
         summary = self.get_error_summary()
-        lines.append(f"\n총 에러: {summary['total']}개")
-        lines.append(f"  - 복구 가능: {summary['recoverable']}개")
-        lines.append(f"  - 치명적: {summary['critical']}개")
+        out.write("\n" + "="*60 + "\n")
+        out.write("에러 리포트\n")
+        out.write("="*60 + "\n")
+        out.write(f"\n총 에러: {summary['total']}개 (그룹 {summary['groups']}개)\n")
+        out.write(f"  - 복구 가능: {summary['recoverable']}개\n")
+        out.write(f"  - 치명적: {summary['critical']}개\n")
         
-        lines.append(f"\n에러 유형별:")
+        out.write(f"\n에러 유형별:\n")
         for error_type, count in summary['by_type'].items():
-            lines.append(f"  - {error_type}: {count}개")
+            out.write(f"  - {error_type}: {count}개\n")
         
-        lines.append("\n상세 내역:")
-        lines.append("-"*60)
+        out.write("\n그룹별 내역 (예외 타입 + 가장 안쪽 프레임):\n")
+        out.write("-"*60 + "\n")
         
-        for i, error in enumerate(self.errors, 1):
-            lines.append(f"\n[{i}] {error.error_type}")
-            lines.append(f"  컨텍스트: {error.context}")
-            lines.append(f"  메시지: {error.error_message}")
-            
-            if error.recoverable:
-                lines.append(f"  상태: 복구 가능")
-                if error.recovery_action:
-                    lines.append(f"  복구 액션: {error.recovery_action}")
-            else:
-                lines.append(f"  상태: 치명적")
+        for i, group in enumerate(sorted(self.groups.values(), key=lambda g: -g.count), 1):
+            out.write(f"\n[{i}] {group.error_type} @ {group.frame or '(프레임 없음)'}\n")
+            out.write(f"  건수: {group.count}개 (복구 가능 {group.recoverable}, 치명적 {group.critical})\n")
+            for label, example in (("첫 예시", group.first), ("마지막 예시", group.last)):
+                if example is None:
+                    continue
+                out.write(f"  {label}: [{example.context}] {example.error_message}\n")
+                if example.recovery_action:
+                    out.write(f"    복구 액션: {example.recovery_action}\n")
+            if group.sources:
+                out.write(f"  소스 표본 ({len(group.sources)}/{group.sources_seen}): {', '.join(group.sources)}\n")
             
-            if error.traceback_str:
-                tb_lines = error.traceback_str.strip().split("\n")
+            if group.first and group.first.traceback_str:
+                tb_lines = group.first.traceback_str.strip().split("\n")
                 if len(tb_lines) > 5:
-                    lines.append(f"  스택 트레이스: (마지막 3줄)")
-                    for line in tb_lines[-3:]:
-                        lines.append(f"    {line}")
+                    out.write(f"  스택 트레이스: (마지막 3줄)\n")
+                    tb_lines = tb_lines[-3:]
                 else:
-                    lines.append(f"  스택 트레이스:")
-                    for line in tb_lines:
-                        lines.append(f"    {line}")
-        
-        lines.append("\n" + "="*60)
+                    out.write(f"  스택 트레이스:\n")
+                for line in tb_lines:
+                    out.write(f"    {line}\n")
         
-        return "\n".join(lines)
+        out.write("\n" + "="*60)
+    
+    def generate_error_report(self) -> str:
+        """에러 리포트 생성 (문자열)"""
+        buffer = io.StringIO()
+        self.write_error_report(buffer)
+        return buffer.getvalue()
 
 
 # 에러 복구 유틸리티
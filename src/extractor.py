@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
-from dataclasses import asdict
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .schema import PreprocessedDocument, Candidate, ExtractedCandidates, ExtractionMetadata
+from .metrics import stage_timer
 from .patterns import (
     DATE_PATTERN,
     TIME_PATTERN,
@@ -13,6 +13,10 @@ from .patterns import (
     VEHICLE_NO_SIMPLE,
     LABEL_TOKENS,
 )
+from .regex_backend import compile_pattern
+
+# 라벨 뒤 ':' / 공백
+_LEADING_SEPARATORS = compile_pattern("extractor.leading_separators", r"^[\s:]+")
 
 
 def _iter_lines(text: str) -> List[str]:
@@ -54,7 +58,7 @@ def _make_extraction_meta(
         is_imputed=is_imputed,
         notes=notes,
     )
-    return asdict(m)
+    return m.to_dict()
 
 
 def _add_candidate(
@@ -65,8 +69,19 @@ def _add_candidate(
     method: str,
     score: int,
     meta: Optional[Dict[str, Any]] = None,
+    confidence: Optional[float] = None,
+    notes: str = "auto_attached",
+    with_metadata: bool = True,
 ) -> None:
-    value_raw = (value_raw or "").strip()
+    """
+    후보 추가
+    - with_metadata=True: meta["extraction_metadata"]에 추출 근거를 붙인다
+      (strategy_used는 method, source_line_index는 meta["line_index"]에서 결정,
+       raw_match는 넘겨받은 값 그대로, normalized_match는 공백을 정리한 값)
+    - with_metadata=False: 근거 생성 생략 (최종 결과만 필요할 때)
+    """
+    raw_match = value_raw or ""
+    value_raw = raw_match.strip()
     source_line = (source_line or "").strip()
     if not value_raw:
         return
@@ -75,16 +90,21 @@ def _add_candidate(
         meta = {}
 
     # 모든 후보에 ExtractionMetadata가 붙도록
-    if "extraction_metadata" not in meta:
-        line_index = int(meta.get("line_index", -1) if meta.get("line_index") is not None else -1)
+    if with_metadata and "extraction_metadata" not in meta:
+        line_index = meta.get("line_index")
+        if line_index is None:
+            line_index = -1
+        if confidence is None:
+            # 호출부가 근거를 지정하지 않은 경우
+            confidence = 0.9 if method == "label" else 0.5
         meta["extraction_metadata"] = _make_extraction_meta(
             field=field,
             strategy_used="label_match" if method == "label" else "pattern_fallback",
-            raw_match=value_raw,
+            raw_match=raw_match,
             normalized_match=value_raw,
-            source_line_index=line_index,
-            confidence=0.9 if method == "label" else 0.5,
-            notes="auto_attached",
+            source_line_index=int(line_index),
+            confidence=confidence,
+            notes=notes,
         )
 
     out.append(
@@ -144,7 +164,7 @@ def _extract_weight_after_token(line: str, token: str) -> Optional[str]:
     tail = line[pos + len(token):]
 
     # 토큰 뒤에 오는 ':'/공백 제거
-    tail = re.sub(r"^[\s:]+", "", tail)
+    tail = _LEADING_SEPARATORS.sub("", tail)
 
     m = _first_match(WEIGHT_KG_PATTERN, tail)
     if not m:
@@ -160,7 +180,10 @@ def _extract_vehicle_digits_from_label_line(line: str, label_token: str) -> str:
     return digits.strip() 
 
 
-def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
+def extract_by_label(
+    normalized_text: str,
+    with_metadata: bool = True
+) -> Tuple[List[Candidate], List[str]]:
     """
     라벨 기반 후보 추출
     반환: (candidates, label_found_but_no_value 리스트)
@@ -206,16 +229,10 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
                     meta={
                         "line_index": i,
                         "label_token": token,
-                        "extraction_metadata": _make_extraction_meta(
-                            field=field,
-                            strategy_used="label_match",
-                            raw_match=value_raw,
-                            normalized_match=value_raw,
-                            source_line_index=i,
-                            confidence=0.95,
-                            notes="weight_from_label_nearby",
-                        ),
                     },
+                    confidence=0.95,
+                    notes="weight_from_label_nearby",
+                    with_metadata=with_metadata,
                 )
             else:
                 # 라벨은 발견됐지만 값 추출 실패
@@ -246,16 +263,10 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
                         meta={
                             "line_index": tgt_idx,
                             "label_token": token,
-                            "extraction_metadata": _make_extraction_meta(
-                                field=field,
-                                strategy_used="label_match",
-                                raw_match=value_raw,
-                                normalized_match=value_raw,
-                                source_line_index=tgt_idx,
-                                confidence=0.9,
-                                notes="dt_from_label",
-                            ),
                         },
+                        confidence=0.9,
+                        notes="dt_from_label",
+                        with_metadata=with_metadata,
                     )
                     found = True
                     break
@@ -280,16 +291,10 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
                     meta={
                         "line_index": i,
                         "label_token": v_token,
-                        "extraction_metadata": _make_extraction_meta(
-                            field="vehicle_no",
-                            strategy_used="label_match",
-                            raw_match=value_raw,
-                            normalized_match=value_raw,
-                            source_line_index=i,
-                            confidence=0.9,
-                            notes="vehicle_from_label_same_line",
-                        ),
                     },
+                    confidence=0.9,
+                    notes="vehicle_from_label_same_line",
+                    with_metadata=with_metadata,
                 )
             else:
                 # 2) 다음 줄
@@ -308,16 +313,10 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
                             meta={
                                 "line_index": i + 1,
                                 "label_token": v_token,
-                                "extraction_metadata": _make_extraction_meta(
-                                    field="vehicle_no",
-                                    strategy_used="label_match",
-                                    raw_match=value_raw,
-                                    normalized_match=value_raw,
-                                    source_line_index=i + 1,
-                                    confidence=0.85,
-                                    notes="vehicle_from_label_next_line",
-                                ),
                             },
+                            confidence=0.85,
+                            notes="vehicle_from_label_next_line",
+                            with_metadata=with_metadata,
                         )
                     else:
                         # 3) 전형 패턴 실패 → digits-only 후보(낮은 확신)
@@ -334,16 +333,10 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
                                     "line_index": i,
                                     "label_token": v_token,
                                     "ambiguous": True,
-                                    "extraction_metadata": _make_extraction_meta(
-                                        field="vehicle_no",
-                                        strategy_used="label_match",
-                                        raw_match=digits,
-                                        normalized_match=digits,
-                                        source_line_index=i,
-                                        confidence=0.4,
-                                        notes="vehicle_digits_fallback_from_label_line",
-                                    ),
                                 },
+                                confidence=0.4,
+                                notes="vehicle_digits_fallback_from_label_line",
+                                with_metadata=with_metadata,
                             )
                         else:
                             label_misses.append(f"vehicle_no@line:{i}")
@@ -351,7 +344,7 @@ def extract_by_label(normalized_text: str) -> Tuple[List[Candidate], List[str]]:
     return out, label_misses
 
 
-def extract_by_pattern(normalized_text: str) -> List[Candidate]:
+def extract_by_pattern(normalized_text: str, with_metadata: bool = True) -> List[Candidate]:
     # 패턴 기반 후보 추출 (fallback)
 
     lines = _iter_lines(normalized_text)
@@ -370,16 +363,10 @@ def extract_by_pattern(normalized_text: str) -> List[Candidate]:
                 score=50,
                 meta={
                     "line_index": i,
-                    "extraction_metadata": _make_extraction_meta(
-                        field="date",
-                        strategy_used="pattern_fallback",
-                        raw_match=value_raw,
-                        normalized_match=value_raw,
-                        source_line_index=i,
-                        confidence=0.6,
-                        notes="date_from_pattern",
-                    ),
                 },
+                confidence=0.6,
+                notes="date_from_pattern",
+                with_metadata=with_metadata,
             )
 
         # 시간
@@ -394,16 +381,10 @@ def extract_by_pattern(normalized_text: str) -> List[Candidate]:
                 score=50,
                 meta={
                     "line_index": i,
-                    "extraction_metadata": _make_extraction_meta(
-                        field="time",
-                        strategy_used="pattern_fallback",
-                        raw_match=value_raw,
-                        normalized_match=value_raw,
-                        source_line_index=i,
-                        confidence=0.6,
-                        notes="time_from_pattern",
-                    ),
                 },
+                confidence=0.6,
+                notes="time_from_pattern",
+                with_metadata=with_metadata,
             )
 
         # 중량(kg)
@@ -418,16 +399,10 @@ def extract_by_pattern(normalized_text: str) -> List[Candidate]:
                 score=45,
                 meta={
                     "line_index": i,
-                    "extraction_metadata": _make_extraction_meta(
-                        field="weight_kg",
-                        strategy_used="pattern_fallback",
-                        raw_match=value_raw,
-                        normalized_match=value_raw,
-                        source_line_index=i,
-                        confidence=0.5,
-                        notes="weight_from_pattern",
-                    ),
                 },
+                confidence=0.5,
+                notes="weight_from_pattern",
+                with_metadata=with_metadata,
             )
 
         # 차량번호
@@ -442,16 +417,10 @@ def extract_by_pattern(normalized_text: str) -> List[Candidate]:
                 score=45,
                 meta={
                     "line_index": i,
-                    "extraction_metadata": _make_extraction_meta(
-                        field="vehicle_no",
-                        strategy_used="pattern_fallback",
-                        raw_match=value_raw,
-                        normalized_match=value_raw,
-                        source_line_index=i,
-                        confidence=0.5,
-                        notes="vehicle_from_pattern",
-                    ),
                 },
+                confidence=0.5,
+                notes="vehicle_from_pattern",
+                with_metadata=with_metadata,
             )
 
         # 차량번호(단순 4자리) - 낮은 score
@@ -467,24 +436,27 @@ def extract_by_pattern(normalized_text: str) -> List[Candidate]:
                 meta={
                     "line_index": i,
                     "note": "vehicle_simple_4digits",
-                    "extraction_metadata": _make_extraction_meta(
-                        field="vehicle_no",
-                        strategy_used="pattern_fallback",
-                        raw_match=value_raw,
-                        normalized_match=value_raw,
-                        source_line_index=i,
-                        confidence=0.2,
-                        notes="vehicle_simple_4digits",
-                    ),
                 },
+                confidence=0.2,
+                notes="vehicle_simple_4digits",
+                with_metadata=with_metadata,
             )
 
     return out
 
 
-def extract_candidates(preprocessed: PreprocessedDocument) -> ExtractedCandidates:
-    label_candidates, label_misses = extract_by_label(preprocessed.normalized_text)
-    pattern_candidates = extract_by_pattern(preprocessed.normalized_text)
+def extract_candidates(
+    preprocessed: PreprocessedDocument,
+    with_metadata: bool = True
+) -> ExtractedCandidates:
+    """
+    라벨 기반 + 패턴 기반 후보 추출
+    - with_metadata=False: 후보별 extraction_metadata 생성 생략 (선택 결과는 동일)
+    """
+    with stage_timer("extract.label"):
+        label_candidates, label_misses = extract_by_label(preprocessed.normalized_text, with_metadata)
+    with stage_timer("extract.pattern"):
+        pattern_candidates = extract_by_pattern(preprocessed.normalized_text, with_metadata)
 
     candidates = _dedupe_candidates(label_candidates + pattern_candidates)
 
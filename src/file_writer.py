@@ -0,0 +1,356 @@
+"""
+백그라운드 산출물 기록기
+- 제한 크기 큐 + 전용 기록 스레드: 파이프라인(CPU) 쪽은 큐에 넣기만 한다
+- 이미 만든 디렉토리는 캐시해 mkdir를 반복하지 않는다
+- 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 원자적 교체
+  → 중단되어도 반쯤 쓰인 JSON이 최종 경로에 남지 않는다
+- fsync 정책:
+    never: fsync 없음 (OS 페이지 캐시에 맡김)
+    batch: fsync_batch개마다 임시 파일 fsync → 일괄 교체 → 디렉토리 fsync
+    file:  파일마다 fsync → 교체 → 디렉토리 fsync
+- 처리량(files/s, MB/s), 큐 대기 시간(enqueue → 기록 시작), 디렉토리 캐시 hit/miss를 stats()로 보고
+
+threads=0이면 submit()에서 바로 기록한다 (같은 원자적 교체/fsync 정책 적용).
+
+기록 실패는 submit()에서 던지지 않고 (경로, key)와 함께 모아 두었다가 flush() / close()에서
+WriteFailedError로 한꺼번에 전달한다 → 다른 문서의 submit()이 실패를 떠안지 않고,
+호출자는 실패한 문서(key)만 골라 완료 처리에서 뺄 수 있다.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .config import Constants
+from .error_handler import OutputError
+from .metrics import stage_timer
+
+
+FSYNC_NEVER = "never"
+FSYNC_BATCH = "batch"
+FSYNC_FILE = "file"
+FSYNC_POLICIES = [FSYNC_NEVER, FSYNC_BATCH, FSYNC_FILE]
+
+# 큐 종료 신호
+_STOP = object()
+
+# 기록 실패 1건: (key, 최종 경로, 예외)
+WriteFailure = Tuple[Optional[str], Path, BaseException]
+
+# 임시 파일명 일련번호 (같은 경로가 연달아 들어와도 충돌하지 않도록)
+_tmp_counter = itertools.count()
+
+
+def _fsync_dir(directory: Path) -> None:
+    """디렉토리 엔트리(rename) 영속화 (지원하지 않는 플랫폼은 무시)"""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_tmp(path: Path, data: bytes, fsync: bool) -> Path:
+    """같은 디렉토리의 임시 파일에 기록 후 임시 경로 반환"""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{next(_tmp_counter)}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def atomic_write(path: Path, content: Union[str, bytes], fsync: bool = False) -> None:
+    """임시 파일에 쓴 뒤 원자적 교체 (단발성 기록용)"""
+    data = content.encode(Constants.DEFAULT_ENCODING) if isinstance(content, str) else content
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(_write_tmp(path, data, fsync), path)
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+class WriteFailedError(OutputError):
+    """백그라운드 기록 실패 (failures: 실패한 파일 전체, keys: 실패한 파일이 속한 key)"""
+
+    def __init__(self, failures: List[WriteFailure]):
+        self.failures = failures
+        self.keys = {key for key, _, _ in failures if key is not None}
+        _, path, error = failures[0]
+        more = f" 외 {len(failures) - 1}건" if len(failures) > 1 else ""
+        super().__init__(f"산출물 기록 실패: {path}{more}: {type(error).__name__}: {error}")
+
+
+class _WriterStats:
+    """기록 통계 (여러 스레드에서 갱신)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self.dir_cache_hits = 0
+        self.dir_cache_misses = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def record(self, nbytes: int, latency: float) -> None:
+        with self._lock:
+            self.files += 1
+            self.bytes += nbytes
+            self.latency_total += latency
+            if latency > self.latency_max:
+                self.latency_max = latency
+            self.finished = time.perf_counter()
+
+
+class BackgroundFileWriter:
+    """
+    제한 크기 큐 기반 파일 기록기
+
+    같은 경로는 항상 같은 스레드가 처리하므로 경로별 기록 순서가 유지된다.
+    기록 실패는 다음 flush() / close()에서 WriteFailedError로 전달된다 (submit()은 던지지 않음).
+    """
+
+    def __init__(
+        self,
+        threads: int = Constants.WRITER_THREADS,
+        queue_size: int = Constants.WRITER_QUEUE_SIZE,
+        fsync: str = FSYNC_NEVER,
+        fsync_batch: int = Constants.WRITER_FSYNC_BATCH,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"알 수 없는 fsync 정책: {fsync}")
+
+        self.threads = max(0, threads)
+        self.fsync = fsync
+        self.fsync_batch = max(1, fsync_batch)
+
+        self._stats = _WriterStats()
+        self._dirs: Set[Path] = set()
+        self._dirs_lock = threading.Lock()
+        self._failures: List[WriteFailure] = []
+        self._failures_lock = threading.Lock()  # 여러 기록 스레드가 동시에 실패할 수 있음
+        self._closed = False
+
+        # 스레드별 큐 (전체 크기를 스레드 수로 나눔)
+        self._queues: List[queue.Queue] = []
+        self._workers: List[threading.Thread] = []
+        per_thread = max(1, queue_size // max(1, self.threads))
+        for i in range(self.threads):
+            q: queue.Queue = queue.Queue(maxsize=per_thread)
+            t = threading.Thread(
+                target=self._run, args=(q,), name=f"artifact-writer-{i}", daemon=True
+            )
+            self._queues.append(q)
+            self._workers.append(t)
+            t.start()
+
+        # threads=0일 때 batch 정책용 대기 목록
+        self._inline_pending: List[Tuple[Path, Path, Optional[str]]] = []
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def submit(self, path: Path, content: Union[str, bytes], key: Optional[str] = None) -> None:
+        """
+        파일 기록 요청 (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            path: 최종 경로
+            content: str이면 Constants.DEFAULT_ENCODING으로 인코딩
+            key: 실패 보고용 묶음 이름 (예: 문서 stem)
+        """
+        if self._closed:
+            raise OutputError("닫힌 기록기에 submit() 호출")
+
+        data = content.encode(Constants.DEFAULT_ENCODING) if isinstance(content, str) else content
+        if self._stats.started is None:
+            self._stats.started = time.perf_counter()
+
+        if not self._workers:
+            try:
+                self._write(path, data, key, time.perf_counter(), self._inline_pending)
+            except Exception as e:
+                self._record_failures([(key, path, e)])
+            return
+
+        q = self._queues[hash(path) % len(self._queues)]
+        q.put((path, data, key, time.perf_counter()))
+
+    def flush(self) -> None:
+        """지금까지 요청된 파일을 모두 기록 (batch 정책의 대기분 포함)"""
+        if not self._workers:
+            self._commit(self._inline_pending)
+        else:
+            for q in self._queues:
+                q.put(None)  # 배치 커밋 신호
+            for q in self._queues:
+                q.join()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            for q in self._queues:
+                q.put(_STOP)
+            for t in self._workers:
+                t.join()
+        self._raise_pending_error()
+
+    def stats(self) -> Dict[str, Any]:
+        """처리량 / 큐 대기 시간 통계"""
+        s = self._stats
+        elapsed = 0.0
+        if s.started is not None and s.finished is not None:
+            elapsed = max(s.finished - s.started, 1e-9)
+        return {
+            "files": s.files,
+            "bytes": s.bytes,
+            "errors": s.errors,
+            "dir_cache_hits": s.dir_cache_hits,
+            "dir_cache_misses": s.dir_cache_misses,
+            "elapsed_sec": round(elapsed, 6),
+            "files_per_sec": round(s.files / elapsed, 1) if elapsed else 0.0,
+            "mb_per_sec": round(s.bytes / elapsed / 1e6, 3) if elapsed else 0.0,
+            "queue_latency_avg_ms": round(s.latency_total / s.files * 1000, 3) if s.files else 0.0,
+            "queue_latency_max_ms": round(s.latency_max * 1000, 3),
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------------
+    # 기록 스레드
+    # ------------------------------------------------------------------
+
+    def _run(self, q: queue.Queue) -> None:
+        pending: List[Tuple[Path, Path, Optional[str]]] = []
+        while True:
+            item = q.get()
+            try:
+                if item is _STOP:
+                    return
+                if item is None:
+                    self._commit(pending)
+                    continue
+                path, data, key, enqueued = item
+                self._write(path, data, key, enqueued, pending)
+            except BaseException as e:  # 다음 flush() / close()에서 전달
+                self._record_failures([(key, path, e)])
+            finally:
+                q.task_done()
+
+    def _record_failures(self, failures: List[WriteFailure]) -> None:
+        with self._stats._lock:
+            self._stats.errors += len(failures)
+        with self._failures_lock:
+            self._failures.extend(failures)
+
+    def _ensure_dir(self, directory: Path) -> None:
+        if directory in self._dirs:
+            with self._stats._lock:
+                self._stats.dir_cache_hits += 1
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._dirs_lock:
+            self._dirs.add(directory)
+        with self._stats._lock:
+            self._stats.dir_cache_misses += 1
+
+    def _write(
+        self,
+        path: Path,
+        data: bytes,
+        key: Optional[str],
+        enqueued: float,
+        pending: List[Tuple[Path, Path, Optional[str]]],
+    ) -> None:
+        latency = time.perf_counter() - enqueued
+        with stage_timer("write.io"):
+            self._ensure_dir(path.parent)
+
+            tmp = _write_tmp(path, data, fsync=self.fsync == FSYNC_FILE)
+
+            if self.fsync == FSYNC_BATCH:
+                # 배치가 찰 때까지 교체를 미룬다 (fsync 전에는 최종 경로에 보이지 않음)
+                pending.append((tmp, path, key))
+                self._stats.record(len(data), latency)
+                if len(pending) >= self.fsync_batch:
+                    self._commit(pending)
+                return
+
+            os.replace(tmp, path)
+            if self.fsync == FSYNC_FILE:
+                _fsync_dir(path.parent)
+        self._stats.record(len(data), latency)
+
+    def _commit(self, pending: List[Tuple[Path, Path, Optional[str]]]) -> None:
+        """
+        batch 정책: 대기 중인 임시 파일 fsync → 교체 → 디렉토리 fsync
+        한 파일이 실패해도 나머지는 교체하고, 실패한 파일만 실패 목록에 남긴다
+        """
+        if not pending:
+            return
+        failures: List[WriteFailure] = []
+        try:
+            synced = []
+            for tmp, path, key in pending:
+                try:
+                    fd = os.open(str(tmp), os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                except OSError as e:
+                    failures.append((key, path, e))
+                    continue
+                synced.append((tmp, path, key))
+            directories = set()
+            for tmp, path, key in synced:
+                try:
+                    os.replace(tmp, path)
+                except OSError as e:
+                    failures.append((key, path, e))
+                    continue
+                directories.add(path.parent)
+            for directory in directories:
+                _fsync_dir(directory)
+        finally:
+            # 교체하지 못한 임시 파일 정리 (교체된 파일은 이미 임시 경로에 없음)
+            for tmp, _, _ in pending:
+                tmp.unlink(missing_ok=True)
+            pending.clear()
+            if failures:
+                self._record_failures(failures)
+
+    def _raise_pending_error(self) -> None:
+        with self._failures_lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise WriteFailedError(failures) from failures[0][2]
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, TextIO
 from datetime import datetime
 
+from .config import Constants
+
 
 class ColoredFormatter(logging.Formatter):
     """컬러 로그 포맷터"""
@@ -22,25 +30,114 @@ class ColoredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         levelname = record.levelname
         if levelname in self.COLORS:
+            # 같은 레코드를 받는 파일 핸들러에 색상 코드가 섞이지 않도록 복사본에 적용
+            record = logging.makeLogRecord(record.__dict__)
             record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
         
         return super().format(record)
 
 
+class JSONLineFormatter(logging.Formatter):
+    """
+    JSON lines 로그 포맷터 (한 레코드 = 한 줄)
+    - 일반 레코드: {"ts", "level", "logger", "message"} (+ 예외 시 "exc")
+    - 문서 레코드(extra={"document": {...}}): {"ts", "level", "event": "document", ...문서 필드}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+        }
+        document = getattr(record, "document", None)
+        if document is not None:
+            data["event"] = "document"
+            data.update(document)
+        else:
+            data["logger"] = record.name
+            data["message"] = record.getMessage()
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _not_document(record: logging.LogRecord) -> bool:
+    # 문서 레코드는 JSON 파일 로그 전용 (콘솔에는 출력하지 않음)
+    return not hasattr(record, "document")
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    같은 프로세스 안의 큐로 레코드만 넘기는 핸들러
+    - 기본 QueueHandler.prepare()는 호출 스레드에서 메시지를 포맷하고 레코드를 복사한다 (피클 대비)
+    - 스레드 간 전달은 피클이 필요 없으므로 포맷까지 리스너 스레드로 미룬다
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _QueueState:
+    """큐 로깅 모드의 리스너 / 워커용 프로세스 간 큐"""
+
+    def __init__(self, handlers: List[logging.Handler]):
+        self.handlers = handlers
+        self.listeners: List[logging.handlers.QueueListener] = []
+        self.worker_queue: Optional[Any] = None
+
+    def listen(self, q: Any) -> None:
+        listener = logging.handlers.QueueListener(q, *self.handlers, respect_handler_level=True)
+        listener.start()
+        self.listeners.append(listener)
+
+    def stop(self) -> None:
+        # 리스너는 큐에 남은 레코드를 모두 처리한 뒤 종료한다
+        for listener in self.listeners:
+            listener.stop()
+        self.listeners.clear()
+        if self.worker_queue is not None:
+            self.worker_queue.close()
+            self.worker_queue.join_thread()
+            self.worker_queue = None
+        for handler in self.handlers:
+            handler.close()
+
+
+# 로거 이름 → 큐 로깅 상태
+_queue_states: Dict[str, _QueueState] = {}
+
+
 def setup_logger(
     name: str = "ocr_pipeline",
     log_dir: Optional[Path] = None,
     console_level: int = logging.INFO,
     file_level: int = logging.DEBUG,
-    enable_color: bool = True
+    enable_color: bool = True,
+    console_stream: Optional[TextIO] = None,
+    queued: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = Constants.LOG_BACKUP_COUNT,
+    json_lines: bool = False,
 ) -> logging.Logger:
+    """
+    파이프라인 로거 설정
 
+    Args:
+        queued: True면 로거에는 큐 핸들러만 달고, 포맷과 콘솔/파일 출력은 백그라운드 리스너 스레드에서 처리
+                (종료 시 stop_logger()로 남은 레코드를 비운다)
+        max_bytes: 0보다 크면 실행마다 새 파일 대신 pipeline.log 하나를 크기 기준으로 교체
+                   (pipeline.log.1 ~ .<backup_count>까지 보관)
+        json_lines: 파일 로그를 JSON lines로 기록 (pipeline_*.jsonl / pipeline.jsonl)
+                    문서 레코드(extra={"document": ...})는 이 모드의 파일에만 남는다
+    """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG) 
+    stop_logger(name)
     logger.handlers.clear() 
+    handlers: List[logging.Handler] = []
     
     # 1) 콘솔 핸들러
-    console_handler = logging.StreamHandler(sys.stdout)
+    # stdout을 데이터 출력으로 쓰는 모드(--stdout)에서는 stderr를 넘겨받는다
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
     console_handler.setLevel(console_level)
     
     if enable_color:
@@ -51,30 +148,98 @@ def setup_logger(
         console_formatter = logging.Formatter(console_format)
     
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.addFilter(_not_document)
+    handlers.append(console_handler)
     
     # 2) 파일 핸들러
+    log_file = None
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
         
-        # 파일명: pipeline_YYYYMMDD_HHMMSS.log
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = log_dir / f"pipeline_{timestamp}.log"
-        
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        suffix = ".jsonl" if json_lines else ".log"
+        if max_bytes > 0:
+            # 크기 기준 교체: 로그 폴더 크기 상한 = max_bytes * (backup_count + 1)
+            log_file = log_dir / f"pipeline{suffix}"
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+        else:
+            # 파일명: pipeline_YYYYMMDD_HHMMSS.log (.jsonl)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            log_file = log_dir / f"pipeline_{timestamp}{suffix}"
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(file_level)
         
-        file_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
-        file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
+        if json_lines:
+            file_formatter: logging.Formatter = JSONLineFormatter()
+        else:
+            file_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+            file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
         
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-        
+        handlers.append(file_handler)
+    
+    # 어느 핸들러도 받지 않는 레벨은 로거에서 바로 거른다 (레코드 생성 / 큐 전달 비용 없음)
+    logger.setLevel(min(h.level for h in handlers))
+    
+    if queued:
+        state = _QueueState(handlers)
+        local_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        state.listen(local_queue)
+        _queue_states[name] = state
+        logger.addHandler(_LocalQueueHandler(local_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+    
+    if log_file:
         logger.info(f"로그 파일: {log_file}")
     
     return logger
 
 
+def stop_logger(name: str = "ocr_pipeline") -> None:
+    """큐 로깅 모드 종료: 남은 레코드를 모두 출력하고 리스너를 멈춤 (큐 모드가 아니면 아무것도 하지 않음)"""
+    state = _queue_states.pop(name, None)
+    if state is None:
+        return
+    logging.getLogger(name).handlers.clear()
+    state.stop()
+
+
+@atexit.register
+def _stop_all_loggers() -> None:
+    for name in list(_queue_states):
+        stop_logger(name)
+
+
+def worker_log_queue(name: str = "ocr_pipeline") -> Optional[Any]:
+    """
+    프로세스 풀 워커용 로그 큐 (큐 로깅 모드가 아니면 None)
+    - 워커는 setup_worker_logger(queue)로 이 큐에 레코드를 보내고, 부모의 리스너가 같은 핸들러로 출력
+    """
+    state = _queue_states.get(name)
+    if state is None:
+        return None
+    if state.worker_queue is None:
+        state.worker_queue = multiprocessing.Queue()
+        state.listen(state.worker_queue)
+    return state.worker_queue
+
+
+def setup_worker_logger(log_queue: Any, level: int = logging.DEBUG, name: str = "ocr_pipeline") -> logging.Logger:
+    """
+    워커 프로세스 로거: 모든 레코드를 부모의 로그 큐로 보냄
+    (fork로 물려받은 핸들러 / 리스너 없는 큐 핸들러는 버린다)
+    """
+    _queue_states.clear()
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.setLevel(level)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return logger
+
+
 def get_logger(name: str = "ocr_pipeline") -> logging.Logger:
 
     return logging.getLogger(name)
@@ -93,13 +258,13 @@ class LogContext:
     
     def __enter__(self):
         """컨텍스트 진입"""
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter()
         self.logger.log(self.level, f"▶ {self.message} 시작...")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 종료"""
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.perf_counter() - self.start_time
         
         if exc_type is None:
             self.logger.log(self.level, f"✓ {self.message} 완료 ({elapsed:.2f}초)")
@@ -1,10 +1,13 @@
 ﻿from __future__ import annotations
 
+import argparse
 import json
 import logging
+import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from dataclasses import asdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 from .pipeline import run_full_pipeline
 from .utils import (
@@ -19,20 +22,33 @@ from .output_formatters import (
     format_extract_log,
     format_candidates_output,
     format_resolved_output,
-    format_parsed_output,
+    format_parse_result,
     format_csv_row,
-    write_summary_csv,
-    get_output_files,
+    SummaryCSVWriter,
 )
-from .schemas import CSVRowSchema
-from .logger import setup_logger, log_step
+from .logger import setup_logger, stop_logger, log_step
 from .progress import ProgressBar, print_section_header, print_status, Colors
 from .error_handler import ErrorHandler, FileReadError, safe_execute
+from .streaming import run_stream, DEFAULT_CHUNK_SIZE
+from .artifacts import ArtifactStore, create_artifact_store, write_text, write_json
+from .file_writer import BackgroundFileWriter, FSYNC_POLICIES, FSYNC_NEVER, WriteFailedError
+from .sqlite_sink import SQLiteResultSink
+from .metrics import StageMetrics, enable_metrics, observe_stage, stage_timer, start_document_trace, stop_document_trace
+from .prometheus import PipelineTelemetry, MetricsHTTPServer, TextfileExporter
+from .memprofile import memory_document, start_memprofile, stop_memprofile
+from .profiling import PROFILE_CPROFILE, PROFILE_MODES, PROFILE_SAMPLE, profile_document, start_profiling, stop_profiling
+from .columnar import ColumnarExporter, default_backend, backend_suffix, error_code
+from .watchdog import DocumentTimeout, DocumentWatchdog, Quarantine, WorkerCrashed, REASON_TIMEOUT, REASON_WORKER_CRASH
+from .scheduler import BatchScheduler, ScheduledResult, SCHEDULES, SCHEDULE_LPT
+from .checkpoint import CheckpointJournal, truncate_results
 
 ROOT = Path(__file__).resolve().parents[1]
 RAW_DIR = ROOT / "data" / "raw"
 PROCESSED_DIR = ROOT / "data" / "processed"
 LOG_DIR = ROOT / "logs"
+QUARANTINE_DIR = ROOT / "data" / "quarantine"
+
+MB = 1024 * 1024
 
 # 처리할 대상 파일 목록
 TARGET_FILES = [
@@ -42,28 +58,25 @@ TARGET_FILES = [
     "sample_04.json",
 ]
 
-# 글로벌 로거 및 에러 핸들러
+# 글로벌 로거, 에러 핸들러 및 산출물 저장소
 logger = None
 error_handler = None
+artifact_store: Optional[ArtifactStore] = None
 
+# 문서별 JSON 로그 레코드 기록 여부 (--log-json)
+log_documents = False
 
-# ============================================================================
-# 파일 I/O 함수 (순수 I/O만 담당)
-# ============================================================================
-
-def write_text(path: Path, content: str) -> None:
-    """텍스트 파일 쓰기"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding=Constants.DEFAULT_ENCODING)
+# 문서별 시간 제한 실행기 / 격리 디렉토리 (--doc-timeout, 미설정 시 현재 프로세스에서 실행)
+watchdog: Optional[DocumentWatchdog] = None
+quarantine: Optional[Quarantine] = None
 
 
-def write_json(path: Path, data: dict) -> None:
-    """JSON 파일 쓰기"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(data, ensure_ascii=False, indent=Constants.JSON_INDENT),
-        encoding=Constants.DEFAULT_ENCODING
-    )
+def get_artifact_store() -> ArtifactStore:
+    """현재 산출물 저장소 (미설정 시 기본 files 레이아웃)"""
+    global artifact_store
+    if artifact_store is None:
+        artifact_store = create_artifact_store(FileNamingConvention.LAYOUT_FILES, PROCESSED_DIR)
+    return artifact_store
 
 
 # ============================================================================
@@ -166,112 +179,107 @@ def create_resolve_outputs(
 # 단일 파일 처리 함수
 # ============================================================================
 
-def process_single_file(input_path: Path) -> Tuple[str, bool, str, Dict[str, Any]]:
+def process_single_file(
+    input_path: Path, outcome: Optional[ScheduledResult] = None
+) -> Tuple[str, bool, str, Dict[str, Any]]:
     """
     단일 파일 처리 (테스트 가능한 순수 로직)
     
     Args:
         input_path: 입력 파일 경로
+        outcome: 병렬 모드에서 워커가 이미 실행한 파이프라인 결과 (없으면 여기서 실행)
     
     Returns:
         (status, is_valid, console_output, parsed_data)
-        status: "SUCCESS" | "FAILED" | "MISSING"
+        status: "SUCCESS" | "FAILED" | "MISSING" | "TIMEOUT"
         is_valid: 검증 통과 여부
         console_output: 콘솔 출력 문자열
         parsed_data: 파싱 결과 딕셔너리 (CSV 생성용)
     """
     global logger, error_handler
     
+    # 병렬 모드: 소요 시간에 워커의 파이프라인 실행 시간 포함
+    started_ns = time.perf_counter_ns() - (outcome.elapsed_ns if outcome is not None else 0)
     if not input_path.exists():
-        if logger:
+        if log_documents:
+            log_document(input_path.name, "MISSING", False, started_ns, None, None, {})
+        elif logger:
             logger.warning(f"파일 없음: {input_path.name}")
         return "MISSING", False, "", {}
     
+    # --log-json: 단계별 로그 줄 대신 문서당 JSON 레코드 1건
+    stages_ns = start_document_trace() if log_documents else None
+    status = "FAILED"
     try:
-        if logger:
+        if logger and not log_documents:
             logger.info(f"파일 처리 시작: {input_path.name}")
         
+        # 기록할 단계 (저장소의 상세 수준) → 필요한 산출물만 생성
+        store = get_artifact_store()
+        stages = set(store.stages)
+        with_evidence = needs_evidence(stages)
+        
         # 파이프라인 실행
-        with log_step(logger, f"{input_path.name} 파이프라인"):
-            preprocessed, extracted, resolved, parsed = run_full_pipeline(str(input_path))
+        # 단계별 소요 시간은 DEBUG 로그로만 남긴다 (집계는 --metrics)
+        with log_step(logger, f"{input_path.name} 파이프라인", logging.DEBUG):
+            preprocessed, extracted, resolved, parsed = run_pipeline(input_path, with_evidence, stages_ns, outcome)
         
         stem = input_path.stem
         
-        # 데이터를 dict로 변환
-        preprocessed_dict = asdict(preprocessed)
-        extracted_dict = asdict(extracted)
-        resolved_dict = asdict(resolved)
-        parsed_dict = asdict(parsed)
-        
-        # 1) 전처리 산출물
-        with log_step(logger, "전처리 산출물 생성"):
-            preprocess_out = create_preprocess_outputs(
-                stem=stem,
-                preprocessed_dict=preprocessed_dict,
-                raw_text=preprocessed.raw_text,
-                normalized_text=preprocessed.normalized_text
-            )
-            
-            write_text(
-                PROCESSED_DIR / FileNamingConvention.preprocess_raw(stem),
-                preprocess_out["raw"]
-            )
-            write_text(
-                PROCESSED_DIR / FileNamingConvention.preprocess_normalized(stem),
-                preprocess_out["normalized"]
-            )
-            write_json(
-                PROCESSED_DIR / FileNamingConvention.preprocess_log(stem),
-                preprocess_out["log"]
-            )
-        
-        # 2) Extractor 산출물
-        with log_step(logger, "추출 산출물 생성"):
-            extract_out = create_extract_outputs(
-                stem=stem,
-                extracted_dict=extracted_dict
-            )
-            
-            write_json(
-                PROCESSED_DIR / FileNamingConvention.extract_candidates(stem),
-                extract_out["candidates"]
-            )
-            write_json(
-                PROCESSED_DIR / FileNamingConvention.extract_log(stem),
-                extract_out["log"]
-            )
-        
-        # 3) Resolver 산출물
-        with log_step(logger, "후보 선택 산출물 생성"):
-            resolve_out = create_resolve_outputs(
-                stem=stem,
-                resolved_dict=resolved_dict
-            )
-            write_json(
-                PROCESSED_DIR / FileNamingConvention.resolve_result(stem),
-                resolve_out
-            )
-        
-        # 4) ParseResult 산출물 (포맷터 사용)
-        with log_step(logger, "최종 파싱 결과 생성"):
-            parsed_output = format_parsed_output(
-                source=f"{stem}.json",
-                date=parsed_dict.get("date"),
-                time=parsed_dict.get("time"),
-                vehicle_no=parsed_dict.get("vehicle_no"),
-                gross_weight_kg=parsed_dict.get("gross_weight_kg"),
-                tare_weight_kg=parsed_dict.get("tare_weight_kg"),
-                net_weight_kg=parsed_dict.get("net_weight_kg"),
-                parse_warnings=parsed_dict.get("parse_warnings", []),
-                validation_errors=parsed_dict.get("validation_errors", []),
-                imputation_notes=parsed_dict.get("imputation_notes", []),
-                is_valid=len(parsed_dict.get("validation_errors", [])) == 0,
-            )
-            
-            write_json(
-                PROCESSED_DIR / FileNamingConvention.parse_result(stem),
-                parsed_output
-            )
+        with stage_timer("format"):
+            # 데이터를 dict로 변환 (얕은 변환: 후보 meta 등은 복사하지 않음)
+            preprocessed_dict = preprocessed.to_dict()
+            extracted_dict = extracted.to_dict()
+            resolved_dict = resolved.to_dict()
+            parsed_dict = parsed.to_dict()
+
+            artifacts: Dict[str, Any] = {}
+
+            # 1) 전처리 산출물
+            if stages & {"raw", "normalized", "preprocess_log"}:
+                with log_step(logger, "전처리 산출물 생성", logging.DEBUG):
+                    preprocess_out = create_preprocess_outputs(
+                        stem=stem,
+                        preprocessed_dict=preprocessed_dict,
+                        raw_text=preprocessed.raw_text,
+                        normalized_text=preprocessed.normalized_text
+                    )
+                artifacts["raw"] = preprocess_out["raw"]
+                artifacts["normalized"] = preprocess_out["normalized"]
+                artifacts["preprocess_log"] = preprocess_out["log"]
+
+            # 2) Extractor 산출물
+            if stages & {"candidates", "extract_log"}:
+                with log_step(logger, "추출 산출물 생성", logging.DEBUG):
+                    extract_out = create_extract_outputs(
+                        stem=stem,
+                        extracted_dict=extracted_dict
+                    )
+                artifacts["candidates"] = extract_out["candidates"]
+                artifacts["extract_log"] = extract_out["log"]
+                candidate_summary = extract_out["summary"]
+            else:
+                candidate_summary = summarize_candidates(extracted_dict["candidates"])
+
+            # 3) Resolver 산출물
+            if "resolved" in stages:
+                with log_step(logger, "후보 선택 산출물 생성", logging.DEBUG):
+                    artifacts["resolved"] = create_resolve_outputs(
+                        stem=stem,
+                        resolved_dict=resolved_dict
+                    )
+
+            # 4) ParseResult 산출물 (포맷터 사용)
+            with log_step(logger, "최종 파싱 결과 생성", logging.DEBUG):
+                parsed_output = format_parse_result(
+                    source=f"{stem}.json",
+                    parsed_dict=parsed_dict,
+                )
+            artifacts["parsed"] = parsed_output
+
+        # 산출물 저장 (레이아웃은 저장소가 결정)
+        with log_step(logger, "산출물 저장", logging.DEBUG):
+            store.write_document(stem, artifacts)
         
         # 5) 요약 생성
         summary = build_processing_summary(
@@ -279,7 +287,7 @@ def process_single_file(input_path: Path) -> Tuple[str, bool, str, Dict[str, Any
             extracted_dict=extracted_dict,
             resolved_dict=resolved_dict,
             parsed_dict=parsed_dict,
-            candidate_summary=extract_out["summary"]
+            candidate_summary=candidate_summary
         )
         
         is_valid = summary["is_valid"]
@@ -288,7 +296,7 @@ def process_single_file(input_path: Path) -> Tuple[str, bool, str, Dict[str, Any
         console_output = format_console_output(input_path.name, summary)
         
         # 7) 산출물 목록 추가
-        files = get_output_files(stem)
+        files = store.output_files(stem, date=parsed_output["date"])
         console_output += f"\n\n[산출물]"
         for f in files:
             console_output += f"\n  - {f}"
@@ -296,14 +304,39 @@ def process_single_file(input_path: Path) -> Tuple[str, bool, str, Dict[str, Any
         status_text = "VALID" if is_valid else "INVALID"
         console_output += f"\n파일: {input_path.name} [SUCCESS ({status_text})]"
         
-        if logger:
+        if log_documents:
+            log_document(
+                input_path.name, "SUCCESS", is_valid, started_ns, stages_ns,
+                candidate_summary["counts"], parsed_output,
+            )
+        elif logger:
             if is_valid:
                 logger.info(f"✓ {input_path.name}: 검증 통과")
             else:
                 logger.warning(f"✗ {input_path.name}: 검증 실패")
         
+        status = "SUCCESS"
         return "SUCCESS", is_valid, console_output, parsed_output
         
+    except DocumentTimeout as e:
+        status = "TIMEOUT"
+        # 워커는 이미 교체됨: 입력은 격리하고 다음 문서로
+        if error_handler:
+            error_handler.handle_error(
+                error=e,
+                context=f"파일 처리: {input_path.name}",
+                recoverable=False,
+                source=input_path.name,
+            )
+        copied = quarantine.add(input_path, REASON_TIMEOUT, str(e)) if quarantine else None
+        if logger and copied:
+            logger.warning(f"격리: {input_path.name} → {copied}")
+        if log_documents:
+            log_document(
+                input_path.name, "TIMEOUT", False, started_ns, stages_ns, None,
+                {"validation_errors": ["pipeline_timeout"]},
+            )
+        return "TIMEOUT", False, f"\nTIMEOUT: {e}\n", {}
     except Exception as e:
         error_msg = f"\nERROR: {input_path.name} 처리 중 오류 발생\n"
         error_msg += f"  {type(e).__name__}: {e}\n"
@@ -312,64 +345,690 @@ def process_single_file(input_path: Path) -> Tuple[str, bool, str, Dict[str, Any
             error_handler.handle_error(
                 error=e,
                 context=f"파일 처리: {input_path.name}",
-                recoverable=False
+                recoverable=False,
+                source=input_path.name,
             )
         
         if logger:
             logger.error(f"파일 처리 실패: {input_path.name}", exc_info=True)
+        if isinstance(e, WorkerCrashed) and quarantine:
+            copied = quarantine.add(input_path, REASON_WORKER_CRASH, str(e))
+            if logger:
+                logger.warning(f"격리: {input_path.name} → {copied}")
+        if log_documents:
+            log_document(
+                input_path.name, "FAILED", False, started_ns, stages_ns, None,
+                {"validation_errors": [f"pipeline_error:{type(e).__name__}"]},
+            )
         
         import traceback
         error_msg += traceback.format_exc()
         
         return "FAILED", False, error_msg, {}
+    finally:
+        # 실패 / 시간 초과 문서도 포함 (느린 꼬리가 주로 여기에 있음), 상태별은 document.<상태>
+        elapsed_ns = time.perf_counter_ns() - started_ns
+        observe_stage("document", elapsed_ns)
+        observe_stage(f"document.{status.lower()}", elapsed_ns)
+        if log_documents:
+            stop_document_trace()
+
+
+def needs_evidence(stages: Any) -> bool:
+    """후보 목록/선택 결과를 남기지 않으면 추출·선택 근거도 만들지 않음"""
+    return bool(set(stages) & {"candidates", "resolved"})
+
+
+def run_pipeline(
+    input_path: Path,
+    with_evidence: bool,
+    trace: Optional[Dict[str, int]],
+    outcome: Optional[ScheduledResult] = None,
+) -> Tuple[Any, Any, Any, Any]:
+    """
+    파이프라인 실행 결과
+    - 병렬 모드: 워커 슬롯이 이미 실행한 결과 (단계 시간은 trace에 합산)
+    - --doc-timeout: 시간 제한 워커 프로세스에서 실행
+    - 기본: 현재 프로세스에서 실행
+    """
+    if outcome is not None:
+        if trace is not None and outcome.stages_ns:
+            for stage, ns in outcome.stages_ns.items():
+                trace[stage] = trace.get(stage, 0) + ns
+        return outcome.result()
+    if watchdog is None:
+        return run_full_pipeline(str(input_path), with_evidence=with_evidence)
+    return watchdog.run(str(input_path), with_evidence=with_evidence, trace=trace)
+
+
+def log_document(
+    source: str,
+    status: str,
+    is_valid: bool,
+    started_ns: int,
+    stages_ns: Optional[Dict[str, int]],
+    candidate_counts: Optional[Dict[str, Any]],
+    parsed: Dict[str, Any],
+) -> None:
+    """문서 1건 = JSON 로그 레코드 1건 (소요 시간, 후보 수, 경고 / 검증 오류 코드)"""
+    if not logger:
+        return
+    record = {
+        "source": source,
+        "status": status,
+        "is_valid": is_valid,
+        "duration_ms": round((time.perf_counter_ns() - started_ns) / 1e6, 3),
+        "stages_ms": {stage: round(ns / 1e6, 3) for stage, ns in (stages_ns or {}).items()},
+        "candidates": candidate_counts or {},
+        "warnings": [error_code(w) for w in parsed.get("parse_warnings", [])],
+        "validation_errors": [error_code(e) for e in parsed.get("validation_errors", [])],
+    }
+    level = logging.INFO if status == "SUCCESS" else logging.WARNING
+    logger.log(level, f"document {source}", extra={"document": record})
+
+
+def list_input_files(input_dir: Optional[Path] = None) -> Tuple[Path, List[str]]:
+    """배치 모드 처리 대상 (입력 디렉토리, 파일명 목록): 기본은 data/raw 샘플, 지정하면 디렉토리 안 *.json 전체 (이름순)"""
+    if input_dir is None:
+        return RAW_DIR, TARGET_FILES
+    return input_dir, sorted(path.name for path in input_dir.glob("*.json"))
+
+
+# ============================================================================
+# 체크포인트
+# ============================================================================
+
+def commit_checkpoint(
+    journal: CheckpointJournal,
+    csv_writer: SummaryCSVWriter,
+    sqlite_sink: Optional[SQLiteResultSink],
+    store: ArtifactStore,
+) -> None:
+    """
+    체크포인트 커밋: 결과(summary.csv, SQLite, 문서 산출물)를 먼저 디스크로 내보낸 뒤 완료 문서를 저널에 추가
+    산출물 기록에 실패하면 실패 문서 앞까지만 저널에 넣고 예외를 다시 던진다 (--resume 시 실패 문서부터 재처리)
+    """
+    csv_writer.flush(fsync=journal.fsync)
+    if sqlite_sink:
+        sqlite_sink.flush()
+    try:
+        store.flush()
+    except WriteFailedError as e:
+        journal.commit(failed={f"{stem}.json" for stem in e.keys})
+        raise
+    journal.commit()
+
+
+# ============================================================================
+# CLI 인자
+# ============================================================================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.main",
+        description="OCR 계근지 파싱 파이프라인",
+    )
+    parser.add_argument(
+        "--stdin", action="store_true",
+        help="stdin에서 JSONL 입력 (한 줄 = OCR JSON 1건)",
+    )
+    parser.add_argument(
+        "--stdout", action="store_true",
+        help="ParsedOutputSchema JSONL을 stdout으로 출력 (문서별 산출물 파일 없음)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="병렬 워커 프로세스 수 (기본: 1, 배치 모드는 큰 파일부터 동적 배분, 결과는 입력 순서)",
+    )
+    parser.add_argument(
+        "--schedule", choices=SCHEDULES, default=SCHEDULE_LPT,
+        help="배치 병렬 모드 배분 순서: lpt(파일 크기 내림차순, 기본) / input(입력 순서)",
+    )
+    parser.add_argument(
+        "--memory-budget", type=float, default=None, metavar="MB",
+        help="배치 병렬 모드 in-flight 추정 메모리 상한 (MB): 처리 중 + 순서 대기 문서(입력 크기, 후보 수 기준)가 넘으면 배분 보류",
+    )
+    parser.add_argument(
+        "--worker-max-docs", type=int, default=0, metavar="N",
+        help="워커 프로세스가 N건 처리하면 새 워커로 교체 (기본: 0=교체 안 함, --workers > 1 또는 --doc-timeout)",
+    )
+    parser.add_argument(
+        "--worker-max-rss", type=float, default=None, metavar="MB",
+        help="문서 처리 후 워커 프로세스 RSS가 MB를 넘으면 새 워커로 교체 (--workers > 1 또는 --doc-timeout)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"스트리밍 병렬 모드에서 워커 호출당 줄 수 (기본: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--input-dir", type=Path, default=None, metavar="DIR",
+        help="배치 모드 입력 디렉토리: 안의 *.json 전체를 이름순으로 처리 (기본: data/raw 샘플 4개)",
+    )
+    parser.add_argument(
+        "--csv-flush-every", type=int, default=Constants.CSV_FLUSH_EVERY,
+        help=f"summary.csv flush 주기 (행, 기본: {Constants.CSV_FLUSH_EVERY})",
+    )
+    parser.add_argument(
+        "--sqlite", type=Path, default=None, metavar="DB_PATH",
+        help="파싱 결과를 SQLite DB에도 기록 (조회: python -m src.sqlite_sink DB_PATH)",
+    )
+    parser.add_argument(
+        "--columnar", action="store_true",
+        help="요약을 컬럼형 파일로도 기록 (pyarrow 있으면 summary.parquet, 없으면 summary.npz)",
+    )
+    parser.add_argument(
+        "--layout", choices=FileNamingConvention.LAYOUTS,
+        default=FileNamingConvention.LAYOUT_FILES,
+        help="문서별 산출물 레이아웃: files(단계별 파일) / bundle(문서당 1개) / jsonl(실행당 단계별 JSONL + 인덱스)",
+    )
+    parser.add_argument(
+        "--verbosity", choices=FileNamingConvention.VERBOSITY_LEVELS,
+        default=FileNamingConvention.VERBOSITY_DEBUG,
+        help="문서별 산출물 상세 수준: minimal(파싱 결과만) / standard(+로그, 선택 결과) / debug(전체, 기본)",
+    )
+    parser.add_argument(
+        "--compact-json", action="store_true",
+        help="JSON 산출물을 들여쓰기 없이 한 줄로 기록 (운영용)",
+    )
+    parser.add_argument(
+        "--shard", choices=FileNamingConvention.SHARDS,
+        default=FileNamingConvention.SHARD_FLAT,
+        help="문서별 산출물 디렉토리 샤딩: flat / hash(ab/cd/) / date(YYYY/MM/DD/) (files, bundle 레이아웃)",
+    )
+    parser.add_argument(
+        "--writer-threads", type=int, default=Constants.WRITER_THREADS,
+        help=f"산출물 기록 스레드 수 (기본: {Constants.WRITER_THREADS}, 0=처리 스레드에서 바로 기록)",
+    )
+    parser.add_argument(
+        "--fsync", choices=FSYNC_POLICIES, default=FSYNC_NEVER,
+        help="산출물 fsync 정책: never / batch(묶음마다) / file(파일마다) (기본: never)",
+    )
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="단계별 지연 시간 계측: 종료 시 p50/p95/p99 보고 + JSON 덤프 (기본 경로: logs/metrics_YYYYMMDD_HHMMSS.json)",
+    )
+    parser.add_argument(
+        "--metrics-json", type=Path, default=None, metavar="PATH",
+        help="계측 JSON 덤프 경로 (지정하면 --metrics 포함, 스트리밍 모드는 지정할 때만 덤프)",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=None, metavar="PORT",
+        help="Prometheus 메트릭을 http://127.0.0.1:PORT/metrics 로 노출 (실행 중에만)",
+    )
+    parser.add_argument(
+        "--metrics-textfile", type=Path, default=None, metavar="PATH",
+        help="Prometheus 메트릭을 주기적으로 파일에 기록 (node_exporter textfile collector용)",
+    )
+    parser.add_argument(
+        "--metrics-interval", type=float, default=Constants.METRICS_TEXTFILE_INTERVAL,
+        help=f"--metrics-textfile 기록 주기 (초, 기본: {Constants.METRICS_TEXTFILE_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const=PROFILE_CPROFILE, default=None, choices=PROFILE_MODES,
+        help="프로파일: cprofile(기본, .pstats + collapsed stack) / sample(타이머 시그널 스택 샘플러)",
+    )
+    parser.add_argument(
+        "--profile-every", type=int, default=0, metavar="N",
+        help="cprofile 모드에서 N번째 문서마다만 프로파일 (기본: 0=실행 전체, 지정하면 --profile 포함)",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=Constants.PROFILE_SAMPLE_INTERVAL_MS, metavar="MS",
+        help=f"sample 모드 샘플 간격 (ms, 기본: {Constants.PROFILE_SAMPLE_INTERVAL_MS})",
+    )
+    parser.add_argument(
+        "--profile-out", type=Path, default=None, metavar="PREFIX",
+        help="프로파일 출력 경로 접두사 (기본: logs/profile_YYYYMMDD_HHMMSS)",
+    )
+    parser.add_argument(
+        "--memprofile", action="store_true",
+        help="메모리 프로파일 (tracemalloc): 단계별 순할당, 상위 할당 위치, 입력 크기 구간별 피크 / RSS",
+    )
+    parser.add_argument(
+        "--memprofile-every", type=int, default=Constants.MEMPROFILE_SNAPSHOT_EVERY, metavar="N",
+        help=f"N번째 문서마다 단계 전후 스냅샷 비교 (기본: {Constants.MEMPROFILE_SNAPSHOT_EVERY})",
+    )
+    parser.add_argument(
+        "--memprofile-top", type=int, default=Constants.MEMPROFILE_TOP, metavar="N",
+        help=f"보고할 상위 할당 위치 수 (기본: {Constants.MEMPROFILE_TOP})",
+    )
+    parser.add_argument(
+        "--memprofile-out", type=Path, default=None, metavar="PREFIX",
+        help="메모리 프로파일 출력 경로 접두사 (지정하면 --memprofile 포함, 기본: logs/memprofile_YYYYMMDD_HHMMSS)",
+    )
+    parser.add_argument(
+        "--log-queue", action="store_true",
+        help="큐 로깅: 로그 포맷 / 콘솔·파일 출력을 백그라운드 스레드에서 처리 (스트리밍 워커 로그도 부모로 모음)",
+    )
+    parser.add_argument(
+        "--progress", action="store_true",
+        help="스트리밍 모드 진행률(처리 건수, docs/s)을 stderr에 표시 (배치 모드는 항상 표시)",
+    )
+    parser.add_argument(
+        "--progress-interval", type=float, default=Constants.PROGRESS_MIN_INTERVAL_MS, metavar="MS",
+        help=f"프로그레스 바 최소 다시 그리기 간격 (ms, 기본: {Constants.PROGRESS_MIN_INTERVAL_MS}, "
+             f"터미널이 아니면 {Constants.PROGRESS_PLAIN_INTERVAL:g}초마다 한 줄)",
+    )
+    parser.add_argument(
+        "--doc-timeout", type=float, default=None, metavar="SECONDS",
+        help="문서당 처리 시간 제한: 문서를 워커 프로세스에서 처리하고 초과하면 워커를 교체, TIMEOUT으로 기록 + 입력 격리 (배치 모드)",
+    )
+    parser.add_argument(
+        "--quarantine-dir", type=Path, default=None, metavar="DIR",
+        help="--doc-timeout 시간 초과 / 워커 비정상 종료 입력의 격리 디렉토리 (기본: data/quarantine)",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="체크포인트 저널(처리 디렉토리의 checkpoint.jsonl)의 완료 문서를 건너뛰고 이어서 처리 (summary.csv / SQLite에 중복 행 없음)",
+    )
+    parser.add_argument(
+        "--checkpoint-every", type=int, default=Constants.CHECKPOINT_EVERY, metavar="N",
+        help=f"N건마다 결과 파일을 flush하고 체크포인트 저널에 커밋 (기본: {Constants.CHECKPOINT_EVERY})",
+    )
+    parser.add_argument(
+        "--log-json", action="store_true",
+        help="파일 로그를 JSON lines로 기록: 문서당 레코드 1건(단계별 소요 시간, 후보 수, 경고 / 검증 오류 코드), 단계별 로그 줄 생략",
+    )
+    parser.add_argument(
+        "--log-rotate", nargs="?", type=int, const=Constants.LOG_MAX_BYTES, default=0, metavar="BYTES",
+        help=f"실행마다 새 로그 파일 대신 logs/pipeline.log를 크기 기준으로 교체 (기본 크기: {Constants.LOG_MAX_BYTES}바이트)",
+    )
+    parser.add_argument(
+        "--log-backups", type=int, default=Constants.LOG_BACKUP_COUNT, metavar="N",
+        help=f"--log-rotate로 교체된 로그 파일 보관 수 (기본: {Constants.LOG_BACKUP_COUNT})",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.stdin != args.stdout:
+        parser.error("--stdin과 --stdout은 함께 사용해야 합니다")
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size는 1 이상이어야 합니다")
+    if args.input_dir is not None and args.stdin:
+        parser.error("--input-dir은 배치 모드 전용입니다")
+    if args.input_dir is not None and not args.input_dir.is_dir():
+        parser.error(f"--input-dir 디렉토리가 없습니다: {args.input_dir}")
+    if args.csv_flush_every < 1:
+        parser.error("--csv-flush-every는 1 이상이어야 합니다")
+    if args.layout == FileNamingConvention.LAYOUT_JSONL and args.shard != FileNamingConvention.SHARD_FLAT:
+        parser.error("jsonl 레이아웃은 --shard를 지원하지 않습니다")
+    if args.writer_threads < 0:
+        parser.error("--writer-threads는 0 이상이어야 합니다")
+    if args.metrics_json:
+        args.metrics = True
+    if args.metrics_port is not None and not 0 <= args.metrics_port <= 65535:
+        parser.error("--metrics-port는 0~65535 범위여야 합니다")
+    if args.metrics_interval <= 0:
+        parser.error("--metrics-interval은 0보다 커야 합니다")
+    if args.profile_every < 0:
+        parser.error("--profile-every는 0 이상이어야 합니다")
+    if args.profile_every and args.profile is None:
+        args.profile = PROFILE_CPROFILE
+    if args.profile_every and args.profile == PROFILE_SAMPLE:
+        parser.error("--profile-every는 cprofile 모드에만 적용됩니다")
+    if args.profile_interval <= 0:
+        parser.error("--profile-interval은 0보다 커야 합니다")
+    if args.memprofile_out:
+        args.memprofile = True
+    if args.memprofile_every < 1:
+        parser.error("--memprofile-every는 1 이상이어야 합니다")
+    if args.memprofile_top < 1:
+        parser.error("--memprofile-top은 1 이상이어야 합니다")
+    if args.progress_interval < 0:
+        parser.error("--progress-interval은 0 이상이어야 합니다")
+    if args.log_json and args.stdin:
+        parser.error("--log-json은 배치 모드 전용입니다 (스트리밍 모드는 파일 로그가 없음)")
+    if args.doc_timeout is not None and args.stdin:
+        parser.error("--doc-timeout은 배치 모드 전용입니다")
+    if args.doc_timeout is not None and args.doc_timeout <= 0:
+        parser.error("--doc-timeout은 0보다 커야 합니다")
+    if args.doc_timeout is not None and (args.profile or args.memprofile):
+        parser.error("--doc-timeout은 --profile / --memprofile과 함께 쓸 수 없습니다 (워커 프로세스는 프로파일하지 않음)")
+    if args.workers > 1 and not args.stdin and (args.profile or args.memprofile):
+        parser.error("배치 병렬 모드(--workers)는 --profile / --memprofile과 함께 쓸 수 없습니다 (스트리밍 모드는 지원)")
+    if args.memory_budget is not None and (args.stdin or args.workers < 2):
+        parser.error("--memory-budget은 배치 병렬 모드(--workers > 1) 전용입니다")
+    if args.memory_budget is not None and args.memory_budget <= 0:
+        parser.error("--memory-budget은 0보다 커야 합니다")
+    if args.worker_max_docs < 0:
+        parser.error("--worker-max-docs는 0 이상이어야 합니다")
+    if args.worker_max_rss is not None and args.worker_max_rss <= 0:
+        parser.error("--worker-max-rss는 0보다 커야 합니다")
+    if (args.worker_max_docs or args.worker_max_rss is not None) and (
+        args.stdin or (args.workers < 2 and args.doc_timeout is None)
+    ):
+        parser.error("--worker-max-docs / --worker-max-rss는 워커 프로세스를 쓰는 배치 모드(--workers > 1 또는 --doc-timeout) 전용입니다")
+    if args.quarantine_dir is not None and args.doc_timeout is None:
+        parser.error("--quarantine-dir은 --doc-timeout과 함께 사용해야 합니다")
+    if args.resume and args.stdin:
+        parser.error("--resume은 배치 모드 전용입니다")
+    if args.resume and args.columnar:
+        parser.error("--resume은 --columnar와 함께 쓸 수 없습니다 (컬럼형 파일은 종료 시에만 완성되어 이어쓸 수 없음)")
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every는 1 이상이어야 합니다")
+    if args.log_rotate < 0:
+        parser.error("--log-rotate는 0 이상이어야 합니다")
+    if args.log_backups < 1:
+        parser.error("--log-backups는 1 이상이어야 합니다")
+
+    return args
+
+
+# ============================================================================
+# 계측 보고
+# ============================================================================
+
+def report_metrics(
+    metrics: StageMetrics,
+    json_path: Optional[Path],
+    mode: str,
+    out: Optional[TextIO] = None
+) -> None:
+    """단계별 지연 시간 표 출력 + (경로가 있으면) JSON 덤프"""
+    out = out or sys.stdout
+    print("\n단계별 지연 시간 (ms):", file=out)
+    print(metrics.format_report(), file=out)
+
+    if json_path:
+        metrics.dump_json(json_path, extra={"mode": mode})
+        if logger:
+            logger.info(f"계측 JSON: {json_path}")
+
+
+def start_telemetry(args: argparse.Namespace) -> Tuple[Optional[PipelineTelemetry], List[Any]]:
+    """
+    --metrics-port / --metrics-textfile: Prometheus 메트릭 노출 시작
+    (단계 지연 시간 히스토그램을 위해 단계 계측도 함께 켠다)
+
+    Returns:
+        (telemetry, exporters) - 노출 옵션이 없으면 (None, [])
+    """
+    if args.metrics_port is None and args.metrics_textfile is None:
+        return None, []
+
+    telemetry = PipelineTelemetry(enable_metrics())
+    exporters: List[Any] = []
+    if args.metrics_port is not None:
+        server = MetricsHTTPServer(telemetry.registry, args.metrics_port)
+        exporters.append(server)
+        if logger:
+            logger.info(f"Prometheus 메트릭: http://127.0.0.1:{server.port}/metrics")
+    if args.metrics_textfile is not None:
+        exporters.append(
+            TextfileExporter(telemetry.registry, args.metrics_textfile, args.metrics_interval)
+        )
+        if logger:
+            logger.info(f"Prometheus textfile: {args.metrics_textfile} ({args.metrics_interval:g}초마다)")
+    return telemetry, exporters
+
+
+def stop_telemetry(exporters: List[Any]) -> None:
+    """노출 종료 (textfile은 최종 값을 한 번 더 기록)"""
+    for exporter in exporters:
+        exporter.close()
+
+
+def start_profile(args: argparse.Namespace) -> None:
+    """--profile: 현재 프로세스에서 프로파일 세션 시작"""
+    if args.profile is not None:
+        start_profiling(args.profile, every=args.profile_every, interval=args.profile_interval / 1000)
+
+
+def finish_profile(args: argparse.Namespace, out: Optional[TextIO] = None) -> None:
+    """프로파일 세션 종료 및 파일 기록 (out이 있으면 경로를 출력, 없으면 로그)"""
+    session = stop_profiling()
+    if session is None:
+        return
+
+    prefix = args.profile_out or LOG_DIR / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    for path in session.finish(prefix):
+        message = f"프로파일: {path}"
+        if out is not None:
+            print(message, file=out)
+        elif logger:
+            logger.info(message)
+
+
+def start_memory_profile(args: argparse.Namespace) -> None:
+    """--memprofile: 현재 프로세스에서 메모리 프로파일 시작"""
+    if args.memprofile:
+        start_memprofile(every=args.memprofile_every, top=args.memprofile_top)
+
+
+def finish_memory_profile(args: argparse.Namespace, out: Optional[TextIO] = None) -> None:
+    """메모리 프로파일 종료 후 보고서 출력 및 파일 기록 (out: 보고서 / 경로 출력 스트림)"""
+    profiler = stop_memprofile()
+    if profiler is None:
+        return
+    profiler.stop()
+
+    out = out or sys.stdout
+    print("\n" + profiler.format_report(), file=out)
+    prefix = args.memprofile_out or LOG_DIR / f"memprofile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    for path in profiler.write(prefix):
+        message = f"메모리 프로파일: {path}"
+        if out is sys.stderr:
+            print(message, file=out)
+        elif logger:
+            logger.info(message)
+
+
+# ============================================================================
+# 스트리밍 모드 (stdin JSONL -> stdout JSONL)
+# ============================================================================
+
+def run_stream_mode(args: argparse.Namespace) -> None:
+    """
+    stdin/stdout JSONL 스트리밍 실행
+    - stdout은 데이터 전용: 로그는 stderr로, 헤더/프로그레스 바는 출력하지 않음
+    """
+    global logger, error_handler
+
+    logger = setup_logger(
+        name="ocr_pipeline",
+        log_dir=None,
+        console_level=logging.WARNING,
+        enable_color=False,
+        console_stream=sys.stderr,
+        queued=args.log_queue,
+    )
+
+    if hasattr(sys.stdin, "reconfigure"):
+        sys.stdin.reconfigure(encoding=Constants.DEFAULT_ENCODING)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding=Constants.DEFAULT_ENCODING)
+
+    metrics = enable_metrics() if args.metrics else None
+    telemetry, exporters = start_telemetry(args)
+    start_profile(args)
+    start_memory_profile(args)
+    # 줄별 실패는 로그 대신 시그니처별로 모아 마지막에 요약 (병렬 모드는 워커 집계 병합)
+    error_handler = ErrorHandler()
+
+    try:
+        stats = run_stream(
+            sys.stdin,
+            sys.stdout,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            on_result=telemetry.record_document if telemetry else None,
+            error_handler=error_handler,
+            progress=ProgressBar(
+                total=None, prefix="처리", stream=sys.stderr,
+                min_interval=args.progress_interval / 1000,
+            ) if args.progress else None,
+        )
+    finally:
+        stop_telemetry(exporters)
+        finish_profile(args, out=sys.stderr)
+        finish_memory_profile(args, out=sys.stderr)
+
+    # stdout은 데이터 전용이므로 보고는 stderr로
+    if metrics is not None:
+        report_metrics(metrics, args.metrics_json, mode="stream", out=sys.stderr)
+
+    if stats["failed"]:
+        logger.warning(
+            f"스트리밍 처리 중 실패: {stats['failed']}건 / 전체 {stats['total']}건"
+        )
+        groups = sorted(error_handler.groups.values(), key=lambda g: -g.count)
+        for group in groups[:Constants.ERROR_SUMMARY_GROUPS]:
+            logger.warning(
+                f"  {group.error_type} @ {group.frame}: {group.count}건 "
+                f"(예: {', '.join(group.sources[:3])})"
+            )
+        if len(groups) > Constants.ERROR_SUMMARY_GROUPS:
+            logger.warning(f"  ... 외 {len(groups) - Constants.ERROR_SUMMARY_GROUPS}개 그룹")
+    stop_logger()
 
 
 # ============================================================================
 # 메인 함수
 # ============================================================================
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """메인 실행 함수"""
-    global logger, error_handler
+    global logger, error_handler, artifact_store, log_documents, watchdog, quarantine
+
+    args = parse_args(argv)
+
+    if args.stdin:
+        run_stream_mode(args)
+        return
     
     # 로거 및 에러 핸들러 초기화
     logger = setup_logger(
         name="ocr_pipeline",
         log_dir=LOG_DIR,
-        console_level=logging.INFO
+        console_level=logging.INFO,
+        queued=args.log_queue,
+        max_bytes=args.log_rotate,
+        backup_count=args.log_backups,
+        json_lines=args.log_json,
+        # JSON 로그는 문서 레코드로 충분하므로 단계별 DEBUG 줄은 만들지 않는다
+        file_level=logging.INFO if args.log_json else logging.DEBUG,
     )
+    log_documents = args.log_json
     error_handler = ErrorHandler(logger)
     
     # 헤더 출력
     print_section_header("OCR 데이터 처리 파이프라인")
     
-    logger.info(f"처리 대상: {len(TARGET_FILES)}개 파일")
-    logger.info(f"입력 경로: {RAW_DIR}")
+    input_dir, target_files = list_input_files(args.input_dir)
+    logger.info(f"처리 대상: {len(target_files)}개 파일")
+    logger.info(f"입력 경로: {input_dir}")
     logger.info(f"출력 경로: {PROCESSED_DIR}")
     
     # 디렉토리 생성
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # results: (status, filename, is_valid)
-    results: List[Tuple[str, str, bool]] = []
+    metrics = enable_metrics() if args.metrics else None
+    telemetry, exporters = start_telemetry(args)
+
+    writer = BackgroundFileWriter(threads=args.writer_threads, fsync=args.fsync)
+    if telemetry:
+        telemetry.track_writer(writer)
+    artifact_store = create_artifact_store(
+        args.layout, PROCESSED_DIR, writer=writer, shard=args.shard,
+        verbosity=args.verbosity, compact_json=args.compact_json,
+    )
+    logger.info(
+        f"산출물 레이아웃: {args.layout} (상세 수준 {args.verbosity}, 샤딩 {args.shard}, "
+        f"기록 스레드 {args.writer_threads}, fsync={args.fsync})"
+    )
+
+    # 체크포인트 저널 (--resume: 완료 문서는 건너뛰고 summary.csv는 마지막 커밋 위치부터 이어쓰기)
+    csv_path = PROCESSED_DIR / FileNamingConvention.summary_csv()
+    journal = CheckpointJournal(
+        PROCESSED_DIR / FileNamingConvention.checkpoint_journal(),
+        resume=args.resume,
+        fsync=args.fsync != FSYNC_NEVER,
+    )
+    if args.resume:
+        dropped = truncate_results(csv_path, journal.csv_offset)
+        target_files = [filename for filename in target_files if filename not in journal.completed]
+        logger.info(
+            f"체크포인트 재개: 완료 {journal.resumed}개 건너뜀, 남은 파일 {len(target_files)}개 "
+            f"(summary.csv 미커밋 {dropped}바이트 제거)"
+        )
+
+    # results: (status, filename, is_valid), 재개 시 이전 실행의 완료 문서 포함
+    results: List[Tuple[str, str, bool]] = [
+        (entry.status, entry.source, entry.is_valid) for entry in journal.completed.values()
+    ]
     
-    # CSV 행 수집
-    csv_rows: List[CSVRowSchema] = []
+    # 요약 CSV (결과가 나올 때마다 한 행씩 기록)
+    csv_writer = SummaryCSVWriter(csv_path, flush_every=args.csv_flush_every, resume=args.resume)
+    
+    # SQLite 결과 저장소 (선택)
+    sqlite_sink = SQLiteResultSink(args.sqlite) if args.sqlite else None
+    
+    # 컬럼형 요약 (선택)
+    columnar = None
+    if args.columnar:
+        backend = default_backend()
+        columnar = ColumnarExporter(
+            PROCESSED_DIR / FileNamingConvention.summary_columnar(backend_suffix(backend)),
+            backend=backend,
+        )
     
+    start_profile(args)
+    start_memory_profile(args)
+
+    # 문서 실행 방식: 병렬 워커 슬롯(--workers) / 시간 제한 워커(--doc-timeout) / 현재 프로세스
+    watchdog = quarantine = None
+    scheduler = None
+    if args.doc_timeout is not None:
+        quarantine = Quarantine(args.quarantine_dir or QUARANTINE_DIR)
+        logger.info(f"문서 시간 제한: {args.doc_timeout:g}초 (격리 경로: {quarantine.directory})")
+    max_rss = int(args.worker_max_rss * MB) if args.worker_max_rss is not None else None
+    if args.workers > 1:
+        scheduler = BatchScheduler(
+            args.workers, timeout=args.doc_timeout, schedule=args.schedule,
+            memory_budget=int(args.memory_budget * MB) if args.memory_budget is not None else None,
+            max_tasks=args.worker_max_docs, max_rss=max_rss,
+        )
+        logger.info(f"병렬 처리: 워커 {args.workers}개, 배분 순서 {args.schedule}")
+    elif args.doc_timeout is not None:
+        watchdog = DocumentWatchdog(args.doc_timeout, max_tasks=args.worker_max_docs, max_rss=max_rss)
+    if args.memory_budget is not None:
+        logger.info(f"메모리 예산: in-flight {args.memory_budget:g}MB")
+    if args.worker_max_docs or max_rss is not None:
+        logger.info(
+            f"워커 교체: {args.worker_max_docs or '-'}건마다 / RSS "
+            f"{f'{args.worker_max_rss:g}MB' if max_rss is not None else '-'} 초과 시"
+        )
+
     # 프로그레스 바
     progress = ProgressBar(
-        total=len(TARGET_FILES),
+        total=len(target_files),
         prefix="진행률",
-        suffix="완료"
+        suffix="완료",
+        min_interval=args.progress_interval / 1000,
     )
 
-    for i, filename in enumerate(TARGET_FILES, 1):
-        input_path = RAW_DIR / filename
+    # (입력 경로, 병렬 모드 워커 결과): 병렬 모드도 입력 순서대로 나온다
+    input_paths = [input_dir / filename for filename in target_files]
+    if scheduler is not None:
+        documents = (
+            (item.path, item) for item in scheduler.run(
+                input_paths, with_evidence=needs_evidence(artifact_store.stages), traced=log_documents,
+            )
+        )
+    else:
+        documents = ((input_path, None) for input_path in input_paths)
+
+    for i, (input_path, outcome) in enumerate(documents, 1):
+        filename = input_path.name
         
-        logger.info(f"\n[{i}/{len(TARGET_FILES)}] {filename} 처리 중...")
+        if not log_documents:
+            logger.info(f"\n[{i}/{len(target_files)}] {filename} 처리 중...")
         
-        status, is_valid, console_output, parsed_data = process_single_file(input_path)
+        with profile_document(i), memory_document(i, input_path):
+            status, is_valid, console_output, parsed_data = process_single_file(input_path, outcome)
         
         # 콘솔 출력 (상세 정보는 디버그 모드에서만)
         if status == "SUCCESS":
@@ -379,26 +1038,80 @@ def main() -> None:
                 print_status("✗", filename, "검증 실패", Colors.YELLOW)
         elif status == "MISSING":
             print_status("!", filename, "파일 없음", Colors.YELLOW)
+        elif status == "TIMEOUT":
+            print_status("⏱", filename, "시간 초과", Colors.RED)
         else:
             print_status("✗", filename, "처리 실패", Colors.RED)
         
         results.append((status, filename, is_valid))
+        if telemetry:
+            telemetry.record_document(status, is_valid, parsed_data.get("validation_errors", []))
         
-        # CSV 행 추가
+        # CSV 행 기록
         if status == "SUCCESS" and parsed_data:
-            csv_row = format_csv_row(filename, parsed_data)
-            csv_rows.append(csv_row)
+            csv_writer.write_row(format_csv_row(filename, parsed_data))
+            if sqlite_sink:
+                sqlite_sink.write(parsed_data)
+            if columnar:
+                columnar.write(filename, parsed_data)
+        
+        # 체크포인트: checkpoint_every건마다 결과 파일 flush 후 저널 커밋
+        journal.record(filename, status, is_valid, csv_writer.offset)
+        if journal.pending >= args.checkpoint_every:
+            commit_checkpoint(journal, csv_writer, sqlite_sink, artifact_store)
         
         # 프로그레스 바 업데이트
         progress.update()
 
-    # CSV 파일 생성
-    if csv_rows:
-        with log_step(logger, "요약 CSV 생성"):
-            csv_path = PROCESSED_DIR / FileNamingConvention.summary_csv()
-            write_summary_csv(csv_path, csv_rows)
-            logger.info(f"CSV 파일 생성: {csv_path}")
-            print(f"  ✓ 요약 CSV 생성: {csv_path.name}")
+    runner = scheduler or watchdog
+    if runner is not None:
+        runner.close()
+        runner_stats = runner.stats()
+        if scheduler is not None:
+            logger.info(
+                f"병렬 처리: 워커 {runner_stats['workers']}개 ({runner_stats['schedule']}), "
+                f"경과 {runner_stats['wall_sec']}초, 워커 가동률 {runner_stats['utilization'] or 0:.1%}"
+            )
+        if scheduler is not None and args.memory_budget is not None:
+            logger.info(
+                f"메모리 예산: 최대 in-flight {runner_stats['peak_inflight_bytes'] / MB:.1f}MB / "
+                f"{args.memory_budget:g}MB, 배분 보류 {runner_stats['throttled']}회"
+            )
+        if args.worker_max_docs or max_rss is not None:
+            logger.info(
+                f"워커 교체: 문서 수 {runner_stats['recycled_tasks']}회, RSS {runner_stats['recycled_rss']}회, "
+                f"워커 RSS 최대 {runner_stats['rss_max'] / MB:.1f}MB"
+            )
+        if args.doc_timeout is not None:
+            logger.info(
+                f"문서 시간 제한: 시간 초과 {runner_stats['timeouts']}건, 워커 비정상 종료 {runner_stats['crashes']}건, "
+                f"워커 시작 {runner_stats['workers_started']}회"
+            )
+        watchdog = None
+    commit_checkpoint(journal, csv_writer, sqlite_sink, artifact_store)
+    artifact_store.close()
+    stop_telemetry(exporters)
+    finish_profile(args)
+    finish_memory_profile(args)
+    writer_stats = writer.stats()
+    logger.info(
+        f"산출물 기록: {writer_stats['files']}개 파일, "
+        f"{writer_stats['files_per_sec']} files/s, {writer_stats['mb_per_sec']} MB/s, "
+        f"큐 대기 평균 {writer_stats['queue_latency_avg_ms']}ms / 최대 {writer_stats['queue_latency_max_ms']}ms"
+    )
+    csv_writer.close()
+    if sqlite_sink:
+        sqlite_sink.close()
+        logger.info(f"SQLite 기록: {args.sqlite} ({sqlite_sink.rows_written}건)")
+    if columnar:
+        columnar.close()
+        logger.info(f"컬럼형 요약 생성: {columnar.output_path} ({columnar.rows_written}행)")
+    journal.close()
+    logger.info(f"체크포인트 저널: {journal.path} (완료 {len(journal.completed)}개, 커밋 {journal.commits}회)")
+
+    if csv_writer.rows_written:
+        logger.info(f"CSV 파일 생성: {csv_path} ({csv_writer.rows_written}행)")
+        print(f"  ✓ 요약 CSV 생성: {csv_path.name}")
 
     # 최종 요약
     print_section_header("처리 완료")
@@ -410,6 +1123,7 @@ def main() -> None:
     valid_count = sum(1 for r in results if r[0] == "SUCCESS" and r[2] is True)
     failed_count = sum(1 for r in results if r[0] == "FAILED")
     missing_count = sum(1 for r in results if r[0] == "MISSING")
+    timeout_count = sum(1 for r in results if r[0] == "TIMEOUT")
 
     print("결과 요약:")
     print(f"  전체:        {len(results)}개")
@@ -417,8 +1131,16 @@ def main() -> None:
     print(f"  검증통과:    {valid_count}개")
     print(f"  실패:        {failed_count}개")
     print(f"  파일 없음:   {missing_count}개")
+    print(f"  시간 초과:   {timeout_count}개")
+    if quarantine is not None and quarantine.count:
+        print(f"  격리:        {quarantine.count}개 ({quarantine.index_path})")
+    if journal.resumed:
+        print(f"  이전 실행:   {journal.resumed}개 (체크포인트에서 건너뜀)")
     
-    logger.info(f"처리 완료: 전체 {len(results)}개, 성공 {success_count}개, 검증통과 {valid_count}개")
+    logger.info(
+        f"처리 완료: 전체 {len(results)}개, 성공 {success_count}개, 검증통과 {valid_count}개, "
+        f"실패 {failed_count}개, 시간 초과 {timeout_count}개"
+    )
     
     # 에러 리포트
     if error_handler.has_critical_errors():
@@ -428,10 +1150,16 @@ def main() -> None:
         
         # 에러 리포트 파일 생성
         error_report_path = LOG_DIR / "error_report.txt"
-        error_report = error_handler.generate_error_report()
-        error_report_path.write_text(error_report, encoding="utf-8")
+        error_handler.write_error_report(error_report_path)
         logger.info(f"에러 리포트: {error_report_path}")
     
+    if metrics is not None:
+        metrics_path = args.metrics_json or (
+            LOG_DIR / f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        report_metrics(metrics, metrics_path, mode="batch")
+
+    stop_logger()
     print("\n처리가 완료되었습니다.")
 
 
@@ -0,0 +1,377 @@
+"""
+메모리 프로파일 (--memprofile)
+- tracemalloc으로 파이프라인 단계(metrics.stage_timer 구간)마다 순할당량(종료 - 시작 추적 메모리) 집계
+- N번째 문서마다 단계 전후 스냅샷을 비교해 단계별 상위 할당 위치(파일:줄) 누적
+- 문서 1건 처리 후 남은 메모리(문서 순할당)와 문서별 tracemalloc 피크 / RSS를
+  입력 크기 구간별로 집계 → 처리 후에도 남는 메모리(결과 누적, 캐시 등)와 큰 문서의 피크를 구분
+- 실행 시작 ~ 종료 스냅샷 비교로 실행 동안 남은 메모리의 상위 할당 위치 보고
+
+단계 구간은 중첩될 수 있으므로(예: 기록 스레드 0개일 때 write ⊃ write.io) 순할당량은 포함 관계 그대로다.
+처리 스레드(프로파일을 시작한 스레드) 밖의 단계(기록 스레드의 write.io 등)는 집계하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import tracemalloc
+from bisect import bisect_right
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .config import Constants
+from .metrics import set_stage_hook
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# 보고서에 상위 할당 위치를 보여줄 단계 수
+_REPORT_STAGES = 5
+
+# 집계에서 제외할 파일 (추적기 / 이 모듈 자신의 할당)
+_EXCLUDED_FILES = {tracemalloc.__file__, __file__}
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot()
+
+
+def _top_diff(after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, top: int) -> List[tracemalloc.StatisticDiff]:
+    # filter_traces()는 추적 블록마다 파이썬으로 돌아 느리므로 위치별로 묶은 뒤 제외한다
+    stats = after.compare_to(before, "lineno")
+    return [
+        s for s in stats
+        if s.size_diff and s.traceback[0].filename not in _EXCLUDED_FILES
+        and not s.traceback[0].filename.startswith("<frozen importlib")
+    ][:top]
+
+
+def _site(stat: tracemalloc.StatisticDiff) -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def current_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux는 /proc/self/statm, 그 외에는 최대 RSS로 대체, 없으면 None)"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    return None
+
+
+def size_bucket(size: int, bounds_kb: List[int] = Constants.MEMPROFILE_SIZE_BUCKETS_KB) -> str:
+    """입력 크기 구간 이름 (예: "<4KB", "4-16KB", ">=1024KB")"""
+    i = bisect_right([b * 1024 for b in bounds_kb], size)
+    if i == 0:
+        return f"<{bounds_kb[0]}KB"
+    if i == len(bounds_kb):
+        return f">={bounds_kb[-1]}KB"
+    return f"{bounds_kb[i - 1]}-{bounds_kb[i]}KB"
+
+
+def _source_size(source: Union[int, str, Path]) -> int:
+    if isinstance(source, Path):
+        try:
+            return source.stat().st_size
+        except OSError:
+            return 0
+    if isinstance(source, str):
+        return len(source.encode(Constants.DEFAULT_ENCODING))
+    return int(source)
+
+
+class _StageMemory:
+    """단계 1구간의 순할당량 (+ 스냅샷 문서면 상위 할당 위치)"""
+
+    __slots__ = ("profiler", "stage", "before", "snapshot")
+
+    def __init__(self, profiler: "MemoryProfiler", stage: str):
+        self.profiler = profiler
+        self.stage = stage
+
+    def __enter__(self):
+        self.snapshot = _take_snapshot() if self.profiler._snapshot_document else None
+        self.before = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        net = tracemalloc.get_traced_memory()[0] - self.before
+        self.profiler._record_stage(self.stage, net, self.snapshot)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class MemoryProfiler:
+    """
+    tracemalloc 기반 단계별 메모리 프로파일
+
+    Args:
+        every: N번째 문서마다 단계 전후 스냅샷 비교 (1번째 문서는 항상)
+        top: 보고할 상위 할당 위치 수
+        frames: tracemalloc 추적 프레임 수
+    """
+
+    def __init__(
+        self,
+        every: int = Constants.MEMPROFILE_SNAPSHOT_EVERY,
+        top: int = Constants.MEMPROFILE_TOP,
+        frames: int = 1,
+    ):
+        self.every = max(1, every)
+        self.top = top
+        self.frames = frames
+
+        self.stage_net: Dict[str, int] = defaultdict(int)
+        self.stage_calls: Dict[str, int] = defaultdict(int)
+        self.stage_sites: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        # 크기 구간 → {documents, bytes, retained, traced_peak_max, rss_max}
+        self.buckets: Dict[str, Dict[str, int]] = {}
+        self.documents = 0
+        self.run_sites: Dict[str, int] = {}
+
+        self._snapshot_document = False
+        self._thread_id = threading.get_ident()
+        self._run_start: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._thread_id = threading.get_ident()
+        self._run_start = _take_snapshot()
+        set_stage_hook(self._stage)
+
+    def _stage(self, stage: str):
+        if threading.get_ident() != self._thread_id:
+            return _NULL_STAGE
+        return _StageMemory(self, stage)
+
+    def _record_stage(self, stage: str, net: int, before: Optional[tracemalloc.Snapshot]) -> None:
+        self.stage_net[stage] += net
+        self.stage_calls[stage] += 1
+        if before is None:
+            return
+        sites = self.stage_sites[stage]
+        for stat in _top_diff(_take_snapshot(), before, self.top):
+            sites[_site(stat)] += stat.size_diff
+
+    def document(self, index: int, source: Union[int, str, Path]) -> "_DocumentMemory":
+        """문서 1건 처리 구간 (source: 입력 크기 계산용 - 파일 경로, 원문 줄 또는 바이트 수)"""
+        return _DocumentMemory(self, index, source)
+
+    def _record_document(self, size: int, retained: int, traced_peak: int) -> None:
+        self.documents += 1
+        bucket = self.buckets.setdefault(
+            size_bucket(size),
+            {"documents": 0, "bytes": 0, "retained": 0, "traced_peak_max": 0, "rss_max": 0},
+        )
+        bucket["documents"] += 1
+        bucket["bytes"] += size
+        bucket["retained"] += retained
+        bucket["traced_peak_max"] = max(bucket["traced_peak_max"], traced_peak)
+        bucket["rss_max"] = max(bucket["rss_max"], current_rss_bytes() or 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """지금까지의 집계를 꺼냄 (워커 → 부모 전달용, 수집은 계속됨)"""
+        data = self.to_dict(include_run=False)
+        self.stage_net.clear()
+        self.stage_calls.clear()
+        self.stage_sites.clear()
+        self.buckets = {}
+        self.documents = 0
+        return data
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """다른 프로세스의 snapshot() 병합 (순할당 합산, 피크는 최대값)"""
+        self.documents += data["documents"]
+        for stage, s in data["stages"].items():
+            self.stage_net[stage] += s["net_bytes"]
+            self.stage_calls[stage] += s["calls"]
+            for site, size in s["top_sites"].items():
+                self.stage_sites[stage][site] += size
+        for name, b in data["size_buckets"].items():
+            bucket = self.buckets.setdefault(
+                name, {"documents": 0, "bytes": 0, "retained": 0, "traced_peak_max": 0, "rss_max": 0}
+            )
+            for key in ("documents", "bytes", "retained"):
+                bucket[key] += b[key]
+            for key in ("traced_peak_max", "rss_max"):
+                bucket[key] = max(bucket[key], b[key])
+
+    def stop(self) -> None:
+        """수집 종료 (실행 전체 상위 할당 위치 계산 후 추적 중단)"""
+        set_stage_hook(None)
+        if self._run_start is not None and tracemalloc.is_tracing():
+            stats = _top_diff(_take_snapshot(), self._run_start, self.top)
+            self.run_sites = {_site(s): s.size_diff for s in stats}
+            self._run_start = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def abandon(self) -> None:
+        """기록 없이 중단 (fork로 물려받은 프로파일러 정리용)"""
+        set_stage_hook(None)
+        self._run_start = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    # ------------------------------------------------------------------
+    # 보고
+    # ------------------------------------------------------------------
+
+    def to_dict(self, include_run: bool = True) -> Dict[str, Any]:
+        stages = {}
+        for stage in self.stage_calls:
+            sites = sorted(self.stage_sites.get(stage, {}).items(), key=lambda kv: -abs(kv[1]))
+            stages[stage] = {
+                "calls": self.stage_calls[stage],
+                "net_bytes": self.stage_net[stage],
+                "top_sites": dict(sites[: self.top]),
+            }
+        data: Dict[str, Any] = {
+            "documents": self.documents,
+            "stages": stages,
+            "size_buckets": {name: dict(b) for name, b in self.buckets.items()},
+        }
+        if include_run:
+            data["run_top_sites"] = dict(self.run_sites)
+        return data
+
+    def format_report(self) -> str:
+        lines = [f"메모리 프로파일: 문서 {self.documents}건"]
+
+        lines.append("\n[단계별 순할당 (KB, 구간 종료 - 시작)]")
+        width = max([len(s) for s in self.stage_calls] + [5])
+        lines.append(f"{'stage':{width}s} {'calls':>8s} {'net_kb':>12s} {'per_call_kb':>12s}")
+        for stage in sorted(self.stage_calls, key=lambda s: -abs(self.stage_net[s])):
+            calls, net = self.stage_calls[stage], self.stage_net[stage]
+            lines.append(f"{stage:{width}s} {calls:8d} {net / 1024:12.1f} {net / calls / 1024:12.2f}")
+
+        lines.append("\n[입력 크기 구간별 (문서 처리 후 남은 메모리 / 피크)]")
+        lines.append(
+            f"{'bucket':>10s} {'docs':>7s} {'retained_kb':>12s} {'traced_peak_kb':>15s} {'rss_max_mb':>11s}"
+        )
+        for name in sorted(self.buckets, key=lambda n: self.buckets[n]["bytes"] / max(1, self.buckets[n]["documents"])):
+            b = self.buckets[name]
+            lines.append(
+                f"{name:>10s} {b['documents']:7d} {b['retained'] / 1024:12.1f} "
+                f"{b['traced_peak_max'] / 1024:15.1f} {b['rss_max'] / 1024 / 1024:11.1f}"
+            )
+
+        if self.run_sites:
+            lines.append("\n[실행 동안 남은 메모리 상위 할당 위치 (KB)]")
+            for site, size in sorted(self.run_sites.items(), key=lambda kv: -kv[1]):
+                lines.append(f"  {size / 1024:10.1f}  {site}")
+
+        # 단계별 상위 할당 위치는 순할당이 큰 단계만
+        for stage in sorted(self.stage_sites, key=lambda s: -abs(self.stage_net[s]))[:_REPORT_STAGES]:
+            sites = sorted(self.stage_sites[stage].items(), key=lambda kv: -abs(kv[1]))[:5]
+            if not sites:
+                continue
+            lines.append(f"\n[{stage} 상위 할당 위치 (KB, 스냅샷 문서 합계)]")
+            for site, size in sites:
+                lines.append(f"  {size / 1024:10.1f}  {site}")
+
+        return "\n".join(lines)
+
+    def write(self, prefix: Path) -> List[Path]:
+        """<prefix>.txt (보고서) / <prefix>.json 기록"""
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        txt = prefix.with_name(prefix.name + ".txt")
+        js = prefix.with_name(prefix.name + ".json")
+        txt.write_text(self.format_report() + "\n", encoding=Constants.DEFAULT_ENCODING)
+        js.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=Constants.JSON_INDENT),
+            encoding=Constants.DEFAULT_ENCODING,
+        )
+        return [txt, js]
+
+
+class _DocumentMemory:
+    """문서 1건 처리 구간: 스냅샷 문서 여부 설정, 남은 메모리 / 피크 기록"""
+
+    __slots__ = ("profiler", "index", "source", "before")
+
+    def __init__(self, profiler: MemoryProfiler, index: int, source: Union[int, str, Path]):
+        self.profiler = profiler
+        self.index = index
+        self.source = source
+
+    def __enter__(self):
+        p = self.profiler
+        p._snapshot_document = self.index == 1 or self.index % p.every == 0
+        tracemalloc.reset_peak()
+        self.before = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        current, peak = tracemalloc.get_traced_memory()
+        p = self.profiler
+        p._snapshot_document = False
+        p._record_document(_source_size(self.source), current - self.before, peak - self.before)
+        return False
+
+
+# ============================================================================
+# 프로세스 전역 프로파일러
+# ============================================================================
+
+_profiler: Optional[MemoryProfiler] = None
+
+
+def start_memprofile(
+    every: int = Constants.MEMPROFILE_SNAPSHOT_EVERY,
+    top: int = Constants.MEMPROFILE_TOP,
+) -> MemoryProfiler:
+    """현재 프로세스에서 메모리 프로파일 시작"""
+    global _profiler
+    _profiler = MemoryProfiler(every=every, top=top)
+    _profiler.start()
+    return _profiler
+
+
+def stop_memprofile() -> Optional[MemoryProfiler]:
+    """전역 프로파일러 해제 (stop()/write()는 호출자가)"""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_memory_profiler() -> Optional[MemoryProfiler]:
+    return _profiler
+
+
+def memory_document(index: int, source: Union[int, str, Path]):
+    """문서 1건 처리 구간 (프로파일러가 없으면 아무것도 하지 않음)"""
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.document(index, source)
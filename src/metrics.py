@@ -0,0 +1,350 @@
+"""
+파이프라인 단계별 지연 시간 계측
+- time.perf_counter_ns 기반 단조 시계 타이머
+- 고정 버킷 히스토그램 (1-2-5 로그 간격, 1us ~ 10s): 병합이 단순 합이라 워커 간 집계가 쉽다
+- 실행 종료 시 단계별 p50 / p95 / p99 보고, 추세 추적용 JSON 덤프
+
+단계 이름:
+    load                    OCR JSON 로드
+    preprocess.<규칙명>     전처리 규칙별
+    extract.label           라벨 기반 추출
+    extract.pattern         패턴 기반 추출
+    resolve                 후보 선택
+    normalize               타입 정규화
+    validate                검증 및 복구
+    format                  dict 변환 + 단계별 산출물 생성 (main)
+    serialize               산출물 JSON 직렬화 (저장소)
+    write                   산출물 기록 요청 (기록 스레드가 있으면 큐 투입까지)
+    write.io                파일 1개 실제 기록 (임시 파일 + 교체)
+    document                문서 1건 전체 (main, 실패 / 시간 초과 포함)
+    document.<상태>         상태별 문서 1건 전체 (success / failed / timeout)
+
+계측은 enable_metrics()를 호출한 프로세스에서만 동작하며, 꺼져 있으면
+stage_timer()는 아무것도 하지 않는 공유 객체를 돌려준다.
+문서별 로그용으로 start_document_trace()를 호출하면 그 스레드의 단계 소요 시간을
+문서 단위로도 합산한다 (히스토그램 계측과 독립).
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import Constants
+
+
+def _bucket_bounds() -> List[int]:
+    bounds: List[int] = []
+    base = 1_000  # 1us
+    while base <= 10_000_000_000:  # 10s
+        for m in (1, 2, 5):
+            bound = base * m
+            if bound <= 10_000_000_000:
+                bounds.append(bound)
+        base *= 10
+    return bounds
+
+
+# 버킷 상한 (ns, 포함). 마지막 버킷은 상한 초과 (overflow)
+BUCKET_BOUNDS_NS: List[int] = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (ns)"""
+
+    __slots__ = ("counts", "count", "sum_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns: Optional[int] = None
+
+    def observe(self, ns: int) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS_NS, ns)] += 1
+        self.count += 1
+        self.sum_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if self.max_ns is None or ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.count += other.count
+        self.sum_ns += other.sum_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        if other.max_ns is not None and (self.max_ns is None or other.max_ns > self.max_ns):
+            self.max_ns = other.max_ns
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        분위수 추정 (ns)
+        - 해당 버킷 안에서 선형 보간, 관측 최소/최대값으로 제한
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, c in enumerate(self.counts):
+            if not c:
+                continue
+            if cumulative + c >= rank:
+                lower = BUCKET_BOUNDS_NS[i - 1] if i > 0 else 0
+                upper = BUCKET_BOUNDS_NS[i] if i < len(BUCKET_BOUNDS_NS) else self.max_ns
+                value = lower + (upper - lower) * max(0.0, rank - cumulative) / c
+                return float(min(max(value, self.min_ns), self.max_ns))
+            cumulative += c
+        return float(self.max_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ns": self.sum_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "buckets": list(self.counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        h = cls()
+        h.counts = list(data["buckets"])
+        h.count = data["count"]
+        h.sum_ns = data["sum_ns"]
+        h.min_ns = data["min_ns"]
+        h.max_ns = data["max_ns"]
+        return h
+
+
+class _StageTimer:
+    __slots__ = ("metrics", "trace", "stage", "start")
+
+    def __init__(self, metrics: Optional["StageMetrics"], stage: str, trace: Optional[Dict[str, int]] = None):
+        self.metrics = metrics
+        self.trace = trace
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        ns = time.perf_counter_ns() - self.start
+        if self.metrics is not None:
+            self.metrics.observe(self.stage, ns)
+        if self.trace is not None:
+            self.trace[self.stage] = self.trace.get(self.stage, 0) + ns
+        return False
+
+
+class _NullTimer:
+    """계측이 꺼져 있을 때 쓰는 공유 no-op 타이머"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class StageMetrics:
+    """단계명 → 히스토그램 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, ns: int) -> None:
+        with self._lock:
+            h = self.histograms.get(stage)
+            if h is None:
+                h = self.histograms[stage] = LatencyHistogram()
+            h.observe(ns)
+
+    def timer(self, stage: str) -> _StageTimer:
+        return _StageTimer(self, stage)
+
+    def merge_dict(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """다른 프로세스의 snapshot() 결과 병합"""
+        with self._lock:
+            for stage, hdata in data.items():
+                other = LatencyHistogram.from_dict(hdata)
+                h = self.histograms.get(stage)
+                if h is None:
+                    self.histograms[stage] = other
+                else:
+                    h.merge(other)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """직렬화 가능한 상태 (워커 → 부모 전달용)"""
+        with self._lock:
+            data = {stage: h.to_dict() for stage, h in self.histograms.items()}
+            if reset:
+                self.histograms = {}
+        return data
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 요약 (ms)"""
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            items = list(self.histograms.items())
+        for stage, h in items:
+            out[stage] = {
+                "count": h.count,
+                "mean_ms": round(h.sum_ns / h.count / 1e6, 4) if h.count else None,
+                "p50_ms": _ms(h.percentile(0.50)),
+                "p95_ms": _ms(h.percentile(0.95)),
+                "p99_ms": _ms(h.percentile(0.99)),
+                "max_ms": _ms(h.max_ns),
+                "total_ms": round(h.sum_ns / 1e6, 3),
+            }
+        return out
+
+    def format_report(self) -> str:
+        """단계별 지연 시간 표 (총 소요 시간 내림차순)"""
+        summary = self.summary()
+        if not summary:
+            return "(계측 데이터 없음)"
+
+        width = max(len(stage) for stage in summary)
+        lines = [
+            f"{'stage':{width}s} {'count':>8s} {'mean':>9s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s} {'total':>11s}"
+        ]
+        for stage, s in sorted(summary.items(), key=lambda kv: -kv[1]["total_ms"]):
+            lines.append(
+                f"{stage:{width}s} {s['count']:8d} {s['mean_ms']:9.3f} {s['p50_ms']:9.3f} "
+                f"{s['p95_ms']:9.3f} {s['p99_ms']:9.3f} {s['max_ms']:9.3f} {s['total_ms']:11.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump_json(self, path: Path, extra: Optional[Dict[str, Any]] = None) -> None:
+        """추세 추적용 JSON (요약 + 원본 버킷)"""
+        data = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            **(extra or {}),
+            "bucket_bounds_ns": BUCKET_BOUNDS_NS,
+            "summary": self.summary(),
+            "histograms": self.snapshot(),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(data, ensure_ascii=False, indent=Constants.JSON_INDENT),
+            encoding=Constants.DEFAULT_ENCODING,
+        )
+
+
+def _ms(ns: Optional[float]) -> Optional[float]:
+    return round(ns / 1e6, 4) if ns is not None else None
+
+
+# ============================================================================
+# 프로세스 전역 수집기
+# ============================================================================
+
+_metrics: Optional[StageMetrics] = None
+
+# 단계 훅: 설정되면 stage_timer 구간마다 hook(stage)가 돌려준 컨텍스트를 함께 연다
+# (메모리 프로파일 등 단계 경계가 필요한 다른 수집기용)
+_stage_hook: Optional[Callable[[str], Any]] = None
+
+# 문서 1건 동안의 단계별 소요 시간 합계 (ns) / 이를 기록할 스레드
+_trace: Optional[Dict[str, int]] = None
+_trace_thread: Optional[int] = None
+
+
+class _HookedStage:
+    __slots__ = ("hook", "timer")
+
+    def __init__(self, hook: Any, timer: Any):
+        self.hook = hook
+        self.timer = timer
+
+    def __enter__(self):
+        self.hook.__enter__()
+        self.timer.__enter__()  # 훅 자체 비용은 지연 시간에 넣지 않는다
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.timer.__exit__(exc_type, exc_val, exc_tb)
+        self.hook.__exit__(exc_type, exc_val, exc_tb)
+        return False
+
+
+def enable_metrics() -> StageMetrics:
+    """현재 프로세스에서 계측 시작 (이미 켜져 있으면 기존 수집기 반환)"""
+    global _metrics
+    if _metrics is None:
+        _metrics = StageMetrics()
+    return _metrics
+
+
+def disable_metrics() -> None:
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[StageMetrics]:
+    return _metrics
+
+
+def set_stage_hook(hook: Optional[Callable[[str], Any]]) -> None:
+    """단계 훅 설정 / 해제 (None)"""
+    global _stage_hook
+    _stage_hook = hook
+
+
+def start_document_trace() -> Dict[str, int]:
+    """
+    현재 스레드에서 문서 1건의 단계별 소요 시간 합산 시작
+    (반환한 dict에 단계 → ns가 쌓인다. 같은 단계가 여러 번이면 합계, 중첩 구간은 각각 포함)
+    """
+    global _trace, _trace_thread
+    _trace = {}
+    _trace_thread = threading.get_ident()
+    return _trace
+
+
+def stop_document_trace() -> None:
+    global _trace, _trace_thread
+    _trace = None
+    _trace_thread = None
+
+
+def observe_stage(stage: str, ns: int) -> None:
+    """직접 잰 구간 기록 (계측이 꺼져 있으면 무시)"""
+    metrics = _metrics
+    if metrics is not None:
+        metrics.observe(stage, ns)
+
+
+def stage_timer(stage: str):
+    """
+    단계 타이머 컨텍스트 매니저
+        with stage_timer("resolve"):
+            ...
+    """
+    metrics = _metrics
+    trace = _trace
+    if trace is not None and threading.get_ident() != _trace_thread:
+        trace = None  # 기록 스레드 등 다른 스레드의 구간은 문서 합계에 넣지 않음
+    if metrics is None and trace is None:
+        timer = _NULL_TIMER
+    else:
+        timer = _StageTimer(metrics, stage, trace)
+    hook = _stage_hook
+    if hook is not None:
+        return _HookedStage(hook(stage), timer)
+    return timer
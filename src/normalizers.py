@@ -5,8 +5,20 @@ from datetime import datetime
 from typing import Optional, Tuple
 
 from .config import Constants
-
-_DATE_SEPS_PATTERN = re.compile(r"[./\s]+")
+from .regex_backend import compile_pattern
+
+# re / regex 백엔드 (regex_backend.py)
+_DATE_SEPS_PATTERN = compile_pattern("normalizers.date_seps", r"[./\s]+")
+_KG_UNIT = compile_pattern("normalizers.kg_unit", r"\bkg\b", flags=re.IGNORECASE)
+_SPLIT_THOUSANDS = compile_pattern("normalizers.split_thousands", r"(\d)\s+(?=\d{3}\b)")
+_WEIGHT_NUMBER = compile_pattern("normalizers.weight_number", r"\d{1,3}(?:,\d{3})+|\d+")
+_COLON_TIME = compile_pattern("normalizers.colon_time", r"(\d{1,2})\s*:\s*(\d{1,2})")
+_KOREAN_TIME = compile_pattern("normalizers.korean_time", r"(\d{1,2})\s*시\s*(\d{1,2})\s*분?")
+_DATE_WITH_TAIL = compile_pattern("normalizers.date_with_tail", r"^(\d{4}[-/.]\d{1,2}[-/.]\d{1,2})(?:[-/.]\d+)+$")
+_PREPROCESS_MARKER = compile_pattern("normalizers.preprocess_marker", r"(?<!\s)\s+(doc_seq|raw_tail):\d+")
+_ISO_DATE = compile_pattern("normalizers.iso_date", r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_NON_DIGIT = compile_pattern("normalizers.non_digit", r"\D")
+_COMPACT_DATE = compile_pattern("normalizers.compact_date", r"^(\d{4})(\d{2})(\d{2})$")
 
 
 def normalize_weight_kg(raw: str) -> Optional[int]:
@@ -26,17 +38,17 @@ def normalize_weight_kg(raw: str) -> Optional[int]:
     if s.startswith("(") and s.endswith(")"):
         s = s[1:-1].strip()
 
-    s = re.sub(r"\bkg\b", " ", s, flags=re.IGNORECASE).strip()
+    s = _KG_UNIT.sub(" ", s).strip()
 
     # OCR 공백 분리 천단위 보정
     MAX_ITER = 10
     for _ in range(Constants.MAX_WEIGHT_NORMALIZATION_ITERATIONS):
-        new_s = re.sub(r"(\d)\s+(?=\d{3}\b)", r"\1", s)
+        new_s = _SPLIT_THOUSANDS.sub(r"\1", s)
         if new_s == s:
             break
         s = new_s
 
-    candidates = re.findall(r"\d{1,3}(?:,\d{3})+|\d+", s)
+    candidates = _WEIGHT_NUMBER.findall(s)
     if not candidates:
         return None
 
@@ -75,7 +87,7 @@ def normalize_time(raw: str) -> Optional[str]:
         s = s[1:-1].strip()
 
     # 1. HH:MM 형태 우선
-    m = re.search(r"(\d{1,2})\s*:\s*(\d{1,2})", s)
+    m = _COLON_TIME.search(s)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2))
@@ -84,7 +96,7 @@ def normalize_time(raw: str) -> Optional[str]:
         return None
 
     # 2. "HH시 MM분" 형태
-    m = re.search(r"(\d{1,2})\s*시\s*(\d{1,2})\s*분?", s)
+    m = _KOREAN_TIME.search(s)
     if m:
         hh = int(m.group(1))
         mm = int(m.group(2))
@@ -128,19 +140,19 @@ def normalize_date(raw: str) -> Tuple[Optional[str], Optional[str]]:
     warning = None
 
     # 예: 2026-01-01-000 같은 케이스 -> 뒤 꼬리 제거
-    tail_cut = re.match(r"^(\d{4}[-/.]\d{1,2}[-/.]\d{1,2})(?:[-/.]\d+)+$", s)
+    tail_cut = _DATE_WITH_TAIL.match(s)
     if tail_cut:
         s = tail_cut.group(1)
         warning = "ambiguous_date_tail"
 
     # doc_seq: 또는 raw_tail: 같은 전처리 결과가 붙어있으면 제거
-    s = re.sub(r"\s+(doc_seq|raw_tail):\d+", "", s)
+    s = _PREPROCESS_MARKER.sub("", s)
 
     # 구분자 통일 후 토큰화
     s2 = _DATE_SEPS_PATTERN.sub("-", s)
     
     # yyyy-mm-dd / yyyy-m-d
-    m = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})$", s2)
+    m = _ISO_DATE.match(s2)
     if m:
         y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
         iso = _try_parse_date_tokens(y, mo, d)
@@ -149,8 +161,8 @@ def normalize_date(raw: str) -> Tuple[Optional[str], Optional[str]]:
         return None, "date_parse_failed"
 
     # yyyymmdd
-    compact = re.sub(r"\D", "", s)
-    m = re.match(r"^(\d{4})(\d{2})(\d{2})$", compact)
+    compact = _NON_DIGIT.sub("", s)
+    m = _COMPACT_DATE.match(compact)
     if m:
         y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
         iso = _try_parse_date_tokens(y, mo, d)
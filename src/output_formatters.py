@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from .config import Constants
 from .schemas import (
     PreprocessLogSchema,
     ExtractLogSchema,
@@ -18,6 +21,36 @@ from .schemas import (
 class FileNamingConvention:
     """파일명 규칙"""
     
+    # 산출물 레이아웃
+    LAYOUT_FILES = "files"    # 문서당 단계별 파일 7개 (기본)
+    LAYOUT_BUNDLE = "bundle"  # 문서당 번들 파일 1개
+    LAYOUT_JSONL = "jsonl"    # 실행당 단계별 append-only JSONL + 인덱스
+    LAYOUTS = [LAYOUT_FILES, LAYOUT_BUNDLE, LAYOUT_JSONL]
+    
+    # 산출물 상세 수준: 기록할 단계 (파이프라인은 필요한 산출물만 생성)
+    VERBOSITY_MINIMAL = "minimal"    # 최종 파싱 결과만 (후보/선택 근거 생성 생략)
+    VERBOSITY_STANDARD = "standard"  # + 전처리/추출 로그, 후보 선택 결과
+    VERBOSITY_DEBUG = "debug"        # + 원문, 정규화 텍스트, 전체 후보 목록 (기본, 기존 동작)
+    VERBOSITY_LEVELS = [VERBOSITY_MINIMAL, VERBOSITY_STANDARD, VERBOSITY_DEBUG]
+    
+    # 문서별 산출물 디렉토리 샤딩 (files / bundle 레이아웃)
+    SHARD_FLAT = "flat"  # 출력 디렉토리 바로 아래 (기본)
+    SHARD_HASH = "hash"  # stem 해시 앞자리: ab/cd/
+    SHARD_DATE = "date"  # 문서 날짜: YYYY/MM/DD/ (날짜 없음: unknown/)
+    SHARDS = [SHARD_FLAT, SHARD_HASH, SHARD_DATE]
+    SHARD_UNKNOWN_DATE = "unknown"
+    
+    # 산출물 단계 (저장 순서)
+    STAGES = [
+        "raw",
+        "normalized",
+        "preprocess_log",
+        "candidates",
+        "extract_log",
+        "resolved",
+        "parsed",
+    ]
+    
     @staticmethod
     def preprocess_raw(stem: str) -> str:
         """원문 텍스트 파일명"""
@@ -57,6 +90,79 @@ class FileNamingConvention:
     def summary_csv() -> str:
         """전체 요약 CSV 파일명"""
         return "summary.csv"
+    
+    @staticmethod
+    def summary_columnar(suffix: str) -> str:
+        """전체 요약 컬럼형 파일명 (suffix: .parquet / .npz)"""
+        return f"summary{suffix}"
+    
+    @staticmethod
+    def checkpoint_journal() -> str:
+        """배치 실행 체크포인트 저널 파일명 (--resume)"""
+        return "checkpoint.jsonl"
+    
+    @classmethod
+    def stages_for(cls, verbosity: str) -> List[str]:
+        """상세 수준 → 기록할 단계 목록 (STAGES 순서)"""
+        if verbosity == cls.VERBOSITY_MINIMAL:
+            return ["parsed"]
+        if verbosity == cls.VERBOSITY_STANDARD:
+            return ["preprocess_log", "extract_log", "resolved", "parsed"]
+        if verbosity == cls.VERBOSITY_DEBUG:
+            return list(cls.STAGES)
+        raise ValueError(f"알 수 없는 상세 수준: {verbosity}")
+    
+    @classmethod
+    def for_stage(cls, stage: str, stem: str) -> str:
+        """단계명 → 개별 산출물 파일명 (files 레이아웃)"""
+        names = {
+            "raw": cls.preprocess_raw,
+            "normalized": cls.preprocess_normalized,
+            "preprocess_log": cls.preprocess_log,
+            "candidates": cls.extract_candidates,
+            "extract_log": cls.extract_log,
+            "resolved": cls.resolve_result,
+            "parsed": cls.parse_result,
+        }
+        return names[stage](stem)
+    
+    @staticmethod
+    def bundle(stem: str) -> str:
+        """문서 번들 파일명 (bundle 레이아웃)"""
+        return f"{stem}_bundle.json"
+    
+    @classmethod
+    def shard_dir(cls, stem: str, shard: str, date: Optional[str] = None) -> str:
+        """
+        문서 산출물 하위 디렉토리 (출력 디렉토리 기준 상대 경로, flat이면 "")
+        
+        - hash: md5(stem) 앞 4자리 → "ab/cd" (디렉토리당 항목 수를 고르게 분산)
+        - date: 문서 날짜(YYYY-MM-DD) → "YYYY/MM/DD", 날짜 없음 → "unknown"
+        """
+        if shard == cls.SHARD_FLAT:
+            return ""
+        if shard == cls.SHARD_HASH:
+            digest = hashlib.md5(stem.encode(Constants.DEFAULT_ENCODING)).hexdigest()
+            width = Constants.SHARD_HASH_WIDTH
+            return "/".join(
+                digest[i * width:(i + 1) * width]
+                for i in range(Constants.SHARD_HASH_DEPTH)
+            )
+        if shard == cls.SHARD_DATE:
+            if not date:
+                return cls.SHARD_UNKNOWN_DATE
+            return date.replace("-", "/")
+        raise ValueError(f"알 수 없는 샤딩 방식: {shard}")
+    
+    @staticmethod
+    def stage_jsonl(run_id: str, stage: str) -> str:
+        """단계별 JSONL 파일명 (jsonl 레이아웃)"""
+        return f"{run_id}_{stage}.jsonl"
+    
+    @staticmethod
+    def jsonl_index(run_id: str) -> str:
+        """문서별 레코드 위치 인덱스 파일명 (jsonl 레이아웃)"""
+        return f"{run_id}_index.jsonl"
 
 
 # 포맷터 함수
@@ -145,6 +251,27 @@ def format_parsed_output(
     }
 
 
+def format_parse_result(
+    source: str,
+    parsed_dict: Dict[str, Any]
+) -> ParsedOutputSchema:
+    """ParseResult(dict)를 최종 파싱 결과 포맷으로 변환"""
+    validation_errors = parsed_dict.get("validation_errors", [])
+    return format_parsed_output(
+        source=source,
+        date=parsed_dict.get("date"),
+        time=parsed_dict.get("time"),
+        vehicle_no=parsed_dict.get("vehicle_no"),
+        gross_weight_kg=parsed_dict.get("gross_weight_kg"),
+        tare_weight_kg=parsed_dict.get("tare_weight_kg"),
+        net_weight_kg=parsed_dict.get("net_weight_kg"),
+        parse_warnings=parsed_dict.get("parse_warnings", []),
+        validation_errors=validation_errors,
+        imputation_notes=parsed_dict.get("imputation_notes", []),
+        is_valid=len(validation_errors) == 0,
+    )
+
+
 # CSV 변환
 def format_csv_row(
     filename: str,
@@ -175,6 +302,22 @@ def format_csv_row(
     }
 
 
+# summary.csv 컬럼 순서 (format_csv_row 키와 동일)
+SUMMARY_CSV_FIELDNAMES = [
+    "filename",
+    "date",
+    "time",
+    "vehicle_no",
+    "gross_weight_kg",
+    "tare_weight_kg",
+    "net_weight_kg",
+    "is_valid",
+    "validation_errors",
+    "parse_warnings",
+    "imputation_notes",
+]
+
+
 def write_summary_csv(
     output_path: Path,
     rows: List[CSVRowSchema]
@@ -182,34 +325,155 @@ def write_summary_csv(
     if not rows:
         return
     
-    fieldnames = [
-        "filename",
-        "date",
-        "time",
-        "vehicle_no",
-        "gross_weight_kg",
-        "tare_weight_kg",
-        "net_weight_kg",
-        "is_valid",
-        "validation_errors",
-        "parse_warnings",
-        "imputation_notes",
-    ]
+    with SummaryCSVWriter(output_path) as writer:
+        for row in rows:
+            writer.write_row(row)
+
+
+class SummaryCSVWriter:
+    """
+    summary.csv 스트리밍 작성기
+    - 결과가 나올 때마다 한 행씩 기록 (전체 행을 메모리에 모으지 않음)
+    - flush_every 행마다 flush → 중단 시 손실은 최대 flush_every 행
+    - resume=True: 기존 파일에 헤더 없이 이어쓰기 (중단 시 잘린 마지막 행은 제거)
+    - 첫 행이 기록될 때 파일을 연다 (행이 없으면 파일 미생성)
+    - offset: 지금까지 기록한 행의 끝 위치 (바이트, 버퍼 포함) → 체크포인트 저널의 결과 위치
+    """
+    
+    def __init__(
+        self,
+        output_path: Path,
+        flush_every: int = Constants.CSV_FLUSH_EVERY,
+        resume: bool = False
+    ):
+        self.output_path = output_path
+        self.flush_every = max(1, flush_every)
+        self.resume = resume
+        self.rows_written = 0
+        self._pending = 0
+        self._file = None
+        self._writer = None
+        self.offset = output_path.stat().st_size if resume and output_path.exists() else 0
+    
+    def _open(self) -> None:
+        append = self.resume and self.output_path.exists() and self.output_path.stat().st_size > 0
+        if append:
+            _truncate_partial_line(self.output_path)
+            append = self.output_path.stat().st_size > 0
+        
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.output_path.open(
+            "a" if append else "w", newline="", encoding=Constants.DEFAULT_ENCODING
+        )
+        self.offset = self.output_path.stat().st_size if append else 0
+        self._writer = csv.DictWriter(_ByteCounter(self), fieldnames=SUMMARY_CSV_FIELDNAMES)
+        if not append:
+            self._writer.writeheader()
+    
+    def write_row(self, row: CSVRowSchema) -> None:
+        """한 행 기록"""
+        if self._file is None:
+            self._open()
+        
+        self._writer.writerow(row)
+        self.rows_written += 1
+        self._pending += 1
+        
+        if self._pending >= self.flush_every:
+            self.flush()
+    
+    def flush(self, fsync: bool = False) -> None:
+        if self._file is not None:
+            self._file.flush()
+            if fsync:
+                os.fsync(self._file.fileno())
+        self._pending = 0
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+    
+    def __enter__(self):
+        return self
     
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _ByteCounter:
+    # csv 모듈의 출력 대상: 파일에 그대로 쓰면서 인코딩 후 바이트 수를 offset에 더함
+    
+    def __init__(self, owner: SummaryCSVWriter):
+        self._owner = owner
+    
+    def write(self, text: str) -> int:
+        self._owner.offset += len(text.encode(Constants.DEFAULT_ENCODING))
+        return self._owner._file.write(text)
+
+
+def _truncate_partial_line(path: Path, block_size: int = 64 * 1024) -> None:
+    # 중단된 실행이 남긴 개행 없는 마지막 행 제거 (파일 끝에서부터 역방향 탐색)
+    with path.open("rb+") as f:
+        end = f.seek(0, 2)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - block_size)
+            f.seek(start)
+            block = f.read(pos - start)
+            if pos == end and block.endswith(b"\n"):
+                return
+            idx = block.rfind(b"\n")
+            if idx >= 0:
+                f.truncate(start + idx + 1)
+                return
+            pos = start
+        f.truncate(0)
 
 
 # 전체 산출물 목록 함수
-def get_output_files(stem: str) -> List[str]:
+def get_output_files(
+    stem: str,
+    layout: str = FileNamingConvention.LAYOUT_FILES,
+    run_id: Optional[str] = None,
+    shard: str = FileNamingConvention.SHARD_FLAT,
+    date: Optional[str] = None,
+    stages: Optional[List[str]] = None
+) -> List[str]:
+    """
+    문서 1건의 산출물이 기록되는 파일 목록 (출력 디렉토리 기준 상대 경로)
+    - files: 단계별 개별 파일 (기본 7개)
+    - bundle: 번들 파일 1개
+    - jsonl: 실행 단위 단계별 JSONL + 인덱스 (run_id 필요, 샤딩 없음)
+    - files / bundle은 shard에 따라 하위 디렉토리가 붙는다 (date 샤딩은 문서 날짜 필요)
+    - stages: 기록하는 단계 (기본: 전체, FileNamingConvention.stages_for 참고)
+    """
+    if stages is None:
+        stages = FileNamingConvention.STAGES
+    prefix = ""
+    if layout != FileNamingConvention.LAYOUT_JSONL:
+        sub = FileNamingConvention.shard_dir(stem, shard, date)
+        prefix = f"{sub}/" if sub else ""
+    
+    if layout == FileNamingConvention.LAYOUT_BUNDLE:
+        return [prefix + FileNamingConvention.bundle(stem)]
+    
+    if layout == FileNamingConvention.LAYOUT_JSONL:
+        if not run_id:
+            raise ValueError("jsonl 레이아웃은 run_id가 필요합니다")
+        files = [
+            FileNamingConvention.stage_jsonl(run_id, stage)
+            for stage in stages
+        ]
+        files.append(FileNamingConvention.jsonl_index(run_id))
+        return files
+    
+    if layout != FileNamingConvention.LAYOUT_FILES:
+        raise ValueError(f"알 수 없는 레이아웃: {layout}")
+    
     return [
-        FileNamingConvention.preprocess_raw(stem),
-        FileNamingConvention.preprocess_normalized(stem),
-        FileNamingConvention.preprocess_log(stem),
-        FileNamingConvention.extract_candidates(stem),
-        FileNamingConvention.extract_log(stem),
-        FileNamingConvention.resolve_result(stem),
-        FileNamingConvention.parse_result(stem),
+        prefix + FileNamingConvention.for_stage(stage, stem)
+        for stage in stages
     ]
\ No newline at end of file
@@ -3,6 +3,58 @@ from dataclasses import dataclass
 from typing import Callable, List
 
 from .schema import PreprocessedDocument
+from .metrics import stage_timer
+from .regex_backend import compile_pattern
+
+
+# 규칙별 정규식 (re / regex 백엔드, regex_backend.py)
+# 세 번째 인자는 regex 백엔드 전용 소유 수량자 표기 (regex에서 측정상 더 빠른 패턴만)
+_SPACES_TABS = compile_pattern("preprocessor.spaces_tabs", r"[ \t]+")
+_PUNCTUATION_SPACING = compile_pattern("preprocessor.punctuation_spacing", r"(?<=[:,()])\s+|(?<!\s)\s+(?=[:,()])")
+_NOISY_DATE = compile_pattern(
+    "preprocessor.noisy_date",
+    r"\d{4}[-./][O\do]{1,2}[-./][O\do]{1,2}",
+    r"\d{4}[-./][O\do]{1,2}+[-./][O\do]{1,2}+",
+)
+_NOISY_WEIGHT = compile_pattern(
+    "preprocessor.noisy_weight",
+    r"(?<![\dOolI,\s])(?P<num>[\dOolI,\s]+)(?P<unit>kg|KG)",
+    r"(?<![\dOolI,\s])(?P<num>[\dOolI,\s]++)(?P<unit>kg|KG)",
+)
+_LABEL_VARIANTS = [
+    (compile_pattern(f"preprocessor.label_variant_{i}", source), label)
+    for i, (source, label) in enumerate([
+        # 날짜
+        (r"날\s*짜", "날짜"),
+        (r"계량\s*일자", "날짜"),
+        (r"일\s*시", "날짜"),
+        # 차량번호
+        (r"차량\s*번호", "차량번호"),
+        (r"차번호", "차량번호"),
+        (r"차량\s*No\.?", "차량번호"),
+        # 중량 (공차중량/차중량은 '차중량'으로 통일)
+        (r"총\s*중\s*량", "총중량"),
+        (r"공차\s*중량", "차중량"),
+        (r"차\s*중\s*량", "차중량"),
+        (r"실\s*중\s*량", "실중량"),
+        # 구분
+        (r"구\s*분", "구분"),
+        # 계량횟수
+        (r"계량\s*횟수", "계량횟수"),
+    ])
+]
+_KOREAN_TIME = compile_pattern("preprocessor.korean_time", r"(\d{1,2})\s*시\s*(\d{1,2})\s*분")
+_SPLIT_THOUSANDS_KG = compile_pattern("preprocessor.split_thousands_kg", r"(\d{1,3})\s+(\d{3})\s*(kg)")
+_DATE_SUFFIX = compile_pattern("preprocessor.date_suffix", r"(\d{4}-\d{2}-\d{2})-(\d+)")
+_DATE_TRAILING_NUMBER = compile_pattern(
+    "preprocessor.date_trailing_number",
+    r"(\d{4}-\d{2}-\d{2})\s+(\d{1,4})(?=\s|$)(?!:)",
+    r"(\d{4}-\d{2}-\d{2})\s++(\d{1,4}+)(?=\s|$)(?!:)",
+)
+_VEHICLE_DIRECTION = compile_pattern("preprocessor.vehicle_direction", r"(차량번호\s*:\s*)(\S+)\s*(입고|출고)")
+_COORDINATES = compile_pattern("preprocessor.coordinates", r"(-?(?<!\d)\d+\.\d+)\s*,\s*(-?\d+\.\d+)")
+_ANY_WHITESPACE = compile_pattern("preprocessor.any_whitespace", r"\s+")
+_SYMBOL_ONLY = compile_pattern("preprocessor.symbol_only", r"[·,]+")
 
 
 @dataclass
@@ -21,7 +73,8 @@ def _apply_rule(
 ) -> str:
     
     before = text
-    result = fn(text)
+    with stage_timer("preprocess." + rule_name):
+        result = fn(text)
     
     # 규칙이 실제로 텍스트를 변경한 경우에만 적용 기록에 추가
     if result.changed and before != result.text:
@@ -41,7 +94,7 @@ def normalize_whitespace(text: str) -> RuleResult:
     lines = text.splitlines()
     new_lines = []
     for line in lines:
-        line2 = re.sub(r"[ \t]+", " ", line).strip()
+        line2 = _SPACES_TABS.sub(" ", line).strip()
         new_lines.append(line2)
     new_text = "\n".join(new_lines)
     return RuleResult(text=new_text, changed=(new_text != text), warnings=[])
@@ -52,12 +105,10 @@ def normalize_punctuation_spacing(text: str) -> RuleResult:
     - 시간 콜론 주변 공백 제거:  '02 : 13' -> '02:13'
     - 콤마 주변 공백 제거(좌표 등): '37.7, 126.8' -> '37.7,126.8'
     - 괄호 주변 공백 제거: '( 09:09 )' -> '(09:09)'
+    네 기호를 한 번에 처리하고, 공백 덩어리는 첫 글자에서만 매칭을 시작한다:
+    덩어리 중간에서 다시 시작하면 기호가 없는 긴 공백 줄에서 이차 시간이 걸린다
     """
-    t = text
-    t = re.sub(r"\s*:\s*", ":", t)
-    t = re.sub(r"\s*,\s*", ",", t)
-    t = re.sub(r"\s*\(\s*", "(", t)
-    t = re.sub(r"\s*\)\s*", ")", t)
+    t = _PUNCTUATION_SPACING.sub("", text)
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
 
@@ -79,9 +130,11 @@ def normalize_character_visual_noise(text: str) -> RuleResult:
                 warnings.append("found_visual_noise_correction")
         return corrected
     
-    t = re.sub(r'\d{4}[-./][O\do]{1,2}[-./][O\do]{1,2}', fix_date, t)
+    t = _NOISY_DATE.sub(fix_date, t)
     
     # kg 근처 숫자 내 O -> 0, I/l -> 1 치환
+    # 숫자/공백 덩어리의 첫 글자에서만 시작 (덩어리 중간에서 시작해도 끝나는 위치는 같으므로 결과 동일,
+    # 'kg'가 없는 긴 덩어리에서 이차 이상으로 되돌아가는 탐색을 막음)
     def fix_weight(m: re.Match) -> str:
         nonlocal changed
         num = m.group('num')
@@ -92,7 +145,7 @@ def normalize_character_visual_noise(text: str) -> RuleResult:
                 warnings.append("found_visual_noise_correction")
         return corrected + ' ' + m.group('unit')
     
-    t = re.sub(r'(?P<num>[\dOolI,\s]+)\s*(?P<unit>kg|KG)', fix_weight, t)
+    t = _NOISY_WEIGHT.sub(fix_weight, t)
     
     return RuleResult(text=t, changed=changed, warnings=warnings)
 
@@ -106,28 +159,8 @@ def normalize_label_variants(text: str) -> RuleResult:
     - '차량 No.' -> '차량번호'
     """
     t = text
-
-    # 날짜
-    t = re.sub(r"날\s*짜", "날짜", t)
-    t = re.sub(r"계량\s*일자", "날짜", t)
-    t = re.sub(r"일\s*시", "날짜", t)
-
-    # 차량번호
-    t = re.sub(r"차량\s*번호", "차량번호", t)
-    t = re.sub(r"차번호", "차량번호", t)
-    t = re.sub(r"차량\s*No\.?", "차량번호", t)
-
-    # 중량 (공차중량/차중량은 '차중량'으로 통일)
-    t = re.sub(r"총\s*중\s*량", "총중량", t)
-    t = re.sub(r"공차\s*중량", "차중량", t)
-    t = re.sub(r"차\s*중\s*량", "차중량", t)
-    t = re.sub(r"실\s*중\s*량", "실중량", t)
-
-    # 구분
-    t = re.sub(r"구\s*분", "구분", t)
-
-    # 계량횟수
-    t = re.sub(r"계량\s*횟수", "계량횟수", t)
+    for pattern, label in _LABEL_VARIANTS:
+        t = pattern.sub(label, t)
 
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
@@ -142,7 +175,7 @@ def normalize_korean_time_format(text: str) -> RuleResult:
         mm = int(m.group(2))
         return f"{hh:02d}:{mm:02d}"
 
-    t = re.sub(r"(\d{1,2})\s*시\s*(\d{1,2})\s*분", repl, text)
+    t = _KOREAN_TIME.sub(repl, text)
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
 
@@ -151,15 +184,9 @@ def normalize_number_grouping_before_unit(text: str) -> RuleResult:
     OCR에서 천 단위 콤마가 공백으로 깨지는 문제를 'kg' 근처에서만 결합
     예) '5 900 kg' -> '5,900 kg'
     모든 숫자 공백 결합은 위험하므로 'kg' 앞에서만 처리
+    한 번 치환한 결과('5,900 kg')는 다시 매칭되지 않으므로 한 번으로 충분하다
     """
-    t = text
-    pattern = re.compile(r"(\d{1,3})\s+(\d{3})\s*(kg)")
-    while True:
-        new_t = pattern.sub(r"\1,\2 \3", t)
-        if new_t == t:
-            break
-        t = new_t
-
+    t = _SPLIT_THOUSANDS_KG.sub(r"\1,\2 \3", text)
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
 
@@ -169,7 +196,7 @@ def normalize_date_suffix(text: str) -> RuleResult:
     - '2026-02-02-00004' -> '2026-02-02 doc_seq:00004'
     """
     warnings = []
-    t, n = re.subn(r"(\d{4}-\d{2}-\d{2})-(\d+)", r"\1 doc_seq:\2", text)
+    t, n = _DATE_SUFFIX.subn(r"\1 doc_seq:\2", text)
     if n > 0:
         warnings.append("found_date_suffix_doc_seq")
     return RuleResult(text=t, changed=(t != text), warnings=warnings)
@@ -190,7 +217,7 @@ def normalize_datetime_trailing_garbage(text: str) -> RuleResult:
         return f"{m.group(1)} raw_tail:{m.group(2)}"
 
     # 날짜 + 공백 + (1~4자리 숫자) + (줄끝 또는 공백) / 단, 바로 뒤에 ':'가 오면 제외
-    t = re.sub(r"(\d{4}-\d{2}-\d{2})\s+(\d{1,4})(?=\s|$)(?!:)", repl, text)
+    t = _DATE_TRAILING_NUMBER.sub(repl, text)
 
     return RuleResult(text=t, changed=(t != text), warnings=warnings)
 
@@ -198,7 +225,7 @@ def normalize_datetime_trailing_garbage(text: str) -> RuleResult:
 def normalize_vehicle_value_noise(text: str) -> RuleResult:
     #차량번호 값에 '입고/출고'가 붙는 값 -> 구분 라벨로 분리
 
-    t = re.sub(r"(차량번호\s*:\s*)(\S+)\s*(입고|출고)", r"\1\2 구분:\3", text)
+    t = _VEHICLE_DIRECTION.sub(r"\1\2 구분:\3", text)
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
 
@@ -207,7 +234,8 @@ def normalize_coordinates(text: str) -> RuleResult:
     좌표를 'lat,lon' 형태로 통일
     예) '37.718114, 126.844940' -> '37.718114,126.844940'
     """
-    t = re.sub(r"(-?\d+\.\d+)\s*,\s*(-?\d+\.\d+)", r"\1,\2", text)
+    # 숫자 덩어리 중간에서는 시작하지 않음 ((?<!\d)): 결과는 같고 긴 숫자 줄에서 이차 시간 탐색을 막음
+    t = _COORDINATES.sub(r"\1,\2", text)
     return RuleResult(text=t, changed=(t != text), warnings=[])
 
 
@@ -219,10 +247,10 @@ def normalize_line_noise(text: str) -> RuleResult:
     lines = text.splitlines()
     new_lines = []
     for line in lines:
-        compact = re.sub(r"\s+", "", line)
+        compact = _ANY_WHITESPACE.sub("", line)
         if compact == "":
             continue
-        if re.fullmatch(r"[·,]+", compact):
+        if _SYMBOL_ONLY.fullmatch(compact):
             continue
         new_lines.append(line)
     new_text = "\n".join(new_lines)
@@ -0,0 +1,323 @@
+"""
+내장 프로파일러 (--profile)
+- cprofile: cProfile로 N번째 문서마다(every=N) 또는 실행 전체(every=0) 프로파일
+            → .pstats + 호출 그래프에서 복원한 collapsed stack
+- sample:   타이머 시그널(SIGALRM, ITIMER_REAL) 기반 wall-clock 스택 샘플러
+            → 샘플 수 기준 collapsed stack (운영과 비슷한 조건에서 낮은 오버헤드)
+- 스트리밍 병렬 모드에서는 워커가 청크마다 스냅샷을 돌려주고 부모가 병합한다
+
+collapsed stack 형식 (flamegraph.pl, speedscope, inferno 등):
+    frame1;frame2;frame3 <값>
+cprofile 쪽 값은 마이크로초이며, cProfile은 호출자→피호출자 간선만 기록하므로
+경로별 시간은 간선 누적 시간 비율로 나눈 근사값이다. 정확한 스택이 필요하면 sample 모드를 쓴다.
+"""
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import signal
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import Constants
+
+PROFILE_CPROFILE = "cprofile"
+PROFILE_SAMPLE = "sample"
+PROFILE_MODES = [PROFILE_CPROFILE, PROFILE_SAMPLE]
+
+# 복원할 최대 스택 깊이 / 출력에서 생략할 경로 시간 (us 미만)
+_MAX_DEPTH = 200
+_MIN_PATH_US = 1.0
+
+
+def _frame_label(filename: str, lineno: int, name: str) -> str:
+    if filename == "~":  # 내장 함수
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+class _StatsSnapshot:
+    """pstats.Stats.add()가 받을 수 있는 원시 stats 래퍼 (프로세스 간 전달용)"""
+
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+def collapse_pstats(stats: pstats.Stats) -> Dict[str, int]:
+    """
+    cProfile 호출 그래프 → collapsed stack (경로 → 자체 시간 us)
+    - 루트(호출자 없음)에서 DFS, 피호출자 시간은 (간선 누적 시간 / 피호출자 총 누적 시간) 비율로 배분
+    - 재귀(경로에 이미 있는 함수)는 끊는다
+    """
+    raw = stats.stats
+    callees: Dict[Any, List[Tuple[Any, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller].append((func, edge[3]))
+
+    out: Dict[str, float] = defaultdict(float)
+
+    def walk(func: Any, path: List[str], on_path: set, ratio: float) -> None:
+        _, _, tt, ct, _ = raw[func]
+        label = _frame_label(*func)
+        path.append(label)
+        on_path.add(func)
+        self_us = tt * ratio * 1e6
+        if self_us >= _MIN_PATH_US:
+            out[";".join(path)] += self_us
+        if len(path) < _MAX_DEPTH:
+            for callee, edge_ct in callees.get(func, ()):
+                if callee in on_path or callee not in raw:
+                    continue
+                callee_ct = raw[callee][3]
+                if callee_ct <= 0:
+                    continue
+                sub = ratio * edge_ct / callee_ct
+                if callee_ct * sub * 1e6 >= _MIN_PATH_US:
+                    walk(callee, path, on_path, sub)
+        path.pop()
+        on_path.discard(func)
+
+    roots = [func for func, value in raw.items() if not value[4]]
+    for root in roots:
+        walk(root, [], set(), 1.0)
+
+    return {stack: int(round(us)) for stack, us in out.items() if us >= _MIN_PATH_US}
+
+
+def write_collapsed(path: Path, stacks: Dict[str, int]) -> None:
+    """collapsed stack 파일 기록 (값 내림차순)"""
+    lines = [f"{stack} {value}" for stack, value in sorted(stacks.items(), key=lambda kv: -kv[1])]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding=Constants.DEFAULT_ENCODING)
+
+
+class StackSampler:
+    """
+    wall-clock 스택 샘플러
+    - SIGALRM 핸들러에서 메인 스레드의 현재 프레임 스택을 문자열로 만들어 개수만 센다
+    - 시그널은 메인 스레드에서만 처리되므로 메인 스레드(파이프라인 처리 스레드)만 샘플링
+    - setitimer가 없는 플랫폼(Windows)에서는 사용할 수 없다
+    """
+
+    def __init__(self, interval: float = Constants.PROFILE_SAMPLE_INTERVAL_MS / 1000):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("이 플랫폼은 signal.setitimer를 지원하지 않습니다")
+        self.interval = interval
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.samples = 0
+        self._previous = None
+        self._running = False
+
+    def _handle(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack: List[str] = []
+        while frame is not None and len(stack) < _MAX_DEPTH:
+            code = frame.f_code
+            stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        if stack:
+            stack.reverse()
+            self.counts[";".join(stack)] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        if self._running:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("StackSampler는 메인 스레드에서 시작해야 합니다")
+        self._previous = signal.signal(signal.SIGALRM, self._handle)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        signal.setitimer(signal.ITIMER_REAL, 0, 0)
+        signal.signal(signal.SIGALRM, self._previous or signal.SIG_DFL)
+        self._running = False
+
+    def take(self) -> Dict[str, int]:
+        """지금까지의 카운트를 꺼내고 비움"""
+        # 시그널 핸들러가 복사 중에 끼어들 수 있으므로 먼저 교체한 뒤 복사
+        counts, self.counts = self.counts, defaultdict(int)
+        return dict(counts)
+
+
+class ProfileSession:
+    """
+    한 실행의 프로파일 세션
+
+    Args:
+        mode: PROFILE_CPROFILE / PROFILE_SAMPLE
+        every: cprofile 모드에서 N번째 문서마다 프로파일 (0이면 실행 전체)
+        interval: sample 모드의 샘플 간격 (초)
+    """
+
+    def __init__(
+        self,
+        mode: str = PROFILE_CPROFILE,
+        every: int = 0,
+        interval: float = Constants.PROFILE_SAMPLE_INTERVAL_MS / 1000,
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일 모드: {mode}")
+        self.mode = mode
+        self.every = max(0, every)
+        self.interval = interval
+        self.profiled_documents = 0
+
+        self._profiler: Optional[cProfile.Profile] = None
+        self._merged: Optional[pstats.Stats] = None
+        self._sampler: Optional[StackSampler] = None
+        self._samples: Dict[str, int] = defaultdict(int)
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self.mode == PROFILE_SAMPLE:
+            self._sampler = StackSampler(self.interval)
+            self._sampler.start()
+            return
+        self._profiler = cProfile.Profile()
+        if self.every == 0:
+            self._profiler.enable()
+
+    @contextmanager
+    def document(self, index: int) -> Iterator[None]:
+        """문서 1건 처리 구간 (cprofile + every=N일 때 index % N == 0인 문서만 프로파일)"""
+        if self._profiler is None or self.every == 0 or index % self.every:
+            yield
+            return
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+            self.profiled_documents += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """지금까지의 수집 결과를 꺼냄 (워커 → 부모 전달용, 수집은 계속됨)"""
+        data: Dict[str, Any] = {"documents": self.profiled_documents}
+        self.profiled_documents = 0
+        if self._profiler is not None:
+            self._profiler.create_stats()  # 프로파일러 비활성화됨
+            data["cprofile"] = self._profiler.stats
+            self._profiler = cProfile.Profile()
+            if self.every == 0:
+                self._profiler.enable()
+        if self._sampler is not None:
+            data["samples"] = self._sampler.take()
+        return data
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """다른 프로세스의 snapshot() 병합"""
+        self.profiled_documents += data.get("documents", 0)
+        if data.get("cprofile"):
+            self._add_stats(_StatsSnapshot(data["cprofile"]))
+        for stack, count in data.get("samples", {}).items():
+            self._samples[stack] += count
+
+    def _add_stats(self, source: Any) -> None:
+        if self._merged is None:
+            self._merged = pstats.Stats(source)
+        else:
+            self._merged.add(source)
+
+    # ------------------------------------------------------------------
+    # 종료 / 출력
+    # ------------------------------------------------------------------
+
+    def abandon(self) -> None:
+        """기록 없이 수집 중단 (fork로 물려받은 세션 정리용)"""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    def finish(self, prefix: Path) -> List[Path]:
+        """
+        수집 종료 후 파일 기록
+
+        Returns:
+            기록한 파일 경로 목록
+            cprofile: <prefix>.pstats, <prefix>.collapsed
+            sample:   <prefix>.sampled.collapsed
+        """
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+
+        if self._sampler is not None:
+            self._sampler.stop()
+            for stack, count in self._sampler.take().items():
+                self._samples[stack] += count
+            path = prefix.with_name(prefix.name + ".sampled.collapsed")
+            write_collapsed(path, dict(self._samples))
+            written.append(path)
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.create_stats()
+            if self._profiler.stats:
+                self._add_stats(_StatsSnapshot(self._profiler.stats))
+            self._profiler = None
+        if self._merged is not None:
+            pstats_path = prefix.with_name(prefix.name + ".pstats")
+            self._merged.dump_stats(str(pstats_path))
+            collapsed_path = prefix.with_name(prefix.name + ".collapsed")
+            write_collapsed(collapsed_path, collapse_pstats(self._merged))
+            written.extend([pstats_path, collapsed_path])
+
+        return written
+
+
+# ============================================================================
+# 프로세스 전역 세션
+# ============================================================================
+
+_session: Optional[ProfileSession] = None
+
+
+def start_profiling(
+    mode: str = PROFILE_CPROFILE,
+    every: int = 0,
+    interval: float = Constants.PROFILE_SAMPLE_INTERVAL_MS / 1000,
+) -> ProfileSession:
+    """현재 프로세스에서 프로파일 시작"""
+    global _session
+    _session = ProfileSession(mode, every, interval)
+    _session.start()
+    return _session
+
+
+def stop_profiling() -> Optional[ProfileSession]:
+    """전역 세션 해제 (파일 기록은 호출자가 finish()로)"""
+    global _session
+    session, _session = _session, None
+    return session
+
+
+def get_profile_session() -> Optional[ProfileSession]:
+    return _session
+
+
+@contextmanager
+def profile_document(index: int) -> Iterator[None]:
+    """문서 1건 처리 구간 (세션이 없으면 아무것도 하지 않음)"""
+    session = _session
+    if session is None:
+        yield
+        return
+    with session.document(index):
+        yield
@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import multiprocessing
 import sys
-from typing import Optional, List
+import threading
+import time
+from typing import Any, List, Optional, TextIO
+
+from .config import Constants
 
 
 class ProgressBar:
+    """
+    진행률 표시
+    - 다시 그리기는 최대 min_interval마다 (update()마다 쓰지 않음, 완료 시에는 항상)
+    - 처리 속도(docs/s)와 남은 시간(ETA) 표시
+    - 출력이 터미널이 아니면(CI 로그 등) \r 덮어쓰기 대신 plain_interval마다 한 줄씩
+    - total=None이면 전체 수를 모르는 모드 (처리 건수 / 속도만)
+    - update()는 스레드 안전 (ProgressAggregator 수신 스레드에서도 호출)
+    """
     
     def __init__(
         self,
-        total: int,
+        total: Optional[int],
         prefix: str = "",
         suffix: str = "",
         width: int = 50,
         fill: str = "█",
-        empty: str = "░"
+        empty: str = "░",
+        stream: Optional[TextIO] = None,
+        min_interval: float = Constants.PROGRESS_MIN_INTERVAL_MS / 1000,
+        plain_interval: float = Constants.PROGRESS_PLAIN_INTERVAL,
+        tty: Optional[bool] = None,
     ):
         
         self.total = total
@@ -23,36 +40,161 @@ class ProgressBar:
         self.fill = fill
         self.empty = empty
         self.current = 0
+        self.stream = stream or sys.stdout
+        if tty is None:
+            isatty = getattr(self.stream, "isatty", None)
+            tty = bool(isatty and isatty())
+        self.tty = tty
+        self.interval = min_interval if tty else plain_interval
+        self.renders = 0
+        
+        self._started = time.monotonic()
+        self._last_render = float("-inf")
+        self._done = False
+        self._lock = threading.Lock()
     
     def update(self, step: int = 1) -> None:
-        """진행 상황 업데이트"""
-        self.current += step
-        self.render()
+        """진행 상황 업데이트 (다시 그리기는 간격 / 완료 기준으로만)"""
+        with self._lock:
+            self.current += step
+            now = time.monotonic()
+            if self._complete() or now - self._last_render >= self.interval:
+                self._render(now)
     
     def render(self) -> None:
-        """프로그레스 바 렌더링"""
-        if self.total == 0:
+        """프로그레스 바 렌더링 (간격과 무관하게 즉시)"""
+        with self._lock:
+            self._render(time.monotonic())
+    
+    def finish(self) -> None:
+        """진행 완료"""
+        with self._lock:
+            if self.total:
+                self.current = max(self.current, self.total)
+            self._render(time.monotonic(), final=True)
+    
+    def rate(self, now: Optional[float] = None) -> float:
+        """시작 이후 평균 처리 속도 (건/초)"""
+        elapsed = (now or time.monotonic()) - self._started
+        return self.current / elapsed if elapsed > 0 else 0.0
+    
+    def eta(self, now: Optional[float] = None) -> Optional[float]:
+        """남은 시간 추정 (초, 전체 수를 모르거나 속도가 0이면 None)"""
+        rate = self.rate(now)
+        if not self.total or rate <= 0:
+            return None
+        return max(0.0, (self.total - self.current) / rate)
+    
+    def _complete(self) -> bool:
+        return bool(self.total) and self.current >= self.total
+    
+    def _render(self, now: float, final: bool = False) -> None:
+        if self.total == 0 or self._done:
             return
+        self._last_render = now
+        self.renders += 1
+        done = final or self._complete()
         
-        percent = min(100, int(100 * self.current / self.total))
-        filled_width = int(self.width * self.current / self.total)
-        
-        bar = self.fill * filled_width + self.empty * (self.width - filled_width)
+        stats = f"{self.rate(now):.1f} docs/s"
+        eta = self.eta(now)
+        if eta is not None and not done:
+            stats += f" ETA {_format_duration(eta)}"
         
-        output = f"\r{self.prefix} |{bar}| {percent}% {self.suffix}"
+        if self.total:
+            percent = min(100, int(100 * self.current / self.total))
+            count = f"{self.current}/{self.total}"
+        else:
+            count = f"{self.current}"
         
-        sys.stdout.write(output)
-        sys.stdout.flush()
+        if self.tty:
+            if self.total:
+                filled_width = min(self.width, int(self.width * self.current / self.total))
+                bar = self.fill * filled_width + self.empty * (self.width - filled_width)
+                output = f"\r{self.prefix} |{bar}| {percent}% {count} {stats} {self.suffix}"
+            else:
+                output = f"\r{self.prefix} {count} {stats} {self.suffix}"
+            # 완료 시 줄바꿈
+            self.stream.write(output + ("\n" if done else ""))
+        else:
+            progress = f"{count} ({percent}%)" if self.total else count
+            self.stream.write(f"{self.prefix} {progress} {stats} {self.suffix}".rstrip() + "\n")
+        self.stream.flush()
         
-        # 완료 시 줄바꿈
-        if self.current >= self.total:
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+        if done:
+            self._done = True
+
+
+def _format_duration(seconds: float) -> str:
+    """초 → MM:SS (1시간 이상이면 H:MM:SS)"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class ProgressReporter:
+    """
+    워커 프로세스 쪽 진행 보고기
+    - update()를 모아 every건 또는 interval초마다 한 번만 큐에 넣는다 (IPC 횟수 제한)
+    - 청크 처리 끝에 flush()
+    """
     
-    def finish(self) -> None:
-        """진행 완료"""
-        self.current = self.total
-        self.render()
+    def __init__(
+        self,
+        queue: Any,
+        every: int = Constants.PROGRESS_REPORT_EVERY,
+        interval: float = Constants.PROGRESS_MIN_INTERVAL_MS / 1000,
+    ):
+        self.queue = queue
+        self.every = every
+        self.interval = interval
+        self.pending = 0
+        self._last_sent = time.monotonic()
+    
+    def update(self, step: int = 1) -> None:
+        self.pending += step
+        if self.pending >= self.every or time.monotonic() - self._last_sent >= self.interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        if self.pending:
+            self.queue.put(self.pending)
+            self.pending = 0
+        self._last_sent = time.monotonic()
+
+
+class ProgressAggregator:
+    """
+    여러 워커 프로세스의 진행 보고(ProgressReporter)를 큐로 모아 한 ProgressBar에 반영
+        aggregator = ProgressAggregator(bar)
+        ... 워커 초기화 인자로 aggregator.queue 전달 → ProgressReporter(queue)
+        aggregator.close()
+    """
+    
+    _STOP = None
+    
+    def __init__(self, bar: ProgressBar, queue: Any = None):
+        self.bar = bar
+        self.queue = queue if queue is not None else multiprocessing.Queue()
+        self._thread = threading.Thread(target=self._run, name="progress-aggregator", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            step = self.queue.get()
+            if step is self._STOP:
+                return
+            self.bar.update(step)
+    
+    def close(self) -> None:
+        """남은 보고를 모두 반영하고 수신 스레드 종료"""
+        self.queue.put(self._STOP)
+        self._thread.join()
+        if hasattr(self.queue, "join_thread"):
+            self.queue.close()
+            self.queue.join_thread()
 
 
 class StepProgress:
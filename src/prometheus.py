@@ -0,0 +1,286 @@
+"""
+Prometheus 텍스트 형식 메트릭 노출 (장시간 배치 / 서비스 모드용)
+- 카운터 / 게이지 / 히스토그램 레지스트리 (외부 의존성 없음, text format 0.0.4)
+- 노출 방법:
+    HTTP: 로컬 포트의 /metrics (백그라운드 스레드)
+    textfile: 주기적으로 파일에 원자적 기록 (node_exporter textfile collector용)
+- 단계 지연 시간은 별도로 다시 기록하지 않고 metrics.StageMetrics의 고정 버킷을
+  노출 시점에 변환한다 → 문서당 기록 비용은 카운터 증가 몇 번뿐
+
+노출 메트릭:
+    ocr_documents_total{status}             처리 건수 (SUCCESS / FAILED / MISSING / TIMEOUT)
+    ocr_documents_valid_total{valid}        검증 통과 여부별 건수 (SUCCESS 문서만)
+    ocr_validation_errors_total{code}       검증 오류 코드별 건수 (":" 앞부분)
+    ocr_writer_dir_cache_total{result}      산출물 기록기 디렉토리 캐시 hit / miss
+    ocr_run_start_time_seconds              실행 시작 시각 (unix time)
+    ocr_last_document_time_seconds          마지막 문서 완료 시각 (unix time)
+    ocr_stage_duration_seconds{stage}       단계별 지연 시간 히스토그램
+"""
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .file_writer import atomic_write
+from .metrics import BUCKET_BOUNDS_NS, StageMetrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블 값 튜플 → 값 (여러 스레드에서 갱신)"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple([str(labels[n]) for n in self.labelnames])
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name}: 레이블 불일치 {sorted(labels)} != {sorted(self.labelnames)}")
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_fmt(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("카운터는 감소할 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def sync(self, total: float, **labels: str) -> None:
+        """다른 곳에서 누적 중인 값 반영 (작아지는 값은 무시)"""
+        key = self._key(labels)
+        with self._lock:
+            if total >= self._values.get(key, 0.0):
+                self._values[key] = total
+
+
+class Gauge(_Metric):
+    """임의 값 게이지"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class StageHistogramCollector:
+    """
+    StageMetrics → Prometheus 히스토그램 (ocr_stage_duration_seconds{stage})
+    - 버킷 경계는 metrics.BUCKET_BOUNDS_NS (초 단위로 변환, 누적 카운트)
+    """
+
+    def __init__(self, stage_metrics: StageMetrics, name: str = "ocr_stage_duration_seconds"):
+        self.stage_metrics = stage_metrics
+        self.name = name
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} 파이프라인 단계별 지연 시간",
+            f"# TYPE {self.name} histogram",
+        ]
+        snapshot = self.stage_metrics.snapshot()
+        bounds = [b / 1e9 for b in BUCKET_BOUNDS_NS] + [float("inf")]
+        for stage in sorted(snapshot):
+            h = snapshot[stage]
+            label = ("stage",)
+            cumulative = 0
+            for bound, count in zip(bounds, h["buckets"]):
+                cumulative += count
+                le = 'le="' + _fmt(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(label, (stage,), le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(label, (stage,))} {_fmt(h['sum_ns'] / 1e9)}")
+            lines.append(f"{self.name}_count{_labels(label, (stage,))} {h['count']}")
+        return lines
+
+
+class Registry:
+    """메트릭 / 수집기 목록 → 텍스트 노출"""
+
+    def __init__(self):
+        self._collectors: List[Any] = []
+        self._hooks: List[Callable[[], None]] = []
+
+    def register(self, collector: Any) -> Any:
+        self._collectors.append(collector)
+        return collector
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames))
+
+    def add_hook(self, hook: Callable[[], None]) -> None:
+        """노출 직전에 호출 (외부 통계를 게이지/카운터로 옮기는 용도)"""
+        self._hooks.append(hook)
+
+    def render(self) -> str:
+        for hook in self._hooks:
+            hook()
+        lines: List[str] = []
+        for collector in self._collectors:
+            lines.extend(collector.render())
+        return "\n".join(lines) + "\n"
+
+
+class PipelineTelemetry:
+    """
+    파이프라인 메트릭 묶음
+    - record_document()는 문서당 1회 호출 (카운터 증가만 수행)
+    """
+
+    def __init__(self, stage_metrics: Optional[StageMetrics] = None):
+        self.registry = Registry()
+        r = self.registry
+        self.documents = r.counter("ocr_documents_total", "처리한 문서 수 (상태별)", ["status"])
+        self.valid = r.counter("ocr_documents_valid_total", "검증 통과 여부별 문서 수", ["valid"])
+        self.validation_errors = r.counter(
+            "ocr_validation_errors_total", "검증 오류 코드별 건수", ["code"]
+        )
+        self.dir_cache = r.counter(
+            "ocr_writer_dir_cache_total", "산출물 기록기 디렉토리 캐시 조회 결과", ["result"]
+        )
+        self.start_time = r.gauge("ocr_run_start_time_seconds", "실행 시작 시각 (unix time)")
+        self.last_document = r.gauge(
+            "ocr_last_document_time_seconds", "마지막 문서 완료 시각 (unix time)"
+        )
+        self.start_time.set(time.time())
+        if stage_metrics is not None:
+            r.register(StageHistogramCollector(stage_metrics))
+
+    def record_document(self, status: str, is_valid: bool, validation_errors: Iterable[str] = ()) -> None:
+        self.documents.inc(status=status)
+        if status == "SUCCESS":
+            self.valid.inc(valid="true" if is_valid else "false")
+        for error in validation_errors:
+            # 세부 값(중량 등)은 레이블에 넣지 않는다 (시계열 수 제한)
+            self.validation_errors.inc(code=error.split(":", 1)[0])
+        self.last_document.set(time.time())
+
+    def track_writer(self, writer: Any) -> None:
+        """기록기 디렉토리 캐시 통계를 노출 시점에 반영"""
+        def sync() -> None:
+            stats = writer.stats()
+            self.dir_cache.sync(stats["dir_cache_hits"], result="hit")
+            self.dir_cache.sync(stats["dir_cache_misses"], result="miss")
+        self.registry.add_hook(sync)
+
+    def render(self) -> str:
+        return self.registry.render()
+
+
+# ============================================================================
+# 노출
+# ============================================================================
+
+class MetricsHTTPServer:
+    """로컬 포트의 /metrics 응답 (데몬 스레드)"""
+
+    def __init__(self, registry: Registry, port: int, host: str = "127.0.0.1"):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 (http.server 규약)
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # 접근 로그 생략
+                return
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class TextfileExporter:
+    """interval초마다 텍스트 파일에 원자적 기록, close() 시 마지막으로 한 번 더 기록"""
+
+    def __init__(self, registry: Registry, path: Path, interval: float):
+        self.registry = registry
+        self.path = path
+        self.interval = max(0.1, interval)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-textfile", daemon=True)
+        self._thread.start()
+
+    def write(self) -> None:
+        atomic_write(self.path, self.registry.render())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.write()
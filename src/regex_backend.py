@@ -0,0 +1,114 @@
+"""
+정규식 백엔드 (re / regex)
+- 기본은 표준 re: 모든 패턴이 뒤보기 조건 / 길이 상한으로 이미 선형 시간이고,
+  합성 계근지 기준 regex 모듈이 문서 처리량 / 최악 입력 모두 더 느림 (benchmarks/bench_regex_backend.py)
+- OCR_REGEX_BACKEND=regex 로 regex 모듈 사용 (src 모듈 import 전에 설정, regex 패키지 필요)
+  - 패턴별 regex 전용 표기(tuned, 소유 수량자)가 있으면 그 표기로 컴파일
+  - re의 원자 그룹 / 소유 수량자는 Python 3.11+라 3.10 지원을 위해 기본 표기(source)에는 쓰지 않음
+- compile_pattern으로 만든 패턴은 이름별로 REGISTRY에 기록 (백엔드 비교 테스트 / 벤치마크에서 두 백엔드로 다시 컴파일)
+
+두 엔진의 문자 분류 차이:
+- \\s: regex는 Unicode White_Space 기준이라 \\x1c-\\x1f를 공백으로 보지 않음 -> regex로 컴파일할 때 보충
+- \\w(\\b): 위첨자 숫자(¹²³), 분수(¼½¾), 일부 CJK 성조 부호, 전각 밑줄(＿)에서 다름 (보정하지 않음)
+- \\d: regex가 더 새 Unicode 표를 써서 최근 추가된 문자 체계의 숫자를 더 인정함 (보정하지 않음)
+"""
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import regex as _regex
+except ImportError:  # pragma: no cover - 환경에 따라 다름
+    _regex = None
+
+
+BACKEND_RE = "re"
+BACKEND_REGEX = "regex"
+BACKEND_ENV = "OCR_REGEX_BACKEND"
+
+# re의 \s 중 regex의 \s에 없는 문자 (파일 / 그룹 / 레코드 / 단위 구분자)
+_RE_ONLY_SPACE = r"\x1c-\x1f"
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 목록"""
+    return [BACKEND_RE] + ([BACKEND_REGEX] if _regex is not None else [])
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """백엔드 이름 확정 (None이면 환경 변수, 없으면 re)"""
+    name = (name or os.environ.get(BACKEND_ENV) or BACKEND_RE).strip().lower()
+    if name not in (BACKEND_RE, BACKEND_REGEX):
+        raise ValueError(f"{BACKEND_ENV}는 re / regex 중 하나여야 합니다: {name!r}")
+    if name == BACKEND_REGEX and _regex is None:
+        raise ImportError("regex 백엔드에는 regex 패키지가 필요합니다 (pip install regex)")
+    return name
+
+
+ACTIVE_BACKEND = resolve_backend()
+
+
+def _with_re_whitespace(source: str) -> str:
+    """regex용 표기의 \\s / \\S를 re와 같은 공백 집합으로 바꿈 (문자 클래스 안팎 구분)"""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\" and i + 1 < len(source):
+            escape = source[i + 1]
+            if escape == "s":
+                out.append(rf"\s{_RE_ONLY_SPACE}" if in_class else rf"[\s{_RE_ONLY_SPACE}]")
+            elif escape == "S":
+                if in_class:
+                    raise ValueError(f"문자 클래스 안의 \\S는 지원하지 않습니다: {source!r}")
+                out.append(rf"[^\s{_RE_ONLY_SPACE}]")
+            else:
+                out.append(source[i:i + 2])
+            i += 2
+            continue
+        if ch == "[" and not in_class:
+            in_class = True
+        elif ch == "]" and in_class:
+            in_class = False
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class PatternSpec:
+    """
+    이름 붙은 정규식 정의
+    - source: re / regex 공통 표기 (되돌아가는 탐색은 뒤보기 조건 / 길이 상한으로 제한)
+    - tuned: regex 전용 표기 (원자 그룹 / 소유 수량자). 모든 입력에서 source와 같은 매칭이어야 하고
+      regex에서 source보다 빠를 때만 둠 (regex는 소유 수량자가 오히려 느린 경우가 많음)
+    """
+    name: str
+    source: str
+    tuned: Optional[str] = None
+    flags: int = 0
+
+    def compile(self, backend: str = BACKEND_RE) -> Any:
+        if backend == BACKEND_REGEX:
+            if _regex is None:
+                raise ImportError("regex 백엔드에는 regex 패키지가 필요합니다 (pip install regex)")
+            return _regex.compile(_with_re_whitespace(self.tuned or self.source), self.flags | _regex.VERSION0)
+        if backend != BACKEND_RE:
+            raise ValueError(f"알 수 없는 정규식 백엔드: {backend!r}")
+        return re.compile(self.source, self.flags)
+
+
+REGISTRY: Dict[str, PatternSpec] = {}
+
+
+def compile_pattern(name: str, source: str, tuned: Optional[str] = None, flags: int = 0) -> Any:
+    """REGISTRY에 등록하고 현재 백엔드(ACTIVE_BACKEND)로 컴파일"""
+    spec = PatternSpec(name=name, source=source, tuned=tuned, flags=flags)
+    if REGISTRY.get(name, spec) != spec:
+        raise ValueError(f"같은 이름의 다른 정규식이 이미 등록됨: {name}")
+    REGISTRY[name] = spec
+    return spec.compile(ACTIVE_BACKEND)
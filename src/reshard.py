@@ -0,0 +1,176 @@
+"""
+평면 산출물 디렉토리 → 샤딩 레이아웃 이전 도구
+- 출력 디렉토리 바로 아래의 문서 산출물(files / bundle 레이아웃)을 stem별로 묶어
+  FileNamingConvention.shard_dir 위치로 이동
+- summary.csv 등 문서 산출물이 아닌 파일은 그대로 둔다
+- 이동은 스레드 풀로 병렬 처리 (같은 파일시스템이면 rename)
+
+실행:
+    python -m src.reshard data/processed --shard hash
+    python -m src.reshard data/processed --shard date --workers 16
+    python -m src.reshard data/processed --shard hash --dest /mnt/big/processed --dry-run
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config import Constants
+from .output_formatters import FileNamingConvention
+
+
+def _document_suffixes() -> List[Tuple[str, str]]:
+    """(파일명 접미사, 단계명) 목록, 긴 접미사 우선"""
+    suffixes = [
+        (FileNamingConvention.for_stage(stage, ""), stage)
+        for stage in FileNamingConvention.STAGES
+    ]
+    suffixes.append((FileNamingConvention.bundle(""), "bundle"))
+    return sorted(suffixes, key=lambda item: len(item[0]), reverse=True)
+
+
+def split_document_name(name: str) -> Optional[Tuple[str, str]]:
+    """산출물 파일명 → (stem, 단계명), 문서 산출물이 아니면 None"""
+    for suffix, stage in _document_suffixes():
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[:-len(suffix)], stage
+    return None
+
+
+def scan_flat_directory(src_dir: Path) -> Dict[str, Dict[str, str]]:
+    """
+    평면 디렉토리 스캔 (os.scandir: 항목 수가 많아도 stat 없이 나열)
+
+    Returns:
+        stem → {단계명: 파일명}
+    """
+    documents: Dict[str, Dict[str, str]] = {}
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            split = split_document_name(entry.name)
+            if split is None:
+                continue
+            stem, stage = split
+            documents.setdefault(stem, {})[stage] = entry.name
+    return documents
+
+
+def _read_document_date(src_dir: Path, files: Dict[str, str]) -> Optional[str]:
+    """date 샤딩용 문서 날짜 (parsed 또는 bundle에서)"""
+    try:
+        if "parsed" in files:
+            data = json.loads((src_dir / files["parsed"]).read_text(encoding=Constants.DEFAULT_ENCODING))
+            return data.get("date")
+        if "bundle" in files:
+            data = json.loads((src_dir / files["bundle"]).read_text(encoding=Constants.DEFAULT_ENCODING))
+            return (data.get("parsed") or {}).get("date")
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def reshard_directory(
+    src_dir: Path,
+    shard: str,
+    dest_dir: Optional[Path] = None,
+    workers: int = Constants.RESHARD_WORKERS,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    평면 디렉토리의 문서 산출물을 샤딩 레이아웃으로 이동
+
+    Args:
+        src_dir: 평면 산출물 디렉토리
+        shard: FileNamingConvention.SHARD_HASH / SHARD_DATE
+        dest_dir: 대상 루트 (기본: src_dir, 제자리 이전)
+        workers: 이동 스레드 수
+        dry_run: True면 이동하지 않고 건수만 계산
+
+    Returns:
+        {"documents": 문서 수, "files": 이동 파일 수, "directories": 샤드 디렉토리 수}
+    """
+    if shard not in FileNamingConvention.SHARDS or shard == FileNamingConvention.SHARD_FLAT:
+        raise ValueError(f"이전 대상 샤딩 방식이 아님: {shard}")
+
+    dest_dir = dest_dir or src_dir
+    documents = scan_flat_directory(src_dir)
+
+    created: Set[Path] = set()
+    lock = threading.Lock()
+
+    def move_document(item: Tuple[str, Dict[str, str]]) -> Tuple[int, Path]:
+        stem, files = item
+        date = _read_document_date(src_dir, files) if shard == FileNamingConvention.SHARD_DATE else None
+        target = dest_dir / FileNamingConvention.shard_dir(stem, shard, date)
+        if dry_run:
+            return len(files), target
+
+        if target not in created:
+            target.mkdir(parents=True, exist_ok=True)
+            with lock:
+                created.add(target)
+        for name in files.values():
+            shutil.move(str(src_dir / name), str(target / name))
+        return len(files), target
+
+    moved = 0
+    directories: Set[Path] = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for count, target in pool.map(move_document, documents.items(), chunksize=64):
+            moved += count
+            directories.add(target)
+
+    return {
+        "documents": len(documents),
+        "files": moved,
+        "directories": len(directories),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """샤딩 이전 CLI"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.reshard",
+        description="평면 산출물 디렉토리를 샤딩 레이아웃으로 이전",
+    )
+    parser.add_argument("src_dir", type=Path, help="평면 산출물 디렉토리")
+    parser.add_argument(
+        "--shard", required=True,
+        choices=[FileNamingConvention.SHARD_HASH, FileNamingConvention.SHARD_DATE],
+        help="샤딩 방식: hash(ab/cd/) / date(YYYY/MM/DD/)",
+    )
+    parser.add_argument("--dest", type=Path, default=None, help="대상 루트 (기본: src_dir)")
+    parser.add_argument(
+        "--workers", type=int, default=Constants.RESHARD_WORKERS,
+        help=f"이동 스레드 수 (기본: {Constants.RESHARD_WORKERS})",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="이동하지 않고 건수만 출력")
+    args = parser.parse_args(argv)
+
+    if not args.src_dir.is_dir():
+        parser.error(f"디렉토리 없음: {args.src_dir}")
+
+    stats = reshard_directory(
+        args.src_dir,
+        args.shard,
+        dest_dir=args.dest,
+        workers=args.workers,
+        dry_run=args.dry_run,
+    )
+    action = "이동 예정" if args.dry_run else "이동"
+    print(
+        f"문서 {stats['documents']}건, 파일 {stats['files']}개 {action} "
+        f"(샤드 디렉토리 {stats['directories']}개)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,11 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from collections import defaultdict
 
-from .schema import Candidate
+from .schema import Candidate, with_to_dict
 from .config import Constants
 
 
+@with_to_dict()
 @dataclass
 class ResolvedFields:
     # 후보들 중 최종 선택된 필드 값들
@@ -50,10 +51,13 @@ def _pick_best(items: List[Candidate]) -> Optional[Candidate]:
     return sorted(items, key=_rank_key)[0]
 
 
-def resolve_candidates(candidates: List[Candidate]) -> ResolvedFields:
+def resolve_candidates(candidates: List[Candidate], with_evidence: bool = True) -> ResolvedFields:
     """
     ExtractedCandidates.candidates를 입력으로 받아
     필드별 최적 후보를 1개씩 선택
+
+    with_evidence=False: 필드별 선택 근거(evidence[field]) 생략.
+    역할 미확정 중량 후보는 검증 단계에서 쓰이므로 value_raw만 남긴다.
     """
     warnings: List[str] = []
     evidence: Dict[str, Any] = {}
@@ -79,6 +83,9 @@ def resolve_candidates(candidates: List[Candidate]) -> ResolvedFields:
             if _rank_key(sorted_items[0]) == _rank_key(sorted_items[1]):
                 warnings.append(f"ambiguous_candidate:{field_name}")
 
+        if not with_evidence:
+            return best.value_raw
+
         evidence[field_name] = {
             "selected_value": best.value_raw,
             "selected_method": best.method,
@@ -100,8 +107,8 @@ def resolve_candidates(candidates: List[Candidate]) -> ResolvedFields:
     # 역할이 확정되지 않은 weight_kg 후보는 확정하지 않고 근거로만 남김
     misc_weights = by_field.get("weight_kg", [])
     if misc_weights:
-        evidence["weight_kg_candidates"] = {
-            "candidates": [
+        if with_evidence:
+            weight_items = [
                 {
                     "value_raw": c.value_raw,
                     "method": c.method,
@@ -109,7 +116,11 @@ def resolve_candidates(candidates: List[Candidate]) -> ResolvedFields:
                     "source_line": c.source_line,
                 }
                 for c in misc_weights
-            ],
+            ]
+        else:
+            weight_items = [{"value_raw": c.value_raw} for c in misc_weights]
+        evidence["weight_kg_candidates"] = {
+            "candidates": weight_items,
             "candidate_count": len(misc_weights),
         }
         warnings.append("unassigned_weight_candidates_present")
@@ -0,0 +1,284 @@
+"""
+배치 모드 병렬 스케줄러 (--workers N)
+- 워커 슬롯 = 배분 스레드 1개 + 워커 프로세스 1개 (watchdog.DocumentWatchdog, --doc-timeout이면 슬롯마다 시간 제한)
+- 크기 기준 LPT (longest processing time first): 디렉토리 스캔 때 얻는 파일 크기 내림차순으로 배분
+  큰 다중 페이지 스캔본이 이름순으로 끝에 몰려 있어도 먼저 시작하므로, 마지막에 한 워커만 일하고
+  나머지가 노는 꼬리 지연(straggler)이 줄어든다
+- 동적 배분: 미리 나눠 주지 않고, 슬롯이 문서를 끝낼 때마다 공유 큐에서 남은 것 중 가장 큰 문서를 가져감
+  (느린 슬롯의 몫을 빨리 끝난 슬롯이 가져가는 work stealing과 같은 효과)
+- 결과는 입력 순서로 내보냄 (재정렬 버퍼): 요약 CSV / SQLite / 컬럼형 / 콘솔 출력이 직렬 실행과 같은 순서
+  - 앞 순서 문서가 끝날 때까지 뒤 순서 결과는 버퍼에 머무름 (최대 전체 문서 수만큼)
+- 메모리 예산 (memory_budget): 처리 중 + 버퍼에 있는 문서의 추정 메모리(in-flight 바이트) 합이
+  예산을 넘으면 새 문서 배분을 멈추고, 부모가 결과를 소비해 줄어들면 다시 배분
+  - 처리 중: 입력 크기 × INFLIGHT_BYTES_PER_INPUT_BYTE / 처리 끝남: 입력 크기 + 후보 수 × INFLIGHT_BYTES_PER_CANDIDATE
+  - 진행 보장: 처리 중인 문서가 없으면 예산을 넘는 문서도 배분하고, 부모가 기다리는 (입력 순서상 다음)
+    문서가 아직 배분 전이면 큐 순서와 무관하게 먼저 배분 (버퍼에 뒤 순서 결과만 쌓여 멈추지 않도록)
+- 워커 재시작 (max_tasks / max_rss): 슬롯 워커마다 watchdog.DocumentWatchdog가 처리
+
+워커는 파이프라인 계산만 하고, 산출물 포맷 / 저장은 부모가 입력 순서대로 한다 (main.process_single_file).
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence
+
+from .config import Constants
+from .pipeline import run_full_pipeline
+from .watchdog import RECYCLE_RSS, RECYCLE_TASKS, DocumentWatchdog
+
+# 배분 순서
+SCHEDULE_LPT = "lpt"
+SCHEDULE_INPUT = "input"
+SCHEDULES = (SCHEDULE_LPT, SCHEDULE_INPUT)
+
+
+def file_sizes(paths: Sequence[Path]) -> List[int]:
+    """파일 크기 (바이트, 없는 파일은 0)"""
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.stat(path).st_size)
+        except OSError:
+            sizes.append(0)
+    return sizes
+
+
+def lpt_order(sizes: Sequence[int]) -> List[int]:
+    """크기 내림차순 인덱스 (같은 크기는 입력 순서)"""
+    return sorted(range(len(sizes)), key=lambda i: (-sizes[i], i))
+
+
+def candidate_count(value: Any) -> int:
+    """파이프라인 결과 (preprocessed, extracted, resolved, parsed)의 후보 수 (다른 형태면 0)"""
+    try:
+        return len(value[1].candidates)
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return 0
+
+
+def inflight_bytes(size: int, candidates: Optional[int] = None) -> int:
+    """
+    문서 1건의 추정 메모리 (바이트)
+    candidates=None: 처리 중 (워커의 JSON 파싱 / 정규화 텍스트 / 후보), 아니면 처리 끝난 결과 객체
+    """
+    if candidates is None:
+        return size * Constants.INFLIGHT_BYTES_PER_INPUT_BYTE
+    return size + candidates * Constants.INFLIGHT_BYTES_PER_CANDIDATE
+
+
+@dataclass
+class ScheduledResult:
+    """워커 슬롯 1건 처리 결과 (value / error 중 하나)"""
+    index: int
+    path: Path
+    value: Any = None
+    error: Optional[BaseException] = None
+    stages_ns: Optional[Dict[str, int]] = None
+    elapsed_ns: int = 0
+    slot: int = 0
+
+    def result(self) -> Any:
+        """파이프라인 반환값 (워커에서 난 예외는 다시 올림)"""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class BatchScheduler:
+    """
+    크기순 동적 배분 + 입력 순서 출력
+        scheduler = BatchScheduler(workers=4, memory_budget=1024 * 1024 * 1024)
+        for item in scheduler.run(paths, with_evidence=True):
+            preprocessed, extracted, resolved, parsed = item.result()
+        scheduler.close()
+    - memory_budget: in-flight 추정 메모리 상한 (바이트, None=무제한)
+    - max_tasks / max_rss: 슬롯 워커 재시작 기준 (DocumentWatchdog)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        timeout: Optional[float] = None,
+        schedule: str = SCHEDULE_LPT,
+        pipeline: Callable[..., Any] = run_full_pipeline,
+        mp_context: Any = None,
+        memory_budget: Optional[int] = None,
+        max_tasks: int = 0,
+        max_rss: Optional[int] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다")
+        if schedule not in SCHEDULES:
+            raise ValueError(f"알 수 없는 배분 순서: {schedule!r}")
+        if memory_budget is not None and memory_budget <= 0:
+            raise ValueError("memory_budget은 0보다 커야 합니다")
+        self.schedule = schedule
+        self.memory_budget = memory_budget
+        self.slots = [
+            DocumentWatchdog(timeout, pipeline=pipeline, mp_context=mp_context, max_tasks=max_tasks, max_rss=max_rss)
+            for _ in range(workers)
+        ]
+        self.dispatched: List[int] = []  # 배분한 순서 (입력 인덱스)
+        self._queue: Deque[int] = deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)  # in-flight 바이트 / 소비 위치 변경
+        self._stop = threading.Event()
+        self._busy_ns = [0] * workers
+        self._wall_ns = 0
+        # 메모리 예산: 입력 크기, 문서별 현재 추정치 (배분 ~ 소비), 부모가 기다리는 입력 인덱스
+        self._sizes: List[int] = []
+        self._weights: Dict[int, int] = {}
+        self._queued: List[bool] = []
+        self._inflight = 0
+        self._head = 0
+        self.peak_inflight = 0
+        self.throttled = 0  # 예산 때문에 배분을 기다린 횟수
+
+    def _fits(self, weight: int) -> bool:
+        return self.memory_budget is None or self._inflight == 0 or self._inflight + weight <= self.memory_budget
+
+    def _next(self) -> Optional[int]:
+        with self._changed:
+            waited = False
+            while True:
+                if self._stop.is_set() or not self._queue:
+                    return None
+                index = self._queue[0]
+                if self._fits(inflight_bytes(self._sizes[index])):
+                    self._queue.popleft()
+                    break
+                if self._queued[self._head]:
+                    # 부모가 기다리는 문서는 예산과 무관하게 먼저 (버퍼만 차서 멈추지 않도록)
+                    index = self._head
+                    self._queue.remove(index)
+                    break
+                if not waited:
+                    self.throttled += 1
+                    waited = True
+                self._changed.wait()
+            self._queued[index] = False
+            self._set_weight(index, inflight_bytes(self._sizes[index]))
+            self.dispatched.append(index)
+            return index
+
+    def _set_weight(self, index: int, weight: int) -> None:
+        # 락 안에서 호출: 문서 추정치 변경 (0이면 해제)
+        self._inflight += weight - self._weights.pop(index, 0)
+        if weight:
+            self._weights[index] = weight
+        self.peak_inflight = max(self.peak_inflight, self._inflight)
+        self._changed.notify_all()
+
+    def _slot_loop(
+        self,
+        slot: int,
+        paths: Sequence[Path],
+        with_evidence: bool,
+        traced: bool,
+        done: "queue.Queue[ScheduledResult]",
+    ) -> None:
+        # 슬롯 스레드: 끝날 때마다 공유 큐에서 다음 문서 (워커 프로세스 응답을 기다리는 동안 GIL을 놓음)
+        watchdog = self.slots[slot]
+        while True:
+            index = self._next()
+            if index is None:
+                return
+            item = ScheduledResult(index=index, path=paths[index], stages_ns={} if traced else None, slot=slot)
+            started = time.perf_counter_ns()
+            try:
+                item.value = watchdog.run(str(paths[index]), with_evidence=with_evidence, trace=item.stages_ns)
+            except Exception as e:
+                item.error = e
+            item.elapsed_ns = time.perf_counter_ns() - started
+            self._busy_ns[slot] += item.elapsed_ns
+            with self._changed:
+                self._set_weight(index, inflight_bytes(self._sizes[index], candidate_count(item.value)))
+            done.put(item)
+
+    def run(self, paths: Sequence[Path], with_evidence: bool = True, traced: bool = False) -> Iterator[ScheduledResult]:
+        """
+        paths 전체를 처리해 입력 순서대로 내보냄
+        traced: 워커의 문서별 단계 시간(stages_ns)을 함께 받음 (--log-json)
+        """
+        paths = list(paths)
+        self._sizes = file_sizes(paths)
+        order = lpt_order(self._sizes) if self.schedule == SCHEDULE_LPT else list(range(len(paths)))
+        self._queue = deque(order)
+        self._queued = [True] * len(paths)
+        self._weights = {}
+        self._inflight = 0
+        self._head = 0
+        self.dispatched = []
+        self._stop.clear()
+        done: "queue.Queue[ScheduledResult]" = queue.Queue()
+        threads = [
+            threading.Thread(
+                target=self._slot_loop, args=(slot, paths, with_evidence, traced, done),
+                name=f"ocr-batch-slot-{slot}", daemon=True,
+            )
+            for slot in range(min(len(self.slots), len(paths)))
+        ]
+        started = time.perf_counter_ns()
+        # 워커는 슬롯 스레드를 띄우기 전에 이 스레드에서 차례로 fork
+        # (다른 슬롯 스레드가 잡고 있던 락을 물려받은 워커가 종료 시 멈추지 않도록)
+        for slot in range(len(threads)):
+            self.slots[slot].start()
+        for thread in threads:
+            thread.start()
+
+        pending: Dict[int, ScheduledResult] = {}
+        finished = False
+        try:
+            for index in range(len(paths)):
+                with self._changed:
+                    self._head = index
+                    self._changed.notify_all()
+                while index not in pending:
+                    item = done.get()
+                    pending[item.index] = item
+                yield pending.pop(index)
+                with self._changed:
+                    self._set_weight(index, 0)  # 부모가 소비 (산출물 포맷 / 저장 끝)
+            finished = True
+        finally:
+            with self._changed:
+                self._stop.set()
+                self._changed.notify_all()
+            if not finished:
+                # 중간에 멈춘 경우 (소비자 예외 등): 처리 중인 워커를 끊어 슬롯 스레드를 풀어준다
+                self.close(force=True)
+            for thread in threads:
+                thread.join()
+            self._wall_ns += time.perf_counter_ns() - started
+
+    def close(self, force: bool = False) -> None:
+        """모든 슬롯의 워커 종료 (force: 처리 중이어도 바로 강제 종료)"""
+        for watchdog in self.slots:
+            watchdog.close(force=force)
+
+    def stats(self) -> Dict[str, Any]:
+        """슬롯 가동률 = 슬롯별 처리 시간 합 / (슬롯 수 × 경과 시간), 메모리 예산 / 워커 재시작 집계"""
+        wall = self._wall_ns / 1e9
+        busy = sum(self._busy_ns) / 1e9
+        return {
+            "workers": len(self.slots),
+            "schedule": self.schedule,
+            "wall_sec": round(wall, 3),
+            "busy_sec": round(busy, 3),
+            "utilization": round(busy / (wall * len(self.slots)), 4) if wall else None,
+            "timeouts": sum(w.timeouts for w in self.slots),
+            "crashes": sum(w.crashes for w in self.slots),
+            "workers_started": sum(w.workers_started for w in self.slots),
+            "memory_budget": self.memory_budget,
+            "peak_inflight_bytes": self.peak_inflight,
+            "throttled": self.throttled,
+            "recycled_tasks": sum(w.recycled[RECYCLE_TASKS] for w in self.slots),
+            "recycled_rss": sum(w.recycled[RECYCLE_RSS] for w in self.slots),
+            "rss_max": max(w.rss_max for w in self.slots),
+        }
@@ -1,6 +1,36 @@
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, Any, Sequence
 
+
+def with_to_dict(nested_lists: Sequence[str] = ()) -> Callable[[type], type]:
+    """
+    dataclass에 필드별로 생성한 to_dict() 메서드를 붙이는 데코레이터 (@dataclass 위에 사용)
+
+    dataclasses.asdict와 달리 재귀 deepcopy를 하지 않는다.
+    - nested_lists에 지정한 필드: 원소의 to_dict() 결과 리스트
+    - 나머지 필드: 값을 그대로 참조 (list/dict도 복사하지 않음)
+    → 직렬화(JSON 기록) 전용. 반환된 dict 안의 list/dict를 수정하면 원본도 바뀐다.
+    """
+    def decorate(cls: type) -> type:
+        items = []
+        for f in fields(cls):
+            if f.name in nested_lists:
+                items.append(f"{f.name!r}: [item.to_dict() for item in self.{f.name}]")
+            else:
+                items.append(f"{f.name!r}: self.{f.name}")
+        source = "def to_dict(self):\n    return {" + ", ".join(items) + "}\n"
+        namespace: Dict[str, Any] = {}
+        exec(source, namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = f"{cls.__name__} → dict (얕은 변환, 필드 순서 유지)"
+        cls.to_dict = to_dict
+        return cls
+    return decorate
+
+
+
+@with_to_dict()
 @dataclass
 class RawDocument:
     """
@@ -12,6 +42,7 @@ class RawDocument:
     meta: Dict = field(default_factory=dict)
 
 
+@with_to_dict()
 @dataclass
 class PreprocessedDocument:
     """
@@ -25,6 +56,7 @@ class PreprocessedDocument:
     applied_rules: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
+@with_to_dict()
 @dataclass
 class ExtractionMetadata:
     """
@@ -47,6 +79,7 @@ class ExtractionMetadata:
     is_imputed: bool = False
     notes: str = ""
 
+@with_to_dict()
 @dataclass
 class Candidate:
     """
@@ -65,6 +98,7 @@ class Candidate:
     meta: Dict = field(default_factory=dict)
 
 
+@with_to_dict(nested_lists=("candidates",))
 @dataclass
 class ExtractedCandidates:
     """
@@ -79,6 +113,7 @@ class ExtractedCandidates:
     warnings: List[str] = field(default_factory=list)
 
 
+@with_to_dict()
 @dataclass
 class ParseResult:
     """
@@ -0,0 +1,332 @@
+"""
+SQLite 결과 저장소
+- ParsedOutputSchema 1건 = parsed_results 1행
+- parse_warnings / validation_errors / imputation_notes는 자식 테이블에 1항목 1행
+- batch_size건씩 모아 WAL 모드 트랜잭션 안에서 executemany로 기록
+- date / vehicle_no / is_valid 인덱스로 조회
+
+조회 CLI (읽기 전용 연결, DB를 변경하지 않음):
+    python -m src.sqlite_sink results.sqlite --date 2026-02-02
+    python -m src.sqlite_sink results.sqlite --vehicle-no 80구8713 --invalid
+    python -m src.sqlite_sink results.sqlite --date-from 2026-02-01 --date-to 2026-02-28 --count
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import Constants
+from .schemas import ParsedOutputSchema
+
+
+# 자식 테이블: (테이블명, ParsedOutputSchema 키)
+CHILD_TABLES: List[Tuple[str, str]] = [
+    ("parse_warnings", "parse_warnings"),
+    ("validation_errors", "validation_errors"),
+    ("imputation_notes", "imputation_notes"),
+]
+
+_RESULT_COLUMNS = [
+    "source",
+    "date",
+    "time",
+    "vehicle_no",
+    "gross_weight_kg",
+    "tare_weight_kg",
+    "net_weight_kg",
+    "is_valid",
+]
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS parsed_results (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    date TEXT,
+    time TEXT,
+    vehicle_no TEXT,
+    gross_weight_kg INTEGER,
+    tare_weight_kg INTEGER,
+    net_weight_kg INTEGER,
+    is_valid INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_parsed_results_date ON parsed_results(date);
+CREATE INDEX IF NOT EXISTS idx_parsed_results_vehicle_no ON parsed_results(vehicle_no);
+CREATE INDEX IF NOT EXISTS idx_parsed_results_is_valid ON parsed_results(is_valid);
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    result_id INTEGER NOT NULL REFERENCES parsed_results(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{table}_result_id ON {table}(result_id);
+CREATE INDEX IF NOT EXISTS idx_{table}_value ON {table}(value);
+"""
+    for table, _ in CHILD_TABLES
+)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """기록용 WAL 모드 연결 (스키마/인덱스가 없으면 생성, 조회는 connect_readonly)"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(_SCHEMA_SQL)
+    return conn
+
+
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """조회 전용 연결 (journal_mode / 스키마를 건드리지 않음, 쓰기는 실패)"""
+    return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+class SQLiteResultSink:
+    """
+    파싱 결과 SQLite 기록기
+    - write()는 버퍼에 쌓기만 하고 batch_size건마다 한 트랜잭션으로 기록
+    - 같은 source를 다시 기록하면 기존 행(자식 포함)을 대체한다 (재실행/재개 시 중복 없음)
+    """
+
+    def __init__(self, db_path: Path, batch_size: int = Constants.SQLITE_BATCH_SIZE):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.rows_written = 0
+        self._conn = connect(db_path)
+        self._buffer: List[ParsedOutputSchema] = []
+        self._next_id = self._conn.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM parsed_results"
+        ).fetchone()[0]
+
+    def write(self, parsed: ParsedOutputSchema) -> None:
+        """결과 1건 추가"""
+        self._buffer.append(parsed)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼를 한 트랜잭션으로 기록"""
+        if not self._buffer:
+            return
+
+        # 같은 배치 안의 중복 source는 마지막 결과만 남긴다
+        batch = list({parsed["source"]: parsed for parsed in self._buffer}.values())
+        self._buffer = []
+
+        result_rows = []
+        child_rows: Dict[str, List[Tuple[int, int, str]]] = {t: [] for t, _ in CHILD_TABLES}
+        for parsed in batch:
+            result_id = self._next_id
+            self._next_id += 1
+            result_rows.append((
+                result_id,
+                parsed["source"],
+                parsed["date"],
+                parsed["time"],
+                parsed["vehicle_no"],
+                parsed["gross_weight_kg"],
+                parsed["tare_weight_kg"],
+                parsed["net_weight_kg"],
+                1 if parsed["is_valid"] else 0,
+            ))
+            for table, key in CHILD_TABLES:
+                for seq, value in enumerate(parsed.get(key) or []):
+                    child_rows[table].append((result_id, seq, str(value)))
+
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "DELETE FROM parsed_results WHERE source = ?",
+                [(row[1],) for row in result_rows],
+            )
+            conn.executemany(
+                f"INSERT INTO parsed_results (id, {', '.join(_RESULT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(_RESULT_COLUMNS) + 1))})",
+                result_rows,
+            )
+            for table, rows in child_rows.items():
+                if rows:
+                    conn.executemany(
+                        f"INSERT INTO {table} (result_id, seq, value) VALUES (?, ?, ?)",
+                        rows,
+                    )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self.rows_written += len(result_rows)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+# ============================================================================
+# 조회
+# ============================================================================
+
+def _build_where(
+    date: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    vehicle_no: Optional[str],
+    is_valid: Optional[bool],
+) -> Tuple[str, List[Any]]:
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    if date is not None:
+        clauses.append("date = ?")
+        params.append(date)
+    if date_from is not None:
+        clauses.append("date >= ?")
+        params.append(date_from)
+    if date_to is not None:
+        clauses.append("date <= ?")
+        params.append(date_to)
+    if vehicle_no is not None:
+        clauses.append("vehicle_no = ?")
+        params.append(vehicle_no)
+    if is_valid is not None:
+        clauses.append("is_valid = ?")
+        params.append(1 if is_valid else 0)
+
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def query_results(
+    conn: sqlite3.Connection,
+    date: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    vehicle_no: Optional[str] = None,
+    is_valid: Optional[bool] = None,
+    limit: Optional[int] = 100,
+) -> List[ParsedOutputSchema]:
+    """
+    조건으로 결과 조회 (ParsedOutputSchema 형태로 복원)
+    - 정렬: date, time, source
+    """
+    where, params = _build_where(date, date_from, date_to, vehicle_no, is_valid)
+    sql = (
+        f"SELECT id, {', '.join(_RESULT_COLUMNS)} FROM parsed_results{where} "
+        f"ORDER BY date, time, source"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    rows = conn.execute(sql, params).fetchall()
+    if not rows:
+        return []
+
+    ids = [row[0] for row in rows]
+    children = _fetch_children(conn, ids)
+
+    results: List[ParsedOutputSchema] = []
+    for row in rows:
+        result_id = row[0]
+        record = dict(zip(_RESULT_COLUMNS, row[1:]))
+        record["is_valid"] = bool(record["is_valid"])
+        for table, key in CHILD_TABLES:
+            record[key] = children[table].get(result_id, [])
+        results.append(record)
+    return results
+
+
+def count_results(
+    conn: sqlite3.Connection,
+    date: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    vehicle_no: Optional[str] = None,
+    is_valid: Optional[bool] = None,
+) -> int:
+    """조건에 맞는 결과 건수"""
+    where, params = _build_where(date, date_from, date_to, vehicle_no, is_valid)
+    return conn.execute(f"SELECT COUNT(*) FROM parsed_results{where}", params).fetchone()[0]
+
+
+def _fetch_children(
+    conn: sqlite3.Connection,
+    ids: Sequence[int]
+) -> Dict[str, Dict[int, List[str]]]:
+    # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+    out: Dict[str, Dict[int, List[str]]] = {t: {} for t, _ in CHILD_TABLES}
+    step = 500
+    for i in range(0, len(ids), step):
+        chunk = ids[i:i + step]
+        marks = ", ".join("?" * len(chunk))
+        for table, _ in CHILD_TABLES:
+            for result_id, value in conn.execute(
+                f"SELECT result_id, value FROM {table} "
+                f"WHERE result_id IN ({marks}) ORDER BY result_id, seq",
+                chunk,
+            ):
+                out[table].setdefault(result_id, []).append(value)
+    return out
+
+
+# ============================================================================
+# 조회 CLI
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """결과 DB 조회 CLI (한 줄 = ParsedOutputSchema JSON 1건)"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.sqlite_sink",
+        description="SQLite 파싱 결과 조회",
+    )
+    parser.add_argument("db", type=Path, help="SQLite DB 경로")
+    parser.add_argument("--date", help="날짜 일치 (YYYY-MM-DD)")
+    parser.add_argument("--date-from", help="날짜 범위 시작 (포함)")
+    parser.add_argument("--date-to", help="날짜 범위 끝 (포함)")
+    parser.add_argument("--vehicle-no", help="차량번호 일치")
+    valid = parser.add_mutually_exclusive_group()
+    valid.add_argument("--valid", dest="is_valid", action="store_const", const=True, help="검증 통과만")
+    valid.add_argument("--invalid", dest="is_valid", action="store_const", const=False, help="검증 실패만")
+    parser.add_argument("--limit", type=int, default=100, help="최대 출력 건수 (기본: 100, 0=제한 없음)")
+    parser.add_argument("--count", action="store_true", help="건수만 출력")
+    args = parser.parse_args(argv)
+
+    if not args.db.exists():
+        parser.error(f"DB 파일 없음: {args.db}")
+
+    conn = connect_readonly(args.db)
+    try:
+        filters = dict(
+            date=args.date,
+            date_from=args.date_from,
+            date_to=args.date_to,
+            vehicle_no=args.vehicle_no,
+            is_valid=args.is_valid,
+        )
+        if args.count:
+            print(count_results(conn, **filters))
+            return
+
+        for record in query_results(conn, limit=args.limit or None, **filters):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
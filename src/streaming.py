@@ -0,0 +1,297 @@
+"""
+JSONL 스트리밍 모드 (stdin -> stdout)
+- 입력 한 줄 = OCR JSON 레코드 1건
+- 출력 한 줄 = ParsedOutputSchema JSON 1건 (입력 순서 유지)
+- 문서별 산출물 파일/프로그레스 바 없이 상수 메모리로 동작
+"""
+from __future__ import annotations
+
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+from .error_handler import ErrorHandler
+from .loader import parse_ocr_record
+from .logger import get_logger, setup_worker_logger, worker_log_queue
+from .progress import ProgressAggregator, ProgressBar, ProgressReporter
+from .metrics import disable_metrics, enable_metrics, get_metrics, stage_timer
+from .memprofile import get_memory_profiler, memory_document, start_memprofile, stop_memprofile
+from .profiling import get_profile_session, profile_document, start_profiling, stop_profiling
+from .pipeline import run_document_pipeline
+from .output_formatters import format_parse_result
+from .schemas import ParsedOutputSchema, get_empty_parsed_output
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 레코드에서 source 이름으로 사용할 키 (우선순위 순)
+SOURCE_KEYS = ("source", "filename", "id")
+
+# 병렬 모드에서 워커 1회 호출당 처리할 줄 수
+DEFAULT_CHUNK_SIZE = 64
+
+# 병렬 모드에서 워커당 동시에 대기시킬 청크 수 (메모리 상한)
+IN_FLIGHT_PER_WORKER = 2
+
+# 워커 프로세스가 청크 결과와 함께 계측 / 프로파일 / 메모리 프로파일 스냅샷을 돌려줄지 여부
+# (부모가 계측·프로파일 중일 때 _init_worker가 켠다. 직렬 모드는 같은 수집기를 쓰므로 꺼둔다)
+_ship_metrics = False
+_ship_profile = False
+_ship_memprofile = False
+
+# 줄 처리 실패 수집기 (직렬 모드: 부모의 수집기, 병렬 모드: _init_worker가 만든 워커 수집기)
+_errors: Optional[ErrorHandler] = None
+_ship_errors = False
+
+# 워커 진행 보고기 (부모가 진행률을 표시할 때 _init_worker가 만든다)
+_progress: Optional[ProgressReporter] = None
+
+
+def dumps_compact(data: Any) -> str:
+    """한 줄 JSON 직렬화 (공백 없음)"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _record_source(record: Dict[str, Any], line_no: int) -> str:
+    for key in SOURCE_KEYS:
+        value = record.get(key)
+        if value:
+            return str(value)
+    return f"stdin:{line_no}"
+
+
+def parse_jsonl_line(line: str, line_no: int) -> Tuple[str, ParsedOutputSchema]:
+    """
+    JSONL 한 줄을 파싱 결과로 변환
+    - 실패해도 예외를 올리지 않고 validation_errors에 원인을 기록한 레코드 반환
+      (출력 줄 수 == 입력 줄 수 유지)
+
+    Returns:
+        (status, parsed_output)
+        status: "SUCCESS" | "FAILED"
+    """
+    source = f"stdin:{line_no}"
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("JSONL 레코드가 JSON 객체가 아님")
+        source = _record_source(record, line_no)
+
+        raw_doc = parse_ocr_record(record, source)
+        # 출력은 ParsedOutputSchema뿐이므로 근거 생성 생략
+        _, _, _, parsed = run_document_pipeline(raw_doc, with_evidence=False)
+        return "SUCCESS", format_parse_result(source, parsed.to_dict())
+
+    except Exception as e:
+        errors = _errors
+        if errors is not None:
+            errors.handle_error(e, context=f"스트리밍 줄 {line_no}", source=source)
+        output = get_empty_parsed_output(source)
+        output["validation_errors"] = [f"pipeline_error:{type(e).__name__}"]
+        return "FAILED", output
+
+
+def _init_worker(
+    metrics_enabled: bool,
+    profile: Optional[Tuple[str, int, float]] = None,
+    memprofile: Optional[Tuple[int, int]] = None,
+    log_config: Optional[Tuple[Any, int]] = None,
+    progress_queue: Any = None,
+    collect_errors: bool = False,
+) -> None:
+    # 워커 프로세스 초기화: 부모가 계측 / 프로파일 / 메모리 프로파일 중이면 워커에서도 수집
+    # (fork로 물려받은 부모의 누적값을 다시 보내지 않도록 새 수집기로 시작)
+    # 부모가 큐 로깅 모드면 워커 로그는 부모의 로그 큐로, 진행률은 진행 큐로 보낸다
+    global _ship_metrics, _ship_profile, _ship_memprofile, _progress, _errors, _ship_errors
+    if log_config is not None:
+        setup_worker_logger(*log_config)
+    _progress = ProgressReporter(progress_queue) if progress_queue is not None else None
+    # fork로 물려받은 부모의 수집기는 버리고 워커 전용 수집기로 (청크마다 스냅샷 전송)
+    _errors = ErrorHandler() if collect_errors else None
+    _ship_errors = collect_errors
+    disable_metrics()
+    inherited = stop_profiling()
+    if inherited is not None:
+        inherited.abandon()
+    inherited_memory = stop_memprofile()
+    if inherited_memory is not None:
+        inherited_memory.abandon()
+    if metrics_enabled:
+        enable_metrics()
+        _ship_metrics = True
+    if profile is not None:
+        start_profiling(*profile)
+        _ship_profile = True
+    if memprofile is not None:
+        start_memprofile(*memprofile)
+        _ship_memprofile = True
+
+
+def _process_chunk(
+    chunk: List[Tuple[int, str]]
+) -> Tuple[List[Tuple[str, bool, str, List[str]]], Optional[Dict[str, Any]]]:
+    # 워커 프로세스에서 실행: 직렬화까지 마친 줄을 반환해 IPC 비용을 줄인다
+    # (검증 오류 코드는 부모의 메트릭 집계용으로 따로 전달)
+    # 계측 / 프로파일 중이면 이 청크 동안의 스냅샷을 함께 반환 (부모가 병합)
+    out: List[Tuple[str, bool, str, List[str]]] = []
+    for line_no, line in chunk:
+        with profile_document(line_no), memory_document(line_no, line):
+            status, parsed = parse_jsonl_line(line, line_no)
+            with stage_timer("serialize"):
+                encoded = dumps_compact(parsed)
+        out.append((status, parsed["is_valid"], encoded, parsed["validation_errors"]))
+        if _progress is not None:
+            _progress.update()
+    if _progress is not None:
+        _progress.flush()
+
+    snapshot: Optional[Dict[str, Any]] = None
+    if _ship_metrics or _ship_profile or _ship_memprofile or _ship_errors:
+        snapshot = {}
+        if _ship_metrics:
+            snapshot["metrics"] = get_metrics().snapshot(reset=True)
+        if _ship_profile:
+            snapshot["profile"] = get_profile_session().snapshot()
+        if _ship_memprofile:
+            snapshot["memprofile"] = get_memory_profiler().snapshot()
+        if _ship_errors and _errors.groups:
+            snapshot["errors"] = _errors.snapshot()
+    return out, snapshot
+
+
+def _iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    # 빈 줄은 건너뛰되 줄 번호는 원본 기준으로 유지
+    chunk: List[Tuple[int, str]] = []
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        chunk.append((line_no, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ordered_parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    max_in_flight: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """
+    입력 순서를 유지하는 병렬 map
+    - executor.map과 달리 입력을 미리 모두 소비하지 않고
+      최대 max_in_flight개 작업만 대기시킨다 (상수 메모리)
+    - initializer는 워커 프로세스 시작 시에만 호출 (workers <= 1이면 호출하지 않음)
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending: Deque[Future] = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_stream(
+    in_stream: TextIO,
+    out_stream: TextIO,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_result: Optional[Callable[[str, bool, List[str]], None]] = None,
+    progress: Optional[ProgressBar] = None,
+    error_handler: Optional[ErrorHandler] = None,
+) -> Dict[str, int]:
+    """
+    JSONL 스트림 처리 실행
+
+    Args:
+        in_stream: 입력 스트림 (한 줄 = OCR JSON 1건)
+        out_stream: 출력 스트림 (한 줄 = ParsedOutputSchema 1건)
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 처리)
+        chunk_size: 병렬 모드의 워커 호출당 줄 수
+        on_result: 줄마다 (status, is_valid, validation_errors)로 호출 (메트릭 집계용)
+        progress: 진행률 표시 (병렬 모드에서는 워커가 처리하는 대로 진행 큐로 보고, 종료 시 finish())
+        error_handler: 실패한 줄의 예외 수집 (병렬 모드에서는 워커별 집계를 병합)
+
+    Returns:
+        {"total", "success", "valid", "failed"} 처리 건수
+
+    현재 프로세스에서 계측 중이면(enable_metrics) 워커의 단계별 히스토그램도,
+    프로파일 중이면(start_profiling) 워커의 프로파일도, 메모리 프로파일 중이면(start_memprofile)
+    워커의 단계별 / 크기 구간별 메모리 집계도 합산된다.
+    """
+    stats = {"total": 0, "success": 0, "valid": 0, "failed": 0}
+    metrics = get_metrics()
+    session = get_profile_session()
+    profile = (session.mode, session.every, session.interval) if session else None
+    memory = get_memory_profiler()
+    memprofile = (memory.every, memory.top) if memory else None
+    log_queue = worker_log_queue() if workers > 1 else None
+    log_config = (log_queue, get_logger().level) if log_queue is not None else None
+    aggregator = ProgressAggregator(progress) if progress is not None and workers > 1 else None
+    progress_queue = aggregator.queue if aggregator is not None else None
+
+    # 직렬 모드는 줄 단위로 즉시 출력 (파이프라인 지연 최소화)
+    effective_chunk = chunk_size if workers > 1 else 1
+    chunks = _iter_chunks(in_stream, max(1, effective_chunk))
+
+    # 직렬 모드는 현재 프로세스에서 줄을 처리하므로 호출자의 수집기에 바로 기록
+    global _errors
+    if workers <= 1:
+        _errors = error_handler
+
+    try:
+        for results, snapshot in ordered_parallel_map(
+            _process_chunk,
+            chunks,
+            workers=workers,
+            max_in_flight=workers * IN_FLIGHT_PER_WORKER,
+            initializer=_init_worker,
+            initargs=(metrics is not None, profile, memprofile, log_config, progress_queue, error_handler is not None),
+        ):
+            if snapshot:
+                if metrics is not None and "metrics" in snapshot:
+                    metrics.merge_dict(snapshot["metrics"])
+                if session is not None and "profile" in snapshot:
+                    session.merge(snapshot["profile"])
+                if memory is not None and "memprofile" in snapshot:
+                    memory.merge(snapshot["memprofile"])
+                if error_handler is not None and "errors" in snapshot:
+                    error_handler.merge(snapshot["errors"])
+            for status, is_valid, line, errors in results:
+                out_stream.write(line)
+                out_stream.write("\n")
+                if on_result is not None:
+                    on_result(status, is_valid, errors)
+
+                stats["total"] += 1
+                if status == "SUCCESS":
+                    stats["success"] += 1
+                    if is_valid:
+                        stats["valid"] += 1
+                else:
+                    stats["failed"] += 1
+            out_stream.flush()
+            if progress is not None and aggregator is None:
+                progress.update(len(results))
+    finally:
+        _errors = None
+        if aggregator is not None:
+            aggregator.close()
+    if progress is not None:
+        progress.finish()
+
+    return stats
@@ -0,0 +1,325 @@
+"""
+문서별 처리 시간 제한 (배치 모드 --doc-timeout)
+- DocumentWatchdog: 문서 1건씩 전용 워커 프로세스에서 run_full_pipeline 실행
+  (배치 병렬 모드는 워커 슬롯마다 하나씩, src/scheduler.py)
+  - 제한 시간 안에 결과가 오지 않으면 워커를 강제 종료(SIGKILL)하고 DocumentTimeout
+    (정규식 최악 입력 등으로 C 코드 안에서 멈춘 경우도 끊을 수 있도록 스레드가 아닌 프로세스)
+  - 워커가 비정상 종료하면(세그폴트, 메모리 부족 등) WorkerCrashed
+  - 다음 문서 전에 새 워커로 교체. 제한 시간은 워커 준비(import) 이후부터 잰다
+  - 워커 재시작(recycle): max_tasks건 처리 후, 또는 문서 처리 후 워커 RSS가 max_rss를 넘으면
+    정상 종료시키고 다음 문서 전에 새 워커 (단편화 / 캐시로 불어난 워커 메모리를 돌려받음)
+  - 파이프라인 예외는 워커 쪽 가장 안쪽 프레임(remote_frame)을 붙여 같은 타입으로 다시 올림
+    (에러 그룹 시그니처가 현재 프로세스 실행과 같도록)
+  - 계측 중이면 워커의 단계별 히스토그램 / 문서 추적(start_document_trace)을 문서마다 부모로 합산
+- Quarantine: 시간 초과 / 워커 비정상 종료 입력을 격리 디렉토리로 복사 + quarantine.jsonl에 사유 기록
+  (원본은 그대로 둔다: 다음 실행에서 다시 처리할지는 운영자가 결정)
+
+산출물 포맷 / 저장은 부모 프로세스에서 하므로 워커는 파이프라인 계산만 맡는다.
+"""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import pickle
+import shutil
+import signal
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config import Constants
+from .error_handler import PipelineError, error_signature
+from .memprofile import current_rss_bytes
+from .metrics import disable_metrics, enable_metrics, get_metrics, start_document_trace, stop_document_trace
+from .pipeline import run_full_pipeline
+
+QUARANTINE_INDEX = "quarantine.jsonl"
+
+# 격리 사유
+REASON_TIMEOUT = "TIMEOUT"
+REASON_WORKER_CRASH = "WORKER_CRASH"
+
+# 워커 재시작 사유
+RECYCLE_TASKS = "tasks"
+RECYCLE_RSS = "rss"
+
+_READY = "ready"
+
+# 워커 fork는 한 번에 하나씩 (여러 슬롯 스레드가 동시에 fork하면 서로 잡고 있던 락을 물려받음)
+_START_LOCK = threading.Lock()
+
+
+class DocumentTimeout(PipelineError):
+    """문서 처리 시간 초과 (워커 강제 종료)"""
+
+    def __init__(self, source: str, timeout: float):
+        super().__init__(f"{source}: 처리 시간 제한 {timeout:g}초 초과")
+        self.source = source
+        self.timeout = timeout
+
+    def __reduce__(self):
+        return type(self), (self.source, self.timeout)
+
+
+class WorkerCrashed(PipelineError):
+    """문서 처리 중 워커 프로세스 비정상 종료"""
+
+    def __init__(self, source: str, exitcode: Optional[int]):
+        super().__init__(f"{source}: 워커 프로세스 비정상 종료 (exitcode={exitcode})")
+        self.source = source
+        self.exitcode = exitcode
+
+    def __reduce__(self):
+        return type(self), (self.source, self.exitcode)
+
+
+class RemoteTraceback(Exception):
+    """워커 프로세스의 스택 트레이스 (다시 올린 예외의 __cause__로 에러 리포트에 남음)"""
+
+    def __str__(self) -> str:
+        return "\n" + self.args[0]
+
+
+def _portable_error(error: Exception) -> Exception:
+    # 부모로 보낼 예외: 워커 쪽 프레임 / 트레이스를 속성으로 (피클 안 되는 예외는 RuntimeError로)
+    frame = error_signature(error)[1]
+    remote_traceback = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+    try:
+        pickle.loads(pickle.dumps(error))
+        portable = error
+    except Exception:
+        portable = RuntimeError(f"{type(error).__name__}: {error}")
+    portable.remote_frame = frame
+    portable.remote_traceback = remote_traceback
+    return portable
+
+
+def _worker_main(conn: Any, pipeline: Callable[..., Any], metrics_enabled: bool) -> None:
+    # 워커 프로세스: 요청 (경로, with_evidence, 문서 추적 여부) → (결과 / 예외, 계측 스냅샷, 단계별 ns, RSS)
+    # fork로 물려받은 부모의 계측 수집기 / 문서 추적은 버리고 새로 시작, Ctrl+C는 부모가 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    disable_metrics()
+    stop_document_trace()
+    if metrics_enabled:
+        enable_metrics()
+    conn.send(_READY)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        input_path, with_evidence, traced = request
+        trace = start_document_trace() if traced else None
+        try:
+            payload: Tuple[str, Any] = ("ok", pipeline(input_path, with_evidence=with_evidence))
+        except Exception as e:
+            payload = ("error", _portable_error(e))
+        finally:
+            stop_document_trace()
+        metrics = get_metrics()
+        snapshot = metrics.snapshot(reset=True) if metrics is not None else None
+        try:
+            conn.send((payload, snapshot, trace, current_rss_bytes()))
+        except Exception as e:  # 결과 직렬화 실패
+            conn.send((("error", _portable_error(e)), snapshot, trace, current_rss_bytes()))
+    # 정리 단계 없이 종료: fork 시점에 부모의 다른 스레드가 잡고 있던 락(stdout 등)을
+    # 물려받았으면 인터프리터 종료 처리에서 멈출 수 있다 (워커는 남길 파일 / 버퍼가 없음)
+    conn.close()
+    os._exit(0)
+
+
+class DocumentWatchdog:
+    """
+    문서별 시간 제한 실행기 (워커 프로세스 1개, 문서 1건씩)
+        watchdog = DocumentWatchdog(timeout=10.0)
+        preprocessed, extracted, resolved, parsed = watchdog.run(path, with_evidence=True)
+        watchdog.close()
+    - run()은 run_full_pipeline과 같은 반환값 / 예외, 추가로 DocumentTimeout / WorkerCrashed
+    - timeout=None이면 시간 제한 없는 워커 (배치 병렬 모드의 슬롯)
+    - pipeline: 워커에서 실행할 함수 (spawn 방식에서도 넘길 수 있게 모듈 최상위 함수)
+    - max_tasks: 워커 1개가 처리할 최대 문서 수 (0=무제한), max_rss: 워커 RSS 상한 (바이트, None=무제한)
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float],
+        pipeline: Callable[..., Any] = run_full_pipeline,
+        mp_context: Any = None,
+        start_timeout: float = Constants.WORKER_START_TIMEOUT,
+        max_tasks: int = 0,
+        max_rss: Optional[int] = None,
+    ):
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout은 0보다 커야 합니다")
+        if max_tasks < 0:
+            raise ValueError("max_tasks는 0 이상이어야 합니다")
+        if max_rss is not None and max_rss <= 0:
+            raise ValueError("max_rss는 0보다 커야 합니다")
+        self.timeout = timeout
+        self.pipeline = pipeline
+        self.start_timeout = start_timeout
+        self.max_tasks = max_tasks
+        self.max_rss = max_rss
+        self._ctx = mp_context or multiprocessing.get_context()
+        self._process: Any = None
+        self._conn: Any = None
+        self._tasks = 0  # 현재 워커가 처리한 문서 수
+        self.timeouts = 0
+        self.crashes = 0
+        self.workers_started = 0
+        self.recycled = {RECYCLE_TASKS: 0, RECYCLE_RSS: 0}
+        self.rss_max = 0  # 문서 처리 직후 워커 RSS 최댓값 (바이트)
+
+    def start(self) -> None:
+        """워커를 미리 띄움 (이미 실행 중이면 그대로, 아니면 run()이 첫 문서 전에 띄운다)"""
+        if self._process is not None and self._process.is_alive():
+            return
+        self._kill()
+        self._start()
+
+    def _start(self) -> None:
+        with _START_LOCK:
+            parent_conn, child_conn = self._ctx.Pipe()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(child_conn, self.pipeline, get_metrics() is not None),
+                name="ocr-doc-worker",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+        self._process, self._conn = process, parent_conn
+        self._tasks = 0
+        self.workers_started += 1
+        try:
+            ready = parent_conn.poll(self.start_timeout) and parent_conn.recv() == _READY
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            exitcode = self._kill()
+            raise RuntimeError(f"문서 워커 프로세스를 시작하지 못했습니다 (exitcode={exitcode})")
+
+    def _kill(self) -> Optional[int]:
+        # 워커 강제 종료 (이미 끝났으면 회수만), 종료 코드 반환
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is None:
+            return None
+        if process.is_alive():
+            process.kill()
+        process.join()
+        conn.close()
+        return process.exitcode
+
+    @property
+    def worker_pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def run(self, input_path: str, with_evidence: bool = True, trace: Optional[Dict[str, int]] = None) -> Any:
+        """
+        문서 1건 실행 (trace: 부모의 start_document_trace() dict, 워커의 단계별 ns를 더함)
+        시간 초과 / 비정상 종료 시 워커를 정리하고 다음 호출에서 새 워커를 띄운다
+        """
+        if self._process is not None and not self._process.is_alive():
+            self._kill()
+        if self._process is None:
+            self._start()
+
+        source = Path(input_path).name
+        try:
+            self._conn.send((input_path, with_evidence, trace is not None))
+            reply = self._conn.recv() if self._conn.poll(self.timeout) else None
+        except (EOFError, OSError):
+            self.crashes += 1
+            raise WorkerCrashed(source, self._kill()) from None
+        if reply is None:
+            self.timeouts += 1
+            self._kill()
+            raise DocumentTimeout(source, self.timeout)
+
+        (kind, value), snapshot, stages, rss = reply
+        metrics = get_metrics()
+        if metrics is not None and snapshot:
+            metrics.merge_dict(snapshot)
+        if trace is not None and stages:
+            for stage, ns in stages.items():
+                trace[stage] = trace.get(stage, 0) + ns
+        self._tasks += 1
+        self.rss_max = max(self.rss_max, rss or 0)
+        if self.max_rss is not None and rss is not None and rss > self.max_rss:
+            self._recycle(RECYCLE_RSS)
+        elif self.max_tasks and self._tasks >= self.max_tasks:
+            self._recycle(RECYCLE_TASKS)
+        if kind == "error":
+            raise value from RemoteTraceback(value.remote_traceback)
+        return value
+
+    def _recycle(self, reason: str) -> None:
+        # 워커 정상 종료 (새 워커는 다음 문서 전에 띄움)
+        self.recycled[reason] += 1
+        self.close()
+
+    def close(self, force: bool = False) -> None:
+        """워커 종료 (대기 중이면 정상 종료 요청, 응답이 없거나 force면 강제 종료)"""
+        if self._process is None:
+            return
+        if force:
+            self._kill()
+            return
+        try:
+            self._conn.send(None)
+            self._process.join(timeout=self.start_timeout)
+        except OSError:
+            pass
+        self._kill()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "timeout_sec": self.timeout,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "workers_started": self.workers_started,
+            "recycled_tasks": self.recycled[RECYCLE_TASKS],
+            "recycled_rss": self.recycled[RECYCLE_RSS],
+            "rss_max": self.rss_max,
+        }
+
+
+class Quarantine:
+    """
+    격리 디렉토리
+    - 입력 파일 복사본 (같은 이름이면 덮어씀, 이력은 인덱스에 남음)
+    - quarantine.jsonl: 한 줄 = 격리 1건 {source, path, reason, detail, time}
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.count = 0
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / QUARANTINE_INDEX
+
+    def add(self, input_path: Path, reason: str, detail: str = "") -> Path:
+        """입력 파일을 격리 디렉토리로 복사하고 인덱스에 기록, 복사본 경로 반환"""
+        input_path = Path(input_path)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / input_path.name
+        if input_path.exists():
+            shutil.copy2(input_path, target)
+        record = {
+            "source": input_path.name,
+            "path": str(input_path.resolve()),
+            "reason": reason,
+            "detail": detail,
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(self.index_path, "a", encoding=Constants.DEFAULT_ENCODING) as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+        return target
@@ -0,0 +1,155 @@
+"""
+artifacts.py 모듈 단위 테스트
+- 레이아웃별 산출물 저장소 (files / bundle / jsonl)
+- jsonl 인덱스 기반 문서 조회
+"""
+import json
+
+import pytest
+
+from src.artifacts import (
+    ArtifactStore,
+    FileArtifactStore,
+    BundleArtifactStore,
+    JsonlArtifactStore,
+    create_artifact_store,
+    find_document_dir,
+    load_jsonl_index,
+    read_jsonl_document,
+)
+from src.output_formatters import FileNamingConvention
+
+
+def _artifacts(stem: str) -> dict:
+    return {
+        "raw": f"{stem} 원문\n총중량: 12 480 kg",
+        "normalized": f"{stem} 정규화\n총중량: 12,480 kg",
+        "preprocess_log": {"source": f"{stem}.json", "applied_rules": []},
+        "candidates": {"source": f"{stem}.json", "candidates": []},
+        "extract_log": {"source": f"{stem}.json", "warnings": []},
+        "resolved": {"source": f"{stem}.json", "resolved_fields": {}},
+        "parsed": {"source": f"{stem}.json", "is_valid": True},
+    }
+
+
+# 레이아웃별 저장소 테스트
+class TestArtifactStores:
+
+    def test_files_layout(self, tmp_path):
+        """files: 단계별 파일 7개"""
+        store = FileArtifactStore(tmp_path)
+        store.write_document("sample_01", _artifacts("sample_01"))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(store.output_files("sample_01"))
+        assert (tmp_path / "sample_01_raw.txt").read_text(encoding="utf-8").startswith("sample_01 원문")
+        parsed = json.loads((tmp_path / "sample_01_parsed.json").read_text(encoding="utf-8"))
+        assert parsed["is_valid"] is True
+
+    def test_bundle_layout(self, tmp_path):
+        """bundle: 문서당 파일 1개"""
+        store = BundleArtifactStore(tmp_path)
+        store.write_document("sample_01", _artifacts("sample_01"))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["sample_01_bundle.json"]
+        bundle = json.loads((tmp_path / "sample_01_bundle.json").read_text(encoding="utf-8"))
+        assert bundle["source"] == "sample_01.json"
+        assert bundle["parsed"] == _artifacts("sample_01")["parsed"]
+
+    def test_jsonl_layout_file_count(self, tmp_path):
+        """jsonl: 문서 수와 무관하게 단계별 파일 7개 + 인덱스"""
+        with JsonlArtifactStore(tmp_path, run_id="run_test") as store:
+            for i in range(5):
+                store.write_document(f"doc_{i}", _artifacts(f"doc_{i}"))
+
+        assert len(list(tmp_path.iterdir())) == 8
+        lines = (tmp_path / "run_test_parsed.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 5
+
+    def test_jsonl_index_lookup(self, tmp_path):
+        """인덱스로 특정 문서 산출물 복원"""
+        with JsonlArtifactStore(tmp_path, run_id="run_test") as store:
+            for i in range(3):
+                store.write_document(f"doc_{i}", _artifacts(f"doc_{i}"))
+
+        index = load_jsonl_index(tmp_path, "run_test")
+        assert list(index) == ["doc_0", "doc_1", "doc_2"]
+
+        restored = read_jsonl_document(tmp_path, "run_test", "doc_1", index=index)
+        assert restored == _artifacts("doc_1")
+
+    def test_minimal_verbosity(self, tmp_path):
+        """minimal: parsed 단계만 기록 (레이아웃 공통)"""
+        artifacts = {"parsed": _artifacts("doc")["parsed"]}
+        for layout in FileNamingConvention.LAYOUTS:
+            store = create_artifact_store(layout, tmp_path / layout, run_id="run_test", verbosity="minimal")
+            store.write_document("doc", artifacts)
+            store.close()
+            assert sorted(p.name for p in (tmp_path / layout).iterdir()) == sorted(store.output_files("doc"))
+
+        assert (tmp_path / "files" / "doc_parsed.json").exists()
+        assert read_jsonl_document(tmp_path / "jsonl", "run_test", "doc") == artifacts
+
+    def test_create_unknown_layout(self, tmp_path):
+        """알 수 없는 레이아웃"""
+        with pytest.raises(ValueError):
+            create_artifact_store("unknown", tmp_path)
+
+    def test_create_by_layout(self, tmp_path):
+        """레이아웃 이름으로 생성"""
+        for layout in FileNamingConvention.LAYOUTS:
+            store = create_artifact_store(layout, tmp_path / layout)
+            assert store.layout == layout
+            store.close()
+
+    def test_write_document_required(self, tmp_path):
+        """기록 방법이 없는 저장소는 생성 시점에 거부"""
+        with pytest.raises(TypeError):
+            ArtifactStore(tmp_path)
+
+        class NoWriteStore(ArtifactStore):
+            layout = "none"
+
+        with pytest.raises(TypeError):
+            NoWriteStore(tmp_path)
+
+
+# 샤딩 레이아웃 테스트
+class TestShardedStores:
+
+    def _dated(self, stem, date):
+        artifacts = _artifacts(stem)
+        artifacts["parsed"] = {"source": f"{stem}.json", "date": date}
+        return artifacts
+
+    def test_hash_shard_and_lookup(self, tmp_path):
+        """hash: ab/cd/ 아래 기록, 조회 헬퍼로 위치 계산"""
+        with FileArtifactStore(tmp_path, shard="hash") as store:
+            store.write_document("sample_01", _artifacts("sample_01"))
+            files = store.output_files("sample_01")
+
+        assert all((tmp_path / f).exists() for f in files)
+        directory = find_document_dir(tmp_path, "sample_01", shard="hash")
+        assert directory == tmp_path / FileNamingConvention.shard_dir("sample_01", "hash")
+        assert find_document_dir(tmp_path, "missing", shard="hash") is None
+
+    def test_date_shard_and_lookup(self, tmp_path):
+        """date: 문서 날짜별 디렉토리, 날짜 없으면 unknown/"""
+        with BundleArtifactStore(tmp_path, shard="date") as store:
+            store.write_document("a", self._dated("a", "2026-02-02"))
+            store.write_document("b", self._dated("b", None))
+
+        assert (tmp_path / "2026" / "02" / "02" / "a_bundle.json").exists()
+        assert (tmp_path / "unknown" / "b_bundle.json").exists()
+
+        # 날짜를 모르면 탐색
+        assert find_document_dir(tmp_path, "a", shard="date", layout="bundle") == tmp_path / "2026" / "02" / "02"
+        assert find_document_dir(tmp_path, "b", shard="date", layout="bundle") == tmp_path / "unknown"
+        assert find_document_dir(tmp_path, "a", shard="date", date="2026-02-02", layout="bundle") is not None
+
+    def test_jsonl_rejects_shard(self, tmp_path):
+        with pytest.raises(ValueError):
+            create_artifact_store("jsonl", tmp_path, shard="hash")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
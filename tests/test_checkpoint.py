@@ -0,0 +1,243 @@
+"""
+checkpoint.py 모듈 단위 테스트
+- CheckpointJournal: commit 전 기록은 저널에 없음, 재개 시 완료 목록 / 마지막 커밋 위치, 잘린 마지막 줄 무시
+- truncate_results: 커밋 위치로 자르기, 결과 파일이 더 짧으면 재개 불가
+- main: 실행 도중 프로세스가 죽은 뒤 --resume → summary.csv / SQLite가 한 번에 끝낸 실행과 같음 (중복 행 없음)
+"""
+import json
+import multiprocessing
+import os
+import sqlite3
+
+import pytest
+
+from src import main as pipeline_main
+from src.artifacts import create_artifact_store
+from src.checkpoint import CheckpointEntry, CheckpointJournal, read_journal, truncate_results
+from src.error_handler import OutputError
+from src.file_writer import BackgroundFileWriter, WriteFailedError
+from src.output_formatters import FileNamingConvention, SummaryCSVWriter, format_csv_row
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "checkpoint.jsonl"
+
+
+# 저널 테스트
+class TestCheckpointJournal:
+
+    def test_commit(self, journal_path):
+        journal = CheckpointJournal(journal_path)
+        journal.record("a.json", "SUCCESS", True, 120)
+        journal.record("b.json", "FAILED", None, 120)
+        assert journal.pending == 2
+        assert read_journal(journal_path)[0] == []  # commit 전에는 저널에 없음
+
+        assert journal.commit() == 2
+        assert journal.csv_offset == 120
+        assert read_journal(journal_path)[0] == [
+            CheckpointEntry("a.json", "SUCCESS", True, 120),
+            CheckpointEntry("b.json", "FAILED", False, 120),
+        ]
+        journal.close()
+
+    def test_resume(self, journal_path):
+        with CheckpointJournal(journal_path) as journal:
+            journal.record("a.json", "SUCCESS", True, 100)
+            journal.commit()
+            journal.record("b.json", "SUCCESS", False, 180)
+
+        journal = CheckpointJournal(journal_path, resume=True)
+        assert list(journal.completed) == ["a.json", "b.json"]
+        assert journal.resumed == 2
+        assert journal.csv_offset == 180
+        journal.record("c.json", "TIMEOUT", False, 180)
+        journal.close()
+        assert [e.source for e in read_journal(journal_path)[0]] == ["a.json", "b.json", "c.json"]
+
+    def test_partial_last_line_dropped(self, journal_path):
+        with CheckpointJournal(journal_path) as journal:
+            journal.record("a.json", "SUCCESS", True, 100)
+        with journal_path.open("ab") as f:
+            f.write(b'{"source": "b.json", "sta')
+
+        with CheckpointJournal(journal_path, resume=True) as journal:
+            assert list(journal.completed) == ["a.json"]
+            journal.record("b.json", "SUCCESS", True, 150)
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["source"] for line in lines] == ["a.json", "b.json"]
+
+    def test_new_run_clears_journal(self, journal_path):
+        with CheckpointJournal(journal_path) as journal:
+            journal.record("a.json", "SUCCESS", True, 100)
+        with CheckpointJournal(journal_path) as journal:
+            assert journal.completed == {}
+        assert journal_path.read_bytes() == b""
+
+    def test_commit_stops_at_failed(self, journal_path):
+        """기록 실패 문서부터는 저널에 넣지 않음 (커밋 위치가 실패 문서 앞)"""
+        with CheckpointJournal(journal_path) as journal:
+            for name, offset in [("a.json", 100), ("b.json", 150), ("c.json", 200)]:
+                journal.record(name, "SUCCESS", True, offset)
+            assert journal.commit(failed={"b.json"}) == 1
+            assert journal.csv_offset == 100
+            assert journal.pending == 0
+        assert [e.source for e in read_journal(journal_path)[0]] == ["a.json"]
+
+    def test_resume_without_journal(self, journal_path):
+        with CheckpointJournal(journal_path, resume=True) as journal:
+            assert journal.resumed == 0 and journal.csv_offset == 0
+
+
+# 결과 파일 자르기 테스트
+class TestTruncateResults:
+
+    def test_truncate(self, tmp_path):
+        path = tmp_path / "summary.csv"
+        path.write_bytes(b"header\nrow1\nrow2\nro")
+        assert truncate_results(path, 12) == 7
+        assert path.read_bytes() == b"header\nrow1\n"
+        assert truncate_results(tmp_path / "missing.csv", 0) == 0
+
+    def test_shorter_than_checkpoint(self, tmp_path):
+        path = tmp_path / "summary.csv"
+        path.write_bytes(b"header\n")
+        with pytest.raises(OutputError):
+            truncate_results(path, 100)
+
+
+# 배치 모드 연동 테스트
+class TestBatchResume:
+
+    N_DOCS = 8
+    CRASH_AT = "doc_06.json"
+
+    @pytest.fixture
+    def raw(self, tmp_path):
+        directory = tmp_path / "raw"
+        directory.mkdir()
+        for i in range(1, self.N_DOCS + 1):
+            sample = pipeline_main.RAW_DIR / f"sample_{(i - 1) % 4 + 1:02d}.json"
+            (directory / f"doc_{i:02d}.json").write_bytes(sample.read_bytes())
+        return directory
+
+    def _use(self, monkeypatch, out):
+        monkeypatch.setattr(pipeline_main, "PROCESSED_DIR", out / "processed")
+        monkeypatch.setattr(pipeline_main, "LOG_DIR", out / "logs")
+        for name in ["logger", "error_handler", "artifact_store", "log_documents", "watchdog", "quarantine"]:
+            monkeypatch.setattr(pipeline_main, name, getattr(pipeline_main, name))
+
+    def _crash_run(self, monkeypatch, argv):
+        # 자식 프로세스에서 CRASH_AT 문서 처리 중 정리 없이 종료 (버퍼에 남은 결과는 사라짐)
+        run_full_pipeline = pipeline_main.run_full_pipeline
+
+        def crashing_pipeline(input_path, with_evidence=True):
+            if input_path.endswith(self.CRASH_AT):
+                os._exit(9)
+            return run_full_pipeline(input_path, with_evidence=with_evidence)
+
+        with monkeypatch.context() as m:
+            m.setattr(pipeline_main, "run_full_pipeline", crashing_pipeline)
+            process = multiprocessing.get_context("fork").Process(target=pipeline_main.main, args=(argv,))
+            process.start()
+            process.join()
+        assert process.exitcode == 9
+
+    def test_resume_after_crash(self, tmp_path, raw, monkeypatch, capsys):
+        argv = ["--input-dir", str(raw), "--checkpoint-every", "2", "--csv-flush-every", "1"]
+
+        self._use(monkeypatch, tmp_path / "clean")
+        pipeline_main.main(argv + ["--sqlite", str(tmp_path / "clean.sqlite")])
+
+        self._use(monkeypatch, tmp_path / "resumed")
+        db_path = tmp_path / "resumed.sqlite"
+        self._crash_run(monkeypatch, argv + ["--sqlite", str(db_path)])
+        processed = tmp_path / "resumed" / "processed"
+        journal = read_journal(processed / "checkpoint.jsonl")[0]
+        assert [e.source for e in journal] == [f"doc_{i:02d}.json" for i in range(1, 5)]
+        # 마지막 커밋(doc_04) 이후에 기록된 doc_05 행은 summary.csv에 남아 있음
+        assert (processed / "summary.csv").stat().st_size > journal[-1].csv_offset
+
+        capsys.readouterr()
+        pipeline_main.main(argv + ["--sqlite", str(db_path), "--resume"])
+        out = capsys.readouterr().out
+        assert "전체:        8개" in out
+        assert "이전 실행:   4개" in out
+        assert "doc_04.json" not in out  # 완료 문서는 다시 처리하지 않음
+
+        clean = tmp_path / "clean" / "processed"
+        assert (processed / "summary.csv").read_bytes() == (clean / "summary.csv").read_bytes()
+        assert (processed / "checkpoint.jsonl").read_bytes() == (clean / "checkpoint.jsonl").read_bytes()
+        with sqlite3.connect(str(db_path)) as conn:
+            sources = [row[0] for row in conn.execute("SELECT source FROM parsed_results ORDER BY source")]
+        assert sources == [f"doc_{i:02d}.json" for i in range(1, self.N_DOCS + 1)]
+        assert (processed / "doc_06_parsed.json").exists()
+
+    def test_commit_checkpoint_flushes_results_first(self, tmp_path, monkeypatch):
+        """main() 밖에서도 호출 가능: 저널 커밋 시점에 summary.csv / 문서 산출물이 디스크에 있음"""
+        monkeypatch.setattr(pipeline_main, "artifact_store", None)
+        store = create_artifact_store(
+            FileNamingConvention.LAYOUT_FILES, tmp_path / "out",
+            writer=BackgroundFileWriter(threads=1), verbosity=FileNamingConvention.VERBOSITY_MINIMAL,
+        )
+        csv_writer = SummaryCSVWriter(tmp_path / "summary.csv", flush_every=100)
+        journal = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+        parsed = {
+            "source": "a.json", "date": "2026-02-02", "time": "09:12", "vehicle_no": "8713",
+            "gross_weight_kg": 12480, "tare_weight_kg": 7470, "net_weight_kg": 5010,
+            "is_valid": True, "validation_errors": [], "parse_warnings": [], "imputation_notes": [],
+        }
+        try:
+            store.write_document("a", {"parsed": parsed})
+            csv_writer.write_row(format_csv_row("a.json", parsed))
+            journal.record("a.json", "SUCCESS", True, csv_writer.offset)
+
+            pipeline_main.commit_checkpoint(journal, csv_writer, None, store)
+
+            assert read_journal(journal.path)[0][0].source == "a.json"
+            assert (tmp_path / "summary.csv").stat().st_size == csv_writer.offset
+            assert (tmp_path / "out" / "a_parsed.json").exists()
+        finally:
+            store.close()
+            csv_writer.close()
+            journal.close()
+
+    def test_commit_checkpoint_leaves_failed_document_out(self, tmp_path, monkeypatch):
+        """산출물 기록에 실패한 문서는 저널에 넣지 않고 예외 전달 (--resume 시 다시 처리)"""
+        monkeypatch.setattr(pipeline_main, "artifact_store", None)
+        (tmp_path / "out").mkdir()
+        (tmp_path / "out" / "b_parsed.json").mkdir()  # 디렉토리라 교체 실패
+        store = create_artifact_store(
+            FileNamingConvention.LAYOUT_FILES, tmp_path / "out",
+            writer=BackgroundFileWriter(threads=1), verbosity=FileNamingConvention.VERBOSITY_MINIMAL,
+        )
+        csv_writer = SummaryCSVWriter(tmp_path / "summary.csv")
+        journal = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+        try:
+            for stem in ["a", "b", "c"]:
+                store.write_document(stem, {"parsed": {"source": f"{stem}.json"}})
+                journal.record(f"{stem}.json", "SUCCESS", True, csv_writer.offset)
+
+            with pytest.raises(WriteFailedError) as info:
+                pipeline_main.commit_checkpoint(journal, csv_writer, None, store)
+
+            assert info.value.keys == {"b"}
+            assert [e.source for e in read_journal(journal.path)[0]] == ["a.json"]
+        finally:
+            store.close()
+            csv_writer.close()
+            journal.close()
+
+    @pytest.mark.parametrize("argv", [
+        ["--stdin", "--stdout", "--resume"],
+        ["--resume", "--columnar"],
+        ["--checkpoint-every", "0"],
+    ])
+    def test_invalid_args(self, argv):
+        with pytest.raises(SystemExit):
+            pipeline_main.parse_args(argv)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""
+columnar.py 모듈 단위 테스트
+- ColumnarExporter: Parquet / npz 기록 (row group 단위)
+- load_columnar: 타입 보존 로드
+"""
+from pathlib import Path
+
+import pytest
+
+from src.columnar import ColumnarExporter, error_code, load_columnar, BACKEND_NPZ, BACKEND_PARQUET
+
+pd = pytest.importorskip("pandas")
+
+
+def _parsed(i: int) -> dict:
+    return {
+        "source": f"doc_{i}.json",
+        "date": None if i == 1 else "2026-02-02",
+        "time": "09:12",
+        "vehicle_no": "80구8713",
+        "gross_weight_kg": None if i == 1 else 12480 + i,
+        "tare_weight_kg": 7470,
+        "net_weight_kg": 5010,
+        "parse_warnings": ["unassigned_weight_candidates_present", f"ambiguous_candidate:field_{i}"] if i % 2 else [],
+        "validation_errors": ["weight_mismatch:net(1) != gross(2) - tare(3)"] if i == 1 else [],
+        "imputation_notes": [],
+        "is_valid": i != 1,
+    }
+
+
+def _export(path: Path, backend: str, n: int = 5) -> None:
+    with ColumnarExporter(path, row_group_size=2, backend=backend) as exporter:
+        for i in range(n):
+            exporter.write(f"doc_{i}.json", _parsed(i))
+    assert exporter.rows_written == n
+    assert exporter.row_groups == 3
+
+
+def _check_frame(df) -> None:
+    assert list(df["filename"]) == [f"doc_{i}.json" for i in range(5)]
+    assert str(df["gross_weight_kg"].dtype) == "Int64"
+    assert df["gross_weight_kg"].isna().tolist() == [False, True, False, False, False]
+    assert df["gross_weight_kg"][0] == 12480
+    assert df["date"].dtype.kind == "M"
+    assert pd.isna(df["date"][1])
+    assert df["is_valid"].tolist() == [True, False, True, True, True]
+    assert list(df["validation_error_codes"][1]) == ["weight_mismatch"]
+    assert list(df["parse_warnings"][3]) == ["unassigned_weight_candidates_present", "ambiguous_candidate"]
+    assert list(df["parse_warnings"][0]) == []
+
+
+# 백엔드별 기록/로드 테스트
+class TestColumnarExporter:
+
+    def test_npz_round_trip(self, tmp_path):
+        """npz: row group 3개 기록 후 타입 보존 로드"""
+        pytest.importorskip("numpy")
+        path = tmp_path / "summary.npz"
+        _export(path, BACKEND_NPZ)
+        _check_frame(load_columnar(path))
+
+    def test_parquet_round_trip(self, tmp_path):
+        """Parquet: row group 3개 기록 후 타입 보존 로드"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "summary.parquet"
+        _export(path, BACKEND_PARQUET)
+        _check_frame(load_columnar(path))
+
+    def test_npz_empty(self, tmp_path):
+        """행이 없어도 로드 가능한 빈 파일"""
+        pytest.importorskip("numpy")
+        path = tmp_path / "summary.npz"
+        ColumnarExporter(path, backend=BACKEND_NPZ).close()
+        assert len(load_columnar(path)) == 0
+
+
+# 오류 코드 추출 테스트
+class TestErrorCode:
+
+    def test_error_code(self):
+        """':' 앞부분만 코드로 사용"""
+        assert error_code("missing_required_field:date") == "missing_required_field"
+        assert error_code("no_colon") == "no_colon"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
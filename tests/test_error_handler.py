@@ -0,0 +1,161 @@
+"""
+error_handler.py 모듈 단위 테스트
+- 시그니처(예외 타입 + 가장 안쪽 프레임)별 집계, 첫 / 마지막 예시
+- 소스 표본 크기 제한 (reservoir sampling), 그룹 수 상한
+- 스냅샷 병합, 리포트 기록
+- 스트리밍 병렬 모드에서 워커 집계 병합
+"""
+import io
+import json
+
+from src.error_handler import OVERFLOW_SIGNATURE, ErrorHandler, error_signature
+from src.streaming import run_stream
+
+
+def _fail_a(value):
+    raise ValueError(f"bad value {value}")
+
+
+def _fail_b():
+    return {}["missing"]
+
+
+def _record(handler, func, *args, source=None, recoverable=False):
+    try:
+        func(*args)
+    except Exception as e:
+        handler.handle_error(e, context="test", source=source, recoverable=recoverable)
+
+
+# 집계 테스트
+class TestGrouping:
+
+    def test_signature(self):
+        """예외 타입과 가장 안쪽 프레임"""
+        try:
+            _fail_a(1)
+        except ValueError as e:
+            error_type, frame = error_signature(e)
+        assert error_type == "ValueError"
+        assert frame.startswith("test_error_handler.py:") and frame.endswith(" _fail_a")
+
+    def test_same_signature_grouped(self):
+        """같은 위치의 같은 예외는 한 그룹, 트레이스는 첫 예시만"""
+        handler = ErrorHandler()
+        for i in range(100):
+            _record(handler, _fail_a, i, source=f"doc_{i}")
+        _record(handler, _fail_b, source="doc_b")
+
+        assert len(handler.groups) == 2
+        group = handler.groups[("ValueError", next(f for t, f in handler.groups if t == "ValueError"))]
+        assert group.count == 100
+        assert group.first.error_message == "bad value 0"
+        assert "Traceback" in group.first.traceback_str
+        assert group.last.error_message == "bad value 99"
+        assert group.last.traceback_str is None
+
+    def test_summary(self):
+        """복구 가능 / 치명적 / 유형별 건수"""
+        handler = ErrorHandler()
+        _record(handler, _fail_a, 1, recoverable=True)
+        _record(handler, _fail_a, 2)
+        _record(handler, _fail_b)
+
+        summary = handler.get_error_summary()
+        assert summary["total"] == 3
+        assert summary["recoverable"] == 1
+        assert summary["critical"] == 2
+        assert summary["by_type"] == {"ValueError": 2, "KeyError": 1}
+        assert handler.has_critical_errors()
+
+    def test_reservoir_bounded(self):
+        """소스 표본은 sample_size를 넘지 않고, 본 건수는 모두 셈"""
+        handler = ErrorHandler(sample_size=5, seed=1)
+        for i in range(1000):
+            _record(handler, _fail_a, i, source=f"doc_{i}")
+
+        group = next(iter(handler.groups.values()))
+        assert len(group.sources) == 5
+        assert group.sources_seen == 1000
+        # 앞쪽 5개에 고정되지 않음
+        assert group.sources != [f"doc_{i}" for i in range(5)]
+
+    def test_max_groups(self):
+        """그룹 수 상한 초과분은 기타 그룹으로"""
+        handler = ErrorHandler(max_groups=1)
+        _record(handler, _fail_a, 1)
+        _record(handler, _fail_b)
+        _record(handler, _fail_b)
+
+        assert len(handler.groups) == 2
+        assert handler.groups[OVERFLOW_SIGNATURE].count == 2
+
+
+# 병합 / 리포트 테스트
+class TestMergeAndReport:
+
+    def test_merge(self):
+        """건수 합산, 첫 예시 유지, 표본 크기 제한"""
+        parent = ErrorHandler(sample_size=4, seed=0)
+        worker = ErrorHandler(sample_size=4, seed=0)
+        for i in range(10):
+            _record(parent, _fail_a, i, source=f"p{i}")
+            _record(worker, _fail_a, 100 + i, source=f"w{i}")
+        _record(worker, _fail_b, source="wb")
+
+        data = worker.snapshot()
+        assert worker.groups == {}
+        json.dumps(data)  # 프로세스 간 전달 가능한 형태
+        parent.merge(data)
+
+        summary = parent.get_error_summary()
+        assert summary["total"] == 21
+        assert summary["groups"] == 2
+        group = next(g for g in parent.groups.values() if g.error_type == "ValueError")
+        assert group.first.error_message == "bad value 0"
+        assert group.last.error_message == "bad value 109"
+        assert len(group.sources) == 4
+        assert group.sources_seen == 20
+
+    def test_report_streamed_to_file(self, tmp_path):
+        """그룹 단위 리포트 (건수 내림차순)"""
+        handler = ErrorHandler()
+        _record(handler, _fail_b, source="b")
+        for i in range(3):
+            _record(handler, _fail_a, i, source=f"a{i}")
+
+        path = tmp_path / "logs" / "error_report.txt"
+        handler.write_error_report(path)
+        text = path.read_text(encoding="utf-8")
+
+        assert "총 에러: 4개 (그룹 2개)" in text
+        assert text.index("[1] ValueError") < text.index("[2] KeyError")
+        assert "소스 표본 (3/3): a0, a1, a2" in text
+        assert text == handler.generate_error_report()
+
+    def test_empty_report(self):
+        assert ErrorHandler().generate_error_report() == "에러 없음"
+
+
+# 스트리밍 병렬 모드 테스트
+class TestStreamErrors:
+
+    def test_workers_merged(self, sample_raw_ocr_text):
+        """워커에서 난 줄 처리 실패가 부모 수집기에 합산됨"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        lines = "\n".join([line, "broken", line, "also broken", "[1]", line]) + "\n"
+        handler = ErrorHandler()
+
+        stats = run_stream(io.StringIO(lines), io.StringIO(), workers=2, chunk_size=2, error_handler=handler)
+
+        assert stats["failed"] == 3
+        summary = handler.get_error_summary()
+        assert summary["by_type"] == {"JSONDecodeError": 2, "ValueError": 1}
+        sources = [s for g in handler.groups.values() for s in g.sources]
+        assert sorted(sources) == ["stdin:2", "stdin:4", "stdin:5"]
+
+    def test_serial(self):
+        """직렬 모드는 호출자 수집기에 바로 기록"""
+        handler = ErrorHandler()
+        run_stream(io.StringIO("broken\n"), io.StringIO(), error_handler=handler)
+        assert handler.total == 1
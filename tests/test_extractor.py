@@ -0,0 +1,79 @@
+"""
+extractor.py / resolver.py 근거 생성 여부 테스트
+- with_metadata / with_evidence를 꺼도 선택 결과와 최종 파싱 결과는 동일
+- 추출 근거의 raw_match / normalized_match / source_line_index
+"""
+from dataclasses import asdict
+
+import pytest
+
+from src.extractor import _add_candidate, extract_candidates
+from src.pipeline import normalize_resolved_fields
+from src.preprocessor import preprocess
+from src.resolver import resolve_candidates
+
+
+@pytest.fixture
+def preprocessed(sample_preprocessed_text):
+    return preprocess(sample_preprocessed_text)
+
+
+# 추출 근거 생성 여부 테스트
+class TestExtractionMetadata:
+
+    def test_metadata_attached_by_default(self, preprocessed):
+        """기본: 모든 후보에 extraction_metadata"""
+        extracted = extract_candidates(preprocessed)
+        assert extracted.candidates
+        for c in extracted.candidates:
+            meta = c.meta["extraction_metadata"]
+            assert meta["source_line_index"] == c.meta["line_index"]
+            assert meta["strategy_used"] == ("label_match" if c.method == "label" else "pattern_fallback")
+
+    def test_metadata_skipped(self, preprocessed):
+        """with_metadata=False: 근거 없이 같은 후보"""
+        full = extract_candidates(preprocessed)
+        lean = extract_candidates(preprocessed, with_metadata=False)
+
+        assert all("extraction_metadata" not in c.meta for c in lean.candidates)
+        assert [(c.field, c.value_raw, c.method, c.score) for c in lean.candidates] == \
+            [(c.field, c.value_raw, c.method, c.score) for c in full.candidates]
+        assert lean.warnings == full.warnings
+
+    @pytest.mark.parametrize("confidence", [None, 0.95])
+    def test_raw_and_normalized_match(self, confidence):
+        """raw_match는 넘겨받은 값 그대로, normalized_match는 공백 정리 값 (confidence 지정 여부와 무관)"""
+        out = []
+        _add_candidate(out, "vehicle_no", " 80구8713 ", "차량번호: 80구8713", "label", 10,
+                       meta={"line_index": 0}, confidence=confidence)
+        meta = out[0].meta["extraction_metadata"]
+        assert out[0].value_raw == "80구8713"
+        assert (meta["raw_match"], meta["normalized_match"]) == (" 80구8713 ", "80구8713")
+        assert meta["source_line_index"] == 0
+
+    def test_missing_line_index(self):
+        """meta에 line_index가 없으면 source_line_index = -1"""
+        out = []
+        _add_candidate(out, "date", "2026-02-02", "2026-02-02", "pattern", 1)
+        assert out[0].meta["extraction_metadata"]["source_line_index"] == -1
+
+
+# 선택 근거 생성 여부 테스트
+class TestResolverEvidence:
+
+    def test_same_result_without_evidence(self, preprocessed):
+        """with_evidence=False: 선택 값/경고/최종 결과 동일, 근거는 중량 후보 값만"""
+        candidates = extract_candidates(preprocessed).candidates
+        full = resolve_candidates(candidates)
+        lean = resolve_candidates(extract_candidates(preprocessed, with_metadata=False).candidates, with_evidence=False)
+
+        assert lean.date_raw == full.date_raw
+        assert lean.net_weight_raw == full.net_weight_raw
+        assert lean.warnings == full.warnings
+        assert "date" in full.evidence and "date" not in lean.evidence
+
+        full_result = asdict(normalize_resolved_fields(full))
+        lean_result = asdict(normalize_resolved_fields(lean))
+        full_result.pop("evidence")
+        lean_result.pop("evidence")
+        assert lean_result == full_result
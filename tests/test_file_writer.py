@@ -0,0 +1,151 @@
+"""
+file_writer.py 모듈 단위 테스트
+- 원자적 교체 / 디렉토리 캐시
+- fsync 정책별 기록
+- 기록 스레드 예외 전달, 통계
+"""
+import threading
+
+import pytest
+
+from src import file_writer
+from src.error_handler import OutputError
+from src.file_writer import (
+    BackgroundFileWriter,
+    FSYNC_BATCH,
+    FSYNC_FILE,
+    FSYNC_NEVER,
+    WriteFailedError,
+    atomic_write,
+)
+
+
+def _files(directory):
+    return sorted(p.name for p in directory.rglob("*") if p.is_file())
+
+
+# 기록 결과 테스트
+class TestBackgroundFileWriter:
+
+    @pytest.mark.parametrize("threads", [0, 1, 4])
+    @pytest.mark.parametrize("fsync", [FSYNC_NEVER, FSYNC_BATCH, FSYNC_FILE])
+    def test_writes_all_files(self, tmp_path, threads, fsync):
+        """스레드 수 / fsync 정책과 무관하게 모든 파일 기록, 임시 파일 없음"""
+        with BackgroundFileWriter(threads=threads, fsync=fsync, fsync_batch=3) as writer:
+            for i in range(10):
+                writer.submit(tmp_path / f"d{i % 2}" / f"doc_{i}.json", f'{{"i": {i}}}')
+
+        assert _files(tmp_path) == sorted(f"doc_{i}.json" for i in range(10))
+        assert (tmp_path / "d1" / "doc_3.json").read_text(encoding="utf-8") == '{"i": 3}'
+
+    def test_same_path_keeps_last(self, tmp_path):
+        """같은 경로는 요청 순서대로 기록 (마지막 내용이 남음)"""
+        path = tmp_path / "doc.txt"
+        with BackgroundFileWriter(threads=4) as writer:
+            for i in range(50):
+                writer.submit(path, str(i))
+
+        assert path.read_text(encoding="utf-8") == "49"
+
+    def test_batch_defers_until_flush(self, tmp_path):
+        """batch: 묶음이 차거나 flush 전에는 최종 경로에 보이지 않음"""
+        writer = BackgroundFileWriter(threads=0, fsync=FSYNC_BATCH, fsync_batch=10)
+        writer.submit(tmp_path / "a.txt", "a")
+        assert not (tmp_path / "a.txt").exists()
+
+        writer.flush()
+        assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "a"
+        writer.close()
+
+    @pytest.mark.parametrize("threads", [0, 1])
+    def test_batch_failure_keeps_rest(self, tmp_path, threads):
+        """batch: 한 파일 교체가 실패해도 같은 묶음의 나머지는 기록, 실패한 파일만 보고"""
+        (tmp_path / "doc_2.json").mkdir()  # 디렉토리라 교체 실패
+        writer = BackgroundFileWriter(threads=threads, fsync=FSYNC_BATCH, fsync_batch=5)
+        for i in range(5):
+            writer.submit(tmp_path / f"doc_{i}.json", str(i), key=f"doc_{i}")
+        with pytest.raises(WriteFailedError) as info:
+            writer.flush()
+        writer.close()
+
+        assert [(key, path) for key, path, _ in info.value.failures] == [("doc_2", tmp_path / "doc_2.json")]
+        assert _files(tmp_path) == ["doc_0.json", "doc_1.json", "doc_3.json", "doc_4.json"]  # 임시 파일 없음
+
+    def test_worker_error_raised_on_close(self, tmp_path):
+        """기록 스레드 예외는 close()에서 OutputError로 전달"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("file", encoding="utf-8")
+
+        writer = BackgroundFileWriter(threads=1)
+        writer.submit(blocker / "doc.txt", "x")  # 부모가 파일이라 mkdir 실패
+        with pytest.raises(OutputError):
+            writer.close()
+        assert writer.stats()["errors"] == 1
+
+    @pytest.mark.parametrize("threads", [0, 2])
+    def test_failure_reported_with_key_on_flush(self, tmp_path, threads):
+        """실패는 다른 key의 submit()이 아니라 flush()에서, 실패한 경로 / key와 함께 전달"""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("file", encoding="utf-8")
+
+        writer = BackgroundFileWriter(threads=threads)
+        writer.submit(blocker / "a.txt", "x", key="a")
+        writer.submit(tmp_path / "b.txt", "x", key="b")
+        with pytest.raises(WriteFailedError) as info:
+            writer.flush()
+        assert info.value.keys == {"a"}
+        assert [path for _, path, _ in info.value.failures] == [blocker / "a.txt"]
+        assert (tmp_path / "b.txt").exists()
+        writer.close()
+
+    def test_errors_from_many_workers(self, tmp_path, monkeypatch):
+        """여러 기록 스레드가 동시에 실패해도 오류 수는 모두 집계, 예외는 한 번만 전달"""
+        gate = threading.Event()
+
+        def failing_write_tmp(path, data, fsync):
+            gate.wait()  # 모든 요청이 큐에 들어간 뒤 한꺼번에 실패
+            raise OSError("disk full")
+
+        monkeypatch.setattr(file_writer, "_write_tmp", failing_write_tmp)
+        writer = BackgroundFileWriter(threads=4, queue_size=100)
+        for i in range(20):
+            writer.submit(tmp_path / f"{i}.txt", "x")
+        gate.set()
+        with pytest.raises(WriteFailedError) as info:
+            writer.close()
+        assert len(info.value.failures) == 20
+        assert writer.stats()["errors"] == 20
+        writer.close()  # 이미 전달한 예외는 다시 나지 않음
+
+    def test_submit_after_close(self, tmp_path):
+        writer = BackgroundFileWriter(threads=1)
+        writer.close()
+        with pytest.raises(OutputError):
+            writer.submit(tmp_path / "a.txt", "a")
+
+    def test_invalid_fsync_policy(self):
+        with pytest.raises(ValueError):
+            BackgroundFileWriter(fsync="always")
+
+    def test_stats(self, tmp_path):
+        """파일 수 / 바이트 수 / 큐 대기 시간 집계"""
+        with BackgroundFileWriter(threads=2) as writer:
+            for i in range(5):
+                writer.submit(tmp_path / f"{i}.txt", "가나")  # UTF-8 6바이트
+
+        stats = writer.stats()
+        assert stats["files"] == 5
+        assert stats["bytes"] == 30
+        assert stats["queue_latency_max_ms"] >= stats["queue_latency_avg_ms"] >= 0
+
+
+# 단발성 원자적 기록 테스트
+class TestAtomicWrite:
+
+    def test_replaces_existing(self, tmp_path):
+        path = tmp_path / "sub" / "a.json"
+        atomic_write(path, "old")
+        atomic_write(path, "new", fsync=True)
+
+        assert path.read_text(encoding="utf-8") == "new"
+        assert _files(tmp_path) == ["a.json"]
@@ -0,0 +1,190 @@
+"""
+logger.py 모듈 단위 테스트
+- 큐 로깅: 리스너 스레드 출력, stop_logger()로 남은 레코드 비움
+- 크기 기준 로그 교체
+- JSON lines 파일 로그, 문서 레코드
+- 로거 레벨 (핸들러가 받지 않는 레벨은 로거에서 거름)
+- 스트리밍 병렬 모드 워커 로그 전달
+"""
+import io
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+import pytest
+
+from src.logger import JSONLineFormatter, setup_logger, setup_worker_logger, stop_logger, worker_log_queue
+from src.streaming import run_stream
+
+NAME = "ocr_pipeline_test"
+
+
+@pytest.fixture(autouse=True)
+def _cleanup():
+    """테스트 간 로거 / 리스너 정리"""
+    yield
+    stop_logger(NAME)
+    stop_logger()
+    logging.getLogger(NAME).handlers.clear()
+
+
+# 큐 로깅 테스트
+class TestQueuedLogger:
+
+    def test_records_flushed_on_stop(self, tmp_path):
+        """stop_logger() 후 모든 레코드가 파일에 기록됨"""
+        logger = setup_logger(NAME, log_dir=tmp_path, console_stream=io.StringIO(), queued=True)
+        for i in range(200):
+            logger.debug(f"line {i}")
+        stop_logger(NAME)
+
+        text = next(tmp_path.glob("pipeline_*.log")).read_text(encoding="utf-8")
+        assert "line 0" in text and "line 199" in text
+        assert logger.handlers == []
+
+    def test_output_in_listener_thread(self):
+        """콘솔 출력은 호출 스레드가 아닌 리스너 스레드에서"""
+        threads = []
+
+        class _Stream(io.StringIO):
+            def write(self, s):
+                threads.append(threading.get_ident())
+                return super().write(s)
+
+        logger = setup_logger(NAME, console_stream=_Stream(), queued=True)
+        logger.info("x")
+        stop_logger(NAME)
+
+        assert threads and threading.get_ident() not in threads
+
+    def test_console_levels_respected(self):
+        """콘솔 핸들러 레벨은 리스너에서도 적용"""
+        stream = io.StringIO()
+        logger = setup_logger(NAME, console_stream=stream, console_level=logging.WARNING,
+                              enable_color=False, queued=True)
+        logger.info("hidden")
+        logger.warning("shown")
+        stop_logger(NAME)
+
+        assert "shown" in stream.getvalue()
+        assert "hidden" not in stream.getvalue()
+
+
+# 파일 / 레벨 테스트
+class TestFileHandler:
+
+    def test_rotation(self, tmp_path):
+        """max_bytes 초과 시 pipeline.log.N으로 교체, backup_count까지만 보관"""
+        logger = setup_logger(NAME, log_dir=tmp_path, console_stream=io.StringIO(),
+                              max_bytes=500, backup_count=2)
+        for i in range(100):
+            logger.debug(f"rotation line {i:04d}")
+        for handler in logger.handlers:
+            handler.close()
+
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == ["pipeline.log", "pipeline.log.1", "pipeline.log.2"]
+
+    def test_no_color_codes_in_file(self, tmp_path):
+        """콘솔 색상 코드가 파일 로그에 섞이지 않음"""
+        logger = setup_logger(NAME, log_dir=tmp_path, console_stream=io.StringIO(), enable_color=True)
+        logger.info("plain")
+        for handler in logger.handlers:
+            handler.close()
+
+        text = next(tmp_path.glob("pipeline_*.log")).read_text(encoding="utf-8")
+        assert "\033[" not in text
+
+    def test_logger_level_is_lowest_handler_level(self):
+        """파일 핸들러가 없으면 콘솔 레벨 미만은 로거에서 거름"""
+        logger = setup_logger(NAME, console_stream=io.StringIO(), console_level=logging.WARNING)
+        assert not logger.isEnabledFor(logging.INFO)
+
+
+# JSON lines 로그 테스트
+class TestJSONLines:
+
+    def test_document_record(self, tmp_path):
+        """문서 레코드는 파일에 필드 그대로, 콘솔에는 출력하지 않음"""
+        console = io.StringIO()
+        logger = setup_logger(NAME, log_dir=tmp_path, console_stream=console, json_lines=True)
+        logger.info("일반 메시지")
+        logger.info("document a.json", extra={"document": {"source": "a.json", "stages_ms": {"load": 1.5}}})
+        for handler in logger.handlers:
+            handler.close()
+
+        path = next(tmp_path.glob("pipeline_*.jsonl"))
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert records[-2]["message"] == "일반 메시지"
+        assert records[-1]["event"] == "document"
+        assert records[-1]["stages_ms"] == {"load": 1.5}
+        assert "일반 메시지" in console.getvalue()
+        assert "a.json" not in console.getvalue()
+
+    def test_exception_field(self):
+        """예외 정보는 exc 필드로"""
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            record = logging.LogRecord(NAME, logging.ERROR, __file__, 1, "fail", None, sys.exc_info())
+        data = json.loads(JSONLineFormatter().format(record))
+        assert data["message"] == "fail"
+        assert "ValueError: bad" in data["exc"]
+
+    def test_rotation_name(self, tmp_path):
+        """교체 모드 파일명은 pipeline.jsonl"""
+        logger = setup_logger(NAME, log_dir=tmp_path, console_stream=io.StringIO(),
+                              json_lines=True, max_bytes=1000)
+        for handler in logger.handlers:
+            handler.close()
+        assert (tmp_path / "pipeline.jsonl").exists()
+
+
+# 워커 로그 전달 테스트
+class TestWorkerLogging:
+
+    def test_not_queued_returns_none(self):
+        """큐 로깅 모드가 아니면 워커 큐 없음"""
+        setup_logger(NAME, console_stream=io.StringIO())
+        assert worker_log_queue(NAME) is None
+
+    def test_worker_queue_forwarding(self, tmp_path):
+        """워커 큐로 보낸 레코드가 부모 핸들러로 출력됨 (같은 프로세스에서 흉내)"""
+        stream = io.StringIO()
+        setup_logger(NAME, console_stream=stream, enable_color=False, queued=True)
+        q = worker_log_queue(NAME)
+
+        worker_logger = logging.getLogger(NAME + ".worker")
+        worker_logger.propagate = False
+        worker_logger.addHandler(logging.handlers.QueueHandler(q))
+        worker_logger.warning("from worker")
+        stop_logger(NAME)
+        worker_logger.handlers.clear()
+
+        assert "from worker" in stream.getvalue()
+
+    def test_stream_with_workers(self, sample_raw_ocr_text):
+        """큐 로깅 모드에서 병렬 스트리밍 정상 동작"""
+        setup_logger(console_stream=io.StringIO(), queued=True)
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        out = io.StringIO()
+
+        stats = run_stream(io.StringIO("\n".join([line] * 4) + "\n"), out, workers=2, chunk_size=1)
+        stop_logger()
+
+        assert stats["total"] == 4
+        assert len(out.getvalue().splitlines()) == 4
+
+    def test_setup_worker_logger(self):
+        """워커 로거는 큐 핸들러 하나만"""
+        q = queue.SimpleQueue()
+        logger = setup_worker_logger(q, logging.INFO, name=NAME)
+        logger.debug("dropped")
+        logger.info("kept")
+
+        assert len(logger.handlers) == 1
+        assert q.get_nowait().getMessage() == "kept"
+        assert q.empty()
@@ -0,0 +1,168 @@
+"""
+memprofile.py 모듈 단위 테스트
+- 단계별 순할당 / 스냅샷 문서의 상위 할당 위치
+- 입력 크기 구간별 문서 집계
+- 스냅샷 병합, 파일 기록
+- 스트리밍 병렬 모드에서 워커 집계 병합
+"""
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from src.memprofile import (
+    MemoryProfiler,
+    memory_document,
+    size_bucket,
+    start_memprofile,
+    stop_memprofile,
+)
+from src.metrics import stage_timer
+from src.streaming import run_stream
+
+_kept = []
+
+
+def _allocate(n: int) -> None:
+    _kept.append(bytearray(n))
+
+
+@pytest.fixture(autouse=True)
+def _no_profiler():
+    """테스트 간 전역 프로파일러 / 추적 정리"""
+    yield
+    _kept.clear()
+    profiler = stop_memprofile()
+    if profiler is not None:
+        profiler.abandon()
+
+
+# 단계 / 문서 집계 테스트
+class TestMemoryProfiler:
+
+    def test_stage_net_allocation(self):
+        """단계 구간에서 남긴 메모리가 순할당으로 집계"""
+        profiler = MemoryProfiler(every=1)
+        profiler.start()
+        with profiler.document(1, 100):
+            with stage_timer("big"):
+                _allocate(200_000)
+            with stage_timer("small"):
+                _allocate(1_000)
+        profiler.stop()
+
+        assert profiler.stage_calls == {"big": 1, "small": 1}
+        assert profiler.stage_net["big"] >= 200_000
+        assert profiler.stage_net["small"] < 100_000
+        assert not tracemalloc.is_tracing()
+
+    def test_snapshot_sites(self):
+        """스냅샷 문서에서 할당 위치(파일:줄) 기록, 그 외 문서는 순할당만"""
+        profiler = MemoryProfiler(every=10)
+        profiler.start()
+        with profiler.document(2, 100):
+            with stage_timer("big"):
+                _allocate(100_000)
+        assert "big" not in profiler.stage_sites
+
+        with profiler.document(10, 100):
+            with stage_timer("big"):
+                _allocate(100_000)
+        profiler.stop()
+
+        sites = profiler.stage_sites["big"]
+        assert any("test_memprofile.py:" in site for site in sites)
+        assert profiler.run_sites
+
+    def test_size_buckets(self):
+        """입력 크기 구간별 문서 수 / 남은 메모리"""
+        profiler = MemoryProfiler()
+        profiler.start()
+        with profiler.document(1, 1_000):
+            _allocate(50_000)
+        with profiler.document(2, "가" * 10_000):  # utf-8 30000바이트
+            pass
+        profiler.stop()
+
+        assert profiler.documents == 2
+        assert profiler.buckets["<4KB"]["documents"] == 1
+        assert profiler.buckets["<4KB"]["retained"] >= 50_000
+        assert profiler.buckets["16-64KB"]["bytes"] == 30_000
+
+    def test_no_profiler_is_noop(self):
+        """프로파일러가 없으면 문서 구간은 아무것도 하지 않음"""
+        with memory_document(1, 10):
+            with stage_timer("x"):
+                pass
+        assert not tracemalloc.is_tracing()
+
+
+# 크기 구간 테스트
+class TestSizeBucket:
+
+    @pytest.mark.parametrize("size,expected", [
+        (0, "<4KB"),
+        (4 * 1024, "4-16KB"),
+        (100 * 1024, "64-256KB"),
+        (2048 * 1024, ">=1024KB"),
+    ])
+    def test_bucket_names(self, size, expected):
+        assert size_bucket(size) == expected
+
+
+# 병합 / 출력 테스트
+class TestMergeAndWrite:
+
+    def test_merge(self):
+        """순할당 / 문서 수는 합산, 피크는 최대값"""
+        worker = MemoryProfiler()
+        worker.start()
+        with worker.document(1, 100):
+            with stage_timer("big"):
+                _allocate(10_000)
+        data = worker.snapshot()
+        worker.abandon()
+        assert worker.documents == 0
+
+        parent = MemoryProfiler()
+        parent.merge(data)
+        parent.merge(data)
+
+        assert parent.documents == 2
+        assert parent.stage_calls["big"] == 2
+        assert parent.stage_net["big"] == 2 * data["stages"]["big"]["net_bytes"]
+        assert parent.buckets["<4KB"]["traced_peak_max"] == data["size_buckets"]["<4KB"]["traced_peak_max"]
+
+    def test_write(self, tmp_path):
+        """<prefix>.txt 보고서와 <prefix>.json"""
+        profiler = MemoryProfiler()
+        profiler.start()
+        with profiler.document(1, 100):
+            with stage_timer("load"):
+                _allocate(1_000)
+        profiler.stop()
+
+        written = profiler.write(tmp_path / "m")
+        assert [p.name for p in written] == ["m.txt", "m.json"]
+        assert "load" in (tmp_path / "m.txt").read_text(encoding="utf-8")
+        data = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+        assert set(data) == {"documents", "stages", "size_buckets", "run_top_sites"}
+
+
+# 스트리밍 병렬 모드 병합 테스트
+class TestStreamMemprofile:
+
+    def test_workers_merged(self, sample_raw_ocr_text):
+        """워커에서 처리한 문서 / 단계 호출이 부모에 합산됨"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        lines = "\n".join([line] * 6) + "\n"
+
+        profiler = start_memprofile(every=2)
+        run_stream(io.StringIO(lines), io.StringIO(), workers=2, chunk_size=2)
+        stop_memprofile()
+        profiler.stop()
+
+        assert profiler.documents == 6
+        assert profiler.stage_calls["serialize"] == 6
+        assert profiler.stage_calls["resolve"] == 6
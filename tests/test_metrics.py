@@ -0,0 +1,266 @@
+"""
+metrics.py 모듈 단위 테스트
+- LatencyHistogram: 고정 버킷 기록 / 병합 / 분위수
+- StageMetrics: 단계별 기록, 스냅샷 병합, JSON 덤프
+- 전역 수집기: 꺼져 있을 때 no-op, 파이프라인/스트리밍 계측, 실패 문서의 document 단계
+- 문서별 단계 소요 시간 합산 (--log-json)
+"""
+import io
+import json
+import threading
+
+import pytest
+
+from src import main as pipeline_main
+from src import streaming
+from src.artifacts import create_artifact_store
+from src.output_formatters import FileNamingConvention
+from src.metrics import (
+    BUCKET_BOUNDS_NS,
+    LatencyHistogram,
+    StageMetrics,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+    observe_stage,
+    stage_timer,
+    start_document_trace,
+    stop_document_trace,
+)
+from src.preprocessor import preprocess
+from src.streaming import run_stream
+
+
+@pytest.fixture
+def metrics():
+    """테스트 동안만 전역 계측 켜기"""
+    disable_metrics()
+    m = enable_metrics()
+    yield m
+    disable_metrics()
+
+
+# 히스토그램 테스트
+class TestLatencyHistogram:
+
+    def test_bucket_bounds_sorted(self):
+        """버킷 상한은 1us ~ 10s 오름차순"""
+        assert BUCKET_BOUNDS_NS[0] == 1_000
+        assert BUCKET_BOUNDS_NS[-1] == 10_000_000_000
+        assert BUCKET_BOUNDS_NS == sorted(BUCKET_BOUNDS_NS)
+
+    def test_observe(self):
+        """상한 포함 버킷에 기록, 상한 초과는 overflow 버킷"""
+        h = LatencyHistogram()
+        h.observe(1_000)
+        h.observe(1_500)
+        h.observe(20_000_000_000)
+
+        assert h.counts[0] == 1
+        assert h.counts[1] == 1
+        assert h.counts[-1] == 1
+        assert h.count == 3
+        assert h.min_ns == 1_000
+        assert h.max_ns == 20_000_000_000
+
+    def test_percentile_within_observed_range(self):
+        """분위수는 버킷 보간값이며 관측 최소/최대 범위 안"""
+        h = LatencyHistogram()
+        for ns in range(100_000, 200_001, 1_000):
+            h.observe(ns)
+
+        p50 = h.percentile(0.50)
+        p99 = h.percentile(0.99)
+        assert 100_000 <= p50 <= p99 <= 200_000
+
+    def test_percentile_empty(self):
+        """관측값이 없으면 None"""
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_merge_equals_combined(self):
+        """병합 결과 == 한 히스토그램에 모두 기록한 결과"""
+        a, b, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for ns in (3_000, 40_000, 900_000):
+            a.observe(ns)
+            combined.observe(ns)
+        for ns in (500, 7_000_000):
+            b.observe(ns)
+            combined.observe(ns)
+
+        a.merge(b)
+        assert a.to_dict() == combined.to_dict()
+
+    def test_dict_roundtrip(self):
+        """to_dict / from_dict 왕복"""
+        h = LatencyHistogram()
+        h.observe(12_345)
+        assert LatencyHistogram.from_dict(h.to_dict()).to_dict() == h.to_dict()
+
+
+# 단계별 수집기 테스트
+class TestStageMetrics:
+
+    def test_timer_records_stage(self):
+        """timer() 구간이 해당 단계에 기록됨"""
+        m = StageMetrics()
+        with m.timer("resolve"):
+            pass
+        with m.timer("resolve"):
+            pass
+
+        assert m.histograms["resolve"].count == 2
+
+    def test_timer_records_on_exception(self):
+        """예외가 나도 기록하고 예외는 그대로 전달"""
+        m = StageMetrics()
+        with pytest.raises(ValueError):
+            with m.timer("load"):
+                raise ValueError("boom")
+
+        assert m.histograms["load"].count == 1
+
+    def test_snapshot_merge(self):
+        """워커 스냅샷 병합 (reset=True면 워커 쪽은 비워짐)"""
+        parent, worker = StageMetrics(), StageMetrics()
+        parent.observe("load", 10_000)
+        worker.observe("load", 20_000)
+        worker.observe("write", 30_000)
+
+        parent.merge_dict(worker.snapshot(reset=True))
+
+        assert parent.histograms["load"].count == 2
+        assert parent.histograms["write"].count == 1
+        assert worker.histograms == {}
+
+    def test_summary_and_report(self):
+        """요약에 p50/p95/p99 포함, 보고 표에 단계명 포함"""
+        m = StageMetrics()
+        for ns in (1_000_000, 2_000_000, 3_000_000):
+            m.observe("serialize", ns)
+
+        s = m.summary()["serialize"]
+        assert s["count"] == 3
+        assert {"p50_ms", "p95_ms", "p99_ms", "max_ms"} <= set(s)
+        assert s["max_ms"] == 3.0
+        assert "serialize" in m.format_report()
+
+    def test_dump_json(self, tmp_path):
+        """JSON 덤프: 버킷 상한 + 요약 + 원본 히스토그램"""
+        m = StageMetrics()
+        m.observe("load", 5_000)
+        path = tmp_path / "m" / "metrics.json"
+
+        m.dump_json(path, extra={"mode": "batch"})
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["mode"] == "batch"
+        assert data["bucket_bounds_ns"] == BUCKET_BOUNDS_NS
+        assert data["summary"]["load"]["count"] == 1
+        assert data["histograms"]["load"]["sum_ns"] == 5_000
+
+
+# 전역 수집기 / 파이프라인 계측 테스트
+class TestGlobalMetrics:
+
+    def test_disabled_is_noop(self):
+        """꺼져 있으면 공유 no-op 타이머, 기록 없음"""
+        disable_metrics()
+        assert stage_timer("a") is stage_timer("b")
+        with stage_timer("a"):
+            pass
+        observe_stage("a", 1_000)
+        assert get_metrics() is None
+
+    def test_preprocess_rules_timed(self, metrics, sample_raw_ocr_text):
+        """전처리 규칙별 단계 기록"""
+        preprocess(sample_raw_ocr_text)
+
+        stages = metrics.histograms
+        assert stages["preprocess.collapsed_whitespace"].count == 1
+        assert stages["preprocess.standardized_labels"].count == 1
+
+    def test_stream_stages(self, metrics, sample_raw_ocr_text):
+        """스트리밍 직렬 모드: 파이프라인 단계가 모두 기록됨"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        run_stream(io.StringIO(line + "\n" + line + "\n"), io.StringIO())
+
+        for stage in ("extract.label", "extract.pattern", "resolve", "normalize", "validate", "serialize"):
+            assert metrics.histograms[stage].count == 2
+
+    def test_stream_workers_aggregated(self, metrics, sample_raw_ocr_text):
+        """병렬 모드: 워커 히스토그램이 부모에 합산됨"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        lines = "\n".join([line] * 6) + "\n"
+
+        run_stream(io.StringIO(lines), io.StringIO(), workers=2, chunk_size=2)
+
+        assert metrics.histograms["resolve"].count == 6
+        # 부모 프로세스는 자기 수집기를 스냅샷으로 다시 보내지 않음
+        assert streaming._ship_metrics is False
+
+    def test_failed_document_timed(self, metrics, tmp_path, monkeypatch):
+        """실패한 문서도 document / document.failed에 기록"""
+        def failing_pipeline(input_path, with_evidence=True):
+            raise ValueError("broken")
+
+        monkeypatch.setattr(pipeline_main, "run_full_pipeline", failing_pipeline)
+        monkeypatch.setattr(pipeline_main, "logger", None)
+        monkeypatch.setattr(pipeline_main, "error_handler", None)
+        monkeypatch.setattr(pipeline_main, "artifact_store", create_artifact_store(FileNamingConvention.LAYOUT_FILES, tmp_path / "out"))
+        input_path = tmp_path / "doc.json"
+        input_path.write_text("{}", encoding="utf-8")
+
+        assert pipeline_main.process_single_file(input_path)[0] == "FAILED"
+        assert metrics.histograms["document"].count == 1
+        assert metrics.histograms["document.failed"].count == 1
+        assert "document.success" not in metrics.histograms
+
+
+# 문서별 단계 합산 테스트
+class TestDocumentTrace:
+
+    def test_trace_without_metrics(self, sample_raw_ocr_text):
+        """계측이 꺼져 있어도 문서 단위로 단계 시간 합산"""
+        disable_metrics()
+        trace = start_document_trace()
+        try:
+            preprocess(sample_raw_ocr_text)
+            with stage_timer("x"):
+                pass
+            with stage_timer("x"):
+                pass
+        finally:
+            stop_document_trace()
+
+        assert "preprocess.collapsed_whitespace" in trace
+        assert trace["x"] > 0
+        assert get_metrics() is None
+        assert stage_timer("a") is stage_timer("b")  # 종료 후 다시 no-op
+
+    def test_other_thread_ignored(self):
+        """다른 스레드의 구간은 문서 합계에 넣지 않음"""
+        def _other():
+            with stage_timer("write.io"):
+                pass
+
+        trace = start_document_trace()
+        try:
+            t = threading.Thread(target=_other)
+            t.start()
+            t.join()
+        finally:
+            stop_document_trace()
+
+        assert "write.io" not in trace
+
+    def test_trace_and_metrics(self, metrics):
+        """계측과 문서 합산을 동시에"""
+        trace = start_document_trace()
+        try:
+            with stage_timer("resolve"):
+                pass
+        finally:
+            stop_document_trace()
+
+        assert metrics.histograms["resolve"].count == 1
+        assert "resolve" in trace
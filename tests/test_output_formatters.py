@@ -12,6 +12,8 @@ from src.output_formatters import (
     format_parsed_output,
     format_csv_row,
     write_summary_csv,
+    SummaryCSVWriter,
+    SUMMARY_CSV_FIELDNAMES,
     get_output_files,
 )
 
@@ -241,6 +243,94 @@ class TestCSVFormatting:
             
             assert not output_path.exists()
 
+def _csv_row(filename: str) -> dict:
+    return format_csv_row(filename, {
+        "date": "2026-02-02", "time": "09:12", "vehicle_no": "8713",
+        "gross_weight_kg": 12480, "tare_weight_kg": 7470, "net_weight_kg": 5010,
+        "is_valid": True, "validation_errors": [], "parse_warnings": ["w1", "w2"],
+        "imputation_notes": [],
+    })
+
+
+# 스트리밍 CSV 작성기 테스트
+class TestSummaryCSVWriter:
+    
+    def test_columns_match_format_csv_row(self):
+        """컬럼 순서 = format_csv_row 키"""
+        assert SUMMARY_CSV_FIELDNAMES == list(_csv_row("a.json").keys())
+    
+    def test_same_output_as_batch_writer(self, tmp_path):
+        """일괄 작성과 동일한 결과"""
+        rows = [_csv_row(f"sample_{i}.json") for i in range(5)]
+        
+        write_summary_csv(tmp_path / "batch.csv", rows)
+        with SummaryCSVWriter(tmp_path / "stream.csv", flush_every=2) as writer:
+            for row in rows:
+                writer.write_row(row)
+        
+        assert (tmp_path / "batch.csv").read_bytes() == (tmp_path / "stream.csv").read_bytes()
+    
+    def test_flush_interval(self, tmp_path):
+        """flush_every 행마다 디스크에 반영"""
+        path = tmp_path / "summary.csv"
+        writer = SummaryCSVWriter(path, flush_every=2)
+        
+        writer.write_row(_csv_row("a.json"))
+        writer.write_row(_csv_row("b.json"))
+        
+        with path.open("r", encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == 2
+        writer.close()
+    
+    def test_no_rows_no_file(self, tmp_path):
+        """행이 없으면 파일 미생성"""
+        path = tmp_path / "summary.csv"
+        SummaryCSVWriter(path).close()
+        assert not path.exists()
+    
+    def test_resume_appends_without_header(self, tmp_path):
+        """resume: 헤더 없이 이어쓰기"""
+        path = tmp_path / "summary.csv"
+        with SummaryCSVWriter(path) as writer:
+            writer.write_row(_csv_row("a.json"))
+        
+        with SummaryCSVWriter(path, resume=True) as writer:
+            writer.write_row(_csv_row("b.json"))
+        
+        with path.open("r", encoding="utf-8") as f:
+            assert [r["filename"] for r in csv.DictReader(f)] == ["a.json", "b.json"]
+    
+    def test_resume_drops_partial_line(self, tmp_path):
+        """resume: 중단으로 잘린 마지막 행 제거"""
+        path = tmp_path / "summary.csv"
+        with SummaryCSVWriter(path) as writer:
+            writer.write_row(_csv_row("a.json"))
+        with path.open("a", encoding="utf-8") as f:
+            f.write("b.json,2026-02")
+        
+        with SummaryCSVWriter(path, resume=True) as writer:
+            writer.write_row(_csv_row("c.json"))
+        
+        with path.open("r", encoding="utf-8") as f:
+            assert [r["filename"] for r in csv.DictReader(f)] == ["a.json", "c.json"]
+
+    def test_offset_tracks_file_size(self, tmp_path):
+        """offset = flush 여부와 무관하게 기록한 행까지의 파일 크기 (한글 파일명 포함, 이어쓰기 포함)"""
+        path = tmp_path / "summary.csv"
+        writer = SummaryCSVWriter(path, flush_every=100)
+        writer.write_row(_csv_row("계근지_01.json"))
+        offset = writer.offset
+        writer.flush()
+        assert offset == path.stat().st_size
+        writer.close()
+
+        with SummaryCSVWriter(path, resume=True) as writer:
+            assert writer.offset == offset
+            writer.write_row(_csv_row("b.json"))
+            offset = writer.offset
+        assert offset == path.stat().st_size
+
+
 # 출력 파일 목록 반환 함수 테스트
 class TestGetOutputFiles:
     
@@ -256,6 +346,62 @@ class TestGetOutputFiles:
         assert "sample_01_extract_log.json" in files
         assert "sample_01_resolved.json" in files
         assert "sample_01_parsed.json" in files
+    
+    def test_get_output_files_bundle(self):
+        """bundle 레이아웃: 번들 1개"""
+        assert get_output_files("sample_01", layout="bundle") == ["sample_01_bundle.json"]
+    
+    def test_get_output_files_jsonl(self):
+        """jsonl 레이아웃: 단계별 JSONL 7개 + 인덱스"""
+        files = get_output_files("sample_01", layout="jsonl", run_id="run_x")
+        
+        assert len(files) == 8
+        assert "run_x_parsed.jsonl" in files
+        assert "run_x_index.jsonl" in files
+    
+    def test_get_output_files_jsonl_requires_run_id(self):
+        """jsonl 레이아웃은 run_id 필요"""
+        with pytest.raises(ValueError):
+            get_output_files("sample_01", layout="jsonl")
+    
+    def test_get_output_files_sharded(self):
+        """샤딩: 상대 경로에 하위 디렉토리 포함"""
+        files = get_output_files("sample_01", shard="date", date="2026-02-02")
+        assert "2026/02/02/sample_01_parsed.json" in files
+        
+        bundle = get_output_files("sample_01", layout="bundle", shard="hash")
+        assert bundle[0].count("/") == 2
+        assert bundle[0].endswith("/sample_01_bundle.json")
+
+
+# 샤딩 디렉토리 규칙 테스트
+class TestShardDir:
+    
+    def test_flat(self):
+        assert FileNamingConvention.shard_dir("sample_01", "flat") == ""
+    
+    def test_hash_is_stable(self):
+        """hash: 같은 stem은 항상 같은 ab/cd"""
+        first = FileNamingConvention.shard_dir("sample_01", "hash")
+        assert first == FileNamingConvention.shard_dir("sample_01", "hash")
+        assert len(first.split("/")) == 2
+        assert all(len(part) == 2 for part in first.split("/"))
+    
+    def test_date(self):
+        assert FileNamingConvention.shard_dir("s", "date", "2026-02-02") == "2026/02/02"
+        assert FileNamingConvention.shard_dir("s", "date", None) == "unknown"
+    
+    def test_stages_for_verbosity(self):
+        """상세 수준별 기록 단계"""
+        assert FileNamingConvention.stages_for("minimal") == ["parsed"]
+        assert "candidates" not in FileNamingConvention.stages_for("standard")
+        assert FileNamingConvention.stages_for("debug") == FileNamingConvention.STAGES
+        with pytest.raises(ValueError):
+            FileNamingConvention.stages_for("verbose")
+    
+    def test_unknown_shard(self):
+        with pytest.raises(ValueError):
+            FileNamingConvention.shard_dir("s", "month")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+"""
+마이크로 벤치마크 회귀 검사 (benchmarks/bench_micro.py)
+- 비교 로직: 기준 작업 대비 배율로 판정, 새 함수 / 임계값
+- 기준값 파일이 측정 대상 함수 전체를 담고 있는지
+- OCR_PERF_GATE=1일 때만 실제 측정 후 기준값 대비 느려진 함수가 있으면 실패
+"""
+import os
+
+import pytest
+
+from benchmarks.bench_micro import (
+    DEFAULT_THRESHOLD,
+    build_cases,
+    compare,
+    format_rows,
+    load_baseline,
+    run,
+)
+
+BASELINE = {"functions": {"a": {"us": 10.0, "relative": 0.5}, "b": {"us": 2.0, "relative": 0.1}}}
+
+
+# 비교 로직 테스트
+class TestCompare:
+
+    def test_relative_change(self):
+        """us가 같아도 기준 작업 대비 배율이 늘면 회귀"""
+        rows = compare({"a": (10.0, 0.7), "b": (2.0, 0.1)}, BASELINE, threshold=0.25)
+        status = {row["name"]: row["status"] for row in rows}
+        assert status == {"a": "regressed", "b": "ok"}
+        assert rows[0]["change"] == pytest.approx(0.4)
+
+    def test_machine_speed_cancels(self):
+        """기계가 느려 us가 커져도 배율이 같으면 통과"""
+        rows = compare({"a": (30.0, 0.5)}, BASELINE)
+        assert rows[0]["status"] == "ok"
+
+    def test_improved_and_new(self):
+        rows = compare({"a": (5.0, 0.2), "c": (1.0, 0.3)}, BASELINE)
+        assert [row["status"] for row in rows] == ["improved", "new"]
+        assert "new" in format_rows(rows)
+
+
+# 기준값 파일 테스트
+class TestBaselineFile:
+
+    def test_covers_all_cases(self):
+        """측정 대상을 추가 / 이름 변경하면 기준값도 갱신해야 함"""
+        baseline = load_baseline()
+        assert baseline is not None
+        assert sorted(baseline["functions"]) == sorted(case.name for case in build_cases())
+
+    def test_cases_have_inputs(self):
+        assert all(case.calls for case in build_cases())
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not os.environ.get("OCR_PERF_GATE"), reason="OCR_PERF_GATE=1일 때만 측정 (약 10초)")
+def test_no_performance_regression():
+    """기준값 대비 DEFAULT_THRESHOLD 넘게 느려진 함수가 없어야 함"""
+    _, rows = run(baseline=load_baseline(), threshold=DEFAULT_THRESHOLD)
+    regressed = [row for row in rows if row["status"] == "regressed"]
+    assert not regressed, "\n" + format_rows(rows)
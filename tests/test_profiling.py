@@ -0,0 +1,168 @@
+"""
+profiling.py 모듈 단위 테스트
+- ProfileSession: N번째 문서 / 실행 전체 프로파일, 스냅샷 병합, 파일 기록
+- collapse_pstats: 호출 그래프 → collapsed stack
+- StackSampler: 타이머 시그널 샘플링
+- 스트리밍 병렬 모드에서 워커 프로파일 병합
+"""
+import io
+import json
+import pstats
+import signal
+import time
+
+import pytest
+
+from src.profiling import (
+    PROFILE_CPROFILE,
+    PROFILE_SAMPLE,
+    ProfileSession,
+    StackSampler,
+    collapse_pstats,
+    start_profiling,
+    stop_profiling,
+)
+from src.streaming import run_stream
+
+
+def _leaf(n: int) -> int:
+    return sum(range(n))
+
+
+def _outer() -> int:
+    return _leaf(20000) + _leaf(20000)
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        _leaf(1000)
+
+
+@pytest.fixture(autouse=True)
+def _no_session():
+    """테스트 간 전역 세션 정리"""
+    yield
+    session = stop_profiling()
+    if session is not None:
+        session.abandon()
+
+
+# cProfile 세션 테스트
+class TestProfileSession:
+
+    def test_every_nth_document(self, tmp_path):
+        """every=2 → 2, 4번째 문서만 프로파일"""
+        session = ProfileSession(PROFILE_CPROFILE, every=2)
+        session.start()
+        for i in range(1, 5):
+            with session.document(i):
+                _outer()
+
+        assert session.profiled_documents == 2
+        written = session.finish(tmp_path / "p")
+        assert [p.name for p in written] == ["p.pstats", "p.collapsed"]
+
+        stats = pstats.Stats(str(tmp_path / "p.pstats"))
+        calls = {func[2]: value[1] for func, value in stats.stats.items()}
+        assert calls["_outer"] == 2
+
+    def test_whole_run(self, tmp_path):
+        """every=0 → start()부터 finish()까지 전체"""
+        session = ProfileSession(PROFILE_CPROFILE, every=0)
+        session.start()
+        _outer()
+        session.finish(tmp_path / "p")
+
+        stats = pstats.Stats(str(tmp_path / "p.pstats"))
+        assert any(func[2] == "_outer" for func in stats.stats)
+
+    def test_snapshot_merge(self, tmp_path):
+        """워커 스냅샷 병합 시 호출 수 합산"""
+        worker = ProfileSession(PROFILE_CPROFILE, every=1)
+        worker.start()
+        with worker.document(1):
+            _outer()
+        snapshot = worker.snapshot()
+        worker.abandon()
+
+        parent = ProfileSession(PROFILE_CPROFILE, every=1)
+        parent.start()
+        with parent.document(1):
+            _outer()
+        parent.merge(snapshot)
+        parent.finish(tmp_path / "p")
+
+        assert parent.profiled_documents == 2
+        stats = pstats.Stats(str(tmp_path / "p.pstats"))
+        calls = {func[2]: value[1] for func, value in stats.stats.items()}
+        assert calls["_outer"] == 2
+        assert calls["_leaf"] == 4
+
+
+# collapsed stack 테스트
+class TestCollapse:
+
+    def test_call_path(self, tmp_path):
+        """호출자;피호출자 경로와 us 값"""
+        session = ProfileSession(PROFILE_CPROFILE, every=1)
+        session.start()
+        with session.document(1):
+            _outer()
+        session.finish(tmp_path / "p")
+
+        stacks = collapse_pstats(pstats.Stats(str(tmp_path / "p.pstats")))
+        leaf_paths = [s for s in stacks if s.split(";")[-1].startswith("_leaf ")]
+        assert leaf_paths
+        assert all(s.split(";")[-2].startswith("_outer (test_profiling.py:") for s in leaf_paths)
+        assert all(isinstance(v, int) and v > 0 for v in stacks.values())
+
+        lines = (tmp_path / "p.collapsed").read_text(encoding="utf-8").splitlines()
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+# 스택 샘플러 테스트
+@pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="setitimer 미지원 플랫폼")
+class TestStackSampler:
+
+    def test_samples_busy_function(self):
+        """바쁜 함수가 샘플에 나타나고 종료 후 핸들러 복원"""
+        previous = signal.getsignal(signal.SIGALRM)
+        sampler = StackSampler(interval=0.002)
+        sampler.start()
+        _busy(0.2)
+        sampler.stop()
+
+        counts = sampler.take()
+        assert sampler.samples > 0
+        assert any("_busy (test_profiling.py:" in stack for stack in counts)
+        assert signal.getsignal(signal.SIGALRM) == previous
+
+    def test_sample_session_output(self, tmp_path):
+        """sample 모드는 .sampled.collapsed만 기록"""
+        session = ProfileSession(PROFILE_SAMPLE, interval=0.002)
+        session.start()
+        _busy(0.1)
+        written = session.finish(tmp_path / "s")
+
+        assert [p.name for p in written] == ["s.sampled.collapsed"]
+        assert (tmp_path / "s.sampled.collapsed").read_text(encoding="utf-8")
+
+
+# 스트리밍 병렬 모드 병합 테스트
+class TestStreamProfile:
+
+    def test_workers_merged(self, tmp_path, sample_raw_ocr_text):
+        """워커에서 프로파일한 문서 수와 함수 호출이 부모에 합산됨"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        lines = "\n".join([line] * 6) + "\n"
+
+        session = start_profiling(PROFILE_CPROFILE, every=2)
+        run_stream(io.StringIO(lines), io.StringIO(), workers=2, chunk_size=2)
+        stop_profiling()
+        session.finish(tmp_path / "p")
+
+        assert session.profiled_documents == 3
+        stats = pstats.Stats(str(tmp_path / "p.pstats"))
+        calls = {func[2]: value[1] for func, value in stats.stats.items()}
+        assert calls["run_document_pipeline"] == 3
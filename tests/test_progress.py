@@ -0,0 +1,130 @@
+"""
+progress.py 모듈 단위 테스트
+- ProgressBar: 다시 그리기 간격 제한, 속도 / ETA, 터미널이 아닐 때 한 줄 출력
+- ProgressReporter / ProgressAggregator: 워커 진행 보고 묶음, 큐 집계
+- 스트리밍 병렬 모드 진행률
+"""
+import io
+import json
+import queue
+
+from src.progress import ProgressAggregator, ProgressBar, ProgressReporter, _format_duration
+from src.streaming import run_stream
+
+
+# 프로그레스 바 테스트
+class TestProgressBar:
+
+    def test_throttled_redraw(self):
+        """간격 안의 update()는 다시 그리지 않고, 완료 시에는 항상 그림"""
+        out = io.StringIO()
+        bar = ProgressBar(total=1000, stream=out, min_interval=60, tty=True)
+        for _ in range(1000):
+            bar.update()
+
+        assert bar.renders == 2  # 첫 update + 완료
+        assert out.getvalue().endswith("\n")
+        assert "1000/1000" in out.getvalue()
+
+    def test_every_update_when_interval_zero(self):
+        """간격 0이면 매번 그림"""
+        bar = ProgressBar(total=5, stream=io.StringIO(), min_interval=0, tty=True)
+        for _ in range(5):
+            bar.update()
+        assert bar.renders == 5
+
+    def test_plain_lines_when_not_tty(self):
+        """터미널이 아니면 \\r 없이 한 줄씩"""
+        out = io.StringIO()
+        bar = ProgressBar(total=3, prefix="진행률", stream=out, plain_interval=60, tty=False)
+        for _ in range(3):
+            bar.update()
+
+        lines = out.getvalue().splitlines()
+        assert "\r" not in out.getvalue()
+        assert len(lines) == 2
+        assert lines[-1].startswith("진행률 3/3 (100%)")
+        assert "docs/s" in lines[-1]
+
+    def test_auto_detect_tty(self):
+        """StringIO는 터미널이 아님"""
+        assert ProgressBar(total=1, stream=io.StringIO()).tty is False
+
+    def test_eta(self):
+        """ETA = 남은 건수 / 평균 속도"""
+        bar = ProgressBar(total=100, stream=io.StringIO(), min_interval=60, tty=True)
+        bar.current = 25
+        now = bar._started + 5.0  # 5건/초
+        assert bar.rate(now) == 5.0
+        assert bar.eta(now) == 15.0
+
+    def test_unknown_total(self):
+        """전체 수를 모르면 건수 / 속도만, finish()로 줄바꿈"""
+        out = io.StringIO()
+        bar = ProgressBar(total=None, prefix="처리", stream=out, min_interval=0, tty=True)
+        bar.update(3)
+        bar.finish()
+
+        assert bar.eta() is None
+        assert out.getvalue().endswith("\n")
+        assert "처리 3 " in out.getvalue()
+
+    def test_finish_once(self):
+        """완료 후 finish()는 다시 출력하지 않음"""
+        out = io.StringIO()
+        bar = ProgressBar(total=1, stream=out, tty=True)
+        bar.update()
+        bar.finish()
+        assert out.getvalue().count("\n") == 1
+
+    def test_format_duration(self):
+        assert _format_duration(65) == "01:05"
+        assert _format_duration(3725) == "1:02:05"
+
+
+# 워커 진행 보고 테스트
+class TestProgressAggregation:
+
+    def test_reporter_batches(self):
+        """every건마다 한 번만 큐에 넣음, flush()로 나머지"""
+        q = queue.SimpleQueue()
+        reporter = ProgressReporter(q, every=10, interval=60)
+        for _ in range(25):
+            reporter.update()
+        reporter.flush()
+
+        sent = []
+        while not q.empty():
+            sent.append(q.get())
+        assert sent == [10, 10, 5]
+
+    def test_aggregator(self):
+        """여러 보고기의 진행이 한 바에 합산됨"""
+        bar = ProgressBar(total=30, stream=io.StringIO(), min_interval=60, tty=True)
+        aggregator = ProgressAggregator(bar, queue=queue.SimpleQueue())
+        for _ in range(3):
+            reporter = ProgressReporter(aggregator.queue, every=4)
+            for _ in range(10):
+                reporter.update()
+            reporter.flush()
+        aggregator.close()
+
+        assert bar.current == 30
+
+    def test_stream_workers(self, sample_raw_ocr_text):
+        """병렬 스트리밍: 워커 보고로 전체 건수 집계"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        bar = ProgressBar(total=None, stream=io.StringIO(), tty=False)
+
+        run_stream(io.StringIO("\n".join([line] * 7) + "\n"), io.StringIO(), workers=2, chunk_size=2, progress=bar)
+
+        assert bar.current == 7
+
+    def test_stream_serial(self, sample_raw_ocr_text):
+        """직렬 스트리밍: 부모가 직접 갱신"""
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+        bar = ProgressBar(total=None, stream=io.StringIO(), tty=False)
+
+        run_stream(io.StringIO(f"{line}\n{line}\n"), io.StringIO(), progress=bar)
+
+        assert bar.current == 2
@@ -0,0 +1,181 @@
+"""
+prometheus.py 모듈 단위 테스트
+- Counter / Gauge: 레이블별 값, 텍스트 형식
+- StageHistogramCollector: 누적 버킷 / sum / count
+- PipelineTelemetry: 문서 상태 / 검증 오류 코드 집계, 기록기 캐시 통계
+- 노출: HTTP /metrics, textfile
+"""
+import io
+import json
+import urllib.request
+
+import pytest
+
+from src.file_writer import BackgroundFileWriter
+from src.metrics import BUCKET_BOUNDS_NS, StageMetrics
+from src.prometheus import (
+    Counter,
+    Gauge,
+    MetricsHTTPServer,
+    PipelineTelemetry,
+    Registry,
+    StageHistogramCollector,
+    TextfileExporter,
+)
+from src.streaming import run_stream
+
+
+# 기본 메트릭 테스트
+class TestMetricTypes:
+
+    def test_counter_labels(self):
+        """레이블 조합별로 누적"""
+        c = Counter("ocr_x_total", "x", ["status"])
+        c.inc(status="SUCCESS")
+        c.inc(2, status="SUCCESS")
+        c.inc(status="FAILED")
+
+        assert c.get(status="SUCCESS") == 3
+        assert c.render() == [
+            "# HELP ocr_x_total x",
+            "# TYPE ocr_x_total counter",
+            'ocr_x_total{status="FAILED"} 1',
+            'ocr_x_total{status="SUCCESS"} 3',
+        ]
+
+    def test_counter_rejects_negative(self):
+        """카운터 감소 불가"""
+        with pytest.raises(ValueError):
+            Counter("c", "c").inc(-1)
+
+    def test_label_mismatch(self):
+        """정의와 다른 레이블은 오류"""
+        c = Counter("c", "c", ["status"])
+        with pytest.raises(ValueError):
+            c.inc(code="x")
+        with pytest.raises(ValueError):
+            c.inc()
+
+    def test_counter_sync_never_decreases(self):
+        """외부 누적값 반영은 작아지지 않음"""
+        c = Counter("c", "c")
+        c.sync(5)
+        c.sync(3)
+        assert c.get() == 5
+
+    def test_gauge_without_labels(self):
+        """레이블 없는 게이지"""
+        g = Gauge("g", "g")
+        g.set(1.5)
+        assert g.render()[-1] == "g 1.5"
+
+    def test_label_escaping(self):
+        """레이블 값의 따옴표 / 역슬래시 이스케이프"""
+        c = Counter("c", "c", ["code"])
+        c.inc(code='a"b\\c')
+        assert c.render()[-1] == 'c{code="a\\"b\\\\c"} 1'
+
+
+# 단계 히스토그램 변환 테스트
+class TestStageHistogramCollector:
+
+    def test_cumulative_buckets(self):
+        """버킷은 누적, 마지막은 +Inf == count"""
+        m = StageMetrics()
+        m.observe("resolve", 1_000)
+        m.observe("resolve", 3_000_000)
+
+        lines = StageHistogramCollector(m).render()
+        buckets = [l for l in lines if l.startswith("ocr_stage_duration_seconds_bucket")]
+
+        assert len(buckets) == len(BUCKET_BOUNDS_NS) + 1
+        assert buckets[0] == 'ocr_stage_duration_seconds_bucket{stage="resolve",le="1e-06"} 1'
+        assert buckets[-1] == 'ocr_stage_duration_seconds_bucket{stage="resolve",le="+Inf"} 2'
+        assert 'ocr_stage_duration_seconds_count{stage="resolve"} 2' in lines
+        assert 'ocr_stage_duration_seconds_sum{stage="resolve"} 0.003001' in lines
+
+
+# 파이프라인 메트릭 테스트
+class TestPipelineTelemetry:
+
+    def test_record_document(self):
+        """상태별 / 검증 통과 여부별 / 오류 코드별 집계"""
+        t = PipelineTelemetry()
+        t.record_document("SUCCESS", True)
+        t.record_document("SUCCESS", False, ["negative_weight:net=-10", "negative_weight:gross=-1"])
+        t.record_document("MISSING", False)
+
+        assert t.documents.get(status="SUCCESS") == 2
+        assert t.documents.get(status="MISSING") == 1
+        assert t.valid.get(valid="false") == 1
+        assert t.validation_errors.get(code="negative_weight") == 2
+
+    def test_render_contains_all_metrics(self):
+        """노출 텍스트에 모든 메트릭 이름 포함"""
+        stage_metrics = StageMetrics()
+        stage_metrics.observe("load", 10_000)
+        text = PipelineTelemetry(stage_metrics).render()
+
+        for name in (
+            "ocr_documents_total",
+            "ocr_documents_valid_total",
+            "ocr_validation_errors_total",
+            "ocr_writer_dir_cache_total",
+            "ocr_run_start_time_seconds",
+            "ocr_stage_duration_seconds",
+        ):
+            assert f"# TYPE {name} " in text
+
+    def test_track_writer_cache(self, tmp_path):
+        """기록기 디렉토리 캐시 hit / miss를 노출 시점에 반영"""
+        t = PipelineTelemetry()
+        with BackgroundFileWriter(threads=0) as writer:
+            t.track_writer(writer)
+            for i in range(3):
+                writer.submit(tmp_path / "d" / f"{i}.txt", "x")
+            t.render()
+
+        assert t.dir_cache.get(result="miss") == 1
+        assert t.dir_cache.get(result="hit") == 2
+
+    def test_stream_on_result(self, sample_raw_ocr_text):
+        """스트리밍 모드의 줄별 결과가 집계됨 (파싱 실패 포함)"""
+        t = PipelineTelemetry()
+        line = json.dumps({"text": sample_raw_ocr_text}, ensure_ascii=False)
+
+        run_stream(io.StringIO(f"{line}\nbroken\n"), io.StringIO(), on_result=t.record_document)
+
+        assert t.documents.get(status="SUCCESS") == 1
+        assert t.documents.get(status="FAILED") == 1
+        assert t.validation_errors.get(code="pipeline_error") == 1
+
+
+# 노출 테스트
+class TestExporters:
+
+    def test_http_server(self):
+        """/metrics 응답 (임의 포트)"""
+        registry = Registry()
+        registry.counter("ocr_test_total", "t").inc()
+        server = MetricsHTTPServer(registry, port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as resp:
+                body = resp.read().decode("utf-8")
+                content_type = resp.headers["Content-Type"]
+        finally:
+            server.close()
+
+        assert "ocr_test_total 1" in body
+        assert content_type.startswith("text/plain; version=0.0.4")
+
+    def test_textfile_final_write(self, tmp_path):
+        """close() 시 최종 값 기록"""
+        registry = Registry()
+        counter = registry.counter("ocr_test_total", "t")
+        path = tmp_path / "metrics.prom"
+
+        exporter = TextfileExporter(registry, path, interval=60)
+        counter.inc(5)
+        exporter.close()
+
+        assert "ocr_test_total 5" in path.read_text(encoding="utf-8")
@@ -0,0 +1,159 @@
+"""
+정규식 최악 입력(ReDoS) 테스트
+- 적대적 입력 모음: 숫자 / 공백 / 쉼표 / O·l·I / 콜론이 길게 이어지고 'kg' 등 종결자가 없거나 맨 끝에만 있는 줄
+- 등록된 모든 정규식(config.Patterns 포함, 현재 백엔드), 전처리 규칙 전체, 추출기, 정규화 함수가 입력 길이에 선형으로 늘어나는지
+  (4KB → 32KB로 8배 늘렸을 때 시간 비율: 선형이면 약 8배, 이차 시간 탐색이면 약 64배)
+  기계 속도와 무관한 비율로 판정하고, KB당 절대 시간 상한은 아주 느슨한 안전망으로만 둔다
+- 길이 상한을 둔 WEIGHT_KG가 실제 중량 표기는 그대로 잡는지
+"""
+import inspect
+import time
+
+import pytest
+
+from src import normalizers, preprocessor
+from src.config import Patterns
+from src.extractor import extract_by_label, extract_by_pattern
+from src.regex_backend import ACTIVE_BACKEND, REGISTRY
+
+BASE_SIZE = 4 * 1024
+SCALE = 8
+SIZE = BASE_SIZE * SCALE
+MAX_RATIO = 24.0        # SCALE배 입력의 시간 비율 상한 (선형 8, 이차 64)
+MIN_TIMED_MS = 5.0      # 큰 입력이 이보다 빠르면 비율은 잡음이라 판정하지 않음
+MAX_MS_PER_KB = 100.0   # 절대 시간 안전망 (아주 느슨하게)
+
+
+def _repeat(unit: str, size: int = SIZE) -> str:
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def _adversarial(size: int) -> dict:
+    """적대적 입력 모음 (이름 -> 약 size 글자)"""
+    return {
+        "digits": _repeat("1", size),
+        "digits_then_kg": _repeat("1", size) + " kg",
+        "digit_space": _repeat("1 ", size),
+        "digit_space_then_kg": _repeat("1 ", size) + "kg",
+        "digit_newline": _repeat("1\n", size),
+        "digit_comma_space": _repeat("1, ", size),
+        "three_digit_groups": _repeat("123 ", size),
+        "spaces_between_digits": "1" + _repeat(" ", size) + "1",
+        "spaces_then_x": "1" + _repeat(" ", size) + "x",
+        "visual_noise": _repeat("O o l I 0 ", size),
+        "visual_noise_then_k": _repeat("O1 ", size) + "k",
+        "colon_space": _repeat(" : ", size),
+        "dotted_digits": _repeat("1.", size),
+        "decimal_spaces": _repeat("1.5 ", size),
+        "date_tail": "2026-02-02-" + _repeat("1", size),
+        "time_like": _repeat("1:", size),
+        "hangul_digits": _repeat("가1 ", size),
+        "korean_time_like": _repeat("1시 ", size),
+    }
+
+
+ADVERSARIAL = _adversarial(SIZE)
+ADVERSARIAL_BASE = _adversarial(BASE_SIZE)
+
+
+def _patterns():
+    return [(name, REGISTRY[name].compile(ACTIVE_BACKEND)) for name in sorted(REGISTRY)]
+
+
+def _preprocess_rules():
+    return sorted(
+        (name, fn) for name, fn in inspect.getmembers(preprocessor, inspect.isfunction)
+        if name.startswith("normalize_")
+    )
+
+
+TARGETS = (
+    [(name, (lambda p: lambda text: list(p.finditer(text)))(p)) for name, p in _patterns()]
+    + [(f"preprocessor.{name}", fn) for name, fn in _preprocess_rules()]
+    + [
+        ("preprocessor.preprocess", preprocessor.preprocess),
+        ("extract_by_label", extract_by_label),
+        ("extract_by_pattern", extract_by_pattern),
+        ("normalize_weight_kg", normalizers.normalize_weight_kg),
+        ("normalize_time", normalizers.normalize_time),
+        ("normalize_date", normalizers.normalize_date),
+    ]
+)
+
+
+def _elapsed_ms(fn, text: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+# 시간 상한 테스트
+class TestWorstCaseLatency:
+
+    def test_targets_cover_patterns_and_rules(self):
+        """정규식 / 전처리 규칙이 추가되면 자동으로 대상에 포함"""
+        names = {name for name, _ in TARGETS}
+        assert "Patterns.WEIGHT_KG" in names
+        assert "preprocessor.noisy_weight" in names
+        assert "preprocessor.normalize_character_visual_noise" in names
+        assert len(_preprocess_rules()) == 11
+
+    @pytest.mark.parametrize("name,fn", TARGETS, ids=[name for name, _ in TARGETS])
+    def test_linear_scaling(self, name, fn):
+        """모든 적대적 입력에서 SCALE배 길이의 시간 비율이 MAX_RATIO 이하, KB당 MAX_MS_PER_KB ms 이내"""
+        slow = []
+        for corpus, text in ADVERSARIAL.items():
+            large = _elapsed_ms(fn, text)
+            per_kb = large / (len(text) / 1024)
+            if per_kb > MAX_MS_PER_KB:
+                slow.append(f"{corpus}: {per_kb:.1f}ms/KB")
+            if large < MIN_TIMED_MS:
+                continue
+            ratio = large / max(_elapsed_ms(fn, ADVERSARIAL_BASE[corpus]), 1e-3)
+            if ratio > MAX_RATIO:
+                slow.append(f"{corpus}: x{ratio:.1f} ({SCALE}배 입력)")
+        assert not slow, f"{name}: " + ", ".join(slow)
+
+
+# 동작 보존 테스트
+class TestSemanticsPreserved:
+
+    @pytest.mark.parametrize("line,expected", [
+        ("총중량: 02:07 13 460 kg", "13 460"),
+        ("실중량: 5,900 kg", "5,900"),
+        ("12340KG", "12340"),
+        ("총 중 량 14,230 kg (09:09)", "14,230"),
+        ("중량 100,000   kg", "100,000"),
+    ])
+    def test_weight_pattern(self, line, expected):
+        assert Patterns.WEIGHT_KG.search(line).group("num") == expected
+
+    def test_weight_pattern_span_cap(self):
+        """숫자부가 상한보다 길면 끝쪽 WEIGHT_KG_MAX_SPAN 글자 안에서 매칭"""
+        m = Patterns.WEIGHT_KG.search(_repeat("1 ", 200) + "5 900 kg")
+        assert len(m.group("num")) <= Patterns.WEIGHT_KG_MAX_SPAN
+        assert m.group("num").endswith("5 900")
+
+    @pytest.mark.parametrize("text,expected", [
+        ("차중량: 02 : 13 7 560 kg", "차중량:02:13 7 560 kg"),
+        ("( 09:09 )", "(09:09)"),
+        ("37.7 , 126.8", "37.7,126.8"),
+        (": :", "::"),
+    ])
+    def test_punctuation_spacing(self, text, expected):
+        assert preprocessor.normalize_punctuation_spacing(text).text == expected
+
+    def test_visual_noise(self):
+        result = preprocessor.normalize_character_visual_noise("실중량: 1O,48O kg")
+        assert result.text.split() == ["실중량:", "10,480", "kg"]
+        assert result.warnings == ["found_visual_noise_correction"]
+
+    def test_number_grouping_single_pass(self):
+        assert preprocessor.normalize_number_grouping_before_unit("13 460 kg / 1 234 567 kg").text == \
+            "13,460 kg / 1 234,567 kg"
+
+    def test_coordinates(self):
+        assert preprocessor.normalize_coordinates("2026-37.105317, 127.375673").text == "2026-37.105317,127.375673"
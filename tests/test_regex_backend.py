@@ -0,0 +1,125 @@
+"""
+정규식 백엔드 테스트 (src/regex_backend.py)
+- 백엔드 선택 / 환경 변수 / regex 미설치 처리, 이름 중복 등록
+- regex용 \\s 보정 변환
+- 차등 테스트: REGISTRY의 모든 정규식을 re / regex로 컴파일해 같은 입력에서 매칭 위치와 그룹이 같은지
+  (합성 계근지 원문 + 전처리 중간 텍스트 + 줄 단위 + 최악 입력 + 토큰 조합 무작위 문자열)
+"""
+import random
+
+import pytest
+
+from src import regex_backend
+from src.regex_backend import (
+    BACKEND_ENV,
+    BACKEND_RE,
+    BACKEND_REGEX,
+    REGISTRY,
+    PatternSpec,
+    _with_re_whitespace,
+    available_backends,
+    compile_pattern,
+    resolve_backend,
+)
+
+from benchmarks.bench_regex_backend import ADVERSARIAL, corpus
+
+# 무작위 문자열 조각: 패턴이 실제로 보는 토큰 + 경계 문자 (\x1c: re만 공백으로 보는 문자)
+_FUZZ_TOKENS = [
+    "kg", "KG", "Kg", " ", "  ", "\t", "\n", ":", ",", ".", "-", "/", "(", ")",
+    "0", "1", "12", "123", "1234", "2026-02-02", "2026.2.4", "09:12", "9:12:33", "11시", "33분",
+    "가", "서울", "12가3456", "O", "o", "l", "I", "차량번호", "차량 No.", "총 중 량", "실중량",
+    "doc_seq:", "raw_tail:", "·", "입고", "출고", "37.7", "-126.8", "\x1c", "\x1f", "\u3000", "\xa0",
+]
+
+
+def _fuzz_texts(count: int = 3000, seed: int = 0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(_FUZZ_TOKENS) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+
+@pytest.fixture(scope="module")
+def differential_corpus():
+    return corpus(40, seed=3) + list(ADVERSARIAL.values()) + _fuzz_texts()
+
+
+def _matches(pattern, text):
+    found = [(m.span(), m.groups(), m.groupdict()) for m in pattern.finditer(text)]
+    full = pattern.fullmatch(text)
+    return found, full and (full.span(), full.groups())
+
+
+# 백엔드 선택 테스트
+class TestBackendSelection:
+
+    def test_default_is_re(self, monkeypatch):
+        monkeypatch.delenv(BACKEND_ENV, raising=False)
+        assert resolve_backend() == BACKEND_RE
+
+    def test_env_var(self, monkeypatch):
+        pytest.importorskip("regex")
+        monkeypatch.setenv(BACKEND_ENV, " Regex ")
+        assert resolve_backend() == BACKEND_REGEX
+        assert available_backends() == [BACKEND_RE, BACKEND_REGEX]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            resolve_backend("pcre")
+
+    def test_regex_not_installed(self, monkeypatch):
+        monkeypatch.setattr(regex_backend, "_regex", None)
+        assert available_backends() == [BACKEND_RE]
+        with pytest.raises(ImportError):
+            resolve_backend(BACKEND_REGEX)
+        with pytest.raises(ImportError):
+            PatternSpec("x", r"\d+").compile(BACKEND_REGEX)
+
+    def test_registry_rejects_conflicting_names(self, monkeypatch):
+        monkeypatch.setattr(regex_backend, "REGISTRY", {})
+        compile_pattern("x", r"\d+")
+        compile_pattern("x", r"\d+")  # 모듈 재로드 등 같은 정의는 허용
+        with pytest.raises(ValueError):
+            compile_pattern("x", r"\d*")
+
+
+# \s 보정 테스트
+class TestWhitespaceTranslation:
+
+    @pytest.mark.parametrize("source,expected", [
+        (r"a\s+b", r"a[\s\x1c-\x1f]+b"),
+        (r"(?<![\dO,\s])x", r"(?<![\dO,\s\x1c-\x1f])x"),
+        (r"\S+\s*", r"[^\s\x1c-\x1f]+[\s\x1c-\x1f]*"),
+        (r"\\s\d", r"\\s\d"),
+    ])
+    def test_translate(self, source, expected):
+        assert _with_re_whitespace(source) == expected
+
+    def test_negated_shorthand_in_class_rejected(self):
+        with pytest.raises(ValueError):
+            _with_re_whitespace(r"[\S,]")
+
+
+# 차등 테스트 (regex 설치 시)
+class TestDifferential:
+
+    def test_registry_covers_modules(self):
+        prefixes = {name.split(".")[0] for name in REGISTRY}
+        assert {"Patterns", "preprocessor", "normalizers", "extractor"} <= prefixes
+
+    @pytest.mark.parametrize("name", sorted(REGISTRY))
+    def test_same_matches(self, name, differential_corpus):
+        pytest.importorskip("regex")
+        spec = REGISTRY[name]
+        expected = spec.compile(BACKEND_RE)
+        spellings = [PatternSpec(name, spec.source, None, spec.flags)] + ([spec] if spec.tuned else [])
+        for variant in spellings:
+            actual = variant.compile(BACKEND_REGEX)
+            for text in differential_corpus:
+                assert _matches(actual, text) == _matches(expected, text), (name, variant.tuned, text[:200])
+
+    def test_known_word_class_difference(self):
+        """\\w(\\b) 차이는 보정하지 않음 (모듈 docstring): 위첨자 숫자 뒤 4자리"""
+        pytest.importorskip("regex")
+        spec = REGISTRY["Patterns.VEHICLE_NO_SIMPLE"]
+        assert spec.compile(BACKEND_RE).search("²1234") is None
+        assert spec.compile(BACKEND_REGEX).search("²1234") is not None
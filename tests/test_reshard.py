@@ -0,0 +1,81 @@
+"""
+reshard.py 모듈 단위 테스트
+- 산출물 파일명 → stem 분리
+- 평면 디렉토리 → hash / date 샤딩 이전
+"""
+import json
+
+import pytest
+
+from src.artifacts import FileArtifactStore, find_document_dir
+from src.output_formatters import FileNamingConvention
+from src.reshard import reshard_directory, split_document_name
+
+
+def _artifacts(stem: str, date):
+    artifacts = {stage: {"source": f"{stem}.json"} for stage in FileNamingConvention.STAGES}
+    artifacts["raw"] = "원문"
+    artifacts["normalized"] = "정규화"
+    artifacts["parsed"] = {"source": f"{stem}.json", "date": date}
+    return artifacts
+
+
+@pytest.fixture
+def flat_dir(tmp_path):
+    """평면 레이아웃 문서 20건 + summary.csv"""
+    with FileArtifactStore(tmp_path) as store:
+        for i in range(20):
+            date = f"2026-02-{i % 3 + 1:02d}" if i % 5 else None
+            store.write_document(f"doc_{i:02d}", _artifacts(f"doc_{i:02d}", date))
+    (tmp_path / "summary.csv").write_text("filename\n", encoding="utf-8")
+    return tmp_path
+
+
+# 파일명 분리 테스트
+class TestSplitDocumentName:
+
+    def test_stage_files(self):
+        assert split_document_name("sample_01_preprocess_log.json") == ("sample_01", "preprocess_log")
+        assert split_document_name("my_doc_extract_log.json") == ("my_doc", "extract_log")
+        assert split_document_name("a_bundle.json") == ("a", "bundle")
+
+    def test_non_document_files(self):
+        assert split_document_name("summary.csv") is None
+        assert split_document_name("_parsed.json") is None
+
+
+# 이전 테스트
+class TestReshardDirectory:
+
+    def test_hash(self, flat_dir):
+        """hash 이전: 문서 산출물만 이동, 조회 헬퍼로 찾을 수 있음"""
+        stats = reshard_directory(flat_dir, "hash", workers=4)
+
+        assert stats["documents"] == 20
+        assert stats["files"] == 140
+        top_files = sorted(p.name for p in flat_dir.iterdir() if p.is_file())
+        assert top_files == ["summary.csv"]
+        for i in range(20):
+            assert find_document_dir(flat_dir, f"doc_{i:02d}", shard="hash") is not None
+
+    def test_date(self, flat_dir):
+        """date 이전: parsed의 날짜 사용, 없으면 unknown/"""
+        reshard_directory(flat_dir, "date")
+
+        parsed = json.loads((flat_dir / "2026" / "02" / "02" / "doc_01_parsed.json").read_text(encoding="utf-8"))
+        assert parsed["date"] == "2026-02-02"
+        assert (flat_dir / "unknown" / "doc_00_raw.txt").exists()
+
+    def test_dest_and_dry_run(self, flat_dir, tmp_path_factory):
+        dest = tmp_path_factory.mktemp("dest")
+
+        stats = reshard_directory(flat_dir, "hash", dest_dir=dest, dry_run=True)
+        assert stats["files"] == 140
+        assert not any(dest.iterdir())
+
+        reshard_directory(flat_dir, "hash", dest_dir=dest)
+        assert find_document_dir(dest, "doc_07", shard="hash") is not None
+
+    def test_rejects_flat(self, flat_dir):
+        with pytest.raises(ValueError):
+            reshard_directory(flat_dir, "flat")
@@ -0,0 +1,258 @@
+"""
+scheduler.py 모듈 단위 테스트
+- lpt_order / file_sizes: 크기 내림차순 배분 순서
+- BatchScheduler: 입력 순서 출력, 크기순 동적 배분, 꼬리 지연 감소, 워커 예외 / 시간 초과 전달, 중간 종료
+- 메모리 예산: in-flight 추정치 상한, 예산이 작아도 멈추지 않음 (부모가 기다리는 문서 우선), 워커 재시작 집계
+- main: --workers 배치 결과가 직렬 실행과 같은지 (산출물, summary.csv 행 순서, 메모리 예산 / 워커 교체 포함)
+"""
+import time
+from pathlib import Path
+
+import pytest
+
+from src import main as pipeline_main
+from src.error_handler import FileReadError
+from src.config import Constants
+from src.pipeline import run_full_pipeline
+from src.scheduler import (
+    SCHEDULE_INPUT,
+    SCHEDULE_LPT,
+    BatchScheduler,
+    candidate_count,
+    file_sizes,
+    inflight_bytes,
+    lpt_order,
+)
+from src.watchdog import DocumentTimeout
+
+UNIT = 0.05  # 파일 1KB당 처리 시간 (초)
+
+
+def _sized_pipeline(input_path, with_evidence=True):
+    # 파일 크기에 비례해 걸리는 가짜 파이프라인 (CPU를 쓰지 않아 코어 수와 무관)
+    path = Path(input_path)
+    if path.name.startswith("bad"):
+        raise FileReadError(f"손상된 입력: {path.name}")
+    if path.name.startswith("slow"):
+        time.sleep(60)
+    time.sleep(path.stat().st_size / 1024 * UNIT)
+    return path.name
+
+
+def _write(directory: Path, name: str, kb: int) -> Path:
+    path = directory / name
+    path.write_bytes(b"x" * kb * 1024)
+    return path
+
+
+@pytest.fixture
+def skewed(tmp_path):
+    """작은 문서 6건 + 이름순 맨 뒤의 큰 문서 1건 (작은 문서 전체와 같은 양)"""
+    paths = [_write(tmp_path, f"doc_{i}.json", 2) for i in range(6)]
+    paths.append(_write(tmp_path, "zz_large.json", 12))
+    return paths
+
+
+# 배분 순서 테스트
+class TestOrder:
+
+    def test_lpt_order(self):
+        assert lpt_order([3, 10, 3, 7]) == [1, 3, 0, 2]
+        assert lpt_order([]) == []
+
+    def test_file_sizes(self, tmp_path):
+        path = _write(tmp_path, "a.json", 1)
+        assert file_sizes([path, tmp_path / "missing.json"]) == [1024, 0]
+
+
+# 스케줄러 테스트
+class TestBatchScheduler:
+
+    def test_input_order_output_and_lpt_dispatch(self, skewed):
+        scheduler = BatchScheduler(2, pipeline=_sized_pipeline)
+        try:
+            items = list(scheduler.run(skewed))
+        finally:
+            scheduler.close()
+        assert [item.result() for item in items] == [path.name for path in skewed]
+        assert [item.index for item in items] == list(range(len(skewed)))
+        assert scheduler.dispatched == lpt_order(file_sizes(skewed))
+        assert scheduler.dispatched[0] == len(skewed) - 1
+
+    def test_input_schedule(self, skewed):
+        scheduler = BatchScheduler(2, schedule=SCHEDULE_INPUT, pipeline=_sized_pipeline)
+        try:
+            list(scheduler.run(skewed))
+        finally:
+            scheduler.close()
+        assert scheduler.dispatched == list(range(len(skewed)))
+
+    def test_lpt_shortens_tail(self, skewed):
+        """큰 문서가 맨 뒤: 입력 순서는 작은 문서 뒤에 큰 문서 하나만 남고, lpt는 두 슬롯이 같이 끝남"""
+        elapsed = {}
+        for schedule in (SCHEDULE_INPUT, SCHEDULE_LPT):
+            scheduler = BatchScheduler(2, schedule=schedule, pipeline=_sized_pipeline)
+            try:
+                list(scheduler.run(skewed))
+            finally:
+                scheduler.close()
+            elapsed[schedule] = scheduler.stats()["wall_sec"]
+        # 이론값: input 0.3 + 0.6 = 0.9초, lpt 0.6초
+        assert elapsed[SCHEDULE_LPT] < elapsed[SCHEDULE_INPUT] - 0.15
+
+    def test_errors_are_delivered_per_document(self, tmp_path):
+        paths = [_write(tmp_path, "a.json", 1), _write(tmp_path, "bad.json", 1), _write(tmp_path, "b.json", 1)]
+        scheduler = BatchScheduler(2, pipeline=_sized_pipeline)
+        try:
+            items = list(scheduler.run(paths))
+        finally:
+            scheduler.close()
+        assert items[0].result() == "a.json"
+        assert isinstance(items[1].error, FileReadError)
+        with pytest.raises(FileReadError):
+            items[1].result()
+        assert items[2].result() == "b.json"
+
+    def test_timeout_per_slot(self, tmp_path):
+        paths = [_write(tmp_path, "slow.json", 1)] + [_write(tmp_path, f"doc_{i}.json", 1) for i in range(4)]
+        scheduler = BatchScheduler(2, timeout=1.0, pipeline=_sized_pipeline)
+        try:
+            items = list(scheduler.run(paths))
+        finally:
+            scheduler.close()
+        assert isinstance(items[0].error, DocumentTimeout)
+        assert [item.result() for item in items[1:]] == [f"doc_{i}.json" for i in range(4)]
+        stats = scheduler.stats()
+        assert stats["timeouts"] == 1
+        assert stats["crashes"] == 0
+
+    def test_consumer_stops_early(self, tmp_path):
+        paths = [_write(tmp_path, "doc_0.json", 1), _write(tmp_path, "slow.json", 1)]
+        scheduler = BatchScheduler(2, schedule=SCHEDULE_INPUT, pipeline=_sized_pipeline)
+        started = time.perf_counter()
+        items = scheduler.run(paths)
+        assert next(items).result() == "doc_0.json"
+        items.close()  # 처리 중인 워커를 강제 종료하고 슬롯 스레드를 회수
+        assert time.perf_counter() - started < 10
+        assert all(slot.worker_pid is None for slot in scheduler.slots)
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            BatchScheduler(0)
+        with pytest.raises(ValueError):
+            BatchScheduler(2, schedule="random")
+        with pytest.raises(ValueError):
+            BatchScheduler(2, memory_budget=0)
+
+
+# 메모리 예산 테스트
+class TestMemoryBudget:
+
+    def test_inflight_estimate(self):
+        result = run_full_pipeline(str(pipeline_main.RAW_DIR / "sample_01.json"))
+        assert candidate_count(result) == len(result[1].candidates) > 0
+        assert candidate_count("doc.json") == 0
+        assert inflight_bytes(1000) == 1000 * Constants.INFLIGHT_BYTES_PER_INPUT_BYTE
+        assert inflight_bytes(1000, 3) == 1000 + 3 * Constants.INFLIGHT_BYTES_PER_CANDIDATE
+
+    def test_budget_limits_concurrency(self, tmp_path):
+        """처리 중 추정치 2KB × 12 = 24KB: 예산 40KB면 한 번에 1건만 (슬롯 3개여도)"""
+        paths = [_write(tmp_path, f"doc_{i}.json", 2) for i in range(6)]
+        budget = 40 * 1024
+        scheduler = BatchScheduler(3, pipeline=_sized_pipeline, memory_budget=budget)
+        try:
+            items = list(scheduler.run(paths))
+        finally:
+            scheduler.close()
+        assert [item.result() for item in items] == [path.name for path in paths]
+        stats = scheduler.stats()
+        assert stats["peak_inflight_bytes"] <= budget
+        assert stats["throttled"] > 0
+        # 직렬과 같은 경과 시간 (6 × 0.1초)
+        assert stats["wall_sec"] >= 6 * 2 * UNIT * 0.9
+
+    def test_tiny_budget_makes_progress(self, skewed):
+        """예산보다 큰 문서만 있어도 1건씩 진행, 버퍼에 뒤 순서 결과가 있으면 부모가 기다리는 문서부터"""
+        scheduler = BatchScheduler(2, pipeline=_sized_pipeline, memory_budget=1)
+        started = time.perf_counter()
+        try:
+            items = list(scheduler.run(skewed))
+        finally:
+            scheduler.close()
+        assert time.perf_counter() - started < 10
+        assert [item.index for item in items] == list(range(len(skewed)))
+        # 가장 큰 문서(맨 뒤)가 먼저, 그 결과가 버퍼에 있는 동안은 입력 순서대로
+        assert scheduler.dispatched == [len(skewed) - 1] + list(range(len(skewed) - 1))
+
+    def test_budget_released_after_consume(self, tmp_path):
+        paths = [_write(tmp_path, f"doc_{i}.json", 1) for i in range(4)]
+        scheduler = BatchScheduler(2, pipeline=_sized_pipeline, memory_budget=1024 * 1024)
+        try:
+            list(scheduler.run(paths))
+        finally:
+            scheduler.close()
+        assert scheduler._inflight == 0 and scheduler._weights == {}
+
+    def test_worker_recycle_stats(self, tmp_path):
+        paths = [_write(tmp_path, f"doc_{i}.json", 1) for i in range(6)]
+        scheduler = BatchScheduler(2, pipeline=_sized_pipeline, max_tasks=2)
+        try:
+            items = list(scheduler.run(paths))
+        finally:
+            scheduler.close()
+        assert [item.result() for item in items] == [path.name for path in paths]
+        # 슬롯마다 2건 처리할 때마다 교체, 새 워커는 다음 문서가 있을 때만 띄움
+        per_slot = [sum(1 for item in items if item.slot == slot) for slot in range(2)]
+        stats = scheduler.stats()
+        assert stats["recycled_tasks"] == sum(n // 2 for n in per_slot)
+        assert stats["workers_started"] == sum((n + 1) // 2 for n in per_slot)
+        assert stats["rss_max"] > 0
+
+
+# 배치 모드 연동 테스트
+class TestBatchParallel:
+
+    def _run(self, tmp_path, monkeypatch, name, argv):
+        out = tmp_path / name
+        monkeypatch.setattr(pipeline_main, "PROCESSED_DIR", out / "processed")
+        monkeypatch.setattr(pipeline_main, "LOG_DIR", out / "logs")
+        for attr in ["logger", "error_handler", "artifact_store", "log_documents", "watchdog", "quarantine"]:
+            monkeypatch.setattr(pipeline_main, attr, getattr(pipeline_main, attr))
+        raw = tmp_path / "raw"
+        pipeline_main.main(["--input-dir", str(raw)] + argv)
+        return out / "processed"
+
+    @pytest.mark.parametrize("argv", [
+        ["--workers", "3"],
+        ["--workers", "2", "--memory-budget", "0.01", "--worker-max-docs", "2"],
+    ])
+    def test_same_output_as_serial(self, tmp_path, monkeypatch, argv):
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        for i in range(1, 5):
+            (raw / f"sample_{i:02d}.json").write_bytes((pipeline_main.RAW_DIR / f"sample_{i:02d}.json").read_bytes())
+        (raw / "sample_00_broken.json").write_text("{", encoding="utf-8")
+
+        serial = self._run(tmp_path, monkeypatch, "serial", [])
+        parallel = self._run(tmp_path, monkeypatch, "parallel", argv)
+
+        files = sorted(p.relative_to(serial) for p in serial.rglob("*") if p.is_file())
+        assert files == sorted(p.relative_to(parallel) for p in parallel.rglob("*") if p.is_file())
+        for rel in files:
+            assert (serial / rel).read_bytes() == (parallel / rel).read_bytes(), rel
+
+    @pytest.mark.parametrize("argv", [
+        ["--workers", "2", "--profile"],
+        ["--workers", "2", "--memprofile"],
+        ["--memory-budget", "512"],
+        ["--workers", "2", "--memory-budget", "0"],
+        ["--stdin", "--stdout", "--workers", "2", "--memory-budget", "512"],
+        ["--stdin", "--stdout", "--workers", "2", "--worker-max-docs", "100"],
+    ])
+    def test_invalid_args(self, argv):
+        with pytest.raises(SystemExit):
+            pipeline_main.parse_args(argv)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
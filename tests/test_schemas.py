@@ -1,4 +1,9 @@
+import json
+from dataclasses import asdict
+
 import pytest
+from src.schema import Candidate, ExtractedCandidates, ParseResult
+from src.resolver import ResolvedFields
 from src.schemas import (
     validate_preprocess_log,
     validate_candidates_output,
@@ -193,5 +198,48 @@ class TestEmptyTemplates:
         assert validate_parsed_output(result) is True
 
 
+# dataclass to_dict 테스트
+class TestToDict:
+    
+    def _extracted(self):
+        candidate = Candidate(
+            field="date",
+            value_raw="2026-02-02",
+            source_line="날짜: 2026-02-02",
+            method="label",
+            score=85,
+            meta={"line_index": 0, "extraction_metadata": {"confidence": 0.9}},
+        )
+        return ExtractedCandidates(
+            raw_text="날짜: 2026-02-02",
+            normalized_text="날짜: 2026-02-02",
+            candidates=[candidate],
+            warnings=["w"],
+        )
+    
+    def test_same_as_asdict(self):
+        """asdict와 같은 값, 같은 키 순서 (JSON 결과 동일)"""
+        objects = [
+            self._extracted(),
+            ParseResult(date="2026-02-02", net_weight_kg=5010, parse_warnings=["a"]),
+            ResolvedFields(date_raw="2026-02-02", evidence={"date": {"candidate_count": 1}}),
+        ]
+        for obj in objects:
+            assert json.dumps(obj.to_dict(), ensure_ascii=False) == json.dumps(asdict(obj), ensure_ascii=False)
+    
+    def test_nested_candidates_converted(self):
+        """중첩 dataclass 리스트는 dict로 변환"""
+        data = self._extracted().to_dict()
+        assert isinstance(data["candidates"][0], dict)
+        assert data["candidates"][0]["field"] == "date"
+    
+    def test_shallow(self):
+        """list/dict는 복사하지 않고 참조"""
+        extracted = self._extracted()
+        data = extracted.to_dict()
+        assert data["warnings"] is extracted.warnings
+        assert data["candidates"][0]["meta"] is extracted.candidates[0].meta
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
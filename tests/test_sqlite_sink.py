@@ -0,0 +1,137 @@
+"""
+sqlite_sink.py 모듈 단위 테스트
+- SQLiteResultSink: 배치 기록, 자식 테이블, 중복 source 대체
+- query_results / count_results: 조건 조회
+- main: 조회 CLI는 읽기 전용 연결 (스키마 / 저널 모드 변경 없음)
+"""
+import sqlite3
+
+import pytest
+
+from src.sqlite_sink import SQLiteResultSink, connect, connect_readonly, main, query_results, count_results
+
+
+def _parsed(source: str, date: str = "2026-02-02", vehicle_no: str = "80구8713", is_valid: bool = True) -> dict:
+    return {
+        "source": source,
+        "date": date,
+        "time": "09:12",
+        "vehicle_no": vehicle_no,
+        "gross_weight_kg": 12480,
+        "tare_weight_kg": 7470,
+        "net_weight_kg": 5010,
+        "parse_warnings": ["w1", "w2"],
+        "validation_errors": [] if is_valid else ["missing_required_field:date"],
+        "imputation_notes": ["imputed:net_weight=5010"],
+        "is_valid": is_valid,
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "results.sqlite"
+    with SQLiteResultSink(path, batch_size=2) as sink:
+        sink.write(_parsed("a.json", date="2026-02-01"))
+        sink.write(_parsed("b.json", date="2026-02-02", is_valid=False))
+        sink.write(_parsed("c.json", date="2026-02-03", vehicle_no="12가3456"))
+    return path
+
+
+# 기록 테스트
+class TestSQLiteResultSink:
+
+    def test_round_trip(self, db_path):
+        """기록한 결과가 ParsedOutputSchema 형태로 복원"""
+        conn = connect(db_path)
+        rows = query_results(conn, date="2026-02-01")
+        conn.close()
+
+        assert rows == [_parsed("a.json", date="2026-02-01")]
+
+    def test_rows_written(self, tmp_path):
+        """배치 크기와 무관하게 close 시 모두 기록"""
+        with SQLiteResultSink(tmp_path / "r.sqlite", batch_size=10) as sink:
+            for i in range(3):
+                sink.write(_parsed(f"{i}.json"))
+        assert sink.rows_written == 3
+
+    def test_rewrite_same_source_replaces(self, db_path):
+        """같은 source 재기록 시 대체 (자식 행 중복 없음)"""
+        with SQLiteResultSink(db_path) as sink:
+            sink.write(_parsed("a.json", date="2026-03-01"))
+
+        conn = connect(db_path)
+        assert count_results(conn) == 3
+        rows = query_results(conn, date="2026-03-01")
+        conn.close()
+
+        assert len(rows) == 1
+        assert rows[0]["parse_warnings"] == ["w1", "w2"]
+
+    def test_wal_mode(self, db_path):
+        """WAL 저널 모드"""
+        conn = connect(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_indexes_exist(self, db_path):
+        """date / vehicle_no / is_valid 인덱스"""
+        conn = connect(db_path)
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+
+        assert {"idx_parsed_results_date", "idx_parsed_results_vehicle_no", "idx_parsed_results_is_valid"} <= names
+
+
+# 조회 테스트
+class TestQueryResults:
+
+    def test_vehicle_no(self, db_path):
+        """차량번호 조회"""
+        conn = connect(db_path)
+        assert [r["source"] for r in query_results(conn, vehicle_no="12가3456")] == ["c.json"]
+        conn.close()
+
+    def test_date_range_and_validity(self, db_path):
+        """날짜 범위 + 검증 여부"""
+        conn = connect(db_path)
+        rows = query_results(conn, date_from="2026-02-01", date_to="2026-02-02", is_valid=True)
+        assert [r["source"] for r in rows] == ["a.json"]
+        assert count_results(conn, is_valid=False) == 1
+        conn.close()
+
+    def test_limit(self, db_path):
+        """최대 건수"""
+        conn = connect(db_path)
+        assert len(query_results(conn, limit=2)) == 2
+        conn.close()
+
+    def test_readonly_rejects_writes(self, db_path):
+        """읽기 전용 연결은 조회만 가능"""
+        conn = connect_readonly(db_path)
+        assert count_results(conn) == 3
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM parsed_results")
+        conn.close()
+
+    def test_cli_does_not_touch_db(self, tmp_path, capsys):
+        """조회 CLI가 DDL / WAL 전환 없이 기존 DB를 그대로 둠"""
+        path = tmp_path / "plain.sqlite"
+        with sqlite3.connect(str(path)) as conn:
+            conn.execute("CREATE TABLE parsed_results (id INTEGER PRIMARY KEY, source TEXT, date TEXT, "
+                         "vehicle_no TEXT, is_valid INTEGER)")
+            conn.execute("INSERT INTO parsed_results (source, is_valid) VALUES ('a.json', 1)")
+        conn.close()
+
+        main([str(path), "--count"])
+        assert capsys.readouterr().out.strip() == "1"
+
+        conn = sqlite3.connect(str(path))
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+        assert tables == {"parsed_results"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+"""
+streaming.py 모듈 단위 테스트
+- parse_jsonl_line: JSONL 한 줄 파싱
+- ordered_parallel_map: 순서 유지 병렬 map
+- run_stream: stdin/stdout 스트리밍 처리
+"""
+import io
+import json
+
+import pytest
+
+from src.streaming import (
+    parse_jsonl_line,
+    ordered_parallel_map,
+    run_stream,
+)
+
+
+def _record(text: str, **extra) -> str:
+    return json.dumps({"text": text, **extra}, ensure_ascii=False)
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+# JSONL 한 줄 파싱 테스트
+class TestParseJsonlLine:
+
+    def test_valid_record(self, sample_raw_ocr_text):
+        """정상 레코드"""
+        status, parsed = parse_jsonl_line(_record(sample_raw_ocr_text), 1)
+
+        assert status == "SUCCESS"
+        assert parsed["source"] == "stdin:1"
+        assert parsed["date"] == "2026-02-02"
+        assert parsed["net_weight_kg"] == 5900
+
+    def test_source_from_record(self, sample_raw_ocr_text):
+        """레코드의 source 키 사용"""
+        _, parsed = parse_jsonl_line(_record(sample_raw_ocr_text, source="a.json"), 7)
+        assert parsed["source"] == "a.json"
+
+    def test_invalid_json(self):
+        """JSON 파싱 실패 → 오류 레코드"""
+        status, parsed = parse_jsonl_line("not json", 3)
+
+        assert status == "FAILED"
+        assert parsed["source"] == "stdin:3"
+        assert parsed["is_valid"] is False
+        assert parsed["validation_errors"] == ["pipeline_error:JSONDecodeError"]
+
+    def test_non_object_record(self):
+        """JSON 객체가 아닌 레코드"""
+        status, parsed = parse_jsonl_line("[1, 2]", 1)
+        assert status == "FAILED"
+
+
+# 순서 유지 병렬 map 테스트
+class TestOrderedParallelMap:
+
+    def test_serial(self):
+        """워커 1개 (현재 프로세스)"""
+        assert list(ordered_parallel_map(_square, range(5), workers=1, max_in_flight=1)) == [0, 1, 4, 9, 16]
+
+    def test_parallel_preserves_order(self):
+        """워커 여러 개에서도 입력 순서 유지"""
+        result = list(ordered_parallel_map(_square, range(50), workers=2, max_in_flight=3))
+        assert result == [x * x for x in range(50)]
+
+
+# 스트리밍 처리 테스트
+class TestRunStream:
+
+    def test_one_output_line_per_input_line(self, sample_raw_ocr_text):
+        """입력 한 줄당 출력 한 줄, 빈 줄은 건너뜀"""
+        lines = [_record(sample_raw_ocr_text), "", "broken", _record(sample_raw_ocr_text)]
+        out = io.StringIO()
+
+        stats = run_stream(io.StringIO("\n".join(lines) + "\n"), out)
+
+        rows = [json.loads(l) for l in out.getvalue().splitlines()]
+        assert [r["source"] for r in rows] == ["stdin:1", "stdin:3", "stdin:4"]
+        assert stats == {"total": 3, "success": 2, "valid": 2, "failed": 1}
+
+    def test_parallel_matches_serial(self, sample_raw_ocr_text):
+        """병렬 결과가 직렬 결과와 동일"""
+        lines = [_record(sample_raw_ocr_text, id=f"doc{i}") for i in range(10)]
+        data = "\n".join(lines) + "\n"
+
+        serial, parallel = io.StringIO(), io.StringIO()
+        run_stream(io.StringIO(data), serial)
+        run_stream(io.StringIO(data), parallel, workers=2, chunk_size=3)
+
+        assert serial.getvalue() == parallel.getvalue()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
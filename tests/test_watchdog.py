@@ -0,0 +1,254 @@
+"""
+watchdog.py 모듈 단위 테스트
+- DocumentWatchdog: 워커 프로세스 결과가 현재 프로세스 실행과 같은지, 시간 초과 / 비정상 종료 후 워커 교체,
+  워커 예외의 타입 / 에러 그룹 시그니처 보존, 계측 / 문서 추적 합산
+- 워커 재시작: max_tasks건 처리 후 / 워커 RSS가 max_rss 초과 시 새 워커
+- Quarantine: 입력 복사 + quarantine.jsonl 기록
+- main: --doc-timeout 배치 실행의 TIMEOUT 상태, 격리, 결과 요약의 시간 초과 건수
+"""
+import functools
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src import main as pipeline_main
+from src.artifacts import create_artifact_store
+from src.error_handler import ErrorHandler, FileReadError, error_signature
+from src.metrics import disable_metrics, enable_metrics, start_document_trace, stop_document_trace
+from src.output_formatters import FileNamingConvention
+from src.pipeline import run_full_pipeline
+from src.watchdog import (
+    QUARANTINE_INDEX,
+    DocumentTimeout,
+    DocumentWatchdog,
+    Quarantine,
+    RemoteTraceback,
+    WorkerCrashed,
+)
+
+SAMPLE = pipeline_main.RAW_DIR / "sample_01.json"
+TIMEOUT = 1.0
+
+
+def _test_pipeline(input_path, with_evidence=True):
+    # 워커에서 실행할 파이프라인: 파일 이름 접두사로 멈춤 / 비정상 종료 / 예외 흉내
+    name = Path(input_path).name
+    if name.startswith("slow"):
+        time.sleep(60)
+    if name.startswith("crash"):
+        os._exit(3)
+    if name.startswith("bad"):
+        raise FileReadError(f"손상된 입력: {name}")
+    return run_full_pipeline(input_path, with_evidence=with_evidence)
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """정상 / 멈춤 / 비정상 종료 / 예외 입력 (내용은 모두 sample_01)"""
+    directory = tmp_path / "raw"
+    directory.mkdir()
+    for name in ["ok_01.json", "slow_01.json", "crash_01.json", "bad_01.json"]:
+        (directory / name).write_bytes(SAMPLE.read_bytes())
+    return directory
+
+
+@pytest.fixture
+def watchdog():
+    runner = DocumentWatchdog(TIMEOUT, pipeline=_test_pipeline)
+    yield runner
+    runner.close()
+
+
+# 워커 실행 테스트
+class TestDocumentWatchdog:
+
+    def test_same_result_as_in_process(self, watchdog, inputs):
+        expected = run_full_pipeline(str(inputs / "ok_01.json"))
+        actual = watchdog.run(str(inputs / "ok_01.json"))
+        assert [part.to_dict() for part in actual] == [part.to_dict() for part in expected]
+
+    def test_worker_reused_between_documents(self, watchdog, inputs):
+        watchdog.run(str(inputs / "ok_01.json"))
+        pid = watchdog.worker_pid
+        watchdog.run(str(inputs / "ok_01.json"), with_evidence=False)
+        assert watchdog.worker_pid == pid
+        assert watchdog.workers_started == 1
+
+    def test_timeout_kills_and_replaces_worker(self, watchdog, inputs):
+        watchdog.run(str(inputs / "ok_01.json"))
+        pid = watchdog.worker_pid
+        started = time.perf_counter()
+        with pytest.raises(DocumentTimeout) as excinfo:
+            watchdog.run(str(inputs / "slow_01.json"))
+        assert time.perf_counter() - started < TIMEOUT + 5
+        assert excinfo.value.source == "slow_01.json"
+        assert excinfo.value.timeout == TIMEOUT
+        assert watchdog.worker_pid is None
+
+        watchdog.run(str(inputs / "ok_01.json"))
+        assert watchdog.worker_pid != pid
+        stats = watchdog.stats()
+        assert stats.pop("rss_max") > 0
+        assert stats == {
+            "timeout_sec": TIMEOUT, "timeouts": 1, "crashes": 0, "workers_started": 2,
+            "recycled_tasks": 0, "recycled_rss": 0,
+        }
+
+    def test_crash(self, watchdog, inputs):
+        with pytest.raises(WorkerCrashed) as excinfo:
+            watchdog.run(str(inputs / "crash_01.json"))
+        assert excinfo.value.exitcode == 3
+        watchdog.run(str(inputs / "ok_01.json"))
+        assert watchdog.stats()["crashes"] == 1
+
+    def test_pipeline_error_keeps_type_and_signature(self, watchdog, inputs):
+        path = str(inputs / "bad_01.json")
+        with pytest.raises(FileReadError) as remote:
+            watchdog.run(path)
+        with pytest.raises(FileReadError) as local:
+            _test_pipeline(path)
+        assert error_signature(remote.value) == error_signature(local.value)
+        assert isinstance(remote.value.__cause__, RemoteTraceback)
+        assert "_test_pipeline" in str(remote.value.__cause__)
+        # 예외는 워커를 죽이지 않음
+        pid = watchdog.worker_pid
+        watchdog.run(str(inputs / "ok_01.json"))
+        assert watchdog.worker_pid == pid
+
+    def test_metrics_and_trace_merged(self, watchdog, inputs):
+        metrics = enable_metrics()
+        try:
+            trace = start_document_trace()
+            watchdog.run(str(inputs / "ok_01.json"), trace=trace)
+            stop_document_trace()
+            assert trace["load"] > 0
+            assert metrics.snapshot()["load"]["count"] == 1
+        finally:
+            stop_document_trace()
+            disable_metrics()
+
+    def test_recycle_after_max_tasks(self, inputs):
+        runner = DocumentWatchdog(TIMEOUT, pipeline=_test_pipeline, max_tasks=2)
+        try:
+            pids = []
+            for _ in range(5):
+                runner.run(str(inputs / "ok_01.json"), with_evidence=False)
+                pids.append(runner.worker_pid)
+            with pytest.raises(FileReadError):  # 예외로 끝난 문서도 처리 건수에 포함
+                runner.run(str(inputs / "bad_01.json"))
+        finally:
+            runner.close()
+        # 2건마다 워커를 정상 종료하고 다음 문서 전에 새 워커
+        assert pids[0] is not None and pids[1] is None and pids[2] not in (None, pids[0])
+        assert runner.stats()["recycled_tasks"] == 3
+        assert runner.workers_started == 3
+
+    def test_recycle_over_max_rss(self, inputs):
+        runner = DocumentWatchdog(TIMEOUT, pipeline=_test_pipeline, max_rss=1)
+        try:
+            for _ in range(3):
+                runner.run(str(inputs / "ok_01.json"))
+        finally:
+            runner.close()
+        stats = runner.stats()
+        assert (stats["recycled_rss"], stats["recycled_tasks"], stats["workers_started"]) == (3, 0, 3)
+        assert stats["rss_max"] > 1
+
+    @pytest.mark.parametrize("kwargs", [{"timeout": 0}, {"timeout": 1, "max_tasks": -1}, {"timeout": 1, "max_rss": 0}])
+    def test_invalid_args(self, kwargs):
+        with pytest.raises(ValueError):
+            DocumentWatchdog(**kwargs)
+
+
+# 격리 디렉토리 테스트
+class TestQuarantine:
+
+    def test_copy_and_index(self, tmp_path, inputs):
+        quarantine = Quarantine(tmp_path / "q")
+        copied = quarantine.add(inputs / "slow_01.json", "TIMEOUT", "slow_01.json: 처리 시간 제한 1초 초과")
+        quarantine.add(inputs / "slow_01.json", "TIMEOUT")
+
+        assert copied.read_bytes() == SAMPLE.read_bytes()
+        assert (inputs / "slow_01.json").exists()  # 원본은 그대로
+        records = [json.loads(line) for line in (tmp_path / "q" / QUARANTINE_INDEX).read_text(encoding="utf-8").splitlines()]
+        assert len(records) == 2 and quarantine.count == 2
+        assert records[0]["source"] == "slow_01.json"
+        assert records[0]["reason"] == "TIMEOUT"
+        assert records[0]["path"] == str((inputs / "slow_01.json").resolve())
+
+
+# 배치 모드 연동 테스트
+class TestBatchTimeout:
+
+    @pytest.fixture
+    def batch_env(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pipeline_main, "PROCESSED_DIR", tmp_path / "processed")
+        monkeypatch.setattr(pipeline_main, "LOG_DIR", tmp_path / "logs")
+        monkeypatch.setattr(pipeline_main, "QUARANTINE_DIR", tmp_path / "quarantine")
+        # main()이 바꾸는 모듈 전역은 테스트 후 원래대로
+        for name in ["logger", "error_handler", "artifact_store", "log_documents", "watchdog", "quarantine"]:
+            monkeypatch.setattr(pipeline_main, name, getattr(pipeline_main, name))
+        monkeypatch.setattr(
+            pipeline_main, "DocumentWatchdog", functools.partial(DocumentWatchdog, pipeline=_test_pipeline)
+        )
+        return tmp_path
+
+    def test_process_single_file_timeout(self, batch_env, inputs, monkeypatch):
+        runner = DocumentWatchdog(TIMEOUT, pipeline=_test_pipeline)
+        monkeypatch.setattr(pipeline_main, "watchdog", runner)
+        monkeypatch.setattr(pipeline_main, "quarantine", Quarantine(batch_env / "quarantine"))
+        monkeypatch.setattr(pipeline_main, "logger", logging.getLogger("test_watchdog"))
+        monkeypatch.setattr(pipeline_main, "error_handler", ErrorHandler())
+        monkeypatch.setattr(
+            pipeline_main, "artifact_store",
+            create_artifact_store(FileNamingConvention.LAYOUT_FILES, batch_env / "processed"),
+        )
+        try:
+            status, is_valid, _, parsed = pipeline_main.process_single_file(inputs / "slow_01.json")
+            assert (status, is_valid, parsed) == ("TIMEOUT", False, {})
+            assert pipeline_main.error_handler.get_error_summary()["critical"] == 1
+
+            status, is_valid, _, parsed = pipeline_main.process_single_file(inputs / "ok_01.json")
+            assert status == "SUCCESS" and is_valid
+        finally:
+            runner.close()
+        assert (batch_env / "quarantine" / "slow_01.json").exists()
+
+    def test_summary_counts(self, batch_env, inputs, capsys):
+        (inputs / "bad_01.json").unlink()
+        pipeline_main.main(["--input-dir", str(inputs), "--doc-timeout", str(TIMEOUT), "--log-json"])
+        out = capsys.readouterr().out
+        assert "전체:        3개" in out
+        assert "성공(실행):  1개" in out
+        assert "실패:        1개" in out
+        assert "시간 초과:   1개" in out
+
+        records = [json.loads(line) for line in (batch_env / "quarantine" / QUARANTINE_INDEX).read_text(encoding="utf-8").splitlines()]
+        assert sorted((r["source"], r["reason"]) for r in records) == [
+            ("crash_01.json", "WORKER_CRASH"), ("slow_01.json", "TIMEOUT"),
+        ]
+        log = next((batch_env / "logs").glob("pipeline_*.jsonl")).read_text(encoding="utf-8")
+        statuses = {json.loads(line)["source"]: json.loads(line)["status"] for line in log.splitlines() if '"event":"document"' in line}
+        assert statuses == {"crash_01.json": "FAILED", "ok_01.json": "SUCCESS", "slow_01.json": "TIMEOUT"}
+
+    @pytest.mark.parametrize("argv", [
+        ["--stdin", "--stdout", "--doc-timeout", "1"],
+        ["--doc-timeout", "0"],
+        ["--doc-timeout", "1", "--profile"],
+        ["--quarantine-dir", "q"],
+        ["--worker-max-docs", "10"],
+        ["--worker-max-rss", "512"],
+        ["--doc-timeout", "1", "--worker-max-docs", "-1"],
+        ["--doc-timeout", "1", "--worker-max-rss", "0"],
+    ])
+    def test_invalid_args(self, argv):
+        with pytest.raises(SystemExit):
+            pipeline_main.parse_args(argv)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])